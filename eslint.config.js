@@ -20,6 +20,7 @@ export default [
                 AudioContext: "readonly",
                 Storage: "readonly",
                 Blob: "readonly",
+                Worker: "readonly",
                 URL: "readonly",
                 FileReader: "readonly",
                 crypto: "readonly",
@@ -0,0 +1,80 @@
+#!/usr/bin/env node
+/**
+ * Shuffle benchmark: time and heap per casino shuffle, copying vs in-place.
+ * Usage: node --expose-gc scripts/bench-shuffle.js [--decks 1,6,8,100,500] [--iterations N]
+ * Without --expose-gc the heap column can be skewed by garbage from earlier iterations.
+ */
+import { Shuffler, ShuffleWorkspace } from '../src/core/Shuffler.js';
+import { CONFIG } from '../src/core/Constants.js';
+
+function parseArgs(argv) {
+    const args = {};
+    for (let i = 0; i < argv.length; i++) {
+        const key = argv[i];
+        if (key.startsWith('--')) {
+            args[key.slice(2)] = argv[i + 1];
+            i++;
+        }
+    }
+    return args;
+}
+
+const args = parseArgs(process.argv.slice(2));
+const deckCounts = (args.decks || '1,6,8,100,500').split(',').map(Number);
+const gc = globalThis.gc || (() => {});
+
+function buildShoe(decks) {
+    const cards = [];
+    for (let i = 0; i < decks * 52; i++) cards.push({ suit: '♠', value: String(i % 13) });
+    return cards;
+}
+
+/**
+ * Runs `shuffle` repeatedly and returns mean ms per call, plus the heap growth of
+ * single calls sampled right after a GC (an estimate of what one shuffle allocates).
+ */
+function measure(iterations, shuffle) {
+    for (let i = 0; i < Math.min(20, iterations); i++) shuffle();
+
+    const start = performance.now();
+    for (let i = 0; i < iterations; i++) shuffle();
+    const elapsed = performance.now() - start;
+
+    const samples = 10;
+    let heap = 0;
+    for (let i = 0; i < samples; i++) {
+        gc();
+        const before = process.memoryUsage().heapUsed;
+        shuffle();
+        heap += Math.max(0, process.memoryUsage().heapUsed - before);
+    }
+    return { ms: elapsed / iterations, heap: heap / samples };
+}
+
+const passes = CONFIG.CASINO_SHUFFLE_PASSES;
+const kb = (bytes) => `${(bytes / 1024).toFixed(1)} KB`;
+
+console.log(`Casino shuffle, ${passes} riffle passes${globalThis.gc ? '' : ' (run with --expose-gc for stable heap numbers)'}`);
+console.log('decks   cards    copy ms   copy heap   in-place ms   in-place heap');
+for (const decks of deckCounts) {
+    const shoe = buildShoe(decks);
+    // Keep the total work per row roughly constant.
+    const iterations = Number(args.iterations) || Math.max(20, Math.floor(200000 / shoe.length));
+
+    let copied = shoe;
+    const copy = measure(iterations, () => {
+        copied = Shuffler.casinoShuffle(copied, passes);
+    });
+
+    const workspace = new ShuffleWorkspace(shoe.length);
+    const inPlaceShoe = [...shoe];
+    const inPlace = measure(iterations, () => {
+        Shuffler.casinoShuffleInPlace(inPlaceShoe, passes, null, workspace);
+    });
+
+    console.log(
+        `${String(decks).padStart(5)} ${String(shoe.length).padStart(7)} ` +
+        `${copy.ms.toFixed(3).padStart(10)} ${kb(copy.heap).padStart(11)} ` +
+        `${inPlace.ms.toFixed(3).padStart(13)} ${kb(inPlace.heap).padStart(15)}`
+    );
+}
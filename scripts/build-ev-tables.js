@@ -0,0 +1,37 @@
+#!/usr/bin/env node
+/**
+ * Regenerates src/utils/strategyEVTables.js: one serialized EV table per
+ * distinct rule profile in RULES.PROFILES.
+ * Usage: node scripts/build-ev-tables.js [--decks 6]
+ */
+import { writeFileSync } from 'node:fs';
+import { fileURLToPath } from 'node:url';
+import { CONFIG, RULES } from '../src/core/Constants.js';
+import { buildStrategyEVTable, getRuleSignature } from '../src/utils/StrategyEV.js';
+
+const deckArg = process.argv.indexOf('--decks');
+const decks = deckArg !== -1 ? Number(process.argv[deckArg + 1]) : CONFIG.DECKS;
+const target = fileURLToPath(new URL('../src/utils/strategyEVTables.js', import.meta.url));
+
+const tables = [];
+const seen = new Set();
+for (const [key, profile] of Object.entries(RULES.PROFILES)) {
+    const rules = getRuleSignature(profile);
+    if (seen.has(rules)) continue;
+    seen.add(rules);
+    const start = performance.now();
+    tables.push({ profile: key, ...buildStrategyEVTable(profile, decks).serialize() });
+    console.log(`${key} (${rules}, ${decks} decks): ${(performance.now() - start).toFixed(0)} ms`);
+}
+
+const body = tables
+    .map((t) => `    // ${t.profile}\n    { v: ${t.v}, decks: ${t.decks}, rules: '${t.rules}', data: '${t.data}' }`)
+    .join(',\n');
+
+writeFileSync(target, `// Generated by scripts/build-ev-tables.js. Do not edit by hand.
+// Action EVs per (hand, upcard), see StrategyEV.js.
+export const STRATEGY_EV_TABLES = [
+${body}
+];
+`);
+console.log(`Wrote ${tables.length} table(s) to ${target}`);
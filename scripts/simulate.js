@@ -0,0 +1,50 @@
+#!/usr/bin/env node
+/**
+ * Headless simulation CLI.
+ * Usage: node scripts/simulate.js [--hands N] [--profile vegas_strip] [--decks 6] [--bet 100]
+ *                                  [--seed S] [--workers W]
+ * Passing --seed or --workers runs the sharded, reproducible parallel mode.
+ */
+import { runSimulation } from '../src/core/Simulator.js';
+import { runParallelSimulation } from '../src/core/ParallelSimulator.js';
+
+function parseArgs(argv) {
+    const args = {};
+    for (let i = 0; i < argv.length; i++) {
+        const key = argv[i];
+        if (key.startsWith('--')) {
+            args[key.slice(2)] = argv[i + 1];
+            i++;
+        }
+    }
+    return args;
+}
+
+const args = parseArgs(process.argv.slice(2));
+const options = {
+    hands: Number(args.hands || 1000000),
+    ruleProfile: args.profile || 'vegas_strip',
+    decks: args.decks ? Number(args.decks) : undefined,
+    bet: args.bet ? Number(args.bet) : undefined
+};
+const parallel = args.seed !== undefined || args.workers !== undefined;
+const report = parallel
+    ? await runParallelSimulation({
+        ...options,
+        seed: args.seed !== undefined ? args.seed : Date.now(),
+        workers: args.workers ? Number(args.workers) : undefined
+    })
+    : runSimulation(options);
+
+const pct = (x) => `${(x * 100).toFixed(3)}%`;
+if (parallel) console.log(`Seed:            ${report.seed} (${report.shards} shards, ${report.workers} workers)`);
+console.log(`Rounds:          ${report.rounds}`);
+console.log(`Hands:           ${report.hands}`);
+console.log(`House edge:      ${pct(report.houseEdge)} ± ${pct(1.96 * report.standardError)}`);
+console.log(`Variance:        ${report.variance.toFixed(4)} (SD ${report.standardDeviation.toFixed(4)})`);
+console.log('Outcomes:');
+Object.entries(report.frequencies).forEach(([key, freq]) => {
+    console.log(`  ${key.padEnd(10)} ${pct(freq)}`);
+});
+console.log(`Elapsed:         ${(report.elapsedMs / 1000).toFixed(2)} s`);
+console.log(`Throughput:      ${Math.round(report.roundsPerSecond * 60).toLocaleString()} rounds/min`);
@@ -2,17 +2,104 @@ import { Deck } from './Deck.js';
 import { CONFIG, RULES, getActiveRuleProfile } from './Constants.js';
 import * as HandUtils from '../utils/HandUtils.js';
 
+// Cap on cached running scores (a round never has more than a few hands).
+const MAX_TRACKED_SCORES = 16;
+
 /**
  * Core engine for Blackjack game logic.
  * Handles state, deck, hand manipulation, and rule evaluation.
  */
 export class BlackjackEngine {
-    constructor() {
+    /**
+     * @param {Object} [options]
+     * @param {Object} [options.ruleProfile] - Fixed rule profile. Defaults to the active profile.
+     * @param {number} [options.numberOfDecks] - Shoe size. Defaults to CONFIG.DECKS.
+     * @param {string} [options.shuffleMode] - Shuffle mode override. Defaults to CONFIG.SHUFFLE_MODE.
+     * @param {Object} [options.random] - Random source for the shoe (e.g. a seeded one).
+     * @param {boolean} [options.inPlaceShuffle] - Use the allocation-free casino shuffle.
+     * @param {boolean} [options.compact] - Keep the shoe as a Uint8Array of card codes.
+     * @param {string} [options.countSystem] - Count system tracked by the shoe (see CardCounter).
+     */
+    constructor(options = {}) {
+        /** @type {Object|null} Rule profile override (used by headless simulations). */
+        this.ruleProfile = options.ruleProfile || null;
         /** @type {Deck} */
-        this.deck = new Deck();
+        this.deck = new Deck(options.numberOfDecks ?? CONFIG.DECKS, {
+            shuffleMode: options.shuffleMode,
+            random: options.random,
+            inPlaceShuffle: options.inPlaceShuffle,
+            compact: options.compact,
+            countSystem: options.countSystem
+        });
         this.resetState();
     }
 
+    /**
+     * Returns the rule profile in effect for this engine.
+     * @returns {Object}
+     */
+    getRuleProfile() {
+        return this.ruleProfile || getActiveRuleProfile();
+    }
+
+    /**
+     * Running score ({ value, softAces, cardCount }) for a list of cards.
+     * Kept up to date in O(1) as the engine deals; recomputed only when the
+     * array is new or was changed from outside (e.g. tests injecting hands).
+     * @param {Array<Object>} cards - A player hand's cards or the dealer hand.
+     * @returns {{ value: number, softAces: number, cardCount: number }}
+     */
+    getHandScore(cards) {
+        // A round has at most a handful of hands, so a linear scan beats a Map here.
+        const keys = this._scoreKeys;
+        for (let i = 0; i < keys.length; i++) {
+            if (keys[i] === cards) {
+                const score = this._scoreValues[i];
+                if (score.cardCount === cards.length) return score;
+                this._scoreValues[i] = HandUtils.createHandScore(cards);
+                return this._scoreValues[i];
+            }
+        }
+        if (keys.length >= MAX_TRACKED_SCORES) this.clearHandScores();
+        const score = HandUtils.createHandScore(cards);
+        this._scoreKeys.push(cards);
+        this._scoreValues.push(score);
+        return score;
+    }
+
+    /**
+     * Replaces the running score of a card array.
+     * @param {Array<Object>} cards
+     * @param {Object} score
+     */
+    setHandScore(cards, score) {
+        const index = this._scoreKeys.indexOf(cards);
+        if (index === -1) {
+            this._scoreKeys.push(cards);
+            this._scoreValues.push(score);
+        } else {
+            this._scoreValues[index] = score;
+        }
+    }
+
+    /** Forgets all running scores (they are rebuilt on demand). */
+    clearHandScores() {
+        this._scoreKeys = [];
+        this._scoreValues = [];
+    }
+
+    /**
+     * Appends a card to a hand and updates its running score.
+     * @param {Array<Object>} cards
+     * @param {Object} card
+     * @returns {{ value: number, softAces: number, cardCount: number }} Updated score.
+     */
+    addCard(cards, card) {
+        const score = this.getHandScore(cards);
+        cards.push(card);
+        return HandUtils.addCardToScore(score, card);
+    }
+
     /**
      * Resets the game state for a new round.
      */
@@ -23,9 +110,13 @@ export class BlackjackEngine {
         this.dealerHand = [];
         this.currentHandIndex = 0;
         this._dealerRevealed = false;
+        this._holeCardCounted = false;
+        /** @type {number|undefined} deck.shoeId when the hole card was dealt. */
+        this.holeCardShoeId = undefined;
         this.gameStarted = false;
         this.gameOver = false;
         this.insuranceTaken = false;
+        this.clearHandScores();
     }
 
     /**
@@ -33,7 +124,7 @@ export class BlackjackEngine {
      */
     shuffleDeck() {
         this.deck.reset();
-        this.deck.shuffleWithMode(CONFIG.SHUFFLE_MODE);
+        this.deck.shuffleWithMode(this.deck.shuffleMode || CONFIG.SHUFFLE_MODE);
         this.deck.burnCards(CONFIG.BURN_CARDS_AFTER_SHUFFLE);
     }
 
@@ -43,6 +134,8 @@ export class BlackjackEngine {
      * @returns {Object} Initial deal state (hands).
      */
     startGame(bet) {
+        // The previous hole card is turned over when the cards are collected.
+        this.countHoleCard();
         if (this.deck.needsReshuffle) {
             this.shuffleDeck();
         }
@@ -55,7 +148,8 @@ export class BlackjackEngine {
         const p1 = this.deck.draw();
         const d1 = this.deck.draw();
         const p2 = this.deck.draw();
-        const d2 = this.deck.draw(); // Hole card, not counted yet
+        const d2 = this.deck.draw(true); // Hole card, counted when revealed
+        this.holeCardShoeId = this.deck.shoeId;
 
         this.playerHands = [{
             cards: [p1, p2],
@@ -80,9 +174,22 @@ export class BlackjackEngine {
     }
 
     set dealerRevealed(value) {
+        if (value && !this._dealerRevealed) this.countHoleCard();
         this._dealerRevealed = value;
     }
 
+    /**
+     * Counts the dealer's hole card once, when it is turned over. A hole card
+     * dealt before the shoe was reshuffled mid-round belongs to the old count
+     * and is skipped.
+     */
+    countHoleCard() {
+        if (this._holeCardCounted || !this.gameStarted) return;
+        const holeCard = this.dealerHand[1];
+        if (holeCard && this.holeCardShoeId === this.deck.shoeId) this.deck.revealCard(holeCard);
+        this._holeCardCounted = true;
+    }
+
     get dealerUpCard() {
         return this.dealerHand[0];
     }
@@ -97,9 +204,7 @@ export class BlackjackEngine {
         if (!hand || hand.status !== 'playing') return null;
 
         const card = this.deck.draw();
-        hand.cards.push(card);
-
-        const newValue = HandUtils.calculateHandValue(hand.cards);
+        const newValue = this.addCard(hand.cards, card).value;
         if (newValue > 21) {
             hand.status = 'busted';
         } else if (newValue === 21) {
@@ -132,10 +237,10 @@ export class BlackjackEngine {
         const hand = this.playerHands[handIndex];
 
         const card = this.deck.draw();
-        hand.cards.push(card);
+        const score = this.addCard(hand.cards, card);
         hand.bet *= 2;
 
-        if (HandUtils.calculateHandValue(hand.cards) > 21) {
+        if (score.value > 21) {
             hand.status = 'busted';
         } else {
             hand.status = 'stand';
@@ -150,7 +255,7 @@ export class BlackjackEngine {
      * @returns {boolean} True when the hand can double.
      */
     canDouble(handIndex) {
-        const profile = getActiveRuleProfile();
+        const profile = this.getRuleProfile();
         const hand = this.playerHands[handIndex];
         if (!hand || hand.status !== 'playing') return false;
         if (hand.cards.length !== 2) return false;
@@ -160,7 +265,7 @@ export class BlackjackEngine {
 
         if (RULES.DOUBLE_TOTALS !== 'any') {
             const validTotals = Array.isArray(RULES.DOUBLE_TOTALS) ? RULES.DOUBLE_TOTALS : [];
-            const handTotal = HandUtils.calculateHandValue(hand.cards);
+            const handTotal = this.getHandScore(hand.cards).value;
             if (!validTotals.includes(handTotal)) return false;
         }
 
@@ -173,7 +278,7 @@ export class BlackjackEngine {
      * @returns {Object|null} Result object containing split details or null if invalid.
      */
     split(handIndex) {
-        const profile = getActiveRuleProfile();
+        const profile = this.getRuleProfile();
         const hand = this.playerHands[handIndex];
         if (!hand) return null;
 
@@ -200,6 +305,9 @@ export class BlackjackEngine {
 
         hand.cards.push(c1);
         newHand.cards.push(c2);
+        // Both hands now hold two cards: score them from scratch.
+        this.setHandScore(hand.cards, HandUtils.createHandScore(hand.cards));
+        this.setHandScore(newHand.cards, HandUtils.createHandScore(newHand.cards));
 
         hand.splitFromAces = isSplittingAces;
 
@@ -223,7 +331,7 @@ export class BlackjackEngine {
      * @returns {Object|null} Updated hand object.
      */
     surrender(handIndex) {
-        const profile = getActiveRuleProfile();
+        const profile = this.getRuleProfile();
         const hand = this.playerHands[handIndex];
         if (!hand) return null;
 
@@ -242,10 +350,9 @@ export class BlackjackEngine {
      * @returns {boolean} True if dealer should hit.
      */
     dealerShouldHit() {
-        const profile = getActiveRuleProfile();
-        const value = HandUtils.calculateHandValue(this.dealerHand);
-        const isSoft = HandUtils.isSoftHand(this.dealerHand);
-        return (value < 17 || (value === 17 && isSoft && profile.dealerHitsSoft17));
+        const profile = this.getRuleProfile();
+        const { value, softAces } = this.getHandScore(this.dealerHand);
+        return (value < 17 || (value === 17 && softAces > 0 && profile.dealerHitsSoft17));
     }
 
     /**
@@ -255,7 +362,7 @@ export class BlackjackEngine {
     dealerHit() {
         if (this.dealerShouldHit()) {
             const card = this.deck.draw();
-            this.dealerHand.push(card);
+            this.addCard(this.dealerHand, card);
             return card;
         }
         return null;
@@ -266,7 +373,7 @@ export class BlackjackEngine {
      * @returns {Object} Final dealer hand and list of drawn cards.
      */
     dealerTurn() {
-        this.dealerRevealed = true; // Setter handles counting
+        this.dealerRevealed = true; // Setter counts the hole card
         const cardsDrawn = [];
 
         while (this.dealerShouldHit()) {
@@ -285,13 +392,13 @@ export class BlackjackEngine {
      * @returns {Object} Result summary including payouts.
      */
     evaluateResults() {
-        const profile = getActiveRuleProfile();
-        const dealerValue = HandUtils.calculateHandValue(this.dealerHand);
-        const dealerBJ = HandUtils.isNaturalBlackjack(this.dealerHand, 1);
+        const profile = this.getRuleProfile();
+        const dealerValue = this.getHandScore(this.dealerHand).value;
+        const dealerBJ = this.dealerHand.length === 2 && dealerValue === 21;
 
         const results = this.playerHands.map(hand => {
-             const playerValue = HandUtils.calculateHandValue(hand.cards);
-             const playerBJ = HandUtils.isNaturalBlackjack(hand.cards, this.playerHands.length);
+             const playerValue = this.getHandScore(hand.cards).value;
+             const playerBJ = this.playerHands.length === 1 && hand.cards.length === 2 && playerValue === 21;
 
              let result = 'lose';
              let winMultiplier = 0;
@@ -357,7 +464,10 @@ export class BlackjackEngine {
             dealerRevealed: this.dealerRevealed,
             gameStarted: this.gameStarted,
             gameOver: this.gameOver,
+            playerScores: this.playerHands.map((hand) => this.getHandScore(hand.cards)),
+            dealerScore: this.getHandScore(this.dealerHand),
             remainingCards: this.deck.remainingCards,
+            count: this.deck.counter.getState(),
             totalCards: this.deck.totalCards
         };
     }
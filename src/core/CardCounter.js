@@ -0,0 +1,130 @@
+import { RANK_INDEX, RANK_HILO } from '../utils/CardCodes.js';
+
+/**
+ * Card counting systems as per-rank tag tables (index 0 = Ace ... 12 = King,
+ * same order as CardCodes.RANKS).
+ *
+ * `initialRunningCount(decks)` is the running count right after a shuffle:
+ * zero for balanced systems, the conventional pivot offset for KO.
+ */
+export const COUNT_SYSTEMS = Object.freeze({
+    hilo: Object.freeze({
+        name: 'Hi-Lo',
+        balanced: true,
+        tags: RANK_HILO,
+        initialRunningCount: () => 0
+    }),
+    ko: Object.freeze({
+        name: 'KO',
+        balanced: false,
+        tags: Int8Array.from([-1, 1, 1, 1, 1, 1, 1, 0, 0, -1, -1, -1, -1]),
+        initialRunningCount: (decks) => -4 * (decks - 1)
+    }),
+    omega2: Object.freeze({
+        name: 'Omega II',
+        balanced: true,
+        tags: Int8Array.from([0, 1, 1, 2, 2, 2, 1, 0, -1, -2, -2, -2, -2]),
+        initialRunningCount: () => 0
+    })
+});
+
+export const DEFAULT_COUNT_SYSTEM = 'hilo';
+
+/**
+ * Tracks the running count, true count and unseen cards per rank for one shoe.
+ * Every update is O(1); Deck feeds it face-up cards as they are drawn and
+ * BlackjackEngine feeds it the hole card when it is turned over.
+ */
+export class CardCounter {
+    /**
+     * @param {number} numberOfDecks - Decks in the shoe.
+     * @param {string} [system] - Key of COUNT_SYSTEMS. Unknown keys fall back to Hi-Lo.
+     */
+    constructor(numberOfDecks, system = DEFAULT_COUNT_SYSTEM) {
+        this.numberOfDecks = numberOfDecks;
+        this.remainingByRank = new Uint16Array(13);
+        this.setSystem(system);
+    }
+
+    /**
+     * Switches the counting system and restarts the count for a fresh shoe.
+     * @param {string} system - Key of COUNT_SYSTEMS.
+     */
+    setSystem(system) {
+        this.systemKey = COUNT_SYSTEMS[system] ? system : DEFAULT_COUNT_SYSTEM;
+        this.system = COUNT_SYSTEMS[this.systemKey];
+        this.tags = this.system.tags;
+        this.reset();
+    }
+
+    /**
+     * Restarts the count for a freshly shuffled shoe.
+     */
+    reset() {
+        this.runningCount = this.system.initialRunningCount(this.numberOfDecks);
+        this.cardsSeen = 0;
+        this.unseenCards = this.numberOfDecks * 52;
+        this.remainingByRank.fill(this.numberOfDecks * 4);
+    }
+
+    /**
+     * Counts a card by rank index.
+     * @param {number} rank - 0 (Ace) to 12 (King).
+     */
+    countRank(rank) {
+        this.runningCount += this.tags[rank];
+        this.cardsSeen++;
+        this.unseenCards--;
+        // Unsigned: never wrap around if more cards of a rank are counted than the shoe holds.
+        if (this.remainingByRank[rank] > 0) this.remainingByRank[rank]--;
+    }
+
+    /**
+     * Counts a card code (see CardCodes).
+     * @param {number} code
+     */
+    countCode(code) {
+        this.countRank(code >> 2);
+    }
+
+    /**
+     * Counts a {suit, value} card. Unknown ranks are ignored.
+     * @param {Object} card
+     */
+    countCard(card) {
+        const rank = card ? RANK_INDEX[card.value] : undefined;
+        if (rank !== undefined) this.countRank(rank);
+    }
+
+    /**
+     * Decks not yet seen (shoe, burned cards and an unrevealed hole card).
+     * @returns {number}
+     */
+    get decksRemaining() {
+        return this.unseenCards / 52;
+    }
+
+    /**
+     * Running count divided by the decks remaining.
+     * @returns {number}
+     */
+    get trueCount() {
+        return this.unseenCards > 0 ? (this.runningCount * 52) / this.unseenCards : this.runningCount;
+    }
+
+    /**
+     * Plain snapshot for state objects and the UI.
+     * @returns {{ system: string, runningCount: number, trueCount: number,
+     *   decksRemaining: number, cardsSeen: number, remainingByRank: Array<number> }}
+     */
+    getState() {
+        return {
+            system: this.systemKey,
+            runningCount: this.runningCount,
+            trueCount: this.trueCount,
+            decksRemaining: this.decksRemaining,
+            cardsSeen: this.cardsSeen,
+            remainingByRank: Array.from(this.remainingByRank)
+        };
+    }
+}
@@ -2,6 +2,8 @@ export const STORAGE_KEYS = {
     GAME_SAVE: 'blackjack-premium-save',
     SETTINGS: 'blackjack-premium-settings',
     HAND_HISTORY: 'blackjack-premium-history',
+    STATS_SYNC: 'blackjack-premium-sync',
+    PERF_TRACE: 'blackjack-premium-perf', // '1' turns on perf tracing and the overlay (set via ?perf=1)
 };
 
 export const CONFIG = {
@@ -15,9 +17,22 @@ export const CONFIG = {
     MAX_SPLITS: 3, // Maximum number of splits allowed (standard casino rule)
     FIVE_CARD_CHARLIE: false, // Set to true to enable 5-Card Charlie rule
     ANIMATION_SPEED: 500,
+    TURBO_SPEED: 4, // Round delays are divided by this in turbo mode
+    OFFSCREEN_CANVAS: true, // Draw confetti and stats charts in a worker when OffscreenCanvas is available
     STORAGE_VERSION: 3, // Data version for migration support
     HAND_HISTORY_MAX_ENTRIES: 50,
-    HAND_HISTORY_DISPLAY_COUNT: 10,
+    HISTORY_ROW_HEIGHT: 32, // px, fixed row height of the virtualized history list
+    AUTOPLAY: {
+        CHUNK_SIZE: 200, // Hands played between yields to the event loop
+        MAX_HANDS: 100000
+    },
+    SAVE: {
+        COALESCE_MS: 1000, // Saves requested within this window are written once
+        IDLE_TIMEOUT_MS: 500, // Upper bound for waiting on idle time before encoding
+        RETRY_BASE_MS: 1000,
+        RETRY_MAX_MS: 30000,
+        MAX_ATTEMPTS: 4
+    },
     PAYOUT: {
         BLACKJACK: 2.5, // 3:2 payout on original bet (1.5 + 1) -> 2.5x total return logic
         REGULAR: 2.0,
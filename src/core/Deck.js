@@ -1,6 +1,8 @@
 import { CONFIG } from './Constants.js';
-import { Shuffler } from './Shuffler.js';
+import { Shuffler, ShuffleWorkspace } from './Shuffler.js';
 import { getRandomInt } from '../utils/RandomUtils.js';
+import { makeCardCode, decodeCard, RANK_INDEX } from '../utils/CardCodes.js';
+import { CardCounter } from './CardCounter.js';
 
 /**
  * Represents a shoe of playing cards.
@@ -10,13 +12,39 @@ export class Deck {
     /**
      * Creates a new Deck.
      * @param {number} numberOfDecks - Number of standard 52-card decks to include.
+     * @param {Object} [options]
+     * @param {string} [options.shuffleMode] - Fixed shuffle mode. Defaults to CONFIG.SHUFFLE_MODE.
+     * @param {Object} [options.random] - Random source (see RandomUtils). Defaults to crypto.
+     * @param {boolean} [options.inPlaceShuffle] - Casino shuffles reorder the shoe in place
+     *   through a reusable ShuffleWorkspace instead of building intermediate arrays.
+     * @param {boolean} [options.compact] - Keep the shoe as card codes in a Uint8Array
+     *   (see CardCodes). draw() still returns {suit, value} objects; drawCode() returns codes.
+     *   `cards` is not used in this mode.
+     * @param {string} [options.countSystem] - Count system for `counter` (see CardCounter).
      */
-    constructor(numberOfDecks = CONFIG.DECKS) {
+    constructor(numberOfDecks = CONFIG.DECKS, options = {}) {
         this.numberOfDecks = numberOfDecks;
+        this.shuffleMode = options.shuffleMode || null;
+        this.random = options.random || null;
+        this.inPlaceShuffle = !!options.inPlaceShuffle;
+        this.shuffleWorkspace = null;
+        this.compact = !!options.compact;
+        this.codes = null;
+        this.top = 0;
         this.cards = [];
         this.cutCardReached = false;
+        /** @type {CardCounter} Count of the face-up cards dealt since the last reset. */
+        this.counter = new CardCounter(numberOfDecks, options.countSystem);
+        /** @type {number} Bumped by every reset(), so callers can tell a new shoe apart. */
+        this.shoeId = 0;
+        /**
+         * Called with the StrategyEV rank index (see getComposition) of every card
+         * that becomes visible: face-up draws and revealed hole cards.
+         * @type {?Function}
+         */
+        this.onCardSeen = null;
         this.reset();
-        this.shuffleWithMode(CONFIG.SHUFFLE_MODE);
+        this.shuffleWithMode(this.shuffleMode || CONFIG.SHUFFLE_MODE);
     }
 
     /**
@@ -35,21 +63,45 @@ export class Deck {
         const values = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K'];
         this.cards = [];
 
-        for (let i = 0; i < this.numberOfDecks; i++) {
-            for (const suit of suits) {
-                for (const value of values) {
-                    this.cards.push({ suit, value });
+        if (this.compact) {
+            this.resetCodes();
+        } else {
+            for (let i = 0; i < this.numberOfDecks; i++) {
+                for (const suit of suits) {
+                    for (const value of values) {
+                        this.cards.push({ suit, value });
+                    }
                 }
             }
         }
 
         this.cutCardReached = false;
+        this.counter.reset();
+        this.shoeId++;
 
         const minReserved = Math.floor(this.totalCards * CONFIG.PENETRATION_THRESHOLD);
         const maxReserved = Math.floor(this.totalCards * CONFIG.PENETRATION_THRESHOLD * 2);
 
         // We want cutCardPosition to represent the number of cards *remaining* when we cut.
-        this.cutCardPosition = minReserved + getRandomInt(maxReserved - minReserved);
+        this.cutCardPosition = minReserved + getRandomInt(maxReserved - minReserved, this.random);
+    }
+
+    /**
+     * Refills the compact shoe in the same order reset() builds card objects.
+     */
+    resetCodes() {
+        if (!this.codes || this.codes.length !== this.totalCards) {
+            this.codes = new Uint8Array(this.totalCards);
+        }
+        let i = 0;
+        for (let d = 0; d < this.numberOfDecks; d++) {
+            for (let suit = 0; suit < 4; suit++) {
+                for (let rank = 0; rank < 13; rank++) {
+                    this.codes[i++] = makeCardCode(rank, suit);
+                }
+            }
+        }
+        this.top = this.codes.length;
     }
 
     /**
@@ -57,7 +109,24 @@ export class Deck {
      * @returns {number}
      */
     get remainingCards() {
-        return this.cards.length;
+        return this.compact ? this.top : this.cards.length;
+    }
+
+    /**
+     * Remaining cards per rank, in StrategyEV order: [A, 2, ..., 9, ten-valued].
+     * @returns {Array<number>}
+     */
+    getComposition() {
+        const counts = new Array(10).fill(0);
+        if (this.compact) {
+            for (let i = 0; i < this.top; i++) counts[Math.min(9, this.codes[i] >> 2)]++;
+            return counts;
+        }
+        for (const card of this.cards) {
+            const rank = card ? RANK_INDEX[card.value] : undefined;
+            if (rank !== undefined) counts[Math.min(9, rank)]++;
+        }
+        return counts;
     }
 
     /**
@@ -73,7 +142,11 @@ export class Deck {
      * Uses `crypto.getRandomValues` if available for better randomness.
      */
     shuffle() {
-        this.cards = Shuffler.fisherYates(this.cards);
+        if (this.compact) {
+            Shuffler.fisherYatesInPlace(this.codes.subarray(0, this.top), this.random);
+            return;
+        }
+        this.cards = Shuffler.fisherYates(this.cards, this.random);
     }
 
     /**
@@ -82,7 +155,18 @@ export class Deck {
      * @param {number} passes - Number of riffle passes.
      */
     shuffleCasino(passes = CONFIG.CASINO_SHUFFLE_PASSES) {
-        this.cards = Shuffler.casinoShuffle(this.cards, passes);
+        if (this.compact) {
+            if (!this.shuffleWorkspace) this.shuffleWorkspace = new ShuffleWorkspace(this.totalCards);
+            const remaining = this.codes.subarray(0, this.top);
+            Shuffler.casinoShuffleInPlace(remaining, passes, this.random, this.shuffleWorkspace);
+            return;
+        }
+        if (this.inPlaceShuffle) {
+            if (!this.shuffleWorkspace) this.shuffleWorkspace = new ShuffleWorkspace(this.totalCards);
+            Shuffler.casinoShuffleInPlace(this.cards, passes, this.random, this.shuffleWorkspace);
+            return;
+        }
+        this.cards = Shuffler.casinoShuffle(this.cards, passes, this.random);
     }
 
     /**
@@ -105,7 +189,11 @@ export class Deck {
      */
     burnCards(count = CONFIG.BURN_CARDS_AFTER_SHUFFLE) {
         const safeCount = Math.max(0, Number.isFinite(count) ? Math.floor(count) : 0);
-        const burnCount = Math.min(safeCount, this.cards.length);
+        const burnCount = Math.min(safeCount, this.remainingCards);
+        if (this.compact) {
+            this.top -= burnCount;
+            return burnCount;
+        }
         for (let i = 0; i < burnCount; i++) {
             this.cards.pop();
         }
@@ -115,20 +203,72 @@ export class Deck {
     /**
      * Draws a card from the top of the deck.
      * Reshuffles if empty. Updates cut card status.
+     * @param {boolean} [faceDown] - Leave the card out of the count (e.g. the dealer's
+     *   hole card); count it with revealCard() once it is turned over.
      * @returns {Object} The drawn card {suit, value}.
      */
-    draw() {
-        if (this.cards.length === 0) {
+    draw(faceDown = false) {
+        this.prepareDraw();
+        if (this.compact) {
+            const code = this.codes[--this.top];
+            if (!faceDown) this.seeRank(code >> 2);
+            return decodeCard(code);
+        }
+        const card = this.cards.pop();
+        if (!faceDown) this.seeCard(card);
+        return card;
+    }
+
+    /**
+     * Counts a card that was drawn face down and has now been revealed.
+     * @param {Object} card
+     */
+    revealCard(card) {
+        this.seeCard(card);
+    }
+
+    /**
+     * Counts a visible {suit, value} card. Unknown ranks are ignored.
+     * @param {Object} card
+     */
+    seeCard(card) {
+        const rank = card ? RANK_INDEX[card.value] : undefined;
+        if (rank !== undefined) this.seeRank(rank);
+    }
+
+    /**
+     * Counts a visible card by rank index and reports it to onCardSeen.
+     * @param {number} rank - 0 (Ace) to 12 (King).
+     */
+    seeRank(rank) {
+        this.counter.countRank(rank);
+        if (this.onCardSeen) this.onCardSeen(Math.min(9, rank));
+    }
+
+    /**
+     * Draws the top card of a compact shoe as a card code and counts it.
+     * @returns {number}
+     */
+    drawCode() {
+        this.prepareDraw();
+        const code = this.codes[--this.top];
+        this.seeRank(code >> 2);
+        return code;
+    }
+
+    /**
+     * Reshuffles an empty shoe and updates the cut card status before a draw.
+     */
+    prepareDraw() {
+        if (this.remainingCards === 0) {
             this.reset();
-            this.shuffleWithMode(CONFIG.SHUFFLE_MODE);
+            this.shuffleWithMode(this.shuffleMode || CONFIG.SHUFFLE_MODE);
             this.burnCards(CONFIG.BURN_CARDS_AFTER_SHUFFLE);
         }
 
         // Check if cut card was reached during play (including the card being drawn now)
-        if (this.cards.length <= this.cutCardPosition + 1) {
+        if (this.remainingCards <= this.cutCardPosition + 1) {
             this.cutCardReached = true;
         }
-
-        return this.cards.pop();
     }
 }
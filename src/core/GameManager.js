@@ -1,14 +1,17 @@
 import { BlackjackEngine } from './BlackjackEngine.js';
 import { ARCHITECTURE_FLAGS, CONFIG, RULES, getActiveRuleProfile } from './Constants.js';
-import { debounce } from '../utils/debounce.js';
 import { EventEmitter } from '../utils/EventEmitter.js';
 import { supabase } from '../supabaseClient.js';
 import { AuthService } from './services/AuthService.js';
 import { PersistenceService } from './services/PersistenceService.js';
 import { RoundController } from './services/RoundController.js';
+import { AutoPlayer } from './services/AutoPlayer.js';
+import { RealTimeScheduler } from './services/TimerScheduler.js';
 import { HandHistory } from '../utils/HandHistory.js';
-import { evaluatePlayerAction } from '../utils/BasicStrategy.js';
-import { computeAdvancedStats } from '../utils/AdvancedStats.js';
+import { instrumentMethods } from '../utils/PerfTracer.js';
+import { evaluatePlayerAction, evaluateActionWithEVs } from '../utils/BasicStrategy.js';
+import { CompositionSolver } from '../utils/CompositionSolver.js';
+import { AdvancedStatsAggregator } from '../utils/AdvancedStats.js';
 import { validateImportedGameData, mapImportErrorToUiMessage } from '../utils/importValidation.js';
 
 export class GameManager {
@@ -29,20 +32,36 @@ export class GameManager {
         this.soundManager = soundManager;
 
         this.engine = new BlackjackEngine();
+        // Only the table's engine is traced; Simulator engines stay unwrapped.
+        instrumentMethods(this.engine, 'BlackjackEngine', [
+            'startGame', 'hit', 'stand', 'double', 'split', 'surrender',
+            'dealerHit', 'evaluateResults', 'shuffleDeck', 'getState'
+        ]);
         this.username = null;
         this.userId = null; // Store User UID
 
+        // Advanced stats follow each finished hand instead of rescanning history;
+        // history is replayed only when it is replaced (see createHandHistory()).
+        this.advancedStats = new AdvancedStatsAggregator();
+        this.events.on('hand:completed', (entry) => this.advancedStats.add(entry));
+
+        // Perfect-play solver, created on first use and kept in step with this
+        // deck's shoe (see _evaluatePerfectPlay()).
+        this.compositionSolver = null;
+        this._solverDeck = null;
+        this._solverShoeId = null;
+
+        // Round pacing timers (see TimerScheduler); turbo mode speeds them up.
+        this.scheduler = new RealTimeScheduler();
+
         this.initializeGameState();
         this.initializeSettings();
 
-        // Timeouts management
-        this.timeouts = [];
-
         this.authService = new AuthService(this, supabase);
         this.persistenceService = new PersistenceService(this, supabase);
         this.roundController = new RoundController(this);
+        this.autoPlayer = new AutoPlayer(this);
 
-        this.saveGame = debounce(this._saveGameImmediate.bind(this), 1000);
         this.authService.setupAuthListener();
     }
 
@@ -94,14 +113,27 @@ export class GameManager {
     }
 
     addTimeout(fn, delay) {
-        const id = setTimeout(fn, delay);
-        this.timeouts.push(id);
-        return id;
+        return this.scheduler.setTimeout(fn, delay);
     }
 
     clearTimeouts() {
-        this.timeouts.forEach(id => clearTimeout(id));
-        this.timeouts = [];
+        this.scheduler.clearAll();
+    }
+
+    /**
+     * Swaps the timer scheduler, e.g. for a VirtualScheduler in tests and
+     * simulations. Pending timers of the old scheduler are dropped.
+     * @param {Object} scheduler - RealTimeScheduler, VirtualScheduler or compatible.
+     */
+    setScheduler(scheduler) {
+        this.clearTimeouts();
+        this.scheduler = scheduler;
+        this.applyTurboMode();
+    }
+
+    /** Applies the turboMode setting to the scheduler. */
+    applyTurboMode() {
+        this.scheduler.setSpeed(this.settings?.turboMode ? CONFIG.TURBO_SPEED : 1);
     }
 
     initializeGameState() {
@@ -118,12 +150,7 @@ export class GameManager {
         this.sessionWorstBalance = CONFIG.INITIAL_BALANCE;
 
         // Hand history
-        this.handHistory = new HandHistory(
-            CONFIG.HAND_HISTORY_MAX_ENTRIES,
-            (message, level = 'error') => {
-                if (this.ui) this.ui.showToast(message, level);
-            }
-        );
+        this.handHistory = this.createHandHistory();
         this.handCounter = 0;
 
         // Training mode state
@@ -131,7 +158,6 @@ export class GameManager {
         this.currentHandActions = [];
 
         this.engine.resetState();
-        this.timeouts = [];
     }
 
     initializeSettings() {
@@ -143,6 +169,8 @@ export class GameManager {
             volume: 0.5,
             theme: 'dark',
             trainingMode: false,
+            perfectPlay: false,
+            turboMode: false,
         };
     }
 
@@ -156,15 +184,20 @@ export class GameManager {
             blackjacks: this.blackjacks,
             totalWinnings: this.totalWinnings,
             playerHands: engineState.playerHands,
+            playerScores: engineState.playerScores,
             currentHandIndex: engineState.currentHandIndex,
             dealerHand: engineState.dealerHand,
+            dealerScore: engineState.dealerScore,
             dealerRevealed: engineState.dealerRevealed,
+            remainingCards: engineState.remainingCards,
+            totalCards: engineState.totalCards,
+            count: engineState.count,
             gameOver: engineState.gameOver,
             gameStarted: engineState.gameStarted,
             settings: this.settings,
             activeRuleProfile: RULES.ACTIVE_PROFILE,
             trainingMode: this.trainingMode,
-            handHistoryCount: this.handHistory.entries.length,
+            handHistoryCount: this.handHistory.store.size,
         };
     }
 
@@ -180,6 +213,15 @@ export class GameManager {
         }
     }
 
+    /**
+     * Queues a coalesced save (see SaveScheduler).
+     */
+    saveGame() {
+        if (ARCHITECTURE_FLAGS.enablePersistenceService) {
+            return this.persistenceService.scheduleSave();
+        }
+    }
+
     _saveGameImmediate() {
         if (ARCHITECTURE_FLAGS.enablePersistenceService) {
             return this.persistenceService._saveGameImmediate();
@@ -223,12 +265,12 @@ export class GameManager {
         }
     }
 
+    /**
+     * Requests a UI render. Calls are coalesced into one render per animation
+     * frame, which reads the state once (see RenderScheduler).
+     */
     updateUI() {
-        if (this.ui) {
-            this.ui.render(this.getState());
-            const state = this.engine.getState();
-            this.ui.updateShoeIndicator(state.remainingCards, state.totalCards);
-        }
+        if (this.ui) this.ui.requestRender(() => this.getState());
     }
 
     // Game Actions
@@ -261,6 +303,7 @@ export class GameManager {
     }
 
     startGame() {
+        if (this.autoPlayer.running) return;
         if (ARCHITECTURE_FLAGS.enableRoundController) {
             return this.roundController.startGame();
         }
@@ -351,11 +394,36 @@ export class GameManager {
     }
 
     /**
-     * Returns advanced statistics computed from hand history.
+     * Loads the next page of older hands into the history (history panel scrolling).
+     * @returns {Promise<boolean>} Whether more pages remain.
+     */
+    loadOlderHands() {
+        return this.persistenceService.loadOlderHands();
+    }
+
+    /**
+     * Creates an empty hand history whose loads and clears are replayed into
+     * the advanced stats as they happen, and resets the all-time stats.
+     * @returns {HandHistory}
+     */
+    createHandHistory() {
+        const history = new HandHistory(
+            CONFIG.HAND_HISTORY_MAX_ENTRIES,
+            (message, level = 'error') => {
+                if (this.ui) this.ui.showToast(message, level);
+            }
+        );
+        history.onReplaced = () => this.advancedStats.rebuild(history.getHistory(), { newestFirst: true });
+        this.advancedStats.reset();
+        return history;
+    }
+
+    /**
+     * Returns advanced statistics, maintained incrementally from hand:completed.
      * @returns {Object}
      */
     getAdvancedStats() {
-        return computeAdvancedStats(this.handHistory.getHistory(), {
+        return this.advancedStats.getStats({
             wins: this.wins,
             losses: this.losses,
             blackjacks: this.blackjacks,
@@ -379,13 +447,69 @@ export class GameManager {
         if (!dealerUpCard) return;
         const profile = getActiveRuleProfile();
         const canSplit = this.engine.playerHands.length <= CONFIG.MAX_SPLITS && hand.cards.length === 2;
-        const evaluation = evaluatePlayerAction(action, hand.cards, dealerUpCard, profile, canSplit);
+        const available = {
+            canDouble: this.engine.canDouble(this.engine.currentHandIndex),
+            canSurrender: profile.surrenderType !== 'none' &&
+                this.engine.playerHands.length === 1 && hand.cards.length === 2
+        };
+        const evaluation = (this.settings.perfectPlay &&
+            this._evaluatePerfectPlay(action, hand, dealerUpCard, profile, canSplit, available)) ||
+            evaluatePlayerAction(action, hand.cards, dealerUpCard, profile, canSplit, available);
         this.events.emit('training:feedback', { evaluation, action });
     }
 
+    /**
+     * Composition-dependent evaluation against the cards actually left in the shoe.
+     * The dealer's hole card is still unseen from the player's point of view, so
+     * it is counted as part of the shoe until revealed.
+     * The composition is read from the deck once per shoe; after that the deck's
+     * onCardSeen hook removes each card from the solver as it is turned face up.
+     * @returns {Object|null} Evaluation, or null when the solver cannot answer.
+     */
+    _evaluatePerfectPlay(action, hand, dealerUpCard, profile, canSplit, available) {
+        if (!this.compositionSolver) this.compositionSolver = new CompositionSolver();
+        const solver = this.compositionSolver;
+        const deck = this.engine.deck;
+        if (this._solverDeck !== deck || this._solverShoeId !== deck.shoeId) {
+            solver.setComposition(deck.getComposition());
+            const holeCard = this.engine.dealerHand[1];
+            if (holeCard && !this.engine.dealerRevealed && this.engine.holeCardShoeId === deck.shoeId) {
+                solver.addCard(holeCard);
+            }
+            if (this._solverDeck && this._solverDeck !== deck) this._solverDeck.onCardSeen = null;
+            deck.onCardSeen = (rank) => solver.removeCard(rank);
+            this._solverDeck = deck;
+            this._solverShoeId = deck.shoeId;
+        }
+
+        const solution = solver.solve(hand.cards, dealerUpCard, profile, { canSplit, ...available });
+        if (!solution || !solution.bestAction) return null;
+        return evaluateActionWithEVs(action, solution.evByAction, solution.bestAction);
+    }
+
+    /**
+     * Plays a batch of hands with basic strategy, without rendering, sound or
+     * per-hand saves (see AutoPlayer). Not available during a round.
+     * @param {Object} options - See AutoPlayer.run(): hands, bet, flushEvery.
+     * @returns {Promise<Object|null>} The batch summary, or null if it did not start.
+     */
+    async autoPlay(options) {
+        if (this.autoPlayer.running) return null;
+        if (this.engine.gameStarted && !this.engine.gameOver) {
+            if (this.ui) this.ui.showToast('Termine a rodada atual antes do auto-jogo.', 'error', 2000);
+            return null;
+        }
+        return this.autoPlayer.run(options);
+    }
+
+    cancelAutoPlay() {
+        this.autoPlayer.cancel();
+    }
+
     // resetGame, newGame, exportData, importData, updateSetting match original structure but use engine
 
     resetGame() {
+        if (this.autoPlayer.running) return;
         this.clearTimeouts();
         this.balance = CONFIG.INITIAL_BALANCE;
         this.wins = 0;
@@ -395,13 +519,11 @@ export class GameManager {
         this.totalAmountWagered = 0;
         this.sessionBestBalance = CONFIG.INITIAL_BALANCE;
         this.sessionWorstBalance = CONFIG.INITIAL_BALANCE;
-        this.handHistory = new HandHistory(
-            CONFIG.HAND_HISTORY_MAX_ENTRIES,
-            (message, level = 'error') => {
-                if (this.ui) this.ui.showToast(message, level);
-            }
-        );
+        this.handHistory = this.createHandHistory();
         this.handCounter = 0;
+        this.advancedStats.startSession();
+        this.persistenceService.onGameReset();
+        this.events.emit('history:changed');
         // Reset the shoe (deck)
         if (this.engine && this.engine.deck) {
             this.engine.deck.reset();
@@ -415,6 +537,7 @@ export class GameManager {
     }
 
     newGame() {
+        if (this.autoPlayer.running) return;
         this.clearTimeouts();
         this.engine.resetState();
         if (this.currentBet > this.balance) {
@@ -429,6 +552,7 @@ export class GameManager {
     }
 
     rebetAndDeal() {
+        if (this.autoPlayer.running) return;
         this.clearTimeouts();
         this.engine.resetState();
         if (this.currentBet > this.balance) {
@@ -498,6 +622,7 @@ export class GameManager {
                     this.ui.setTheme(this.settings.theme);
                 }
                 this.trainingMode = !!this.settings.trainingMode;
+                this.applyTurboMode();
 
                 this.newGame();
                 this.saveGame();
@@ -524,6 +649,7 @@ export class GameManager {
                 if (key === 'theme') this.ui.setTheme(value);
             }
             if (key === 'trainingMode') this.trainingMode = !!value;
+            if (key === 'turboMode') this.applyTurboMode();
             this.saveSettings();
         }
     }
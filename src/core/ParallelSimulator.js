@@ -0,0 +1,168 @@
+import {
+    createSimulationTotals,
+    mergeSimulationTotals,
+    summarizeSimulation,
+    runSimulationShard
+} from './Simulator.js';
+import { deriveSeed, normalizeSeed } from '../utils/RandomUtils.js';
+
+/**
+ * Parallel simulation runner.
+ *
+ * A run is cut into fixed-size shards, each with its own shoe seeded from
+ * deriveSeed(masterSeed, shardIndex). Workers pull shards from a queue and
+ * return integer totals, which are merged. Because the shard plan depends only
+ * on (hands, shardSize, seed), the merged report is identical for any number
+ * of workers, including the in-process path (workers <= 1).
+ *
+ * Uses `worker_threads` under Node and module Web Workers in the browser.
+ */
+
+export const DEFAULT_SHARD_SIZE = 50000;
+
+const WORKER_URL = new URL('./simulationWorker.js', import.meta.url);
+
+/**
+ * Splits a run into deterministic shards.
+ * @param {Object} options
+ * @param {number} options.hands - Total rounds.
+ * @param {number|string} options.seed - Master seed.
+ * @param {number} [options.shardSize]
+ * @returns {Array<{ index: number, rounds: number, seed: number }>}
+ */
+export function planShards({ hands, seed, shardSize = DEFAULT_SHARD_SIZE }) {
+    const size = Math.max(1, Math.floor(shardSize));
+    const shards = [];
+    let remaining = Math.max(0, Math.floor(hands));
+    let index = 0;
+    while (remaining > 0) {
+        const rounds = Math.min(size, remaining);
+        shards.push({ index, rounds, seed: deriveSeed(seed, index) });
+        remaining -= rounds;
+        index++;
+    }
+    return shards;
+}
+
+function isNode() {
+    return typeof globalThis.process !== 'undefined' && !!globalThis.process.versions?.node;
+}
+
+/**
+ * Best guess at available cores.
+ * @returns {Promise<number>}
+ */
+export async function getDefaultConcurrency() {
+    if (isNode()) {
+        const os = await import('node:os');
+        return typeof os.availableParallelism === 'function' ? os.availableParallelism() : os.cpus().length;
+    }
+    return globalThis.navigator?.hardwareConcurrency || 4;
+}
+
+/**
+ * Wraps a Node or browser worker behind one small interface.
+ * @returns {Promise<{ run: Function, terminate: Function }>}
+ */
+async function spawnWorker() {
+    let post;
+    let terminate;
+    let pending = null;
+
+    const settle = (data) => {
+        const current = pending;
+        pending = null;
+        if (!current) return;
+        if (data && data.error) current.reject(new Error(data.error));
+        else current.resolve(data.totals);
+    };
+    const fail = (err) => {
+        const current = pending;
+        pending = null;
+        if (current) current.reject(err instanceof Error ? err : new Error(String(err?.message || err)));
+    };
+
+    if (isNode()) {
+        const { Worker } = await import('node:worker_threads');
+        const worker = new Worker(WORKER_URL);
+        worker.on('message', settle);
+        worker.on('error', fail);
+        post = (msg) => worker.postMessage(msg);
+        terminate = () => worker.terminate();
+    } else if (typeof globalThis.Worker === 'function') {
+        const worker = new globalThis.Worker(WORKER_URL, { type: 'module' });
+        worker.onmessage = (e) => settle(e.data);
+        worker.onerror = fail;
+        post = (msg) => worker.postMessage(msg);
+        terminate = () => worker.terminate();
+    } else {
+        throw new Error('No worker implementation available');
+    }
+
+    return {
+        run(shard) {
+            return new Promise((resolve, reject) => {
+                pending = { resolve, reject };
+                post(shard);
+            });
+        },
+        terminate
+    };
+}
+
+/**
+ * Runs a seeded simulation split across workers and merges the partial totals.
+ * @param {Object} options - Simulator options (ruleProfile, decks, bet, shuffleMode),
+ *   plus `hands`, `seed`, `workers`, `shardSize` and a policy *name* (default 'basic').
+ * @returns {Promise<Object>} Report (see summarizeSimulation) with timing and shard info.
+ */
+export async function runParallelSimulation(options = {}) {
+    const {
+        hands = 1000000,
+        seed = Date.now(),
+        shardSize = DEFAULT_SHARD_SIZE,
+        workers,
+        policy = 'basic',
+        ...simOptions
+    } = options;
+
+    if (typeof policy !== 'string') {
+        throw new Error('Parallel simulations need a named policy (see SIMULATION_POLICIES)');
+    }
+
+    const masterSeed = normalizeSeed(seed);
+    const shards = planShards({ hands, seed: masterSeed, shardSize })
+        .map((shard) => ({ ...simOptions, ...shard, policy }));
+    const workerCount = Math.min(shards.length, Math.max(1, workers ?? await getDefaultConcurrency()));
+    const bet = simOptions.bet ?? 100;
+    const partials = new Array(shards.length);
+    const start = performance.now();
+
+    if (workerCount <= 1) {
+        shards.forEach((shard) => { partials[shard.index] = runSimulationShard(shard); });
+    } else {
+        const pool = await Promise.all(Array.from({ length: workerCount }, () => spawnWorker()));
+        let next = 0;
+        try {
+            await Promise.all(pool.map(async (worker) => {
+                while (next < shards.length) {
+                    const shard = shards[next++];
+                    partials[shard.index] = await worker.run(shard);
+                }
+            }));
+        } finally {
+            pool.forEach((worker) => worker.terminate());
+        }
+    }
+
+    // Merge in shard order so the result never depends on scheduling.
+    const totals = partials.reduce(mergeSimulationTotals, createSimulationTotals());
+    const elapsedMs = performance.now() - start;
+    const report = summarizeSimulation(totals, bet);
+    report.seed = masterSeed;
+    report.shards = shards.length;
+    report.workers = workerCount;
+    report.elapsedMs = elapsedMs;
+    report.roundsPerSecond = elapsedMs > 0 ? (report.rounds * 1000) / elapsedMs : 0;
+    return report;
+}
@@ -1,6 +1,56 @@
-import { getRandomInt } from '../utils/RandomUtils.js';
+import { getRandomInt, fillRandomInts, pooledRandom } from '../utils/RandomUtils.js';
 import { CONFIG } from './Constants.js';
 
+/**
+ * Without an injected source the shufflers draw from the shared crypto pool,
+ * so a whole shoe costs a handful of crypto calls instead of thousands.
+ */
+function sourceOf(random) {
+    return random || pooledRandom;
+}
+
+/**
+ * Preallocated buffers for Shuffler.casinoShuffleInPlace.
+ * Sized for one shoe; reuse the same workspace for every shuffle of that shoe
+ * so steady-state shuffling allocates nothing.
+ */
+export class ShuffleWorkspace {
+    /**
+     * @param {number} [size] - Number of cards in the shoe.
+     */
+    constructor(size = 0) {
+        this.size = -1;
+        this.resize(size);
+    }
+
+    /**
+     * Reallocates the buffers if the shoe size changed.
+     * @param {number} size
+     */
+    resize(size) {
+        if (size === this.size) return;
+        this.size = size;
+        // Card positions, as indices into the original order.
+        this.order = new Uint32Array(size);
+        this.scratch = new Uint32Array(size);
+        // Bounds n, n-1, ..., 2: Fisher-Yates and the riffle interleave both
+        // need exactly this sequence of upper bounds.
+        this.maxes = new Uint32Array(Math.max(0, size - 1));
+        for (let k = 0; k < this.maxes.length; k++) this.maxes[k] = size - k;
+        this.draws = new Uint32Array(this.maxes.length);
+        this.packetMaxes = new Uint32Array(Math.ceil(size / 2)).fill(4);
+        this.packetDraws = new Uint32Array(this.packetMaxes.length);
+        this.cards = new Array(size);
+    }
+
+    /** Swaps the order and scratch buffers after a step has written to scratch. */
+    swap() {
+        const tmp = this.order;
+        this.order = this.scratch;
+        this.scratch = tmp;
+    }
+}
+
 /**
  * Shuffler class provides various card shuffling algorithms.
  */
@@ -8,67 +58,92 @@ export class Shuffler {
     /**
      * Performs a Fisher-Yates shuffle (unbiased random permutation).
      * @param {Array} cards - The array of cards to shuffle.
+     * @param {Object|null} [random] - Optional random source (see RandomUtils).
      * @returns {Array} A new shuffled array.
      */
-    static fisherYates(cards) {
+    static fisherYates(cards, random = null) {
         const c = [...cards];
+        const source = sourceOf(random);
         for (let i = c.length - 1; i > 0; i--) {
-            const j = getRandomInt(i + 1);
+            const j = getRandomInt(i + 1, source);
             [c[i], c[j]] = [c[j], c[i]];
         }
         return c;
     }
 
+    /**
+     * Fisher-Yates shuffle that permutes `cards` in place (arrays or typed arrays).
+     * @param {Array|Uint8Array} cards - The cards to shuffle (modified in place).
+     * @param {Object|null} [random] - Optional random source.
+     * @returns {Array|Uint8Array} The same `cards` array.
+     */
+    static fisherYatesInPlace(cards, random = null) {
+        const source = sourceOf(random);
+        for (let i = cards.length - 1; i > 0; i--) {
+            const j = getRandomInt(i + 1, source);
+            const tmp = cards[i];
+            cards[i] = cards[j];
+            cards[j] = tmp;
+        }
+        return cards;
+    }
+
     /**
      * Simulates a "Wash" or "Chemmy Shuffle" (scrambling cards on the table).
      * Mathematically equivalent to a random shuffle for our purposes.
      * @param {Array} cards - The array of cards.
+     * @param {Object|null} [random] - Optional random source.
      * @returns {Array} A new shuffled array.
      */
-    static wash(cards) {
+    static wash(cards, random = null) {
         // A wash is intended to be a thorough randomization.
-        return this.fisherYates(cards);
+        return this.fisherYates(cards, random);
     }
 
     /**
      * Simulates a Riffle Shuffle using the Gilbert-Shannon-Reeds (GSR) model.
      * This models the physical process of riffling two piles together.
      * @param {Array} cards - The array of cards.
+     * @param {Object|null} [random] - Optional random source.
      * @returns {Array} A new shuffled array.
      */
-    static riffle(cards) {
+    static riffle(cards, random = null) {
         const len = cards.length;
         if (len <= 1) return [...cards];
+        const source = sourceOf(random);
 
         // Split the deck into two piles roughly in the middle.
         // A real cut is approximately normal distribution around N/2.
         // We use a small uniform variation for simplicity: +/- 5% of total cards.
         const variation = Math.max(1, Math.floor(len * 0.05));
-        const splitPoint = Math.floor(len / 2) + getRandomInt(variation * 2 + 1) - variation;
+        const splitPoint = Math.floor(len / 2) + getRandomInt(variation * 2 + 1, source) - variation;
 
         // Ensure splitPoint is valid
         const validSplit = Math.max(1, Math.min(len - 1, splitPoint));
 
-        const left = cards.slice(0, validSplit);
-        const right = cards.slice(validSplit);
-        const shuffled = [];
+        const shuffled = new Array(len);
 
         // Interleave (GSR model)
         // Probability of taking next card from left pile is size(Left) / (size(Left) + size(Right)).
-        while (left.length > 0 || right.length > 0) {
-            if (left.length === 0) {
-                shuffled.push(right.shift());
-            } else if (right.length === 0) {
-                shuffled.push(left.shift());
+        // The piles are read with moving indices (left = [l, validSplit), right = [r, len)),
+        // so a pass is linear. While both piles have cards, step k sees total = len - k,
+        // so all draws can be requested up front in one batch.
+        const maxes = new Uint32Array(len - 1);
+        for (let k = 0; k < maxes.length; k++) maxes[k] = len - k;
+        const draws = fillRandomInts(maxes, new Uint32Array(maxes.length), source);
+        let l = 0;
+        let r = validSplit;
+        for (let k = 0; k < len; k++) {
+            const leftSize = validSplit - l;
+            if (leftSize === 0) {
+                shuffled[k] = cards[r++];
+            } else if (r === len) {
+                shuffled[k] = cards[l++];
+            } else if (draws[k] < leftSize) {
+                // draws[k] is uniform in [0, total-1]: pick left with P = left / total.
+                shuffled[k] = cards[l++];
             } else {
-                const total = left.length + right.length;
-                // If random integer [0, total-1] is < left.length, pick left.
-                // This corresponds to probability P = left.length / total.
-                if (getRandomInt(total) < left.length) {
-                    shuffled.push(left.shift());
-                } else {
-                    shuffled.push(right.shift());
-                }
+                shuffled[k] = cards[r++];
             }
         }
         return shuffled;
@@ -77,20 +152,32 @@ export class Shuffler {
     /**
      * Simulates a Strip Shuffle (reversing order of small packets).
      * @param {Array} cards - The array of cards.
+     * @param {Object|null} [random] - Optional random source.
      * @returns {Array} A new shuffled array.
      */
-    static strip(cards) {
-        let temp = [...cards];
-        let result = [];
+    static strip(cards, random = null) {
+        const len = cards.length;
+        const result = new Array(len);
+        // At most ceil(n / 2) packets: draw every packet size in one batch.
+        const sizes = fillRandomInts(
+            new Uint32Array(Math.ceil(len / 2)).fill(4),
+            undefined,
+            sourceOf(random)
+        );
+        let packetIndex = 0;
+        let end = len;
+        let out = 0;
 
-        while (temp.length > 0) {
+        while (end > 0) {
             // Take a packet of 2-5 cards from the top (end of array)
-            const size = Math.min(temp.length, 2 + getRandomInt(4));
-            const packet = temp.splice(temp.length - size, size);
+            const size = Math.min(end, 2 + sizes[packetIndex++]);
 
             // Place packet on the new pile (which builds up from bottom)
             // The top packet of original deck becomes bottom packet of new deck.
-            result = result.concat(packet);
+            for (let i = end - size; i < end; i++) {
+                result[out++] = cards[i];
+            }
+            end -= size;
         }
 
         return result;
@@ -99,9 +186,10 @@ export class Shuffler {
     /**
      * Simulates a Cut.
      * @param {Array} cards - The array of cards.
+     * @param {Object|null} [random] - Optional random source.
      * @returns {Array} A new shuffled array.
      */
-    static cut(cards) {
+    static cut(cards, random = null) {
         const len = cards.length;
         if (len < 2) return [...cards];
 
@@ -109,7 +197,7 @@ export class Shuffler {
         const min = Math.max(1, margin);
         const max = Math.max(min + 1, len - margin);
 
-        const cutPoint = min + getRandomInt(max - min);
+        const cutPoint = min + getRandomInt(max - min, sourceOf(random));
 
         return cards.slice(cutPoint).concat(cards.slice(0, cutPoint));
     }
@@ -119,19 +207,123 @@ export class Shuffler {
      * Sequence: Wash -> Riffle x Passes -> Strip -> Cut.
      * @param {Array} cards - The cards to shuffle.
      * @param {number} passes - Number of riffle passes.
+     * @param {Object|null} [random] - Optional random source.
      * @returns {Array} The fully shuffled deck.
      */
-    static casinoShuffle(cards, passes = CONFIG.CASINO_SHUFFLE_PASSES) {
-        let c = this.wash(cards);
+    static casinoShuffle(cards, passes = CONFIG.CASINO_SHUFFLE_PASSES, random = null) {
+        let c = this.wash(cards, random);
 
         const riffleCount = Math.max(1, passes);
         for (let i = 0; i < riffleCount; i++) {
-            c = this.riffle(c);
+            c = this.riffle(c, random);
         }
 
-        c = this.strip(c);
-        c = this.cut(c);
+        c = this.strip(c, random);
+        c = this.cut(c, random);
 
         return c;
     }
+
+    /**
+     * Casino shuffle that reorders `cards` in place.
+     * Same sequence and distribution as casinoShuffle (Wash -> Riffle x Passes -> Strip -> Cut),
+     * but every step permutes a preallocated index buffer, so the whole shuffle is
+     * O(n * passes) and allocates nothing once the workspace has been sized.
+     * @param {Array|Uint8Array} cards - The cards to shuffle (modified in place).
+     * @param {number} passes - Number of riffle passes.
+     * @param {Object|null} [random] - Optional random source.
+     * @param {ShuffleWorkspace} [workspace] - Reusable buffers for this shoe size.
+     * @returns {Array} The same `cards` array.
+     */
+    static casinoShuffleInPlace(
+        cards,
+        passes = CONFIG.CASINO_SHUFFLE_PASSES,
+        random = null,
+        workspace = new ShuffleWorkspace(cards.length)
+    ) {
+        const len = cards.length;
+        if (len < 2) return cards;
+        const source = sourceOf(random);
+        const ws = workspace;
+        ws.resize(len);
+
+        // Wash: Fisher-Yates over the identity permutation.
+        const order = ws.order;
+        for (let i = 0; i < len; i++) order[i] = i;
+        fillRandomInts(ws.maxes, ws.draws, source);
+        for (let k = 0; k < ws.maxes.length; k++) {
+            const i = len - 1 - k;
+            const j = ws.draws[k];
+            const tmp = order[i];
+            order[i] = order[j];
+            order[j] = tmp;
+        }
+
+        const riffleCount = Math.max(1, passes);
+        for (let pass = 0; pass < riffleCount; pass++) {
+            this._riffleIndices(ws, len, source);
+        }
+        this._stripIndices(ws, len, source);
+        this._cutIndices(ws, len, source);
+
+        // Apply the permutation through the card scratch array.
+        const copy = ws.cards;
+        for (let i = 0; i < len; i++) copy[i] = cards[i];
+        for (let i = 0; i < len; i++) cards[i] = copy[ws.order[i]];
+        return cards;
+    }
+
+    /** GSR riffle from ws.order into ws.scratch (see riffle). */
+    static _riffleIndices(ws, len, source) {
+        const variation = Math.max(1, Math.floor(len * 0.05));
+        const splitPoint = Math.floor(len / 2) + getRandomInt(variation * 2 + 1, source) - variation;
+        const validSplit = Math.max(1, Math.min(len - 1, splitPoint));
+        const src = ws.order;
+        const dst = ws.scratch;
+        const draws = fillRandomInts(ws.maxes, ws.draws, source);
+
+        let l = 0;
+        let r = validSplit;
+        for (let k = 0; k < len; k++) {
+            const leftSize = validSplit - l;
+            if (leftSize === 0) {
+                dst[k] = src[r++];
+            } else if (r === len || draws[k] < leftSize) {
+                dst[k] = src[l++];
+            } else {
+                dst[k] = src[r++];
+            }
+        }
+        ws.swap();
+    }
+
+    /** Strip from ws.order into ws.scratch (see strip). */
+    static _stripIndices(ws, len, source) {
+        const src = ws.order;
+        const dst = ws.scratch;
+        const sizes = fillRandomInts(ws.packetMaxes, ws.packetDraws, source);
+        let packetIndex = 0;
+        let end = len;
+        let out = 0;
+        while (end > 0) {
+            const size = Math.min(end, 2 + sizes[packetIndex++]);
+            for (let i = end - size; i < end; i++) dst[out++] = src[i];
+            end -= size;
+        }
+        ws.swap();
+    }
+
+    /** Cut from ws.order into ws.scratch (see cut). */
+    static _cutIndices(ws, len, source) {
+        const margin = Math.floor(len * 0.2);
+        const min = Math.max(1, margin);
+        const max = Math.max(min + 1, len - margin);
+        const cutPoint = min + getRandomInt(max - min, source);
+        const src = ws.order;
+        const dst = ws.scratch;
+        let out = 0;
+        for (let i = cutPoint; i < len; i++) dst[out++] = src[i];
+        for (let i = 0; i < cutPoint; i++) dst[out++] = src[i];
+        ws.swap();
+    }
 }
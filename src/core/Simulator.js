@@ -0,0 +1,343 @@
+import { BlackjackEngine } from './BlackjackEngine.js';
+import { CONFIG, RULES } from './Constants.js';
+import * as HandUtils from '../utils/HandUtils.js';
+import { getRecommendedAction } from '../utils/BasicStrategy.js';
+import { createSeededRandom } from '../utils/RandomUtils.js';
+
+/**
+ * Headless Monte Carlo simulator.
+ * Drives BlackjackEngine directly (no DOM, no timers, no persistence) so rule
+ * profiles and CONFIG tweaks can be evaluated over millions of rounds.
+ *
+ * A policy has the same signature as BasicStrategy.getRecommendedAction:
+ *   (playerCards, dealerUpCard, ruleProfile, canSplit) => { action, code } | string
+ * Insurance is never taken.
+ *
+ * Shoes are shuffled with Fisher-Yates by default: the casino sequence starts
+ * with a full wash (itself a Fisher-Yates pass), so the resulting card order has
+ * the same distribution and the extra riffle/strip/cut work only costs time.
+ * The shoe is a compact Uint8Array of card codes, shuffled in place (also for
+ * 'casino', via Shuffler.casinoShuffleInPlace), so reshuffles allocate nothing
+ * and every dealt card is a shared object from CardCodes.decodeCard.
+ */
+
+/**
+ * Named policies. Worker-based runs can only reference policies by name,
+ * since functions cannot be sent across threads.
+ */
+export const SIMULATION_POLICIES = {
+    basic: getRecommendedAction
+};
+
+/** Per-hand outcome keys, mutually exclusive. */
+export const SIMULATION_OUTCOMES = ['blackjack', 'win', 'tie', 'lose', 'bust', 'surrender'];
+
+/**
+ * Creates an empty accumulator. All fields are integers (amounts are in chips),
+ * so totals from independent runs can be merged exactly.
+ * @returns {Object}
+ */
+export function createSimulationTotals() {
+    const outcomes = {};
+    SIMULATION_OUTCOMES.forEach((key) => { outcomes[key] = 0; });
+    return {
+        rounds: 0,
+        hands: 0,
+        initialWagered: 0,
+        totalWagered: 0,
+        net: 0,
+        netSquared: 0,
+        doubles: 0,
+        splits: 0,
+        dealerBlackjacks: 0,
+        dealerBusts: 0,
+        outcomes
+    };
+}
+
+/**
+ * Adds the counters of `source` into `target`.
+ * @param {Object} target
+ * @param {Object} source
+ * @returns {Object} target
+ */
+export function mergeSimulationTotals(target, source) {
+    target.rounds += source.rounds;
+    target.hands += source.hands;
+    target.initialWagered += source.initialWagered;
+    target.totalWagered += source.totalWagered;
+    target.net += source.net;
+    target.netSquared += source.netSquared;
+    target.doubles += source.doubles;
+    target.splits += source.splits;
+    target.dealerBlackjacks += source.dealerBlackjacks;
+    target.dealerBusts += source.dealerBusts;
+    SIMULATION_OUTCOMES.forEach((key) => {
+        target.outcomes[key] += source.outcomes[key] || 0;
+    });
+    return target;
+}
+
+/**
+ * Builds a report from raw totals.
+ * Edge and variance are expressed per round in units of the initial bet.
+ * @param {Object} totals - Output of createSimulationTotals().
+ * @param {number} bet - Initial bet used for every round.
+ * @returns {Object}
+ */
+export function summarizeSimulation(totals, bet) {
+    const rounds = totals.rounds;
+    const meanUnits = rounds > 0 ? totals.net / rounds / bet : 0;
+    const meanSquareUnits = rounds > 0 ? totals.netSquared / rounds / (bet * bet) : 0;
+    const variance = Math.max(0, meanSquareUnits - meanUnits * meanUnits);
+    const standardError = rounds > 0 ? Math.sqrt(variance / rounds) : 0;
+
+    const frequencies = {};
+    SIMULATION_OUTCOMES.forEach((key) => {
+        frequencies[key] = totals.hands > 0 ? totals.outcomes[key] / totals.hands : 0;
+    });
+
+    return {
+        rounds,
+        hands: totals.hands,
+        bet,
+        net: totals.net,
+        totalWagered: totals.totalWagered,
+        houseEdge: -meanUnits,
+        houseEdgePerWagered: totals.totalWagered > 0 ? -totals.net / totals.totalWagered : 0,
+        variance,
+        standardDeviation: Math.sqrt(variance),
+        standardError,
+        confidence95: [-meanUnits - 1.96 * standardError, -meanUnits + 1.96 * standardError],
+        outcomes: { ...totals.outcomes },
+        frequencies,
+        doubles: totals.doubles,
+        splits: totals.splits,
+        dealerBlackjacks: totals.dealerBlackjacks,
+        dealerBusts: totals.dealerBusts
+    };
+}
+
+function normalizeDecision(decision) {
+    if (typeof decision === 'string') return { action: decision, code: null };
+    return decision || { action: 'stand', code: null };
+}
+
+/**
+ * Plays rounds against a BlackjackEngine with a fixed rule profile.
+ */
+export class Simulator {
+    /**
+     * @param {Object} [options]
+     * @param {Object|string} [options.ruleProfile] - Profile object or key of RULES.PROFILES.
+     * @param {number} [options.decks] - Number of decks in the shoe.
+     * @param {Function|string} [options.policy] - Decision function or key of SIMULATION_POLICIES.
+     * @param {number} [options.bet] - Initial bet per round.
+     * @param {string} [options.shuffleMode] - 'fair' (default) or 'casino'.
+     * @param {number|string} [options.seed] - Seed for a reproducible shoe. Omit to use crypto.
+     */
+    constructor(options = {}) {
+        const profile = typeof options.ruleProfile === 'string'
+            ? RULES.PROFILES[options.ruleProfile]
+            : options.ruleProfile;
+        if (options.ruleProfile && !profile) {
+            throw new Error(`Unknown rule profile: ${options.ruleProfile}`);
+        }
+
+        this.ruleProfile = profile || RULES.PROFILES[RULES.ACTIVE_PROFILE] || RULES.PROFILES.vegas_strip;
+        this.policy = typeof options.policy === 'string'
+            ? SIMULATION_POLICIES[options.policy]
+            : (options.policy || getRecommendedAction);
+        if (!this.policy) {
+            throw new Error(`Unknown simulation policy: ${options.policy}`);
+        }
+        this.bet = options.bet ?? 100;
+        this.engine = new BlackjackEngine({
+            ruleProfile: this.ruleProfile,
+            numberOfDecks: options.decks ?? CONFIG.DECKS,
+            shuffleMode: options.shuffleMode || 'fair',
+            inPlaceShuffle: true,
+            compact: true,
+            random: options.seed !== undefined ? createSeededRandom(options.seed) : null
+        });
+        this.totals = createSimulationTotals();
+    }
+
+    canSplit(hand) {
+        const engine = this.engine;
+        if (hand.cards.length !== 2) return false;
+        if (engine.playerHands.length > CONFIG.MAX_SPLITS) return false;
+        if (hand.splitFromAces && !this.ruleProfile.resplitAces) return false;
+        return HandUtils.getCardNumericValue(hand.cards[0]) === HandUtils.getCardNumericValue(hand.cards[1]);
+    }
+
+    canSurrender(hand) {
+        return this.ruleProfile.surrenderType !== 'none' &&
+            this.engine.playerHands.length === 1 &&
+            hand.cards.length === 2;
+    }
+
+    /**
+     * Asks the policy for a decision and maps it onto an action that is legal right now.
+     * @param {Object} hand
+     * @returns {string}
+     */
+    decide(hand) {
+        const upCard = this.engine.dealerHand[0];
+        const canSplit = this.canSplit(hand);
+        let decision = normalizeDecision(this.policy(hand.cards, upCard, this.ruleProfile, canSplit));
+
+        if (decision.action === 'split' && !canSplit) {
+            decision = normalizeDecision(this.policy(hand.cards, upCard, this.ruleProfile, false));
+        }
+        if (decision.action === 'double' && !this.engine.canDouble(this.engine.currentHandIndex)) {
+            return decision.code === 'DS' ? 'stand' : 'hit';
+        }
+        if (decision.action === 'surrender' && !this.canSurrender(hand)) {
+            return decision.code === 'US' ? 'stand' : 'hit';
+        }
+        if (decision.action === 'split' && !canSplit) return 'hit';
+        return decision.action;
+    }
+
+    playPlayerHands() {
+        const engine = this.engine;
+        const totals = this.totals;
+
+        while (engine.currentHandIndex < engine.playerHands.length) {
+            const index = engine.currentHandIndex;
+            const hand = engine.playerHands[index];
+            if (hand.status !== 'playing') {
+                engine.currentHandIndex++;
+                continue;
+            }
+
+            switch (this.decide(hand)) {
+                case 'hit':
+                    engine.hit(index);
+                    break;
+                case 'double':
+                    engine.double(index);
+                    totals.doubles++;
+                    break;
+                case 'split':
+                    engine.split(index);
+                    totals.splits++;
+                    break;
+                case 'surrender':
+                    engine.surrender(index);
+                    return;
+                default:
+                    engine.stand(index);
+            }
+        }
+    }
+
+    /**
+     * Plays one complete round and records it in the totals.
+     * Mirrors the RoundController flow: peek, naturals, player turn, dealer turn.
+     * @returns {number} Net result of the round in chips.
+     */
+    playRound() {
+        const engine = this.engine;
+        const profile = this.ruleProfile;
+        engine.startGame(this.bet);
+
+        // Both hands hold exactly two cards here, so 21 means a natural.
+        const dealerHasBlackjack = engine.getHandScore(engine.dealerHand).value === 21;
+        const playerHasBlackjack = engine.getHandScore(engine.playerHands[0].cards).value === 21;
+        const peekEndsRound = profile.holeCardPolicy === 'peek' && dealerHasBlackjack;
+
+        if (!peekEndsRound && !playerHasBlackjack) {
+            this.playPlayerHands();
+            const needsDealer = engine.playerHands.some(
+                (h) => h.status !== 'busted' && h.status !== 'surrender'
+            );
+            if (needsDealer) engine.dealerTurn();
+        }
+
+        engine.dealerRevealed = true;
+        engine.gameOver = true;
+        return this.recordResults(dealerHasBlackjack);
+    }
+
+    recordResults(dealerHasBlackjack) {
+        const engine = this.engine;
+        const totals = this.totals;
+        const { dealerValue, results } = engine.evaluateResults();
+        const handsCount = engine.playerHands.length;
+
+        let wagered = 0;
+        let returned = 0;
+        for (const { hand, result, payout } of results) {
+            wagered += hand.bet;
+            returned += payout;
+
+            let outcome = result;
+            if (result === 'win' && HandUtils.isNaturalBlackjack(hand.cards, handsCount)) {
+                outcome = 'blackjack';
+            } else if (result === 'lose' && hand.status === 'busted') {
+                outcome = 'bust';
+            }
+            totals.outcomes[outcome]++;
+        }
+
+        const net = returned - wagered;
+        totals.rounds++;
+        totals.hands += handsCount;
+        totals.initialWagered += this.bet;
+        totals.totalWagered += wagered;
+        totals.net += net;
+        totals.netSquared += net * net;
+        if (dealerHasBlackjack) totals.dealerBlackjacks++;
+        if (dealerValue > 21) totals.dealerBusts++;
+        return net;
+    }
+
+    /**
+     * Plays `rounds` rounds.
+     * @param {number} rounds
+     * @returns {Object} Accumulated totals.
+     */
+    run(rounds) {
+        for (let i = 0; i < rounds; i++) {
+            this.playRound();
+        }
+        return this.totals;
+    }
+
+    /**
+     * Report for everything played so far.
+     * @returns {Object}
+     */
+    getReport() {
+        return summarizeSimulation(this.totals, this.bet);
+    }
+}
+
+/**
+ * Convenience wrapper: builds a Simulator, plays `hands` rounds and returns the report.
+ * @param {Object} options - Simulator options plus `hands`.
+ * @returns {Object} Report with elapsed time and throughput.
+ */
+export function runSimulation(options = {}) {
+    const simulator = new Simulator(options);
+    const start = performance.now();
+    simulator.run(options.hands ?? 100000);
+    const elapsedMs = performance.now() - start;
+    const report = simulator.getReport();
+    report.elapsedMs = elapsedMs;
+    report.roundsPerSecond = elapsedMs > 0 ? (report.rounds * 1000) / elapsedMs : 0;
+    return report;
+}
+
+/**
+ * Plays one independent shard (fresh shoe, own seed) and returns its raw totals.
+ * This is the unit of work handed to simulation workers.
+ * @param {Object} shard - Simulator options plus `rounds`.
+ * @returns {Object} Totals (see createSimulationTotals()).
+ */
+export function runSimulationShard(shard) {
+    const simulator = new Simulator(shard);
+    return simulator.run(shard.rounds);
+}
@@ -0,0 +1,66 @@
+/**
+ * State-reset hook for the Python E2E harness.
+ *
+ * tests/conftest.py keeps a pool of logged-in pages per browser and, instead
+ * of reloading the app between tests, calls `window.__game.__resetForTest()`
+ * to bring the table back to a freshly logged-in state (it resolves once the
+ * stored hand history has been cleared). Only installed where
+ * window.__game is exposed (localhost).
+ *
+ * `__useVirtualClock()` switches round timers to a VirtualScheduler, which
+ * tests then drive with `window.__game.scheduler.advance(ms)` instead of
+ * sleeping; the reset puts the real-time scheduler back.
+ */
+import { RealTimeScheduler, VirtualScheduler } from './services/TimerScheduler.js';
+
+/**
+ * @param {Object} game - GameManager instance, after main.js wired its listeners.
+ */
+export function installE2EResetHook(game) {
+    const baseListeners = copyListeners(game.events._listeners);
+
+    game.__resetForTest = async () => {
+        game.clearTimeouts();
+        // Let the previous test's queued writes land before storage is wiped.
+        game.persistenceService?.flushSaves();
+
+        // Listeners added by a test are dropped; the app's own are kept.
+        game.events._listeners = copyListeners(baseListeners);
+
+        game.initializeGameState();
+        game.initializeSettings();
+        game.setScheduler(new RealTimeScheduler());
+        game.advancedStats.startSession();
+        // The next test must not find this one's hands in IndexedDB.
+        await game.persistenceService?.onGameReset();
+        if (game.engine.deck) game.engine.deck.reset();
+        localStorage.clear();
+        // Otherwise the cached device id, seq and outbox would survive the clear.
+        game.persistenceService?.statsSync.forgetState();
+
+        const ui = game.ui;
+        if (ui) {
+            ui.setAnimationsEnabled(game.settings.animationsEnabled);
+            document.querySelectorAll('.modal, .overlay').forEach((el) => {
+                el.style.display = 'none';
+            });
+            const betInput = document.getElementById('bet-input');
+            if (betInput) betInput.value = game.currentBet;
+        }
+        game.events.emit('history:changed');
+        game.newGame();
+        if (ui) ui.flushRender();
+        return true;
+    };
+
+    game.__useVirtualClock = () => {
+        game.setScheduler(new VirtualScheduler());
+        return true;
+    };
+}
+
+function copyListeners(listeners) {
+    const copy = {};
+    for (const [event, callbacks] of Object.entries(listeners)) copy[event] = [...callbacks];
+    return copy;
+}
@@ -32,6 +32,9 @@ export class AuthService {
     }
 
     onUserSignOut() {
+        // Write whatever is still queued under the account that is signing out. The
+        // session is already gone here, so logout() sends cloud saves before signOut().
+        if (this.game.persistenceService) this.game.persistenceService.flushSaves();
         this.game.userId = null;
         this.game.username = null;
         this.game.initializeGameState();
@@ -47,6 +50,8 @@ export class AuthService {
 
     async logout() {
         try {
+            // Row-level security rejects writes once the session is revoked.
+            if (this.game.persistenceService) await this.game.persistenceService.flushSavesAndWait();
             const { error } = await this.supabase.auth.signOut();
             if (error) throw error;
             if (this.game.ui) this.game.ui.showMessage('Desconectado.', 'info');
@@ -0,0 +1,274 @@
+import { CONFIG, getActiveRuleProfile } from '../Constants.js';
+import { getRecommendedAction } from '../../utils/BasicStrategy.js';
+import * as HandUtils from '../../utils/HandUtils.js';
+import { VirtualScheduler } from './TimerScheduler.js';
+
+// A round that needs more decisions than this is stuck, not long.
+const MAX_ACTIONS_PER_ROUND = 64;
+
+/**
+ * Plays batches of hands with basic strategy through the normal round flow
+ * (RoundController), so balance, stats, HandHistory and AdvancedStats update
+ * exactly as for hands played by hand.
+ *
+ * While a batch runs the UI and sound manager are detached from the game,
+ * round delays run on a VirtualScheduler and the save scheduler is paused.
+ * Hands are played in chunks separated by a macrotask so the page stays
+ * responsive and cancel() can land. The history keeps every hand of the batch
+ * (see HandHistory.retainAll); results and the new hands are written to the UI,
+ * the local store and the cloud at the end, or every `flushEvery` hands, and
+ * the history is then trimmed back to its usual size.
+ *
+ * Events: `autoplay:started {total, bet}`, `autoplay:progress {played, total,
+ * balance, net}` after every chunk, `autoplay:finished` with the summary.
+ */
+export class AutoPlayer {
+    constructor(game) {
+        this.game = game;
+        this.running = false;
+        this.cancelRequested = false;
+        this.saved = null;
+    }
+
+    /** Stops the running batch after the hand in progress. */
+    cancel() {
+        if (this.running) this.cancelRequested = true;
+    }
+
+    /**
+     * Plays up to `hands` hands at a fixed bet.
+     * @param {Object} options
+     * @param {number} options.hands - Hands to play.
+     * @param {number} [options.bet] - Bet per hand, defaults to the current bet.
+     * @param {number} [options.flushEvery=0] - Render and save every N hands; 0 only at the end.
+     * @param {number} [options.chunkSize] - Hands played between yields to the event loop.
+     * @returns {Promise<{ requested: number, played: number, net: number, startBalance: number,
+     *   endBalance: number, stopReason: string }>} stopReason is 'completed', 'cancelled' or 'balance'.
+     *   Rejects when a round fails; `autoplay:finished` is still emitted, with stopReason 'error'.
+     */
+    async run({ hands, bet = this.game.currentBet, flushEvery = 0, chunkSize = CONFIG.AUTOPLAY.CHUNK_SIZE }) {
+        if (this.running) throw new Error('AutoPlayer: a batch is already running');
+        const game = this.game;
+        const total = Math.max(0, Math.min(Math.floor(hands) || 0, CONFIG.AUTOPLAY.MAX_HANDS));
+        const startBalance = game.balance;
+        let played = 0;
+        let stopReason = 'completed';
+        let error = null;
+
+        this.running = true;
+        this.cancelRequested = false;
+        this.suspend();
+        game.events.emit('autoplay:started', { total, bet });
+
+        try {
+            while (played < total) {
+                const chunkEnd = Math.min(total, played + chunkSize);
+                while (played < chunkEnd) {
+                    if (this.cancelRequested) break;
+                    if (bet < CONFIG.MIN_BET || bet > game.balance) break;
+                    this.playRound(bet);
+                    played++;
+                    if (flushEvery > 0 && played % flushEvery === 0 && played < total) await this.flushResults();
+                }
+                if (this.cancelRequested) {
+                    stopReason = 'cancelled';
+                    break;
+                }
+                if (played < chunkEnd) {
+                    stopReason = 'balance';
+                    break;
+                }
+                game.events.emit('autoplay:progress', {
+                    played,
+                    total,
+                    balance: game.balance,
+                    net: game.balance - startBalance
+                });
+                if (played < total) await yieldToEventLoop();
+            }
+        } catch (err) {
+            error = err;
+            stopReason = 'error';
+            this.abandonRound();
+        } finally {
+            await this.persistHands();
+            this.restore();
+            this.running = false;
+            this.cancelRequested = false;
+        }
+
+        const summary = {
+            requested: total,
+            played,
+            net: game.balance - startBalance,
+            startBalance,
+            endBalance: game.balance,
+            stopReason
+        };
+        // Always finished, so listeners re-enable their controls even after an error.
+        this.finish(summary);
+        if (error) throw error;
+        return summary;
+    }
+
+    /** Detaches rendering, sound, real-time timers and background saves. */
+    suspend() {
+        const game = this.game;
+        if (game.ui) game.ui.toggleGameControls(false);
+        this.saved = {
+            ui: game.ui,
+            soundManager: game.soundManager,
+            scheduler: game.scheduler,
+            trainingMode: game.trainingMode,
+            historySize: Math.max(game.handHistory.maxEntries, game.handHistory.store.size)
+        };
+        game.clearTimeouts();
+        game.ui = null;
+        game.soundManager = null;
+        // Training feedback (and the perfect-play solver) is for hands played by a person.
+        game.trainingMode = false;
+        game.setScheduler(new VirtualScheduler());
+        game.persistenceService?.saveScheduler.pause();
+        game.handHistory.retainAll = true;
+    }
+
+    restore() {
+        const game = this.game;
+        const saved = this.saved;
+        if (!saved) return;
+        game.setScheduler(saved.scheduler);
+        game.ui = saved.ui;
+        game.soundManager = saved.soundManager;
+        game.trainingMode = saved.trainingMode;
+        game.handHistory.retainAll = false;
+        game.persistenceService?.saveScheduler.resume();
+        this.saved = null;
+    }
+
+    /**
+     * Writes the hands kept since the last write to the local store and the
+     * cloud, waits for both, then trims the history back to its usual size.
+     */
+    async persistHands() {
+        const game = this.game;
+        const persistence = game.persistenceService;
+        if (persistence) await persistence.persistHandHistory();
+        game.handHistory.trimTo(this.saved.historySize);
+    }
+
+    /** Pushes mid-batch results to the (detached) UI and to storage. */
+    async flushResults() {
+        const game = this.game;
+        await this.persistHands();
+        const ui = this.saved && this.saved.ui;
+        if (ui) ui.requestRender(() => game.getState());
+        game.events.emit('history:changed');
+        game.saveGame();
+        game.persistenceService?.saveScheduler.flush();
+    }
+
+    finish(summary) {
+        const game = this.game;
+        game.events.emit('history:changed');
+        game.saveGame();
+
+        if (game.ui) {
+            game.ui.invalidateRender();
+            const sign = summary.net >= 0 ? '+' : '-';
+            const messageClass = summary.net > 0 ? 'win' : summary.net < 0 ? 'lose' : 'tie';
+            game.ui.showMessage(
+                `Auto-jogo: ${summary.played} mãos, resultado ${sign}$${Math.abs(summary.net)}`,
+                messageClass
+            );
+            if (game.engine.gameOver) game.ui.showNewGameButton();
+        }
+        game.updateUI();
+
+        if (game.balance < CONFIG.MIN_BET) {
+            if (game.ui) game.ui.showToast('Saldo insuficiente! Reiniciando em 2 segundos...', 'lose', 2000);
+            game.addTimeout(() => game.resetGame(), CONFIG.DELAYS.RESET);
+        }
+        game.events.emit('autoplay:finished', summary);
+    }
+
+    /** Voids a round a failure left unfinished: its bets are returned and the table cleared. */
+    abandonRound() {
+        const game = this.game;
+        const engine = game.engine;
+        game.clearTimeouts();
+        if (engine.gameStarted && !engine.gameOver) {
+            game.balance += engine.playerHands.reduce((sum, hand) => sum + hand.bet, 0);
+        }
+        engine.resetState();
+    }
+
+    /**
+     * Plays one round to the end on the virtual clock.
+     * @param {number} bet
+     */
+    playRound(bet) {
+        const game = this.game;
+        const engine = game.engine;
+        const clock = game.scheduler;
+
+        game.clearTimeouts();
+        engine.resetState();
+        game.currentBet = bet;
+        game.roundController.startGame();
+        clock.runAll();
+
+        // The insurance prompt waits for an answer; basic strategy never takes it.
+        if (!engine.gameOver && getActiveRuleProfile().holeCardPolicy === 'peek' && engine.dealerHand[0].value === 'A') {
+            game.respondToInsurance(false);
+            clock.runAll();
+        }
+
+        for (let actions = 0; !engine.gameOver; actions++) {
+            if (actions >= MAX_ACTIONS_PER_ROUND) throw new Error('AutoPlayer: round did not finish');
+            const hand = engine.playerHands[engine.currentHandIndex];
+            // A hand hit to 21 stays current until the player stands.
+            const action = hand.status === 'playing' ? this.decide(hand) : 'stand';
+            game[action]();
+            clock.runAll();
+        }
+        // Drops the reset timer endGame schedules when the balance runs out.
+        game.clearTimeouts();
+    }
+
+    /**
+     * Basic strategy decision mapped onto an action RoundController accepts now.
+     * @param {Object} hand
+     * @returns {string} 'hit', 'stand', 'double', 'split' or 'surrender'.
+     */
+    decide(hand) {
+        const game = this.game;
+        const profile = getActiveRuleProfile();
+        const upCard = game.engine.dealerHand[0];
+        const canSplit = this.canSplit(hand, profile);
+        const { action, code } = getRecommendedAction(hand.cards, upCard, profile, canSplit);
+
+        if (action === 'double' && !game.canDouble()) return code === 'DS' ? 'stand' : 'hit';
+        if (action === 'surrender' && !this.canSurrender(hand, profile)) return code === 'US' ? 'stand' : 'hit';
+        if (action === 'split' && !canSplit) return 'hit';
+        return action;
+    }
+
+    canSplit(hand, profile) {
+        const game = this.game;
+        if (hand.cards.length !== 2) return false;
+        if (game.engine.playerHands.length > CONFIG.MAX_SPLITS) return false;
+        if (game.balance < hand.bet) return false;
+        if (hand.splitFromAces && !profile.resplitAces) return false;
+        return HandUtils.getCardNumericValue(hand.cards[0]) === HandUtils.getCardNumericValue(hand.cards[1]);
+    }
+
+    canSurrender(hand, profile) {
+        return profile.surrenderType !== 'none' &&
+            this.game.engine.playerHands.length === 1 &&
+            hand.cards.length === 2;
+    }
+}
+
+function yieldToEventLoop() {
+    return new Promise((resolve) => setTimeout(resolve, 0));
+}
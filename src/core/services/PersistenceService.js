@@ -1,10 +1,27 @@
 import { CONFIG, STORAGE_KEYS } from '../Constants.js';
 import { StorageManager } from '../../utils/StorageManager.js';
+import { SaveScheduler } from './SaveScheduler.js';
+import { createStorageBackend, migrateLegacyHistory } from '../../utils/AsyncStorage.js';
+import { StatsSync, STATS_COLUMNS } from './StatsSync.js';
+import { instrumentMethods } from '../../utils/PerfTracer.js';
 
 export class PersistenceService {
     constructor(game, supabaseClient) {
         this.game = game;
         this.supabase = supabaseClient;
+        /** IndexedDB hand history store, or null to keep history in localStorage. */
+        this.storageBackend = createStorageBackend();
+        this.statsSync = new StatsSync(game, supabaseClient);
+
+        // Local writes are encoded in idle time; each Supabase table is its own
+        // channel so a slow table never holds back the other.
+        this.saveScheduler = new SaveScheduler();
+        this.saveScheduler.register('local', () => this._writeLocalSave(), { idle: true });
+        this.saveScheduler.register('statistics', () => this.saveStatsToSupabase());
+        this.saveScheduler.register('hand_events', () =>
+            this.game.handHistory.saveToSupabase(this.supabase, this.game.userId, this.statsSync.deviceId)
+        );
+        this.saveScheduler.attachLifecycle();
     }
 
     migrateData(gameState) {
@@ -14,10 +31,43 @@ export class PersistenceService {
         return gameState;
     }
 
+    /**
+     * Queues a save of the game state, history and stats. Requests made within
+     * CONFIG.SAVE.COALESCE_MS are written once.
+     */
+    scheduleSave() {
+        if (!this.game.userId) return;
+        this.saveScheduler.markDirty();
+    }
+
+    /**
+     * Writes the local save right away and sends pending cloud saves.
+     */
     _saveGameImmediate() {
         if (!this.game.userId) return;
 
-        const gameState = {
+        this._writeLocalSave();
+        this.saveScheduler.markDirty('statistics', 'hand_events');
+        this.saveScheduler.flush({ urgent: true });
+    }
+
+    /**
+     * Sends any queued save now (e.g. before the signed-in user changes).
+     */
+    flushSaves() {
+        this.saveScheduler.flush({ urgent: true });
+    }
+
+    /**
+     * Sends queued saves and waits for the cloud requests to settle.
+     * @returns {Promise<void>}
+     */
+    flushSavesAndWait() {
+        return this.saveScheduler.flushAndWait();
+    }
+
+    _buildGameState() {
+        return {
             version: CONFIG.STORAGE_VERSION,
             balance: this.game.balance,
             wins: this.game.wins,
@@ -31,38 +81,68 @@ export class PersistenceService {
             gameStarted: this.game.engine.gameStarted,
             updatedAt: Date.now()
         };
+    }
+
+    _writeLocalSave() {
+        if (!this.game.userId) return;
+
+        StorageManager.set(this.game.getStorageKey(STORAGE_KEYS.GAME_SAVE), this._buildGameState());
+
+        const historyKey = this.game.getStorageKey(STORAGE_KEYS.HAND_HISTORY);
+        if (this.storageBackend) {
+            return this.game.handHistory.saveToBackend(this.storageBackend, historyKey);
+        }
+        this.game.handHistory.saveToLocalStorage(historyKey);
+    }
+
+    /**
+     * Writes new hands to the local store and the cloud right away and waits
+     * for both, e.g. at the end of an auto-play batch.
+     * @returns {Promise<boolean>} false when either write failed.
+     */
+    async persistHandHistory() {
+        if (!this.game.userId) return true;
+        const history = this.game.handHistory;
+        const historyKey = this.game.getStorageKey(STORAGE_KEYS.HAND_HISTORY);
+        const [local, cloud] = await Promise.all([
+            this.storageBackend ? history.saveToBackend(this.storageBackend, historyKey) : true,
+            history.saveToSupabase(this.supabase, this.game.userId, this.statsSync.deviceId),
+        ]);
+        return local && cloud;
+    }
 
-        StorageManager.set(this.game.getStorageKey(STORAGE_KEYS.GAME_SAVE), gameState);
-        this.game.handHistory.saveToLocalStorage(this.game.getStorageKey(STORAGE_KEYS.HAND_HISTORY));
-        this.saveStatsToSupabase();
-        this.game.handHistory.saveToSupabase(this.supabase, this.game.userId).catch(console.error);
+    /**
+     * Propagates a game reset: drops the stored and cloud hand history (the
+     * in-memory copy is reset by the caller) and queues a stats reset.
+     * @returns {Promise<void>} Settles once the local store has been cleared.
+     */
+    onGameReset() {
+        if (!this.game.userId) return Promise.resolve();
+        this.statsSync.recordReset();
+        let cleared = Promise.resolve();
+        if (this.storageBackend) {
+            const historyKey = this.game.getStorageKey(STORAGE_KEYS.HAND_HISTORY);
+            cleared = this.storageBackend.deleteOwner(historyKey).catch(console.warn);
+        }
+        this.game.handHistory.clearSupabase(this.supabase, this.game.userId).catch(console.error);
+        return cleared;
     }
 
+    /**
+     * Sends pending stat increments (see StatsSync).
+     * @returns {Promise<boolean>} false when the save failed and should be retried.
+     */
     async saveStatsToSupabase() {
-        if (!this.game.userId) return;
+        if (!this.game.userId) return true;
 
         try {
-            const stats = {
-                user_id: this.game.userId,
-                balance: this.game.balance,
-                wins: this.game.wins,
-                losses: this.game.losses,
-                blackjacks: this.game.blackjacks,
-                total_winnings: this.game.totalWinnings,
-                updated_at: new Date().toISOString()
-            };
-
-            const { error } = await this.supabase
-                .from('statistics')
-                .upsert(stats, { onConflict: 'user_id' });
-
-            if (error) {
-                console.error('Error saving stats to Supabase:', error);
-                if (this.game.ui) this.game.ui.showToast('Erro ao salvar progresso na nuvem.', 'error');
-            }
+            const ok = await this.statsSync.flush();
+            if (!ok && this.game.ui) this.game.ui.showToast('Erro ao salvar progresso na nuvem.', 'error');
+            return ok;
         } catch (err) {
             console.error('Unexpected error saving stats:', err);
             if (this.game.ui) this.game.ui.showToast('Erro de conexão ao salvar.', 'error');
+            return false;
         }
     }
 
@@ -96,8 +176,45 @@ export class PersistenceService {
 
         if (this.game.userId) {
             this.loadStatsFromSupabase(localTimestamp).catch(console.error);
-            this.game.handHistory.loadFromSupabase(this.supabase, this.game.userId).catch(console.error);
+            this.loadHandHistory().catch(console.error);
+        }
+    }
+
+    /**
+     * Loads hand history from the IndexedDB store (moving a legacy localStorage
+     * copy over on first run), then merges the cloud copy.
+     */
+    async loadHandHistory() {
+        if (this.storageBackend) {
+            const historyKey = this.game.getStorageKey(STORAGE_KEYS.HAND_HISTORY);
+            try {
+                await migrateLegacyHistory(this.storageBackend, historyKey);
+            } catch (err) {
+                console.warn('Could not migrate hand history:', err);
+            }
+            await this.game.handHistory.loadFromBackend(this.storageBackend, historyKey);
+            this.game.updateUI();
+            this.game.events.emit('history:changed');
         }
+        await this.game.handHistory.loadFromSupabase(this.supabase, this.game.userId, this.statsSync.deviceId);
+        this.game.events.emit('history:changed');
+    }
+
+    /**
+     * Loads the next page of older hands for the history panel: from the cloud
+     * while it has more, otherwise from the local IndexedDB store.
+     * @returns {Promise<boolean>} Whether more pages remain.
+     */
+    async loadOlderHands() {
+        const history = this.game.handHistory;
+        if (this.game.userId && this.supabase && history.nextCursor !== null) {
+            return history.loadMoreFromSupabase(this.supabase, this.game.userId, this.statsSync.deviceId);
+        }
+        if (this.storageBackend) {
+            const historyKey = this.game.getStorageKey(STORAGE_KEYS.HAND_HISTORY);
+            return history.loadOlderFromBackend(this.storageBackend, historyKey);
+        }
+        return false;
     }
 
     async loadStatsFromSupabase(localTimestamp) {
@@ -106,45 +223,25 @@ export class PersistenceService {
         try {
             const { data, error } = await this.supabase
                 .from('statistics')
-                .select('*')
+                .select(STATS_COLUMNS)
                 .eq('user_id', this.game.userId)
                 .single();
 
-            if (data) {
-                const remoteTimestamp = new Date(data.updated_at).getTime();
-
-                if (remoteTimestamp > localTimestamp || localTimestamp === 0) {
-                    this.game.balance = Number(data.balance);
-                    this.game.wins = data.wins;
-                    this.game.losses = data.losses;
-                    this.game.blackjacks = data.blackjacks;
-                    this.game.totalWinnings = Number(data.total_winnings);
-
-                    this.game.updateUI();
-
-                    const gameState = {
-                        version: CONFIG.STORAGE_VERSION,
-                        balance: this.game.balance,
-                        wins: this.game.wins,
-                        losses: this.game.losses,
-                        blackjacks: this.game.blackjacks,
-                        totalWinnings: this.game.totalWinnings,
-                        totalAmountWagered: this.game.totalAmountWagered,
-                        sessionBestBalance: this.game.sessionBestBalance,
-                        sessionWorstBalance: this.game.sessionWorstBalance,
-                        handCounter: this.game.handCounter,
-                        gameStarted: this.game.engine.gameStarted,
-                        updatedAt: Date.now()
-                    };
-                    StorageManager.set(this.game.getStorageKey(STORAGE_KEYS.GAME_SAVE), gameState);
-                } else if (localTimestamp > remoteTimestamp) {
-                    this.saveStatsToSupabase();
+            const isNewProfile = !data && error && error.code === 'PGRST116';
+            if (data || isNewProfile) {
+                if (this.statsSync.getState().baseline) {
+                    this.statsSync.applyServerRow(data || null);
+                } else {
+                    this.statsSync.bootstrap(data || null, localTimestamp);
                 }
+                this.game.updateUI();
+                StorageManager.set(this.game.getStorageKey(STORAGE_KEYS.GAME_SAVE), this._buildGameState());
+                this.saveScheduler.markDirty('statistics');
 
-                if (this.game.ui) this.game.ui.showToast('Progresso sincronizado!', 'success');
-            } else if (error && error.code === 'PGRST116') {
-                this.saveStatsToSupabase();
-                if (this.game.ui) this.game.ui.showToast('Novo perfil criado na nuvem.', 'info');
+                if (this.game.ui) {
+                    if (isNewProfile) this.game.ui.showToast('Novo perfil criado na nuvem.', 'info');
+                    else this.game.ui.showToast('Progresso sincronizado!', 'success');
+                }
             } else if (error) {
                 console.error('Error fetching stats:', error);
                 if (this.game.ui) this.game.ui.showToast('Erro ao baixar dados da nuvem.', 'error');
@@ -168,6 +265,7 @@ export class PersistenceService {
             try {
                 const parsed = typeof savedSettings === 'object' ? savedSettings : JSON.parse(savedSettings);
                 this.game.settings = { ...this.game.settings, ...parsed };
+                this.game.applyTurboMode();
                 if (this.game.soundManager) {
                     this.game.soundManager.setEnabled(this.game.settings.soundEnabled);
                     this.game.soundManager.setVolume(this.game.settings.volume);
@@ -187,3 +285,5 @@ export class PersistenceService {
         }
     }
 }
+
+instrumentMethods(PersistenceService.prototype, 'PersistenceService', ['saveStatsToSupabase', 'loadStatsFromSupabase']);
@@ -1,5 +1,6 @@
 import { CONFIG, getActiveRuleProfile } from '../Constants.js';
 import * as HandUtils from '../../utils/HandUtils.js';
+import { instrumentMethods } from '../../utils/PerfTracer.js';
 
 export class RoundController {
     constructor(game) {
@@ -62,14 +63,14 @@ export class RoundController {
         }
         this.game.updateUI();
 
-        const pVal = HandUtils.calculateHandValue(this.game.engine.playerHands[0].cards);
+        const pVal = this.game.engine.getHandScore(this.game.engine.playerHands[0].cards).value;
         if (pVal === 21) {
             this.game.addTimeout(() => this.game.endGame(), CONFIG.DELAYS.TURN);
         }
     }
 
     checkDealerBlackjack() {
-        const val = HandUtils.calculateHandValue(this.game.engine.dealerHand);
+        const val = this.game.engine.getHandScore(this.game.engine.dealerHand).value;
         if (val === 21 && this.game.engine.dealerHand.length === 2) {
             this.game.engine.dealerRevealed = true;
             this.game.updateUI();
@@ -352,7 +353,7 @@ export class RoundController {
         let messageClass = '';
         if (this.game.engine.playerHands.length === 1) {
             const hand = this.game.engine.playerHands[0];
-            const pVal = HandUtils.calculateHandValue(hand.cards);
+            const pVal = this.game.engine.getHandScore(hand.cards).value;
             if (hand.status === 'surrender') {
                 message = 'Você desistiu.';
                 messageClass = 'tie';
@@ -417,3 +418,8 @@ export class RoundController {
         if (this.game.settings.autoSave) this.game.saveGame();
     }
 }
+
+instrumentMethods(RoundController.prototype, 'RoundController', [
+    'startGame', 'startPlayerTurn', 'checkDealerBlackjack', 'respondToInsurance',
+    'hit', 'stand', 'double', 'split', 'surrender', 'nextHand', 'playDealer', 'endGame'
+]);
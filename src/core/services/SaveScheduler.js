@@ -0,0 +1,246 @@
+import { CONFIG } from '../Constants.js';
+
+/**
+ * Coalesces save requests into batched flushes.
+ *
+ * Each registered channel is one destination (local storage, a Supabase table).
+ * markDirty() opens a coalescing window; when it closes every dirty channel runs
+ * once, no matter how many hands were played meanwhile. Channels never have more
+ * than one request in flight: changes made while a request is running are sent
+ * right after it completes. A task that reports failure (returns or resolves to
+ * `false`, or throws) is retried with exponential backoff.
+ *
+ * Idle channels run in requestIdleCallback (setTimeout fallback) so encoding and
+ * localStorage writes stay out of input handling and animations. Urgent flushes
+ * (page hidden or unloading) run everything synchronously.
+ */
+export class SaveScheduler {
+    /**
+     * @param {Object} [options]
+     * @param {number} [options.windowMs] - Coalescing window.
+     * @param {number} [options.retryBaseMs] - First retry delay, doubled per attempt.
+     * @param {number} [options.retryMaxMs] - Retry delay cap.
+     * @param {number} [options.maxAttempts] - Attempts before a failed flush is dropped.
+     * @param {Function} [options.requestIdle] - Idle scheduler, `(callback) => void`.
+     */
+    constructor(options = {}) {
+        this.windowMs = options.windowMs ?? CONFIG.SAVE.COALESCE_MS;
+        this.retryBaseMs = options.retryBaseMs ?? CONFIG.SAVE.RETRY_BASE_MS;
+        this.retryMaxMs = options.retryMaxMs ?? CONFIG.SAVE.RETRY_MAX_MS;
+        this.maxAttempts = options.maxAttempts ?? CONFIG.SAVE.MAX_ATTEMPTS;
+        this.requestIdle = options.requestIdle || defaultRequestIdle;
+        /** @type {Map<string, Object>} */
+        this.channels = new Map();
+        this.timer = null;
+        this.paused = false;
+        this.lifecycleCleanup = null;
+    }
+
+    /**
+     * Registers a save destination.
+     * @param {string} name
+     * @param {Function} task - Performs the save; returns/resolves `false` to request a retry.
+     * @param {Object} [options]
+     * @param {boolean} [options.idle] - Run in idle time instead of right away.
+     */
+    register(name, task, { idle = false } = {}) {
+        this.channels.set(name, {
+            name,
+            task,
+            idle,
+            dirty: false,
+            inFlight: false,
+            /** @type {Promise|null} Settles when the request in flight has. */
+            request: null,
+            idlePending: false,
+            attempts: 0,
+            retryTimer: null
+        });
+    }
+
+    /**
+     * Marks channels as having unsaved changes and opens the coalescing window.
+     * @param {...string} names - Channels to mark. Marks every channel when empty.
+     */
+    markDirty(...names) {
+        const targets = names.length > 0 ? names : [...this.channels.keys()];
+        for (const name of targets) {
+            const channel = this.channels.get(name);
+            if (channel) channel.dirty = true;
+        }
+        this.schedule();
+    }
+
+    /**
+     * Whether any channel still has unsaved or in-flight changes.
+     * @returns {boolean}
+     */
+    get hasPending() {
+        for (const channel of this.channels.values()) {
+            if (channel.dirty || channel.inFlight || channel.idlePending) return true;
+        }
+        return false;
+    }
+
+    schedule() {
+        if (this.timer || this.paused) return;
+        this.timer = setTimeout(() => {
+            this.timer = null;
+            this.flush();
+        }, this.windowMs);
+    }
+
+    /**
+     * Stops markDirty() from opening coalescing windows, e.g. during an
+     * auto-play batch. Changes stay marked and explicit or urgent flushes still run.
+     */
+    pause() {
+        this.paused = true;
+        if (this.timer) {
+            clearTimeout(this.timer);
+            this.timer = null;
+        }
+    }
+
+    /** Undoes pause(); opens a window right away if anything is dirty. */
+    resume() {
+        if (!this.paused) return;
+        this.paused = false;
+        for (const channel of this.channels.values()) {
+            if (channel.dirty) {
+                this.schedule();
+                return;
+            }
+        }
+    }
+
+    /**
+     * Runs every dirty channel now.
+     * @param {Object} [options]
+     * @param {boolean} [options.urgent] - Skip idle scheduling and pending backoff
+     *   (used when the page is being hidden or unloaded).
+     */
+    flush({ urgent = false } = {}) {
+        if (this.timer) {
+            clearTimeout(this.timer);
+            this.timer = null;
+        }
+        for (const channel of this.channels.values()) {
+            if (!channel.dirty) continue;
+            if (urgent || !channel.idle) {
+                this.runChannel(channel, urgent);
+            } else if (!channel.idlePending) {
+                channel.idlePending = true;
+                this.requestIdle(() => {
+                    channel.idlePending = false;
+                    if (channel.dirty) this.runChannel(channel, false);
+                });
+            }
+        }
+    }
+
+    /**
+     * Runs every dirty channel now and resolves once the requests have settled,
+     * including changes that were waiting for a request already in flight
+     * (e.g. before signing out, while the session can still write). A failed
+     * request gets one immediate retry here; later retries are not awaited.
+     * @returns {Promise<void>}
+     */
+    async flushAndWait() {
+        for (let pass = 0; pass < 2; pass++) {
+            this.flush({ urgent: true });
+            const requests = [...this.channels.values()].map((channel) => channel.request).filter(Boolean);
+            if (requests.length === 0) return;
+            await Promise.all(requests);
+        }
+    }
+
+    runChannel(channel, urgent) {
+        if (channel.inFlight) return; // Picked up again when the current request settles.
+        if (channel.retryTimer) {
+            if (!urgent) return;
+            clearTimeout(channel.retryTimer);
+            channel.retryTimer = null;
+        }
+
+        channel.dirty = false;
+        channel.inFlight = true;
+        let result;
+        try {
+            result = channel.task();
+        } catch (err) {
+            console.error(`Save "${channel.name}" failed:`, err);
+            result = false;
+        }
+
+        if (result && typeof result.then === 'function') {
+            channel.request = result.then(
+                (value) => this.settle(channel, value !== false),
+                (err) => {
+                    console.error(`Save "${channel.name}" failed:`, err);
+                    this.settle(channel, false);
+                }
+            );
+        } else {
+            this.settle(channel, result !== false);
+        }
+    }
+
+    settle(channel, ok) {
+        channel.inFlight = false;
+        channel.request = null;
+        if (ok) {
+            channel.attempts = 0;
+        } else if (++channel.attempts < this.maxAttempts) {
+            const delay = Math.min(this.retryMaxMs, this.retryBaseMs * 2 ** (channel.attempts - 1));
+            channel.dirty = true;
+            channel.retryTimer = setTimeout(() => {
+                channel.retryTimer = null;
+                this.runChannel(channel, false);
+            }, delay);
+            return;
+        } else {
+            channel.attempts = 0;
+        }
+        if (channel.dirty) this.schedule();
+    }
+
+    /**
+     * Flushes urgently when the page is hidden or unloaded.
+     * @param {Object} [win] - Window-like target for `pagehide`.
+     * @param {Object} [doc] - Document-like target for `visibilitychange`.
+     */
+    attachLifecycle(win = globalThis.window, doc = globalThis.document) {
+        if (this.lifecycleCleanup || !win || !doc) return;
+        const onVisibilityChange = () => {
+            if (doc.visibilityState === 'hidden') this.flush({ urgent: true });
+        };
+        const onPageHide = () => this.flush({ urgent: true });
+        doc.addEventListener('visibilitychange', onVisibilityChange);
+        win.addEventListener('pagehide', onPageHide);
+        this.lifecycleCleanup = () => {
+            doc.removeEventListener('visibilitychange', onVisibilityChange);
+            win.removeEventListener('pagehide', onPageHide);
+        };
+    }
+
+    /** Cancels pending timers and lifecycle listeners without saving. */
+    dispose() {
+        if (this.timer) clearTimeout(this.timer);
+        this.timer = null;
+        for (const channel of this.channels.values()) {
+            if (channel.retryTimer) clearTimeout(channel.retryTimer);
+            channel.retryTimer = null;
+        }
+        if (this.lifecycleCleanup) this.lifecycleCleanup();
+        this.lifecycleCleanup = null;
+    }
+}
+
+function defaultRequestIdle(callback) {
+    if (typeof globalThis.requestIdleCallback === 'function') {
+        globalThis.requestIdleCallback(callback, { timeout: CONFIG.SAVE.IDLE_TIMEOUT_MS });
+    } else {
+        setTimeout(callback, 0);
+    }
+}
@@ -0,0 +1,296 @@
+import { CONFIG, STORAGE_KEYS } from '../Constants.js';
+import { StorageManager } from '../../utils/StorageManager.js';
+import { instrumentMethods } from '../../utils/PerfTracer.js';
+
+/** Game counter -> `statistics` column. Synced as increments. */
+export const SYNCED_COUNTERS = Object.freeze([
+    ['balance', 'balance'],
+    ['wins', 'wins'],
+    ['losses', 'losses'],
+    ['blackjacks', 'blackjacks'],
+    ['totalWinnings', 'total_winnings'],
+    ['totalAmountWagered', 'total_amount_wagered'],
+    ['handCounter', 'hand_counter']
+]);
+
+export const STATS_COLUMNS = [
+    ...SYNCED_COUNTERS.map(([, column]) => column),
+    'session_best_balance',
+    'session_worst_balance',
+    'updated_at'
+].join(', ');
+
+// Function-not-found codes returned by PostgREST/Postgres before the migration runs.
+const MISSING_RPC_CODES = new Set(['PGRST202', '42883']);
+
+function initialValues() {
+    return {
+        balance: CONFIG.INITIAL_BALANCE,
+        wins: 0,
+        losses: 0,
+        blackjacks: 0,
+        totalWinnings: 0,
+        totalAmountWagered: 0,
+        handCounter: 0,
+        sessionBestBalance: CONFIG.INITIAL_BALANCE,
+        sessionWorstBalance: CONFIG.INITIAL_BALANCE
+    };
+}
+
+function applyDelta(values, delta) {
+    if (delta.reset) Object.assign(values, initialValues());
+    for (const [field] of SYNCED_COUNTERS) {
+        values[field] += delta.d?.[field] || 0;
+    }
+    if (Number.isFinite(delta.best)) values.sessionBestBalance = Math.max(values.sessionBestBalance, delta.best);
+    if (Number.isFinite(delta.worst)) values.sessionWorstBalance = Math.min(values.sessionWorstBalance, delta.worst);
+    return values;
+}
+
+function createDeviceId() {
+    if (typeof crypto !== 'undefined' && typeof crypto.randomUUID === 'function') {
+        return crypto.randomUUID();
+    }
+    return `device-${Date.now().toString(36)}-${Math.random().toString(36).slice(2, 10)}`;
+}
+
+/**
+ * Delta sync of the `statistics` row.
+ *
+ * Local counter changes are folded into deltas tagged with a per-device,
+ * monotonically increasing sequence number and kept in a persisted outbox until
+ * the server acknowledges them. The `apply_stat_deltas` RPC applies every delta
+ * whose seq is above the device's last applied seq in one call, so replays are
+ * no-ops and several devices playing offline add up instead of overwriting each
+ * other. Between flushes changes accumulate in a single open delta, which keeps
+ * a session at a handful of round-trips.
+ *
+ * The baseline is the server's view of the counters plus the outbox; the open
+ * delta is always `current - baseline`.
+ */
+export class StatsSync {
+    constructor(game, supabaseClient) {
+        this.game = game;
+        this.supabase = supabaseClient;
+        this.state = null;
+        this.stateOwner = null;
+    }
+
+    getStorageKey() {
+        return this.game.getStorageKey(STORAGE_KEYS.STATS_SYNC);
+    }
+
+    /**
+     * Persisted sync state for the current user: { deviceId, seq, outbox, baseline }.
+     * `baseline` is null until the first successful load from the server. The
+     * device id lives in the same record as the sequence number, so losing one
+     * always loses both and a fresh id never reuses old sequence numbers.
+     */
+    getState() {
+        const owner = this.getStorageKey();
+        if (this.stateOwner !== owner) {
+            const saved = StorageManager.get(owner);
+            this.state = saved && typeof saved === 'object' && Array.isArray(saved.outbox) && saved.deviceId
+                ? saved
+                : { deviceId: createDeviceId(), seq: 0, outbox: [], baseline: null };
+            this.stateOwner = owner;
+        }
+        return this.state;
+    }
+
+    /**
+     * Drops the cached sync state; the next getState() reads it from storage again.
+     */
+    forgetState() {
+        this.state = null;
+        this.stateOwner = null;
+    }
+
+    /**
+     * Identifier of this browser for the current user.
+     * @returns {string}
+     */
+    get deviceId() {
+        return this.getState().deviceId;
+    }
+
+    saveState() {
+        StorageManager.set(this.getStorageKey(), this.getState());
+    }
+
+    snapshot() {
+        const values = {};
+        for (const [field] of SYNCED_COUNTERS) values[field] = Number(this.game[field]) || 0;
+        values.sessionBestBalance = this.game.sessionBestBalance;
+        values.sessionWorstBalance = this.game.sessionWorstBalance;
+        return values;
+    }
+
+    /**
+     * Changes since the baseline, or null when nothing changed.
+     * @returns {Object|null}
+     */
+    openDelta() {
+        const { baseline } = this.getState();
+        if (!baseline) return null;
+        const current = this.snapshot();
+        const d = {};
+        let changed = false;
+        for (const [field] of SYNCED_COUNTERS) {
+            const diff = current[field] - baseline[field];
+            if (diff !== 0) {
+                d[field] = diff;
+                changed = true;
+            }
+        }
+        const delta = { d };
+        if (current.sessionBestBalance > baseline.sessionBestBalance) {
+            delta.best = current.sessionBestBalance;
+            changed = true;
+        }
+        if (current.sessionWorstBalance < baseline.sessionWorstBalance) {
+            delta.worst = current.sessionWorstBalance;
+            changed = true;
+        }
+        return changed ? delta : null;
+    }
+
+    /**
+     * Moves the open delta into the outbox under the next sequence number.
+     */
+    seal() {
+        const delta = this.openDelta();
+        if (!delta) return;
+        const state = this.getState();
+        delta.seq = ++state.seq;
+        state.outbox.push(delta);
+        state.baseline = this.snapshot();
+        this.saveState();
+    }
+
+    /**
+     * Records a game reset: counters go back to their initial values everywhere.
+     */
+    recordReset() {
+        const state = this.getState();
+        if (!state.baseline) return;
+        state.outbox.push({ seq: ++state.seq, reset: true, d: {} });
+        state.baseline = initialValues();
+        this.seal();
+        this.saveState();
+    }
+
+    /**
+     * Sets the game counters to the server row plus everything not yet applied
+     * there (outbox and open delta).
+     * @param {Object|null} row - `statistics` row, or null for a user without one.
+     */
+    applyServerRow(row) {
+        const state = this.getState();
+        const open = this.openDelta();
+        const values = initialValues();
+        if (row) {
+            for (const [field, column] of SYNCED_COUNTERS) {
+                if (row[column] !== null && row[column] !== undefined) values[field] = Number(row[column]);
+            }
+            if (row.session_best_balance !== null && row.session_best_balance !== undefined) {
+                values.sessionBestBalance = Number(row.session_best_balance);
+            }
+            if (row.session_worst_balance !== null && row.session_worst_balance !== undefined) {
+                values.sessionWorstBalance = Number(row.session_worst_balance);
+            }
+        }
+        for (const delta of state.outbox) applyDelta(values, delta);
+        state.baseline = { ...values };
+        if (open) applyDelta(values, open);
+
+        for (const [field] of SYNCED_COUNTERS) this.game[field] = values[field];
+        this.game.sessionBestBalance = values.sessionBestBalance;
+        this.game.sessionWorstBalance = values.sessionWorstBalance;
+        this.saveState();
+    }
+
+    /**
+     * First load on this device: picks the newer of the local save and the
+     * server row (as the old whole-record sync did), then starts tracking
+     * increments from the server row.
+     * @param {Object|null} row
+     * @param {number} localTimestamp - `updatedAt` of the local save, 0 if none.
+     */
+    bootstrap(row, localTimestamp) {
+        const state = this.getState();
+        const remoteTimestamp = row ? new Date(row.updated_at).getTime() : 0;
+        const local = this.snapshot();
+        const keepLocal = localTimestamp > 0 && localTimestamp >= remoteTimestamp;
+
+        // Without a baseline there is no open delta: the game takes the server values.
+        state.baseline = null;
+        state.outbox = [];
+        this.applyServerRow(row);
+        if (keepLocal) {
+            // The difference to the server row is sent as the first increment.
+            for (const [field] of SYNCED_COUNTERS) this.game[field] = local[field];
+            this.game.sessionBestBalance = local.sessionBestBalance;
+            this.game.sessionWorstBalance = local.sessionWorstBalance;
+        }
+    }
+
+    /**
+     * Sends every unacknowledged delta in a single RPC call.
+     * @returns {Promise<boolean>} false when the flush failed and should be retried.
+     */
+    async flush() {
+        if (!this.game.userId || !this.supabase) return true;
+        if (!this.getState().baseline) return true; // Not loaded yet; nothing to diff against.
+
+        this.seal();
+        const state = this.getState();
+        if (state.outbox.length === 0) return true;
+
+        const { data, error } = await this.supabase.rpc('apply_stat_deltas', {
+            p_device_id: this.deviceId,
+            p_deltas: state.outbox
+        });
+
+        if (error) {
+            if (MISSING_RPC_CODES.has(error.code)) return this.upsertSnapshot();
+            console.error('Error syncing stats to Supabase:', error);
+            return false;
+        }
+
+        const appliedSeq = Number(data?.last_seq ?? 0);
+        state.outbox = state.outbox.filter((delta) => delta.seq > appliedSeq);
+        this.applyServerRow(data?.stats || null);
+        return true;
+    }
+
+    /**
+     * Whole-row upsert for projects that have not run the delta sync migration.
+     * @returns {Promise<boolean>}
+     */
+    async upsertSnapshot() {
+        const { error } = await this.supabase
+            .from('statistics')
+            .upsert({
+                user_id: this.game.userId,
+                balance: this.game.balance,
+                wins: this.game.wins,
+                losses: this.game.losses,
+                blackjacks: this.game.blackjacks,
+                total_winnings: this.game.totalWinnings,
+                updated_at: new Date().toISOString()
+            }, { onConflict: 'user_id' });
+
+        if (error) {
+            console.error('Error saving stats to Supabase:', error);
+            return false;
+        }
+        const state = this.getState();
+        state.outbox = [];
+        state.baseline = this.snapshot();
+        this.saveState();
+        return true;
+    }
+}
+
+instrumentMethods(StatsSync.prototype, 'StatsSync', ['flush', 'upsertSnapshot']);
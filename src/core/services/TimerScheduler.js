@@ -0,0 +1,132 @@
+/**
+ * Timers behind GameManager.addTimeout().
+ *
+ * Round flow (deal, dealer steps, reset) is paced by CONFIG.DELAYS. A
+ * scheduler decides what those delays mean: RealTimeScheduler waits for them,
+ * optionally divided by a speed factor (turbo), and VirtualScheduler only
+ * fires timers when its clock is advanced, so tests and simulations can play
+ * whole rounds without waiting. Both forget a timer as soon as it fires or is
+ * cleared.
+ *
+ * Interface: `setTimeout(fn, delay) => id`, `clearTimeout(id)`, `clearAll()`,
+ * `now()` and the `pending` count.
+ */
+export class RealTimeScheduler {
+    /**
+     * @param {Object} [options]
+     * @param {number} [options.speed=1] - Delays are divided by this factor.
+     */
+    constructor({ speed = 1 } = {}) {
+        this.speed = speed;
+        /** @type {Set<*>} Ids of timers that have not fired yet. */
+        this.ids = new Set();
+    }
+
+    get pending() {
+        return this.ids.size;
+    }
+
+    /** @param {number} speed - 1 for normal pace, >1 for turbo. */
+    setSpeed(speed) {
+        this.speed = speed > 0 ? speed : 1;
+    }
+
+    now() {
+        return performance.now();
+    }
+
+    setTimeout(fn, delay = 0) {
+        const id = setTimeout(() => {
+            this.ids.delete(id);
+            fn();
+        }, delay / this.speed);
+        this.ids.add(id);
+        return id;
+    }
+
+    clearTimeout(id) {
+        if (this.ids.delete(id)) clearTimeout(id);
+    }
+
+    clearAll() {
+        this.ids.forEach((id) => clearTimeout(id));
+        this.ids.clear();
+    }
+}
+
+/**
+ * Manually advanced clock. Timers fire in due-time order (ties in scheduling
+ * order) during advance()/runAll(), including timers scheduled by callbacks
+ * that fall inside the advanced window.
+ */
+export class VirtualScheduler {
+    constructor() {
+        this.time = 0;
+        this.nextId = 1;
+        /** @type {Array<{ id: number, at: number, fn: Function }>} Sorted by due time. */
+        this.queue = [];
+    }
+
+    get pending() {
+        return this.queue.length;
+    }
+
+    /** Turbo has no meaning on a virtual clock; kept so schedulers are interchangeable. */
+    setSpeed() {}
+
+    now() {
+        return this.time;
+    }
+
+    setTimeout(fn, delay = 0) {
+        const timer = { id: this.nextId++, at: this.time + Math.max(0, delay), fn };
+        let i = this.queue.length;
+        while (i > 0 && this.queue[i - 1].at > timer.at) i--;
+        this.queue.splice(i, 0, timer);
+        return timer.id;
+    }
+
+    clearTimeout(id) {
+        const i = this.queue.findIndex((timer) => timer.id === id);
+        if (i >= 0) this.queue.splice(i, 1);
+    }
+
+    clearAll() {
+        this.queue = [];
+    }
+
+    /**
+     * Moves the clock forward, firing every timer due on the way.
+     * @param {number} ms
+     * @returns {number} Timers fired.
+     */
+    advance(ms) {
+        const end = this.time + ms;
+        let fired = 0;
+        while (this.queue.length > 0 && this.queue[0].at <= end) {
+            const timer = this.queue.shift();
+            this.time = timer.at;
+            fired++;
+            timer.fn();
+        }
+        this.time = end;
+        return fired;
+    }
+
+    /**
+     * Fires timers until none are left, e.g. to finish a round.
+     * @param {number} [limit=10000] - Guard against timers that keep rescheduling.
+     * @returns {number} Timers fired.
+     */
+    runAll(limit = 10000) {
+        let fired = 0;
+        while (this.queue.length > 0) {
+            if (fired >= limit) throw new Error(`VirtualScheduler.runAll: more than ${limit} timers`);
+            const timer = this.queue.shift();
+            this.time = timer.at;
+            fired++;
+            timer.fn();
+        }
+        return fired;
+    }
+}
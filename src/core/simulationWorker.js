@@ -0,0 +1,20 @@
+/**
+ * Simulation worker entry point (Node worker_threads or browser module Worker).
+ * Receives one shard at a time and replies with its raw totals.
+ */
+import { runSimulationShard } from './Simulator.js';
+
+function handle(shard) {
+    try {
+        return { index: shard.index, totals: runSimulationShard(shard) };
+    } catch (err) {
+        return { index: shard.index, error: err?.message || String(err) };
+    }
+}
+
+if (typeof globalThis.process !== 'undefined' && globalThis.process.versions?.node) {
+    const { parentPort } = await import('node:worker_threads');
+    parentPort.on('message', (shard) => parentPort.postMessage(handle(shard)));
+} else {
+    globalThis.onmessage = (e) => globalThis.postMessage(handle(e.data));
+}
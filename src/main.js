@@ -2,7 +2,10 @@ import { UIManager } from './ui/UIManager.js';
 import { GameManager } from './core/GameManager.js';
 import { SoundManager } from './utils/SoundManager.js';
 import * as HandUtils from './utils/HandUtils.js';
-import { CONFIG } from './core/Constants.js';
+import { installE2EResetHook } from './core/e2eReset.js';
+import { STORAGE_KEYS } from './core/Constants.js';
+import { perfTracer } from './utils/PerfTracer.js';
+import { PerfOverlay } from './ui/modules/PerfOverlay.js';
 
 let gameInstance = null;
 
@@ -18,13 +21,22 @@ document.addEventListener('DOMContentLoaded', () => {
         ui.initialize(gameInstance);
 
         // Wire EventEmitter events to UI
-        gameInstance.events.on('deck:shuffle', () => ui.showShuffleAnimation());
+        gameInstance.events.on('deck:shuffle', () => {
+            if (!gameInstance.autoPlayer.running) ui.showShuffleAnimation();
+        });
 
-        // Update history panel after each completed hand
+        // Update history panel after each completed hand and when history is loaded or reset.
+        // Auto-play batches refresh it through history:changed instead.
         gameInstance.events.on('hand:completed', () => {
-            ui.renderHistoryPanel(
-                gameInstance.handHistory.getRecentHands(CONFIG.HAND_HISTORY_DISPLAY_COUNT)
-            );
+            if (!gameInstance.autoPlayer.running) ui.updateHistoryPanel();
+        });
+        gameInstance.events.on('history:changed', () => ui.updateHistoryPanel());
+
+        gameInstance.events.on('autoplay:started', () => ui.setAutoPlayRunning(true));
+        gameInstance.events.on('autoplay:progress', (progress) => ui.showAutoPlayProgress(progress));
+        gameInstance.events.on('autoplay:finished', (summary) => {
+            ui.showAutoPlayProgress({ ...summary, total: summary.requested, balance: summary.endBalance });
+            ui.setAutoPlayRunning(false);
         });
 
         // Show training mode feedback when an action is evaluated
@@ -32,10 +44,14 @@ document.addEventListener('DOMContentLoaded', () => {
             ui.showTrainingFeedback(evaluation);
         });
 
+        setupPerfTracing(ui);
+
         // Expose for E2E testing only in development (location.hostname check)
         if (location.hostname === 'localhost' || location.hostname === '127.0.0.1') {
             window.__game = gameInstance;
+            window.__perf = perfTracer;
             window.__HandUtils = HandUtils;
+            installE2EResetHook(gameInstance);
         }
     } catch (e) {
         console.error('Critical initialization error:', e);
@@ -48,6 +64,22 @@ document.addEventListener('DOMContentLoaded', () => {
     }
 });
 
+/**
+ * Perf tracing is a runtime flag: `?perf=1` turns it on for this browser (kept
+ * in localStorage so field reports survive reloads), `?perf=0` turns it off.
+ */
+function setupPerfTracing(ui) {
+    try {
+        const param = new globalThis.URLSearchParams(location.search).get('perf');
+        if (param !== null) localStorage.setItem(STORAGE_KEYS.PERF_TRACE, param === '0' ? '0' : '1');
+        if (localStorage.getItem(STORAGE_KEYS.PERF_TRACE) !== '1') return;
+    } catch {
+        return;
+    }
+    perfTracer.setEnabled(true);
+    new PerfOverlay(perfTracer, { getRenderStats: () => ui.getRenderStats() }).show();
+}
+
 window.addEventListener('error', function(e) {
     console.warn('JavaScript Error:', e.error);
     // Try to recover UI if possible
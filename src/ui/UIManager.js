@@ -1,10 +1,18 @@
 import * as HandUtils from '../utils/HandUtils.js';
 import { ARCHITECTURE_FLAGS, CONFIG } from '../core/Constants.js';
 import { debounce } from '../utils/debounce.js';
+import { instrumentMethods } from '../utils/PerfTracer.js';
 import { supabase } from '../supabaseClient.js';
 import { Renderer } from './modules/Renderer.js';
 import { UIBindings } from './modules/UIBindings.js';
 import { Feedback } from './modules/Feedback.js';
+import { HistoryList } from './modules/HistoryList.js';
+import { RenderScheduler } from './modules/RenderScheduler.js';
+import { CardPool, cardKey } from './modules/CardPool.js';
+import { AnimationTicker } from './modules/AnimationTicker.js';
+import { ConfettiSystem } from './modules/Confetti.js';
+import { CanvasWorkerClient } from './modules/CanvasWorkerClient.js';
+import { drawStreakChart, drawWinRateChart, pickChartStats, readThemeColors } from './modules/StatsCharts.js';
 import { UI_TEXTS_PT_BR } from './i18n/pt-BR.js';
 
 const ACTION_CONTROL_MAP = {
@@ -38,6 +46,33 @@ const ACTION_CONTROL_MAP = {
     },
 };
 
+const HISTORY_RESULT_CLASSES = {
+    win: 'history-win',
+    lose: 'history-lose',
+    tie: 'history-tie',
+    surrender: 'history-surrender',
+};
+
+const HISTORY_RESULT_LABELS = { win: 'Vitória', lose: 'Derrota', tie: 'Empate', surrender: 'Desistiu' };
+
+// History filter select value -> HandHistoryStore.find() criteria.
+const HISTORY_FILTERS = {
+    win: { result: 'win' },
+    lose: { result: 'lose' },
+    tie: { result: 'tie' },
+    surrender: { result: 'surrender' },
+    split: { action: 'split' },
+    double: { action: 'double' },
+};
+
+/** Compact key of a list of cards, for render diffing. */
+function cardsKey(cards) {
+    if (!cards || cards.length === 0) return '';
+    let key = '';
+    for (let i = 0; i < cards.length; i++) key += `${cardKey(cards[i])},`;
+    return key;
+}
+
 export class UIManager {
     constructor() {
         this.elements = {};
@@ -47,16 +82,40 @@ export class UIManager {
         this.renderer = new Renderer(this);
         this.uiBindings = new UIBindings(this);
         this.feedback = new Feedback(this);
+        this.historyView = null;
+        this.cardPool = new CardPool();
+        // One rAF loop for stat tweens and confetti; idle when nothing animates.
+        this.ticker = new AnimationTicker();
+        this.confetti = null;
+        // Confetti and stats charts move to a worker when OffscreenCanvas is available.
+        this.canvasWorker = undefined;
+        // Canvases that already have a main-thread 2D context and can no longer be transferred.
+        this._mainThreadCanvases = new WeakSet();
+        this._themeColors = null;
+        // updateUI() requests are coalesced into one render per frame; _renderCore
+        // compares each region's key with the last rendered one before touching the DOM.
+        this.renderScheduler = new RenderScheduler(() => this._renderRequested());
+        this._stateSource = null;
+        this._renderedKeys = {};
+        this._regionUpdates = {};
+        this._chips = null;
+        this._historySource = null;
+        this._historyRevision = -1;
+        this._historyNewest = null;
         this.postRoundActionsVisible = false;
     }
 
     initialize(game) {
         this.game = game;
         this.cacheElements();
+        this.invalidateRender();
+        this.ticker.attachLifecycle();
         this._applyLocalizedTexts();
         this.bindEvents();
         this.toggleLoading(false);
         this.updateAuthUI();
+        // Start loading the canvas worker now so it is ready before the first chart or win.
+        this._getCanvasWorker();
     }
 
     cacheElements() {
@@ -164,12 +223,18 @@ export class UIManager {
             historyPanel: document.getElementById('history-panel'),
             historyToggle: document.getElementById('history-toggle'),
             historyList: document.getElementById('history-list'),
+            historyFilter: document.getElementById('history-filter'),
+            historyUpcardFilter: document.getElementById('history-upcard-filter'),
             statsModalBtn: document.getElementById('stats-modal-btn'),
             statsModal: document.getElementById('stats-modal'),
             statsAdvancedGrid: document.getElementById('stats-advanced-grid'),
             statsChartWinrate: document.getElementById('stats-chart-winrate'),
             statsChartStreak: document.getElementById('stats-chart-streak'),
             statsModalClose: document.querySelector('.stats-modal-close'),
+            autoplayHands: document.getElementById('autoplay-hands'),
+            autoplayBtn: document.getElementById('autoplay-btn'),
+            autoplayCancelBtn: document.getElementById('autoplay-cancel-btn'),
+            autoplayProgress: document.getElementById('autoplay-progress'),
         };
     }
 
@@ -324,8 +389,10 @@ export class UIManager {
 
         this.bindCheckbox('sound-enabled', (checked) => game.updateSetting('soundEnabled', checked));
         this.bindCheckbox('animations-enabled', (checked) => game.updateSetting('animationsEnabled', checked));
+        this.bindCheckbox('turbo-mode', (checked) => game.updateSetting('turboMode', checked));
         this.bindCheckbox('auto-save', (checked) => game.updateSetting('autoSave', checked));
         this.bindCheckbox('show-stats', (checked) => game.updateSetting('showStats', checked));
+        this.bindCheckbox('perfect-play-toggle', (checked) => game.updateSetting('perfectPlay', checked));
         if (el.volumeSlider) {
             el.volumeSlider.addEventListener('input', (e) => {
                 const value = parseInt(e.target.value);
@@ -370,6 +437,9 @@ export class UIManager {
         if (el.historyToggle) {
             el.historyToggle.addEventListener('click', () => this._toggleHistory());
         }
+        [el.historyFilter, el.historyUpcardFilter].forEach((select) => {
+            if (select) select.addEventListener('change', () => this._applyHistoryFilter());
+        });
 
         // Advanced stats modal
         if (el.statsModalBtn) {
@@ -383,6 +453,22 @@ export class UIManager {
                 if (e.target === el.statsModal) this._closeStatsModal();
             });
         }
+
+        // Auto-play (basic strategy at the current bet)
+        if (el.autoplayBtn) {
+            el.autoplayBtn.addEventListener('click', () => {
+                const hands = parseInt(el.autoplayHands?.value, 10);
+                if (!(hands > 0)) return;
+                this.game.autoPlay({ hands }).catch((err) => {
+                    console.error('Auto-play failed:', err);
+                    this.setAutoPlayRunning(false);
+                    this.showError('O auto-jogo foi interrompido por um erro.');
+                });
+            });
+        }
+        if (el.autoplayCancelBtn) {
+            el.autoplayCancelBtn.addEventListener('click', () => this.game.cancelAutoPlay());
+        }
     }
 
     sanitizeUsername(raw) {
@@ -682,6 +768,36 @@ export class UIManager {
         }
     }
 
+    /**
+     * Queues a render for the next animation frame. Any number of calls before
+     * the frame produce a single render of the state returned by getState then.
+     * @param {Function} getState - `() => state`.
+     */
+    requestRender(getState) {
+        this._stateSource = getState;
+        this.renderScheduler.request();
+    }
+
+    /**
+     * Renders a queued frame immediately (tests, or before reading the DOM).
+     * @returns {boolean} Whether a render was pending.
+     */
+    flushRender() {
+        return this.renderScheduler.flush();
+    }
+
+    /**
+     * Render counters: requested vs performed renders and DOM updates per region.
+     * @returns {Object}
+     */
+    getRenderStats() {
+        return { ...this.renderScheduler.getStats(), regionUpdates: { ...this._regionUpdates } };
+    }
+
+    _renderRequested() {
+        if (this._stateSource) this.render(this._stateSource());
+    }
+
     render(state) {
         if (ARCHITECTURE_FLAGS.enableRendererModule) {
             this.renderer.render(state);
@@ -690,159 +806,170 @@ export class UIManager {
         this._renderCore(state);
     }
 
+    /**
+     * True when a region's key differs from the last rendered one (and records it).
+     * @param {string} region
+     * @param {*} key - Primitive summarizing what the region shows.
+     * @returns {boolean}
+     */
+    _regionChanged(region, key) {
+        if (this._renderedKeys[region] === key) return false;
+        this._renderedKeys[region] = key;
+        this._regionUpdates[region] = (this._regionUpdates[region] || 0) + 1;
+        return true;
+    }
+
+    /** Forgets rendered keys so the next render repaints every region. */
+    invalidateRender() {
+        this._renderedKeys = {};
+    }
+
     _renderCore(state) {
         if (!state) return;
 
-        if (this.elements.balance) this.animateValue(this.elements.balance, state.balance, '$');
-        if (this.elements.currentBet) this.animateValue(this.elements.currentBet, state.currentBet, '$');
-        if (this.elements.wins) this.animateValue(this.elements.wins, state.wins);
-        if (this.elements.losses) this.animateValue(this.elements.losses, state.losses);
-        if (this.elements.betInput) this.elements.betInput.value = state.currentBet;
-        if (this.elements.activeRuleProfile && state.activeRuleProfile) {
+        if (this.elements.balance && this._regionChanged('balance', state.balance)) {
+            this.animateValue(this.elements.balance, state.balance, '$');
+        }
+        if (this.elements.currentBet && this._regionChanged('currentBet', state.currentBet)) {
+            this.animateValue(this.elements.currentBet, state.currentBet, '$');
+        }
+        if (this.elements.wins && this._regionChanged('wins', state.wins)) {
+            this.animateValue(this.elements.wins, state.wins);
+        }
+        if (this.elements.losses && this._regionChanged('losses', state.losses)) {
+            this.animateValue(this.elements.losses, state.losses);
+        }
+        if (this.elements.betInput && this.elements.betInput.value !== String(state.currentBet)) {
+            this.elements.betInput.value = state.currentBet;
+        }
+        if (this.elements.activeRuleProfile && state.activeRuleProfile &&
+            this._regionChanged('ruleProfile', state.activeRuleProfile)) {
             this.elements.activeRuleProfile.textContent = `Perfil de regras: ${state.activeRuleProfile}`;
         }
 
-        this.renderHand(this.elements.dealerCards, state.dealerHand, true, state.dealerRevealed);
-        this.renderPlayerHands(state.playerHands, state.currentHandIndex);
+        if (this._regionChanged('dealerHand', `${cardsKey(state.dealerHand)}|${!!state.dealerRevealed}`)) {
+            this.renderHand(this.elements.dealerCards, state.dealerHand, true, state.dealerRevealed);
+        }
+        const handsKey = (state.playerHands || []).map(h => `${cardsKey(h.cards)}$${h.bet}`).join('|');
+        if (this._regionChanged('playerHands', `${handsKey}#${state.currentHandIndex}`)) {
+            this.renderPlayerHands(state.playerHands, state.currentHandIndex);
+        }
 
-        // Scores
-        const dealerValue = (state.dealerHand && state.dealerHand.length > 0) ?
-            HandUtils.calculateHandValue(state.dealerRevealed ? state.dealerHand : [state.dealerHand[0]]) : 0;
+        // Scores: use the engine's running totals when the state carries them.
+        let dealerValue = 0;
+        if (state.dealerHand && state.dealerHand.length > 0) {
+            if (!state.dealerRevealed) {
+                dealerValue = HandUtils.getCardNumericValue(state.dealerHand[0]);
+            } else {
+                dealerValue = state.dealerScore ? state.dealerScore.value : HandUtils.calculateHandValue(state.dealerHand);
+            }
+        }
 
         let playerValue = 0;
         if (state.playerHands && state.playerHands.length > 0 && state.playerHands[state.currentHandIndex]) {
-             playerValue = HandUtils.calculateHandValue(state.playerHands[state.currentHandIndex].cards);
+            const score = state.playerScores && state.playerScores[state.currentHandIndex];
+            playerValue = score ? score.value : HandUtils.calculateHandValue(state.playerHands[state.currentHandIndex].cards);
         }
 
         if (this.elements.dealerScore) {
             const newVal = state.dealerRevealed ? dealerValue : '?';
-            if (this.elements.dealerScore.textContent !== String(newVal)) {
+            if (this._regionChanged('dealerScore', String(newVal))) {
                 this.elements.dealerScore.textContent = newVal;
-                this.elements.dealerScore.classList.remove('pulse');
-                void this.elements.dealerScore.offsetWidth;
-                this.elements.dealerScore.classList.add('pulse');
+                this._pulse(this.elements.dealerScore);
             }
         }
 
-        if (this.elements.playerScore) {
-            if (this.elements.playerScore.textContent !== String(playerValue)) {
-                this.elements.playerScore.textContent = playerValue;
-                this.elements.playerScore.classList.remove('pulse');
-                void this.elements.playerScore.offsetWidth;
-                this.elements.playerScore.classList.add('pulse');
-            }
+        if (this.elements.playerScore && this._regionChanged('playerScore', String(playerValue))) {
+            this.elements.playerScore.textContent = playerValue;
+            this._pulse(this.elements.playerScore);
         }
 
-        this.updateStats(state.wins, state.losses, state.totalWinnings, state.blackjacks);
+        const statsKey = `${state.wins}|${state.losses}|${state.totalWinnings}|${state.blackjacks}`;
+        if (this._regionChanged('stats', statsKey)) {
+            this.updateStats(state.wins, state.losses, state.totalWinnings, state.blackjacks);
+        }
 
         // Update Buttons
         this._updateActionControls(state);
 
         // Highlight selected chip
-        const chips = document.querySelectorAll('.chip');
-        chips.forEach(chip => {
-            const val = parseInt(chip.dataset.value);
-            if (val === state.currentBet) {
-                chip.classList.add('selected');
-            } else {
-                chip.classList.remove('selected');
-            }
-        });
+        if (this._regionChanged('chips', state.currentBet)) {
+            if (!this._chips || this._chips.length === 0) this._chips = document.querySelectorAll('.chip');
+            this._chips.forEach(chip => {
+                chip.classList.toggle('selected', parseInt(chip.dataset.value) === state.currentBet);
+            });
+        }
 
         // Sync training mode toggle with game state
-        if (this.elements.trainingModeToggle && state.trainingMode !== undefined) {
+        if (this.elements.trainingModeToggle && state.trainingMode !== undefined &&
+            this.elements.trainingModeToggle.checked !== state.trainingMode) {
             this.elements.trainingModeToggle.checked = state.trainingMode;
         }
+        if (state.settings && this._regionChanged('perfectPlay', !!state.settings.perfectPlay)) {
+            this.syncCheckbox('perfect-play-toggle', !!state.settings.perfectPlay);
+        }
+        if (state.settings && this._regionChanged('turboMode', !!state.settings.turboMode)) {
+            this.syncCheckbox('turbo-mode', !!state.settings.turboMode);
+        }
+
+        if (state.totalCards !== undefined &&
+            this._regionChanged('shoe', `${state.remainingCards}/${state.totalCards}`)) {
+            this.updateShoeIndicator(state.remainingCards, state.totalCards);
+        }
+    }
+
+    /**
+     * Restarts the score pulse animation. The class is re-added in the next
+     * frame instead of forcing a synchronous reflow.
+     */
+    _pulse(element) {
+        element.classList.remove('pulse');
+        if (element._pulseFrame) cancelAnimationFrame(element._pulseFrame);
+        element._pulseFrame = requestAnimationFrame(() => {
+            element._pulseFrame = null;
+            element.classList.add('pulse');
+        });
     }
 
     renderHand(container, hand, isDealer, revealDealer) {
         if (!container) return;
 
         if (!hand || hand.length === 0) {
-            container.innerHTML = '';
+            this.cardPool.releaseAll(container);
             return;
         }
 
-        // Sync hand cards with DOM elements to support transitions
+        // Sync hand cards with DOM elements to support transitions. Each element
+        // carries the card it shows (_cardKey), so nothing is read back from the DOM.
         hand.forEach((card, index) => {
             const isHidden = isDealer && index === 1 && !revealDealer;
-            let cardEl = container.children[index];
+            const cardEl = container.children[index];
+
+            if (cardEl && cardEl._cardKey === cardKey(card)) {
+                // Same card: just handle flip
+                this.cardPool.setHidden(cardEl, isHidden);
+                return;
+            }
 
+            // New or different card: (re)insert a pooled element to trigger the deal animation
+            const newCardEl = this.cardPool.acquire(card, isHidden);
+            if (this.animationsEnabled) newCardEl.style.animationDelay = `${index * 0.12}s`;
             if (cardEl) {
-                // Check if card content matches (to detect new vs same card)
-                const currentVal = cardEl.querySelector('.value')?.textContent;
-                const currentSuit = cardEl.querySelector('.suit')?.textContent;
-
-                if (currentVal !== card.value || currentSuit !== card.suit) {
-                    // Mismatch: Replace element to trigger deal animation
-                    const newCardEl = this.createCardElement(card, isHidden);
-                    if (this.animationsEnabled) newCardEl.style.animationDelay = `${index * 0.12}s`;
-                    container.replaceChild(newCardEl, cardEl);
-                } else {
-                    // Match: Just handle flip
-                    if (isHidden) {
-                        cardEl.classList.add('flipped');
-                    } else {
-                        cardEl.classList.remove('flipped');
-                    }
-                }
+                container.replaceChild(newCardEl, cardEl);
+                this.cardPool.release(cardEl);
             } else {
-                // New card
-                cardEl = this.createCardElement(card, isHidden);
-                if (this.animationsEnabled) {
-                    cardEl.style.animationDelay = `${index * 0.12}s`;
-                }
-                container.appendChild(cardEl);
+                container.appendChild(newCardEl);
             }
         });
 
         // Remove excess cards
         while (container.children.length > hand.length) {
-            container.removeChild(container.lastChild);
+            this.cardPool.release(container.removeChild(container.lastChild));
         }
     }
 
     createCardElement(card, hidden = false) {
-        const cardEl = document.createElement('div');
-        cardEl.className = 'card';
-        cardEl.setAttribute('role', 'img');
-        if (hidden) cardEl.classList.add('flipped');
-
-        const suitNames = { '♠': 'Espadas', '♥': 'Copas', '♦': 'Ouros', '♣': 'Paus' };
-        const suitName = suitNames[card.suit] || card.suit;
-        cardEl.setAttribute('aria-label', hidden ? 'Carta virada' : `${card.value} de ${suitName}`);
-
-        const inner = document.createElement('div');
-        inner.className = 'card-inner';
-
-        const front = document.createElement('div');
-        const isRed = card.suit === '♥' || card.suit === '♦';
-        front.className = `card-face card-front ${isRed ? 'red' : 'black'}`;
-        const suitTop = document.createElement('div');
-        suitTop.className = 'suit';
-        suitTop.textContent = card.suit;
-
-        const suitBottom = document.createElement('div');
-        suitBottom.className = 'suit-bottom';
-        suitBottom.textContent = card.suit;
-
-        const valueEl = document.createElement('div');
-        valueEl.className = 'value';
-        valueEl.textContent = card.value;
-
-        front.appendChild(suitTop);
-        front.appendChild(suitBottom);
-        front.appendChild(valueEl);
-
-        const back = document.createElement('div');
-        back.className = 'card-face card-back';
-        back.setAttribute('aria-hidden', 'true');
-
-        inner.appendChild(front);
-        inner.appendChild(back);
-        cardEl.appendChild(inner);
-
-        return cardEl;
+        return this.cardPool.acquire(card, hidden);
     }
 
     renderPlayerHands(hands, currentHandIndex) {
@@ -850,7 +977,7 @@ export class UIManager {
         if (!container) return;
 
         if (!hands || hands.length === 0) {
-            container.innerHTML = '';
+            this.cardPool.releaseAll(container);
             return;
         }
 
@@ -859,7 +986,7 @@ export class UIManager {
             // Remove any hand-container wrappers from previous split state
             if (container.firstChild && container.firstChild.classList &&
                 container.firstChild.classList.contains('hand-container')) {
-                container.innerHTML = '';
+                this.cardPool.releaseAll(container);
             }
             this.renderHand(container, hands[0].cards, false, false);
             return;
@@ -887,7 +1014,10 @@ export class UIManager {
                 handWrapper.appendChild(cardsContainer);
 
                 if (container.children[index]) {
-                    container.replaceChild(handWrapper, container.children[index]);
+                    const replaced = container.children[index];
+                    container.replaceChild(handWrapper, replaced);
+                    if (replaced._cardKey) this.cardPool.release(replaced);
+                    else this.cardPool.releaseAll(replaced);
                 } else {
                     container.appendChild(handWrapper);
                 }
@@ -907,7 +1037,7 @@ export class UIManager {
 
         // Remove excess wrappers
         while (container.children.length > hands.length) {
-            container.removeChild(container.lastChild);
+            this.cardPool.releaseAll(container.removeChild(container.lastChild));
         }
     }
 
@@ -923,6 +1053,28 @@ export class UIManager {
         this._updateActionControls(this.game?.getState?.() || null);
     }
 
+    /**
+     * Switches the auto-play controls between idle and running.
+     * @param {boolean} running
+     */
+    setAutoPlayRunning(running) {
+        const el = this.elements;
+        if (el.autoplayBtn) el.autoplayBtn.disabled = running;
+        if (el.autoplayHands) el.autoplayHands.disabled = running;
+        if (el.autoplayCancelBtn) el.autoplayCancelBtn.style.display = running ? 'inline-block' : 'none';
+        if (running && el.autoplayProgress) el.autoplayProgress.textContent = '';
+    }
+
+    /**
+     * @param {{ played: number, total: number, net: number }} progress - From autoplay:progress.
+     */
+    showAutoPlayProgress({ played, total, net }) {
+        const el = this.elements.autoplayProgress;
+        if (!el) return;
+        const sign = net >= 0 ? '+' : '-';
+        el.textContent = `${played}/${total} mãos (${sign}$${Math.abs(net)})`;
+    }
+
     showMessage(text, type) {
         if (ARCHITECTURE_FLAGS.enableFeedbackModule) {
             this.feedback.showMessage(text, type);
@@ -973,6 +1125,7 @@ export class UIManager {
         } else {
             document.body.classList.remove('theme-light');
         }
+        this._themeColors = null;
         if (this.elements.themeDark) this.elements.themeDark.classList.toggle('active', theme !== 'light');
         if (this.elements.themeLight) this.elements.themeLight.classList.toggle('active', theme === 'light');
         if (this.game) this.game.updateSetting('theme', theme);
@@ -998,71 +1151,83 @@ export class UIManager {
             canvas.style.zIndex = '9999';
             document.body.appendChild(canvas);
 
-            window.addEventListener('resize', () => {
-                canvas.width = window.innerWidth;
-                canvas.height = window.innerHeight;
-            });
+            window.addEventListener('resize', () => this._sizeConfettiCanvas(canvas));
+        }
+        this._sizeConfettiCanvas(canvas);
+        return canvas;
+    }
+
+    _sizeConfettiCanvas(canvas) {
+        // A transferred canvas can only be resized by the worker that owns it.
+        if (this.canvasWorker && this.canvasWorker.has('confetti')) {
+            this.canvasWorker.resize('confetti', window.innerWidth, window.innerHeight);
+            return;
         }
         canvas.width = window.innerWidth;
         canvas.height = window.innerHeight;
-        return canvas;
     }
 
     drawConfetti() {
-        if (this.confettiAnimationId) {
-            cancelAnimationFrame(this.confettiAnimationId);
+        const canvas = this.setupConfettiCanvas();
+        const worker = this._getCanvasWorker();
+        if (worker && (worker.has('confetti') || !this.confetti)) {
+            worker.attach('confetti', canvas);
+            worker.confetti();
+            return;
         }
 
-        const canvas = this.setupConfettiCanvas();
-        const ctx = canvas.getContext('2d');
-        const particles = [];
-        const particleCount = 150;
-        const colors = ['#FFD700', '#FFA500', '#2ecc71', '#3498db', '#e74c3c', '#ffffff'];
-
-        for (let i = 0; i < particleCount; i++) {
-            particles.push({
-                x: Math.random() * canvas.width,
-                y: Math.random() * canvas.height - canvas.height,
-                vx: Math.random() * 4 - 2,
-                vy: Math.random() * 5 + 2,
-                color: colors[Math.floor(Math.random() * colors.length)],
-                size: Math.random() * 8 + 4,
-                rotation: Math.random() * 360,
-                rotationSpeed: Math.random() * 4 - 2
-            });
+        if (!this.confetti || this.confetti.canvas !== canvas) {
+            if (this.confetti) this.ticker.remove(this.confetti);
+            this.confetti = new ConfettiSystem(canvas);
         }
+        this.confetti.burst();
+        this.ticker.add(this.confetti);
+    }
 
-        const update = () => {
-            ctx.clearRect(0, 0, canvas.width, canvas.height);
-            let activeParticles = 0;
-
-            particles.forEach(p => {
-                p.y += p.vy;
-                p.x += p.vx;
-                p.rotation += p.rotationSpeed;
-                p.vy += 0.05; // gravity
-
-                if (p.y < canvas.height) {
-                    activeParticles++;
-                    ctx.save();
-                    ctx.translate(p.x, p.y);
-                    ctx.rotate((p.rotation * Math.PI) / 180);
-                    ctx.fillStyle = p.color;
-                    ctx.fillRect(-p.size / 2, -p.size / 2, p.size, p.size);
-                    ctx.restore();
+    /**
+     * Canvas worker, created on first use. Null when disabled by
+     * CONFIG.OFFSCREEN_CANVAS, when OffscreenCanvas is not available, while the
+     * worker is still loading and after it failed; drawing then stays on the
+     * main thread.
+     * @returns {CanvasWorkerClient|null}
+     */
+    _getCanvasWorker() {
+        if (this.canvasWorker === undefined) {
+            this.canvasWorker = null;
+            if (CONFIG.OFFSCREEN_CANVAS && CanvasWorkerClient.isSupported()) {
+                try {
+                    this.canvasWorker = new CanvasWorkerClient(undefined, {
+                        onError: (err, canvases) => this._onCanvasWorkerError(err, canvases),
+                    });
+                } catch (err) {
+                    console.warn('Canvas worker unavailable, drawing on the main thread:', err);
                 }
-            });
-
-            if (activeParticles > 0) {
-                this.confettiAnimationId = requestAnimationFrame(update);
-            } else {
-                ctx.clearRect(0, 0, canvas.width, canvas.height);
-                cancelAnimationFrame(this.confettiAnimationId);
-                this.confettiAnimationId = null;
             }
-        };
+        }
+        return this.canvasWorker && this.canvasWorker.ready ? this.canvasWorker : null;
+    }
 
-        update();
+    /**
+     * Falls back to main-thread drawing. Transferred canvases cannot get a 2D
+     * context again, so each is swapped for a fresh copy.
+     * @param {*} err
+     * @param {Array<Object>} canvases - Canvases the worker had taken.
+     */
+    _onCanvasWorkerError(err, canvases) {
+        console.warn('Canvas worker failed, drawing on the main thread:', err);
+        this.canvasWorker = null;
+        for (const canvas of canvases) {
+            const fresh = canvas.cloneNode(false);
+            canvas.replaceWith(fresh);
+            if (this.elements.statsChartWinrate === canvas) this.elements.statsChartWinrate = fresh;
+            if (this.elements.statsChartStreak === canvas) this.elements.statsChartStreak = fresh;
+        }
+    }
+
+    /** Chart colours from the theme's CSS variables, read once per theme. */
+    _getThemeColors() {
+        if (!this._themeColors) this._themeColors = readThemeColors();
+        return this._themeColors;
     }
 
     // ── Gameplay feedback helpers ──────────────────────────────────────
@@ -1200,49 +1365,12 @@ export class UIManager {
     animateValue(element, target, prefix = '', suffix = '') {
         if (!element) return;
 
-        // Cancel existing animation if any
-        if (element.dataset.animId) {
-            cancelAnimationFrame(parseInt(element.dataset.animId));
-            delete element.dataset.animId;
-        }
-
         // If animations disabled, update instantly
         if (!this.animationsEnabled) {
-            element.textContent = `${prefix}${target}${suffix}`;
+            this.ticker.set(element, target, prefix, suffix);
             return;
         }
-
-        const currentText = element.textContent.replace(/[^0-9.-]/g, '');
-        let start = parseInt(currentText);
-        if (isNaN(start)) start = 0;
-
-        if (start === target) {
-             element.textContent = `${prefix}${target}${suffix}`;
-             return;
-        }
-
-        const duration = 500;
-        const startTime = performance.now();
-
-        const step = (currentTime) => {
-            const elapsed = currentTime - startTime;
-            const progress = Math.min(elapsed / duration, 1);
-
-            // Ease out cubic
-            const ease = 1 - Math.pow(1 - progress, 3);
-
-            const value = Math.round(start + ((target - start) * ease));
-            element.textContent = `${prefix}${value}${suffix}`;
-
-            if (progress < 1) {
-                element.dataset.animId = requestAnimationFrame(step);
-            } else {
-                element.textContent = `${prefix}${target}${suffix}`;
-                delete element.dataset.animId;
-            }
-        };
-
-        element.dataset.animId = requestAnimationFrame(step);
+        this.ticker.tween(element, target, { prefix, suffix });
     }
 
     // ── New feature methods ──
@@ -1265,6 +1393,10 @@ export class UIManager {
             el.classList.add('wrong');
             el.textContent = `${UI_TEXTS_PT_BR.training.wrongPrefix}${evaluation.recommendedLabel} — ${evaluation.explanation}`;
         }
+        if (!evaluation.isOptimal && evaluation.evLoss > 0) {
+            const cost = (evaluation.evLoss * 100).toFixed(1);
+            el.textContent += `${UI_TEXTS_PT_BR.training.evCostPrefix}${cost}${UI_TEXTS_PT_BR.training.evCostSuffix}`;
+        }
         el.style.display = 'block';
         clearTimeout(this._feedbackTimeout);
         this._feedbackTimeout = setTimeout(() => {
@@ -1273,7 +1405,8 @@ export class UIManager {
     }
 
     /**
-     * Renders the hand history panel.
+     * Renders the hand history panel from a list of entries (full rebuild).
+     * The live panel uses updateHistoryPanel() instead.
      * @param {Array<Object>} hands - Recent hand history entries (newest first).
      */
     renderHistoryPanel(hands) {
@@ -1282,52 +1415,104 @@ export class UIManager {
 
         list.innerHTML = '';
         if (!hands || hands.length === 0) {
-            const empty = document.createElement('div');
-            empty.style.cssText = 'text-align:center; padding:12px; color:var(--text-secondary); font-size:0.85em;';
-            empty.textContent = UI_TEXTS_PT_BR.history.empty;
-            list.appendChild(empty);
+            list.appendChild(this._createHistoryEmpty());
             return;
         }
 
         hands.forEach(entry => {
-            const item = document.createElement('div');
-            const resultClassMap = {
-                win: 'history-win',
-                lose: 'history-lose',
-                tie: 'history-tie',
-                surrender: 'history-surrender',
-            };
-            item.className = `history-item ${resultClassMap[entry.result] || ''}`.trim();
-            item.setAttribute('role', 'listitem');
-
-            const cardsArr = entry.playerCards?.[0] || [];
-            const cardStr = cardsArr.map(c => `${c.value}${c.suit}`).join(' ');
-            const dealerStr = entry.dealerUpCard ? `${entry.dealerUpCard.value}${entry.dealerUpCard.suit}` : '?';
-            const net = entry.netChange;
-            const netStr = net >= 0 ? `+$${net}` : `-$${Math.abs(net)}`;
-            const resultLabels = { win: 'Vitória', lose: 'Derrota', tie: 'Empate', surrender: 'Desistiu' };
-
-            const handNumEl = document.createElement('span');
-            handNumEl.className = 'history-hand-num';
-            handNumEl.textContent = `#${entry.handNumber}`;
-
-            const cardsEl = document.createElement('span');
-            cardsEl.className = 'history-cards';
-            cardsEl.textContent = `${cardStr} vs ${dealerStr}`;
-
-            const resultEl = document.createElement('span');
-            resultEl.className = 'history-result';
-            resultEl.textContent = resultLabels[entry.result] || String(entry.result ?? '');
-
-            const netEl = document.createElement('span');
-            netEl.className = `history-net ${net >= 0 ? 'positive' : 'negative'}`;
-            netEl.textContent = netStr;
-
-            item.append(handNumEl, cardsEl, resultEl, netEl);
+            const item = this._createHistoryRow();
+            this._fillHistoryRow(item, entry);
             list.appendChild(item);
         });
     }
 
+    /**
+     * Syncs the virtualized history panel with the game's hand history. New
+     * hands are prepended; a loaded or replaced history is re-read.
+     */
+    updateHistoryPanel() {
+        const list = this.elements.historyList;
+        const history = this.game?.handHistory;
+        if (!list || !history) return;
+
+        if (!this.historyView) {
+            this.historyView = new HistoryList(list, {
+                getCount: () => this.game.handHistory.store.size,
+                getEntry: (i) => this.game.handHistory.store.at(i),
+                find: (filter) => this.game.handHistory.findHands(filter),
+                loadOlder: () => this.game.loadOlderHands(),
+                createRow: () => this._createHistoryRow(),
+                fillRow: (row, entry) => this._fillHistoryRow(row, entry),
+                createEmpty: () => this._createHistoryEmpty(),
+                rowHeight: CONFIG.HISTORY_ROW_HEIGHT,
+            });
+        }
+
+        const store = history.store;
+        const newest = store.size > 0 ? store.handNumberAt(0) : null;
+        if (history !== this._historySource || history.revision !== this._historyRevision) {
+            this._historySource = history;
+            this._historyRevision = history.revision;
+            this.historyView.refresh();
+        } else if (newest !== this._historyNewest) {
+            let added = 0;
+            while (added < store.size && store.handNumberAt(added) !== this._historyNewest) added++;
+            this.historyView.prepend(added);
+        }
+        this._historyNewest = newest;
+    }
+
+    _applyHistoryFilter() {
+        if (!this.historyView) return;
+        const filter = { ...HISTORY_FILTERS[this.elements.historyFilter?.value] };
+        const upcard = Number(this.elements.historyUpcardFilter?.value);
+        if (upcard) filter.dealerUpCard = upcard;
+        this.historyView.setFilter(filter);
+    }
+
+    _createHistoryEmpty() {
+        const empty = document.createElement('div');
+        empty.style.cssText = 'text-align:center; padding:12px; color:var(--text-secondary); font-size:0.85em;';
+        empty.textContent = UI_TEXTS_PT_BR.history.empty;
+        return empty;
+    }
+
+    _createHistoryRow() {
+        const item = document.createElement('div');
+        item.setAttribute('role', 'listitem');
+
+        const handNumEl = document.createElement('span');
+        handNumEl.className = 'history-hand-num';
+        const cardsEl = document.createElement('span');
+        cardsEl.className = 'history-cards';
+        const resultEl = document.createElement('span');
+        resultEl.className = 'history-result';
+        const netEl = document.createElement('span');
+
+        item.append(handNumEl, cardsEl, resultEl, netEl);
+        item._historyParts = { handNumEl, cardsEl, resultEl, netEl };
+        return item;
+    }
+
+    /**
+     * Writes an entry into a (possibly recycled) history row. Text only, never HTML.
+     */
+    _fillHistoryRow(item, entry) {
+        const { handNumEl, cardsEl, resultEl, netEl } = item._historyParts;
+        item.className = `history-item ${HISTORY_RESULT_CLASSES[entry.result] || ''}`.trim();
+
+        const cardsArr = entry.playerCards?.[0] || [];
+        const cardStr = cardsArr.map(c => `${c.value}${c.suit}`).join(' ');
+        const dealerStr = entry.dealerUpCard ? `${entry.dealerUpCard.value}${entry.dealerUpCard.suit}` : '?';
+        const net = entry.netChange;
+
+        handNumEl.textContent = `#${entry.handNumber}`;
+        cardsEl.textContent = `${cardStr} vs ${dealerStr}`;
+        resultEl.textContent = HISTORY_RESULT_LABELS[entry.result] || String(entry.result ?? '');
+        netEl.className = `history-net ${net >= 0 ? 'positive' : 'negative'}`;
+        netEl.textContent = net >= 0 ? `+$${net}` : `-$${Math.abs(net)}`;
+    }
+
     /**
      * Toggles the history list visibility.
      */
@@ -1341,6 +1526,11 @@ export class UIManager {
             btn.textContent = isHidden ? UI_TEXTS_PT_BR.history.expandedSymbol : UI_TEXTS_PT_BR.history.collapsedSymbol;
             btn.setAttribute('aria-expanded', String(isHidden));
         }
+        // The viewport had no height while hidden.
+        if (isHidden) {
+            if (this.historyView) this.historyView.scheduleRender();
+            else this.updateHistoryPanel();
+        }
     }
 
     _computeActionControlState(state) {
@@ -1377,9 +1567,10 @@ export class UIManager {
             const element = this.elements[elementKey];
             if (!element) return;
 
-            const isVisible = config.visible(controlState);
-            element.style.display = isVisible ? 'inline-block' : 'none';
-            element.disabled = config.disabled(controlState);
+            const display = config.visible(controlState) ? 'inline-block' : 'none';
+            const disabled = config.disabled(controlState);
+            if (element.style.display !== display) element.style.display = display;
+            if (element.disabled !== disabled) element.disabled = disabled;
         });
     }
 
@@ -1443,80 +1634,29 @@ export class UIManager {
      * @param {Object} stats
      */
     _renderStatsCharts(stats) {
-        const style = window.getComputedStyle(document.body);
-        const winColor = style.getPropertyValue('--win-color').trim() || '#2ecc71';
-        const loseColor = style.getPropertyValue('--lose-color').trim() || '#e74c3c';
-        const goldColor = style.getPropertyValue('--primary-gold').trim() || '#FFD700';
-        const textColor = style.getPropertyValue('--text-secondary').trim() || 'rgba(255,255,255,0.7)';
-
-        // Win rate bar chart
+        const colors = this._getThemeColors();
+        const chartStats = pickChartStats(stats);
         const winCanvas = this.elements.statsChartWinrate;
-        if (winCanvas) {
-            const ctx = winCanvas.getContext('2d');
-            const w = winCanvas.width;
-            const h = winCanvas.height;
-            ctx.clearRect(0, 0, w, h);
-
-            const rate = Math.min(100, Math.max(0, stats.winRate || 0));
-            const barH = h * 0.5;
-            const barY = (h - barH) / 2;
-
-            // Background bar
-            ctx.fillStyle = loseColor + '44';
-            ctx.beginPath();
-            ctx.roundRect(10, barY, w - 20, barH, 6);
-            ctx.fill();
-
-            // Win fill
-            const fillW = ((w - 20) * rate) / 100;
-            if (fillW > 0) {
-                ctx.fillStyle = winColor;
-                ctx.beginPath();
-                ctx.roundRect(10, barY, fillW, barH, 6);
-                ctx.fill();
-            }
+        const streakCanvas = this.elements.statsChartStreak;
 
-            // Label
-            ctx.fillStyle = textColor;
-            ctx.font = '12px Poppins, sans-serif';
-            ctx.textAlign = 'center';
-            ctx.fillText(`Taxa de vitória: ${rate}%`, w / 2, h - 4);
+        const worker = this._getCanvasWorker();
+        if (worker && !this._mainThreadCanvases.has(winCanvas) && !this._mainThreadCanvases.has(streakCanvas)) {
+            worker.attach('winrate', winCanvas);
+            worker.attach('streak', streakCanvas);
+            worker.setTheme(colors);
+            worker.drawStats(chartStats);
+            return;
         }
 
-        // Streak chart (win/loss streak bars)
-        const streakCanvas = this.elements.statsChartStreak;
+        if (winCanvas) {
+            this._mainThreadCanvases.add(winCanvas);
+            drawWinRateChart(winCanvas.getContext('2d'), winCanvas.width, winCanvas.height, chartStats, colors);
+        }
         if (streakCanvas) {
-            const ctx = streakCanvas.getContext('2d');
-            const w = streakCanvas.width;
-            const h = streakCanvas.height;
-            ctx.clearRect(0, 0, w, h);
-
-            const maxStreak = Math.max(1, stats.longestWinStreak, stats.longestLossStreak);
-            const barW = (w - 30) / 2;
-            const maxBarH = h * 0.6;
-
-            const drawBar = (x, value, color, label) => {
-                const barH = (value / maxStreak) * maxBarH;
-                const y = h * 0.15 + maxBarH - barH;
-                ctx.fillStyle = color;
-                ctx.beginPath();
-                ctx.roundRect(x, y, barW, barH, 4);
-                ctx.fill();
-                ctx.fillStyle = textColor;
-                ctx.font = 'bold 13px Poppins, sans-serif';
-                ctx.textAlign = 'center';
-                ctx.fillText(value, x + barW / 2, y - 4);
-                ctx.font = '10px Poppins, sans-serif';
-                ctx.fillText(label, x + barW / 2, h - 4);
-            };
-
-            drawBar(10, stats.longestWinStreak || 0, winColor, 'Vitórias');
-            drawBar(20 + barW, stats.longestLossStreak || 0, loseColor, 'Derrotas');
-
-            ctx.fillStyle = goldColor;
-            ctx.font = '10px Poppins, sans-serif';
-            ctx.textAlign = 'center';
-            ctx.fillText('Maiores Sequências', w / 2, 12);
+            this._mainThreadCanvases.add(streakCanvas);
+            drawStreakChart(streakCanvas.getContext('2d'), streakCanvas.width, streakCanvas.height, chartStats, colors);
         }
     }
 }
+
+instrumentMethods(UIManager.prototype, 'UIManager', ['render']);
@@ -0,0 +1,63 @@
+/**
+ * Canvas worker entry point (browser module Worker).
+ * Draws confetti and the stats charts on canvases transferred with
+ * transferControlToOffscreen(); see CanvasWorkerClient for the messages.
+ */
+import { AnimationTicker } from './modules/AnimationTicker.js';
+import { ConfettiSystem } from './modules/Confetti.js';
+import { drawStreakChart, drawWinRateChart, THEME_COLOR_VARS } from './modules/StatsCharts.js';
+
+const canvases = {};
+const ticker = new AnimationTicker();
+let colors = Object.fromEntries(Object.entries(THEME_COLOR_VARS).map(([key, [, fallback]]) => [key, fallback]));
+let confetti = null;
+let lastStats = null;
+
+function drawStats(stats) {
+    lastStats = stats;
+    const win = canvases.winrate;
+    if (win) drawWinRateChart(win.getContext('2d'), win.width, win.height, stats, colors);
+    const streak = canvases.streak;
+    if (streak) drawStreakChart(streak.getContext('2d'), streak.width, streak.height, stats, colors);
+}
+
+function burstConfetti() {
+    const canvas = canvases.confetti;
+    if (!canvas) return;
+    if (!confetti) {
+        confetti = new ConfettiSystem(canvas, {
+            createCanvas: () => new globalThis.OffscreenCanvas(1, 1),
+        });
+    }
+    confetti.burst();
+    ticker.add(confetti);
+}
+
+function handle(msg) {
+    switch (msg.type) {
+        case 'attach':
+            canvases[msg.name] = msg.canvas;
+            break;
+        case 'resize': {
+            const canvas = canvases[msg.name];
+            if (canvas) {
+                canvas.width = msg.width;
+                canvas.height = msg.height;
+            }
+            break;
+        }
+        case 'theme':
+            colors = msg.colors;
+            if (lastStats) drawStats(lastStats);
+            break;
+        case 'stats':
+            drawStats(msg.stats);
+            break;
+        case 'confetti':
+            burstConfetti();
+            break;
+    }
+}
+
+globalThis.onmessage = (e) => handle(e.data);
+globalThis.postMessage({ type: 'ready' });
@@ -10,6 +10,8 @@ export const UI_TEXTS_PT_BR = {
         suboptimalPrefix: '⚠️ Quase: ',
         suboptimalBridge: 'seria melhor.',
         wrongPrefix: '❌ Melhor: ',
+        evCostPrefix: ' (custo esperado: ',
+        evCostSuffix: '% da aposta)',
     },
     history: {
         empty: 'Nenhuma mão jogada ainda.',
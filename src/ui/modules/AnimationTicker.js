@@ -0,0 +1,184 @@
+/** Longest step fed to tweens and systems, so a stalled frame does not jump. */
+const MAX_STEP_MS = 100;
+
+/**
+ * Single animation loop for the UI.
+ *
+ * Owns every numeric text tween and any frame-driven system (e.g. the
+ * confetti particles) and runs them from one requestAnimationFrame chain.
+ * Tween state lives in JS: the value an element currently shows is tracked
+ * here rather than parsed back from its text. The loop stops when nothing is
+ * animating and pauses while the document is hidden.
+ */
+export class AnimationTicker {
+    /**
+     * @param {Object} [options]
+     * @param {Function} [options.requestFrame] - Defaults to requestAnimationFrame (setTimeout without it).
+     * @param {Function} [options.cancelFrame]
+     * @param {Function} [options.now] - Clock in ms, defaults to performance.now().
+     */
+    constructor(options = {}) {
+        this.requestFrame = options.requestFrame || defaultRequestFrame;
+        this.cancelFrame = options.cancelFrame || defaultCancelFrame;
+        this.now = options.now || (() => performance.now());
+        /** @type {Map<Object, Object>} Element -> running tween. */
+        this.tweens = new Map();
+        /** @type {WeakMap<Object, number>} Element -> value it currently shows. */
+        this.values = new WeakMap();
+        /** @type {Set<Object>} Objects with `step(dt)` returning whether they are still running. */
+        this.systems = new Set();
+        this.frame = null;
+        this.lastTime = 0;
+        this.paused = false;
+        this.lifecycleCleanup = null;
+        this.onFrame = (time) => this.tick(time);
+    }
+
+    /** Whether any tween or system is running. */
+    get active() {
+        return this.tweens.size > 0 || this.systems.size > 0;
+    }
+
+    /** Whether a frame is scheduled. */
+    get running() {
+        return this.frame !== null;
+    }
+
+    /**
+     * Tweens the number shown in `element` to `target` (ease-out cubic). The
+     * first value set on an element is written immediately.
+     * @param {Object} element
+     * @param {number} target
+     * @param {Object} [options]
+     * @param {string} [options.prefix]
+     * @param {string} [options.suffix]
+     * @param {number} [options.duration=500] - In ms.
+     */
+    tween(element, target, { prefix = '', suffix = '', duration = 500 } = {}) {
+        if (!element) return;
+        const running = this.tweens.get(element);
+        if (running && running.to === target && running.prefix === prefix && running.suffix === suffix) return;
+
+        const from = this.values.get(element);
+        if (from === undefined || from === target || !Number.isFinite(from)) {
+            this.set(element, target, prefix, suffix);
+            return;
+        }
+        this.tweens.set(element, { element, from, to: target, prefix, suffix, duration, elapsed: 0, shown: from });
+        this.schedule();
+    }
+
+    /**
+     * Writes a value immediately, cancelling any tween on the element.
+     * @param {Object} element
+     * @param {number} value
+     * @param {string} [prefix]
+     * @param {string} [suffix]
+     */
+    set(element, value, prefix = '', suffix = '') {
+        if (!element) return;
+        this.tweens.delete(element);
+        this.values.set(element, value);
+        element.textContent = `${prefix}${value}${suffix}`;
+    }
+
+    /**
+     * Adds a frame-driven system. `system.step(dt)` is called every frame with
+     * the elapsed ms and returns false once it has finished.
+     * @param {Object} system
+     */
+    add(system) {
+        this.systems.add(system);
+        this.schedule();
+    }
+
+    /** @param {Object} system */
+    remove(system) {
+        this.systems.delete(system);
+    }
+
+    /** @private */
+    schedule() {
+        if (this.frame !== null || this.paused || !this.active) return;
+        this.lastTime = this.now();
+        this.frame = this.requestFrame(this.onFrame);
+    }
+
+    /**
+     * Advances every tween and system by the time since the previous frame.
+     * @param {number} [time]
+     */
+    tick(time = this.now()) {
+        this.frame = null;
+        const dt = Math.min(Math.max(time - this.lastTime, 0), MAX_STEP_MS);
+        this.lastTime = time;
+
+        for (const tween of this.tweens.values()) {
+            tween.elapsed += dt;
+            const progress = Math.min(tween.elapsed / tween.duration, 1);
+            const ease = 1 - Math.pow(1 - progress, 3);
+            const value = progress < 1 ? Math.round(tween.from + (tween.to - tween.from) * ease) : tween.to;
+            if (value !== tween.shown) {
+                tween.shown = value;
+                tween.element.textContent = `${tween.prefix}${value}${tween.suffix}`;
+            }
+            this.values.set(tween.element, value);
+            if (progress >= 1) this.tweens.delete(tween.element);
+        }
+
+        for (const system of this.systems) {
+            if (system.step(dt) === false) this.systems.delete(system);
+        }
+
+        if (this.active && !this.paused) {
+            this.frame = this.requestFrame(this.onFrame);
+        }
+    }
+
+    /** Stops the loop until resume(); running animations keep their progress. */
+    pause() {
+        this.paused = true;
+        if (this.frame !== null) this.cancelFrame(this.frame);
+        this.frame = null;
+    }
+
+    resume() {
+        if (!this.paused) return;
+        this.paused = false;
+        this.schedule();
+    }
+
+    /**
+     * Pauses the loop while the document is hidden.
+     * @param {Object} [doc] - Document-like target for `visibilitychange`.
+     */
+    attachLifecycle(doc = globalThis.document) {
+        if (this.lifecycleCleanup || !doc || !doc.addEventListener) return;
+        const onVisibilityChange = () => {
+            if (doc.visibilityState === 'hidden') this.pause();
+            else this.resume();
+        };
+        doc.addEventListener('visibilitychange', onVisibilityChange);
+        this.lifecycleCleanup = () => doc.removeEventListener('visibilitychange', onVisibilityChange);
+    }
+
+    /** Drops every animation and the lifecycle listener. */
+    dispose() {
+        if (this.frame !== null) this.cancelFrame(this.frame);
+        this.frame = null;
+        this.tweens.clear();
+        this.systems.clear();
+        if (this.lifecycleCleanup) this.lifecycleCleanup();
+        this.lifecycleCleanup = null;
+    }
+}
+
+function defaultRequestFrame(callback) {
+    if (typeof requestAnimationFrame === 'function') return requestAnimationFrame(callback);
+    return setTimeout(() => callback(performance.now()), 16);
+}
+
+function defaultCancelFrame(id) {
+    if (typeof cancelAnimationFrame === 'function') cancelAnimationFrame(id);
+    else clearTimeout(id);
+}
@@ -0,0 +1,121 @@
+/**
+ * Main-thread side of the canvas worker.
+ *
+ * Canvases are handed over once with transferControlToOffscreen(); after that
+ * the worker owns their pixels and size, so resizes go through resize().
+ * Theme colours are posted only when they change and cached in the worker.
+ *
+ * The worker posts `ready` once its module has loaded. Callers transfer
+ * canvases only after that, so a worker that fails to load never takes a
+ * canvas. If it fails later, onError receives the canvases it had taken so
+ * they can be replaced and drawn on the main thread.
+ *
+ * Messages: `attach {name, canvas}`, `resize {name, width, height}`,
+ * `theme {colors}`, `stats {stats}`, `confetti`; from the worker, `ready`.
+ */
+export class CanvasWorkerClient {
+    /** Whether canvases can be transferred to a worker in this environment. */
+    static isSupported() {
+        return (
+            typeof globalThis.OffscreenCanvas === 'function' &&
+            typeof globalThis.Worker === 'function' &&
+            typeof globalThis.HTMLCanvasElement === 'function' &&
+            typeof globalThis.HTMLCanvasElement.prototype.transferControlToOffscreen === 'function'
+        );
+    }
+
+    /**
+     * @param {Function} [createWorker] - `() => worker`, defaults to a module Worker on canvasWorker.js.
+     * @param {Object} [options]
+     * @param {Function} [options.onError] - `(error, canvases)` once the worker fails; `canvases` are
+     *   the elements it had taken.
+     */
+    constructor(createWorker, { onError = null } = {}) {
+        // Inline so bundlers see the worker entry and emit it as a chunk.
+        this.worker = createWorker
+            ? createWorker()
+            : new Worker(new URL('../canvasWorker.js', import.meta.url), { type: 'module' });
+        /** @type {Map<string, Object>} Name -> transferred canvas element. */
+        this.canvases = new Map();
+        this.themeKey = null;
+        /** @type {'loading'|'ready'|'failed'} */
+        this.state = 'loading';
+        this.onError = onError;
+        this.worker.onmessage = (e) => {
+            if (e.data && e.data.type === 'ready' && this.state === 'loading') this.state = 'ready';
+        };
+        this.worker.onerror = (e) => {
+            if (e && typeof e.preventDefault === 'function') e.preventDefault();
+            this.fail(e);
+        };
+    }
+
+    /** Whether the worker has loaded and canvases may be transferred. */
+    get ready() {
+        return this.state === 'ready';
+    }
+
+    /**
+     * Stops using the worker and hands back the canvases it had taken.
+     * @param {*} error
+     */
+    fail(error) {
+        if (this.state === 'failed') return;
+        this.state = 'failed';
+        const canvases = [...this.canvases.values()];
+        this.dispose();
+        if (typeof this.onError === 'function') this.onError(error, canvases);
+    }
+
+    /**
+     * Transfers a canvas to the worker under `name`. Later calls with the same
+     * element are no-ops.
+     * @param {string} name - 'confetti', 'winrate' or 'streak'.
+     * @param {Object} canvas - A canvas element that has no rendering context yet.
+     */
+    attach(name, canvas) {
+        if (!canvas || this.canvases.get(name) === canvas) return;
+        const offscreen = canvas.transferControlToOffscreen();
+        this.canvases.set(name, canvas);
+        this.worker.postMessage({ type: 'attach', name, canvas: offscreen }, [offscreen]);
+    }
+
+    /** Whether `name` has been transferred. */
+    has(name) {
+        return this.canvases.has(name);
+    }
+
+    /**
+     * @param {string} name
+     * @param {number} width
+     * @param {number} height
+     */
+    resize(name, width, height) {
+        this.worker.postMessage({ type: 'resize', name, width, height });
+    }
+
+    /**
+     * Sends chart colours, unless the worker already has these.
+     * @param {Object} colors - From readThemeColors().
+     */
+    setTheme(colors) {
+        const key = JSON.stringify(colors);
+        if (key === this.themeKey) return;
+        this.themeKey = key;
+        this.worker.postMessage({ type: 'theme', colors });
+    }
+
+    /** @param {Object} stats - From pickChartStats(). */
+    drawStats(stats) {
+        this.worker.postMessage({ type: 'stats', stats });
+    }
+
+    confetti() {
+        this.worker.postMessage({ type: 'confetti' });
+    }
+
+    dispose() {
+        this.worker.terminate();
+        this.canvases.clear();
+    }
+}
@@ -0,0 +1,154 @@
+const SUIT_NAMES = { '♠': 'Espadas', '♥': 'Copas', '♦': 'Ouros', '♣': 'Paus' };
+
+const CARD_MARKUP =
+    '<div class="card" role="img">' +
+    '<div class="card-inner">' +
+    '<div class="card-face card-front">' +
+    '<div class="suit"></div><div class="suit-bottom"></div><div class="value"></div>' +
+    '</div>' +
+    '<div class="card-face card-back" aria-hidden="true"></div>' +
+    '</div>' +
+    '</div>';
+
+/** Pooled nodes kept per rank and suit; more than a shoe can put on the table at once. */
+const MAX_PER_KEY = 16;
+
+/**
+ * Identity of a card as stored on its element (`el._cardKey`).
+ * @param {{ value: string, suit: string }} card
+ * @returns {string}
+ */
+export function cardKey(card) {
+    return `${card.value}${card.suit}`;
+}
+
+/**
+ * Card view cache.
+ *
+ * Card elements are cloned from a single `<template>` and, once they leave the
+ * table, kept in a pool keyed by rank and suit. acquire() hands back a pooled
+ * node for the same card when there is one, otherwise any pooled node with its
+ * face rewritten, and only clones the template when the pool is empty. The
+ * card shown by an element is stored on it, so callers never read it back
+ * from the DOM.
+ */
+export class CardPool {
+    /**
+     * @param {Object} [doc] - Document used to build the template (defaults to the global one).
+     */
+    constructor(doc) {
+        this.doc = doc || null;
+        this.template = null;
+        /** @type {Map<string, Array<Object>>} */
+        this.free = new Map();
+        this.size = 0;
+        this.created = 0;
+    }
+
+    /**
+     * Returns a card element showing `card`, detached from the DOM.
+     * @param {{ value: string, suit: string }} card
+     * @param {boolean} [hidden=false] - Face down.
+     * @returns {Object}
+     */
+    acquire(card, hidden = false) {
+        const key = cardKey(card);
+        let el = this.take(key);
+        if (!el) {
+            el = this.take(null) || this.clone();
+            this.fill(el, card, key);
+        }
+        el.style.animationDelay = '';
+        this.setHidden(el, hidden);
+        return el;
+    }
+
+    /**
+     * Returns an element to the pool. The caller removes it from the DOM.
+     * @param {Object} el
+     */
+    release(el) {
+        if (!el || !el._cardKey) return;
+        const bucket = this.free.get(el._cardKey);
+        if (bucket) {
+            if (bucket.length >= MAX_PER_KEY) return;
+            bucket.push(el);
+        } else {
+            this.free.set(el._cardKey, [el]);
+        }
+        this.size++;
+    }
+
+    /**
+     * Releases every card element inside `container` and empties it.
+     * @param {Object} container
+     */
+    releaseAll(container) {
+        if (!container) return;
+        const cards = container.querySelectorAll ? container.querySelectorAll('.card') : [];
+        cards.forEach((el) => this.release(el));
+        container.innerHTML = '';
+    }
+
+    /**
+     * Turns a card face down or up, updating its accessible label.
+     * @param {Object} el
+     * @param {boolean} hidden
+     */
+    setHidden(el, hidden) {
+        if (el._hidden === hidden) return;
+        el._hidden = hidden;
+        el.classList.toggle('flipped', hidden);
+        el.setAttribute('aria-label', hidden ? 'Carta virada' : el._cardLabel);
+    }
+
+    /** @private */
+    take(key) {
+        if (this.size === 0) return null;
+        if (key !== null) {
+            const bucket = this.free.get(key);
+            if (!bucket || bucket.length === 0) return null;
+            this.size--;
+            return bucket.pop();
+        }
+        for (const bucket of this.free.values()) {
+            if (bucket.length > 0) {
+                this.size--;
+                return bucket.pop();
+            }
+        }
+        return null;
+    }
+
+    /** @private */
+    clone() {
+        if (!this.template) {
+            this.template = (this.doc || document).createElement('template');
+            this.template.innerHTML = CARD_MARKUP;
+        }
+        const el = this.template.content.firstElementChild.cloneNode(true);
+        el._cardParts = {
+            front: el.querySelector('.card-front'),
+            suit: el.querySelector('.suit'),
+            suitBottom: el.querySelector('.suit-bottom'),
+            value: el.querySelector('.value'),
+        };
+        el._cardKey = null;
+        el._hidden = null;
+        this.created++;
+        return el;
+    }
+
+    /** @private */
+    fill(el, card, key) {
+        const parts = el._cardParts;
+        const isRed = card.suit === '♥' || card.suit === '♦';
+        parts.front.className = `card-face card-front ${isRed ? 'red' : 'black'}`;
+        parts.suit.textContent = card.suit;
+        parts.suitBottom.textContent = card.suit;
+        parts.value.textContent = card.value;
+        el._cardKey = key;
+        el._cardLabel = `${card.value} de ${SUIT_NAMES[card.suit] || card.suit}`;
+        el._hidden = null;
+    }
+}
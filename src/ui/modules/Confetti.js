@@ -0,0 +1,108 @@
+const COLORS = ['#FFD700', '#FFA500', '#2ecc71', '#3498db', '#e74c3c', '#ffffff'];
+const SPRITE_SIZE = 16;
+const FRAME_MS = 1000 / 60;
+const GRAVITY = 0.05;
+
+/**
+ * Confetti particle system, stepped by AnimationTicker.
+ *
+ * Particles live in typed arrays and each colour is pre-rendered once to a
+ * small sprite, so a frame is one setTransform + drawImage per particle with
+ * no save/restore or fillStyle changes. Motion is tuned per 60 Hz frame and
+ * scaled by the real frame time.
+ */
+export class ConfettiSystem {
+    /**
+     * @param {Object} canvas - Target canvas.
+     * @param {Object} [options]
+     * @param {number} [options.count=150]
+     * @param {Function} [options.random] - Defaults to Math.random.
+     * @param {Function} [options.createCanvas] - `() => canvas` for sprites (defaults to document.createElement).
+     */
+    constructor(canvas, options = {}) {
+        this.canvas = canvas;
+        this.ctx = canvas.getContext('2d');
+        this.count = options.count || 150;
+        this.random = options.random || Math.random;
+        this.createCanvas = options.createCanvas || (() => document.createElement('canvas'));
+        this.sprites = null;
+
+        const n = this.count;
+        this.x = new Float32Array(n);
+        this.y = new Float32Array(n);
+        this.vx = new Float32Array(n);
+        this.vy = new Float32Array(n);
+        this.rotation = new Float32Array(n);
+        this.spin = new Float32Array(n);
+        this.size = new Float32Array(n);
+        this.color = new Uint8Array(n);
+        this.alive = 0;
+    }
+
+    /** Scatters all particles above the top edge. */
+    burst() {
+        const { width, height } = this.canvas;
+        const random = this.random;
+        for (let i = 0; i < this.count; i++) {
+            this.x[i] = random() * width;
+            this.y[i] = random() * height - height;
+            this.vx[i] = random() * 4 - 2;
+            this.vy[i] = random() * 5 + 2;
+            this.color[i] = Math.floor(random() * COLORS.length);
+            this.size[i] = random() * 8 + 4;
+            this.rotation[i] = (random() * 360 * Math.PI) / 180;
+            this.spin[i] = ((random() * 4 - 2) * Math.PI) / 180;
+        }
+        this.alive = this.count;
+    }
+
+    /**
+     * Advances and draws one frame.
+     * @param {number} dt - Elapsed ms.
+     * @returns {boolean} Whether any particle is still on screen.
+     */
+    step(dt) {
+        const ctx = this.ctx;
+        const { width, height } = this.canvas;
+        const sprites = this.getSprites();
+        const f = dt / FRAME_MS;
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+        ctx.clearRect(0, 0, width, height);
+
+        let alive = 0;
+        for (let i = 0; i < this.count; i++) {
+            if (this.y[i] >= height) continue;
+            this.x[i] += this.vx[i] * f;
+            this.y[i] += this.vy[i] * f;
+            this.rotation[i] += this.spin[i] * f;
+            this.vy[i] += GRAVITY * f;
+            if (this.y[i] >= height) continue;
+
+            alive++;
+            const s = this.size[i];
+            const cos = Math.cos(this.rotation[i]) * s;
+            const sin = Math.sin(this.rotation[i]) * s;
+            ctx.setTransform(cos, sin, -sin, cos, this.x[i], this.y[i]);
+            ctx.drawImage(sprites[this.color[i]], -0.5, -0.5, 1, 1);
+        }
+        ctx.setTransform(1, 0, 0, 1, 0, 0);
+        this.alive = alive;
+        if (alive === 0) ctx.clearRect(0, 0, width, height);
+        return alive > 0;
+    }
+
+    /** @private */
+    getSprites() {
+        if (this.sprites) return this.sprites;
+        this.sprites = COLORS.map((color) => {
+            const sprite = this.createCanvas();
+            sprite.width = SPRITE_SIZE;
+            sprite.height = SPRITE_SIZE;
+            const sctx = sprite.getContext('2d');
+            sctx.fillStyle = color;
+            sctx.fillRect(0, 0, SPRITE_SIZE, SPRITE_SIZE);
+            return sprite;
+        });
+        return this.sprites;
+    }
+}
@@ -0,0 +1,187 @@
+/**
+ * Virtualized hand history list.
+ *
+ * Only the rows inside the viewport (plus a few above and below) exist in the
+ * DOM. Rows are absolutely positioned inside a spacer as tall as the whole
+ * list and are recycled from a pool as the list scrolls. Rows are keyed by
+ * entry object, so a new hand only inserts one row and moves the others; older
+ * pages are requested from the source when the user scrolls near the end.
+ */
+export class HistoryList {
+    /**
+     * @param {Object} container - Scrollable list element.
+     * @param {Object} options
+     * @param {Function} options.getCount - `() => number` of hands in the source.
+     * @param {Function} options.getEntry - `(i) => entry`, newest first.
+     * @param {Function} [options.find] - `(filter) => Array<entry>` for filtered views.
+     * @param {Function} [options.loadOlder] - `() => Promise<boolean>`, resolves whether more pages remain.
+     * @param {Function} options.createRow - `() => element`.
+     * @param {Function} options.fillRow - `(row, entry) => void`.
+     * @param {Function} [options.createEmpty] - `() => element` shown when the list is empty.
+     * @param {number} [options.rowHeight] - Fixed row height in px.
+     * @param {number} [options.overscan] - Extra rows rendered above and below the viewport.
+     */
+    constructor(container, options) {
+        this.container = container;
+        this.options = options;
+        this.rowHeight = options.rowHeight || 32;
+        this.overscan = options.overscan ?? 6;
+        this.filter = null;
+        /** @type {Array<Object>|null} Matching entries while a filter is active. */
+        this.items = null;
+        /** @type {Map<Object, Object>} Entry -> row currently showing it. */
+        this.rows = new Map();
+        this.pool = [];
+        this.frame = null;
+        this.loading = false;
+        this.hasMore = true;
+
+        this.spacer = document.createElement('div');
+        this.spacer.className = 'history-spacer';
+        this.spacer.style.position = 'relative';
+        this.emptyEl = options.createEmpty ? options.createEmpty() : null;
+        container.innerHTML = '';
+        container.classList?.add('virtual');
+        if (this.emptyEl) container.appendChild(this.emptyEl);
+        container.appendChild(this.spacer);
+
+        this.onScroll = () => this.scheduleRender();
+        container.addEventListener('scroll', this.onScroll, { passive: true });
+    }
+
+    get count() {
+        return this.items ? this.items.length : this.options.getCount();
+    }
+
+    entryAt(i) {
+        return this.items ? this.items[i] : this.options.getEntry(i);
+    }
+
+    /**
+     * Shows only hands matching the filter (see HandHistoryStore.find()), or all hands for null.
+     * @param {Object|null} filter
+     */
+    setFilter(filter) {
+        this.filter = filter && Object.keys(filter).length > 0 ? filter : null;
+        this.container.scrollTop = 0;
+        this.refresh();
+    }
+
+    /**
+     * Re-reads the source, e.g. after history was loaded or replaced.
+     */
+    refresh() {
+        this.hasMore = true;
+        this.updateItems();
+        this.scheduleRender();
+    }
+
+    /**
+     * New hands were added at the top. Rows already on screen keep their
+     * content; when the list is scrolled the offset is shifted so the view does
+     * not jump.
+     * @param {number} added - Number of new hands.
+     */
+    prepend(added) {
+        const before = this.count;
+        this.updateItems();
+        const shift = this.filter ? Math.max(0, this.count - before) : added;
+        if (this.container.scrollTop > 0 && shift > 0) {
+            this.container.scrollTop += shift * this.rowHeight;
+        }
+        this.scheduleRender();
+    }
+
+    updateItems() {
+        this.items = this.filter && this.options.find ? this.options.find(this.filter) : null;
+    }
+
+    scheduleRender() {
+        if (this.frame !== null) return;
+        if (typeof requestAnimationFrame === 'function') {
+            this.frame = requestAnimationFrame(() => this.render());
+        } else {
+            this.frame = 0;
+            this.render();
+        }
+    }
+
+    render() {
+        this.frame = null;
+        const count = this.count;
+        const rh = this.rowHeight;
+        this.spacer.style.height = `${count * rh}px`;
+        if (this.emptyEl) this.emptyEl.style.display = count === 0 ? '' : 'none';
+
+        const top = this.container.scrollTop || 0;
+        const height = this.container.clientHeight || rh * 10;
+        const first = Math.max(0, Math.floor(top / rh) - this.overscan);
+        const last = Math.min(count - 1, Math.ceil((top + height) / rh) + this.overscan);
+
+        const visible = new Map();
+        const unbound = [];
+        for (let i = first; i <= last; i++) {
+            const entry = this.entryAt(i);
+            if (!entry) continue;
+            const row = this.rows.get(entry);
+            if (row) {
+                this.rows.delete(entry);
+                visible.set(entry, row);
+                row.style.transform = `translateY(${i * rh}px)`;
+            } else {
+                unbound.push(i);
+            }
+        }
+        for (const row of this.rows.values()) {
+            row.style.display = 'none';
+            this.pool.push(row);
+        }
+        for (const i of unbound) {
+            const entry = this.entryAt(i);
+            const row = this.pool.pop() || this.createRow();
+            this.options.fillRow(row, entry);
+            row.style.display = '';
+            row.style.transform = `translateY(${i * rh}px)`;
+            visible.set(entry, row);
+        }
+        this.rows = visible;
+
+        if (last >= count - 1 - this.overscan) this.loadOlder();
+    }
+
+    createRow() {
+        const row = this.options.createRow();
+        row.style.position = 'absolute';
+        row.style.left = '0';
+        row.style.right = '0';
+        row.style.top = '0';
+        row.style.height = `${this.rowHeight}px`;
+        this.spacer.appendChild(row);
+        return row;
+    }
+
+    loadOlder() {
+        if (this.loading || !this.hasMore || !this.options.loadOlder) return;
+        this.loading = true;
+        Promise.resolve(this.options.loadOlder())
+            .then((more) => {
+                this.hasMore = more === true;
+            })
+            .catch((err) => {
+                console.warn('Could not load older hands:', err);
+                this.hasMore = false;
+            })
+            .finally(() => {
+                this.loading = false;
+                this.updateItems();
+                this.scheduleRender();
+            });
+    }
+
+    /** Removes the scroll listener and pending frame. */
+    destroy() {
+        this.container.removeEventListener('scroll', this.onScroll);
+        if (this.frame && typeof cancelAnimationFrame === 'function') cancelAnimationFrame(this.frame);
+        this.frame = null;
+    }
+}
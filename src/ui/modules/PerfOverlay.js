@@ -0,0 +1,112 @@
+const REFRESH_MS = 1000;
+const MAX_ROWS = 12;
+
+/**
+ * Small fixed panel with the perf tracer's numbers: p50/p95 per span, long
+ * tasks and render counts, plus a button that downloads the trace as Chrome
+ * trace-event JSON. Built with textContent only and refreshed once a second
+ * while it is shown.
+ */
+export class PerfOverlay {
+    /**
+     * @param {Object} tracer - A PerfTracer.
+     * @param {Object} [options]
+     * @param {Function} [options.getRenderStats] - `() => stats` from UIManager.getRenderStats().
+     * @param {Object} [options.doc] - Document, defaults to the global one.
+     */
+    constructor(tracer, { getRenderStats = null, doc = globalThis.document } = {}) {
+        this.tracer = tracer;
+        this.getRenderStats = getRenderStats;
+        this.doc = doc;
+        this.root = null;
+        this.body = null;
+        this.timer = null;
+    }
+
+    show() {
+        if (!this.root) this.build();
+        this.root.style.display = 'block';
+        this.refresh();
+        if (!this.timer) this.timer = setInterval(() => this.refresh(), REFRESH_MS);
+    }
+
+    hide() {
+        if (this.root) this.root.style.display = 'none';
+        if (this.timer) clearInterval(this.timer);
+        this.timer = null;
+    }
+
+    build() {
+        const doc = this.doc;
+        const root = doc.createElement('div');
+        root.id = 'perf-overlay';
+        root.setAttribute('role', 'status');
+        root.style.cssText = 'position: fixed; bottom: 8px; left: 8px; z-index: 10000; padding: 8px 10px;' +
+            ' background: rgba(0,0,0,0.8); color: #fff; font: 11px/1.4 monospace; border-radius: 6px;' +
+            ' pointer-events: auto; max-width: 360px;';
+
+        const actions = doc.createElement('div');
+        actions.style.cssText = 'display: flex; gap: 6px; margin-bottom: 6px;';
+        actions.appendChild(this.button('Exportar trace', () => this.download()));
+        actions.appendChild(this.button('Limpar', () => {
+            this.tracer.reset();
+            this.refresh();
+        }));
+        actions.appendChild(this.button('×', () => this.hide()));
+
+        this.body = doc.createElement('pre');
+        this.body.style.cssText = 'margin: 0; white-space: pre;';
+
+        root.appendChild(actions);
+        root.appendChild(this.body);
+        doc.body.appendChild(root);
+        this.root = root;
+    }
+
+    button(label, onClick) {
+        const btn = this.doc.createElement('button');
+        btn.type = 'button';
+        btn.textContent = label;
+        btn.style.cssText = 'padding: 2px 8px; font-size: 11px; min-width: auto;';
+        btn.addEventListener('click', onClick);
+        return btn;
+    }
+
+    /**
+     * The panel's text: one line per span, then long tasks and renders.
+     * @returns {string}
+     */
+    format() {
+        const lines = [`${'span'.padEnd(24)} ${'n'.padStart(5)} ${'p50 ms'.padStart(7)} ${'p95 ms'.padStart(7)}`];
+        for (const row of this.tracer.getSummary().slice(0, MAX_ROWS)) {
+            if (row.name === 'longtask') continue;
+            lines.push(
+                `${row.name.padEnd(24).slice(0, 24)} ${String(row.count).padStart(5)} ` +
+                `${row.p50.toFixed(2).padStart(7)} ${row.p95.toFixed(2).padStart(7)}`
+            );
+        }
+        const { count, total } = this.tracer.longTasks;
+        lines.push(`long tasks: ${count} (${Math.round(total)} ms)`);
+        const renders = this.getRenderStats ? this.getRenderStats() : null;
+        if (renders) lines.push(`renders: ${renders.performed} / ${renders.requested} pedidos`);
+        return lines.join('\n');
+    }
+
+    refresh() {
+        if (this.body) this.body.textContent = this.format();
+    }
+
+    download() {
+        const renderStats = this.getRenderStats ? this.getRenderStats() : undefined;
+        const trace = this.tracer.exportTrace({ renderStats });
+        const blob = new Blob([JSON.stringify(trace)], { type: 'application/json' });
+        const url = URL.createObjectURL(blob);
+        const a = this.doc.createElement('a');
+        a.href = url;
+        a.download = `blackjack-trace-${Date.now()}.json`;
+        this.doc.body.appendChild(a);
+        a.click();
+        a.remove();
+        URL.revokeObjectURL(url);
+    }
+}
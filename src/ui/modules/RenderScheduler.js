@@ -0,0 +1,84 @@
+/**
+ * Coalesces render requests into one pass per animation frame.
+ *
+ * GameManager.updateUI() is called after every deal, hit and dealer step;
+ * each call only marks the UI dirty, and the render runs once in the next
+ * frame with the latest state. flush() renders a pending frame right away.
+ */
+export class RenderScheduler {
+    /**
+     * @param {Function} render - Performs the render.
+     * @param {Object} [options]
+     * @param {Function} [options.requestFrame] - Defaults to requestAnimationFrame (setTimeout without it).
+     * @param {Function} [options.cancelFrame]
+     */
+    constructor(render, options = {}) {
+        this.renderFn = render;
+        this.requestFrame = options.requestFrame || defaultRequestFrame;
+        this.cancelFrame = options.cancelFrame || defaultCancelFrame;
+        this.frame = null;
+        this.stats = { requested: 0, performed: 0 };
+    }
+
+    /** Whether a render is waiting for the next frame. */
+    get pending() {
+        return this.frame !== null;
+    }
+
+    /** Marks the UI dirty; renders once in the next frame. */
+    request() {
+        this.stats.requested++;
+        if (this.frame !== null) return;
+        this.frame = this.requestFrame(() => {
+            this.frame = null;
+            this.run();
+        });
+    }
+
+    /**
+     * Renders now if a frame is pending.
+     * @returns {boolean} Whether a render ran.
+     */
+    flush() {
+        if (this.frame === null) return false;
+        this.cancelFrame(this.frame);
+        this.frame = null;
+        this.run();
+        return true;
+    }
+
+    run() {
+        this.stats.performed++;
+        this.renderFn();
+    }
+
+    /**
+     * Render counters: requests, renders performed and requests folded into another frame.
+     * @returns {{ requested: number, performed: number, coalesced: number }}
+     */
+    getStats() {
+        const { requested, performed } = this.stats;
+        return { requested, performed, coalesced: requested - performed };
+    }
+
+    resetStats() {
+        this.stats.requested = 0;
+        this.stats.performed = 0;
+    }
+
+    /** Drops a pending frame without rendering. */
+    cancel() {
+        if (this.frame !== null) this.cancelFrame(this.frame);
+        this.frame = null;
+    }
+}
+
+function defaultRequestFrame(callback) {
+    if (typeof requestAnimationFrame === 'function') return requestAnimationFrame(callback);
+    return setTimeout(callback, 16);
+}
+
+function defaultCancelFrame(id) {
+    if (typeof cancelAnimationFrame === 'function') cancelAnimationFrame(id);
+    else clearTimeout(id);
+}
@@ -0,0 +1,113 @@
+/**
+ * Stats modal chart drawing, shared by the main thread and the canvas worker.
+ * Functions only touch the 2D context they are given.
+ */
+
+/** CSS variables used by the charts and their fallbacks. */
+export const THEME_COLOR_VARS = {
+    win: ['--win-color', '#2ecc71'],
+    lose: ['--lose-color', '#e74c3c'],
+    gold: ['--primary-gold', '#FFD700'],
+    text: ['--text-secondary', 'rgba(255,255,255,0.7)'],
+};
+
+/**
+ * Reads chart colours from computed style. Call once per theme change, not per render.
+ * @param {Object} [style] - A CSSStyleDeclaration, defaults to getComputedStyle(document.body).
+ * @returns {{ win: string, lose: string, gold: string, text: string }}
+ */
+export function readThemeColors(style = window.getComputedStyle(document.body)) {
+    const colors = {};
+    for (const [key, [name, fallback]] of Object.entries(THEME_COLOR_VARS)) {
+        colors[key] = style.getPropertyValue(name).trim() || fallback;
+    }
+    return colors;
+}
+
+/**
+ * The fields the charts use, small enough to post to a worker.
+ * @param {Object} stats - Output of computeAdvancedStats().
+ */
+export function pickChartStats(stats) {
+    return {
+        winRate: stats.winRate || 0,
+        longestWinStreak: stats.longestWinStreak || 0,
+        longestLossStreak: stats.longestLossStreak || 0,
+    };
+}
+
+/**
+ * Win rate bar chart.
+ * @param {Object} ctx - 2D context.
+ * @param {number} w
+ * @param {number} h
+ * @param {Object} stats
+ * @param {Object} colors - From readThemeColors().
+ */
+export function drawWinRateChart(ctx, w, h, stats, colors) {
+    ctx.clearRect(0, 0, w, h);
+
+    const rate = Math.min(100, Math.max(0, stats.winRate || 0));
+    const barH = h * 0.5;
+    const barY = (h - barH) / 2;
+
+    // Background bar
+    ctx.fillStyle = colors.lose + '44';
+    ctx.beginPath();
+    ctx.roundRect(10, barY, w - 20, barH, 6);
+    ctx.fill();
+
+    // Win fill
+    const fillW = ((w - 20) * rate) / 100;
+    if (fillW > 0) {
+        ctx.fillStyle = colors.win;
+        ctx.beginPath();
+        ctx.roundRect(10, barY, fillW, barH, 6);
+        ctx.fill();
+    }
+
+    // Label
+    ctx.fillStyle = colors.text;
+    ctx.font = '12px Poppins, sans-serif';
+    ctx.textAlign = 'center';
+    ctx.fillText(`Taxa de vitória: ${rate}%`, w / 2, h - 4);
+}
+
+/**
+ * Longest win/loss streak bars.
+ * @param {Object} ctx - 2D context.
+ * @param {number} w
+ * @param {number} h
+ * @param {Object} stats
+ * @param {Object} colors - From readThemeColors().
+ */
+export function drawStreakChart(ctx, w, h, stats, colors) {
+    ctx.clearRect(0, 0, w, h);
+
+    const maxStreak = Math.max(1, stats.longestWinStreak, stats.longestLossStreak);
+    const barW = (w - 30) / 2;
+    const maxBarH = h * 0.6;
+
+    const drawBar = (x, value, color, label) => {
+        const barH = (value / maxStreak) * maxBarH;
+        const y = h * 0.15 + maxBarH - barH;
+        ctx.fillStyle = color;
+        ctx.beginPath();
+        ctx.roundRect(x, y, barW, barH, 4);
+        ctx.fill();
+        ctx.fillStyle = colors.text;
+        ctx.font = 'bold 13px Poppins, sans-serif';
+        ctx.textAlign = 'center';
+        ctx.fillText(value, x + barW / 2, y - 4);
+        ctx.font = '10px Poppins, sans-serif';
+        ctx.fillText(label, x + barW / 2, h - 4);
+    };
+
+    drawBar(10, stats.longestWinStreak || 0, colors.win, 'Vitórias');
+    drawBar(20 + barW, stats.longestLossStreak || 0, colors.lose, 'Derrotas');
+
+    ctx.fillStyle = colors.gold;
+    ctx.font = '10px Poppins, sans-serif';
+    ctx.textAlign = 'center';
+    ctx.fillText('Maiores Sequências', w / 2, 12);
+}
@@ -1,123 +1,433 @@
 /**
  * AdvancedStats - derives extended statistics from hand history and base stats.
  * Pure computation module — no DOM, no storage dependencies.
+ *
+ * AdvancedStatsAggregator keeps every metric up to date in O(1) per hand, so the
+ * stats modal never rescans history. Variance uses Welford's algorithm and
+ * percentiles the P² estimator (five markers per quantile), so neither needs the
+ * individual entries.
  */
 
+const RESULT_WIN = 1;
+const RESULT_LOSE = 2;
+const RESULT_OTHER = 3;
+
+const FLAG_DOUBLE = 1;
+const FLAG_SPLIT = 2;
+const FLAG_STRATEGY_KNOWN = 4;
+const FLAG_STRATEGY_OPTIMAL = 8;
+
+const round1 = (value) => Math.round(value * 10) / 10;
+const percent = (part, total) => (total > 0 ? Math.round((part / total) * 1000) / 10 : null);
+
+function resultCode(result) {
+    if (result === 'win') return RESULT_WIN;
+    if (result === 'lose') return RESULT_LOSE;
+    return RESULT_OTHER;
+}
+
+function entryFlags(entry) {
+    let flags = 0;
+    const actions = entry.actions;
+    if (actions) {
+        for (let i = 0; i < actions.length; i++) {
+            if (actions[i] === 'double') flags |= FLAG_DOUBLE;
+            else if (actions[i] === 'split') flags |= FLAG_SPLIT;
+        }
+    }
+    if (entry.wasStrategyOptimal !== null && entry.wasStrategyOptimal !== undefined) {
+        flags |= FLAG_STRATEGY_KNOWN;
+        if (entry.wasStrategyOptimal === true) flags |= FLAG_STRATEGY_OPTIMAL;
+    }
+    return flags;
+}
+
 /**
- * Computes advanced statistics from hand history and base game counters.
- * @param {Array<Object>} history - Array of HandHistory entries (newest first).
- * @param {Object} baseStats
- * @param {number} baseStats.wins
- * @param {number} baseStats.losses
- * @param {number} baseStats.blackjacks
- * @param {number} baseStats.totalWinnings
- * @param {number} baseStats.balance
- * @param {number} baseStats.totalAmountWagered
- * @param {number} baseStats.sessionBestBalance
- * @param {number} baseStats.sessionWorstBalance
- * @returns {Object} Advanced statistics object.
+ * Streaming mean/variance (Welford).
  */
-export function computeAdvancedStats(history, baseStats) {
-    const {
-        wins = 0,
-        losses = 0,
-        totalWinnings = 0,
-        totalAmountWagered = 0,
-        sessionBestBalance = 0,
-        sessionWorstBalance = 0,
-    } = baseStats || {};
-
-    const handsPlayed = wins + losses + (baseStats.ties || 0);
-    const winRate = handsPlayed > 0 ? (wins / handsPlayed) * 100 : 0;
-    const netROI = totalAmountWagered > 0 ? (totalWinnings / totalAmountWagered) * 100 : 0;
-
-    // Work through history oldest→newest for streak calculations
-    const chronological = [...history].reverse();
-
-    let longestWinStreak = 0;
-    let longestLossStreak = 0;
-    let currentWinStreak = 0;
-    let currentLossStreak = 0;
-
-    let doubleDownWins = 0;
-    let doubleDownLosses = 0;
-    let splitWins = 0;
-    let splitLosses = 0;
-
-    let strategyOptimalCount = 0;
-    let strategyTotalCount = 0;
-
-    chronological.forEach(entry => {
-        const result = entry.result;
-
-        // Streaks (ignore tie/surrender for streak purposes)
-        if (result === 'win') {
-            currentWinStreak++;
-            currentLossStreak = 0;
-            if (currentWinStreak > longestWinStreak) longestWinStreak = currentWinStreak;
-        } else if (result === 'lose') {
-            currentLossStreak++;
-            currentWinStreak = 0;
-            if (currentLossStreak > longestLossStreak) longestLossStreak = currentLossStreak;
+export class RunningStats {
+    constructor() {
+        this.reset();
+    }
+
+    reset() {
+        this.count = 0;
+        this.mean = 0;
+        this.m2 = 0;
+        this.min = Infinity;
+        this.max = -Infinity;
+    }
+
+    /** @param {number} x */
+    push(x) {
+        this.count++;
+        const delta = x - this.mean;
+        this.mean += delta / this.count;
+        this.m2 += delta * (x - this.mean);
+        if (x < this.min) this.min = x;
+        if (x > this.max) this.max = x;
+    }
+
+    /** Sample variance (0 with fewer than two values). */
+    get variance() {
+        return this.count > 1 ? this.m2 / (this.count - 1) : 0;
+    }
+
+    get stdDev() {
+        return Math.sqrt(this.variance);
+    }
+}
+
+/**
+ * Streaming quantile estimate with the P² algorithm (Jain & Chlamtac).
+ */
+export class P2Quantile {
+    /** @param {number} p - Quantile in (0, 1), e.g. 0.95. */
+    constructor(p) {
+        this.p = p;
+        this.q = new Float64Array(5);
+        this.n = new Float64Array(5);
+        this.np = new Float64Array(5);
+        this.dn = Float64Array.from([0, p / 2, p, (1 + p) / 2, 1]);
+        this.count = 0;
+    }
+
+    reset() {
+        this.count = 0;
+    }
+
+    /** @param {number} x */
+    push(x) {
+        const { q, n, np, dn } = this;
+        if (this.count < 5) {
+            q[this.count++] = x;
+            if (this.count === 5) {
+                q.sort();
+                for (let i = 0; i < 5; i++) n[i] = i;
+                np.set([0, 2 * this.p, 4 * this.p, 2 + 2 * this.p, 4]);
+            }
+            return;
         }
+        this.count++;
 
-        // Double down efficiency
-        if (entry.actions && entry.actions.includes('double')) {
-            if (result === 'win') doubleDownWins++;
-            else if (result === 'lose') doubleDownLosses++;
+        let k;
+        if (x < q[0]) {
+            q[0] = x;
+            k = 0;
+        } else if (x >= q[4]) {
+            q[4] = x;
+            k = 3;
+        } else {
+            k = 0;
+            while (k < 3 && x >= q[k + 1]) k++;
         }
+        for (let i = k + 1; i < 5; i++) n[i]++;
+        for (let i = 0; i < 5; i++) np[i] += dn[i];
 
-        // Split efficiency
-        if (entry.actions && entry.actions.includes('split')) {
-            if (result === 'win') splitWins++;
-            else if (result === 'lose') splitLosses++;
+        for (let i = 1; i <= 3; i++) {
+            const d = np[i] - n[i];
+            if ((d >= 1 && n[i + 1] - n[i] > 1) || (d <= -1 && n[i - 1] - n[i] < -1)) {
+                const s = Math.sign(d);
+                const parabolic = q[i] + (s / (n[i + 1] - n[i - 1])) * (
+                    ((n[i] - n[i - 1] + s) * (q[i + 1] - q[i])) / (n[i + 1] - n[i]) +
+                    ((n[i + 1] - n[i] - s) * (q[i] - q[i - 1])) / (n[i] - n[i - 1])
+                );
+                if (q[i - 1] < parabolic && parabolic < q[i + 1]) {
+                    q[i] = parabolic;
+                } else {
+                    q[i] += (s * (q[i + s] - q[i])) / (n[i + s] - n[i]);
+                }
+                n[i] += s;
+            }
         }
+    }
 
-        // Strategy compliance
-        if (entry.wasStrategyOptimal !== null && entry.wasStrategyOptimal !== undefined) {
-            strategyTotalCount++;
-            if (entry.wasStrategyOptimal === true) strategyOptimalCount++;
+    /** Current estimate, or null before the first value. */
+    get value() {
+        if (this.count === 0) return null;
+        if (this.count < 5) {
+            const sorted = Array.from(this.q.subarray(0, this.count)).sort((a, b) => a - b);
+            return sorted[Math.round(this.p * (this.count - 1))];
         }
-    });
-
-    // Current streak (from newest entry)
-    let currentStreak = { type: 'none', count: 0 };
-    if (history.length > 0) {
-        const latestResult = history[0].result;
-        let count = 0;
-        for (const entry of history) {
-            if (entry.result === latestResult) count++;
-            else break;
+        return this.q[2];
+    }
+}
+
+/**
+ * Fixed-size window over the last N hands with running sums. Stores a few
+ * numbers per hand in typed arrays, not the entries themselves.
+ */
+export class RollingWindow {
+    /** @param {number} size */
+    constructor(size) {
+        this.size = size;
+        this.net = new Float64Array(size);
+        this.bet = new Float64Array(size);
+        this.results = new Uint8Array(size);
+        this.reset();
+    }
+
+    reset() {
+        this.head = 0;
+        this.length = 0;
+        this.sumNet = 0;
+        this.sumBet = 0;
+        this.wins = 0;
+        this.losses = 0;
+    }
+
+    push(result, net, bet) {
+        if (this.length === this.size) {
+            const old = this.head;
+            this.sumNet -= this.net[old];
+            this.sumBet -= this.bet[old];
+            if (this.results[old] === RESULT_WIN) this.wins--;
+            else if (this.results[old] === RESULT_LOSE) this.losses--;
+        } else {
+            this.length++;
         }
-        currentStreak = {
-            type: latestResult === 'win' ? 'win' : latestResult === 'lose' ? 'loss' : 'other',
-            count,
+        this.net[this.head] = net;
+        this.bet[this.head] = bet;
+        this.results[this.head] = result;
+        this.head = (this.head + 1) % this.size;
+        this.sumNet += net;
+        this.sumBet += bet;
+        if (result === RESULT_WIN) this.wins++;
+        else if (result === RESULT_LOSE) this.losses++;
+    }
+
+    summary() {
+        return {
+            hands: this.length,
+            winRate: this.length > 0 ? round1((this.wins / this.length) * 100) : 0,
+            net: this.sumNet,
+            netROI: this.sumBet > 0 ? round1((this.sumNet / this.sumBet) * 100) : 0,
         };
     }
+}
 
-    const doubleTotal = doubleDownWins + doubleDownLosses;
-    const splitTotal = splitWins + splitLosses;
+function createTotals() {
+    return { hands: 0, wins: 0, losses: 0, net: 0, wagered: 0, netStats: new RunningStats() };
+}
 
+function totalsSummary(totals) {
     return {
-        winRate: Math.round(winRate * 10) / 10,
-        netROI: Math.round(netROI * 10) / 10,
-        longestWinStreak,
-        longestLossStreak,
-        currentStreak,
-        sessionBestBalance,
-        sessionWorstBalance,
-        doubleDownWins,
-        doubleDownLosses,
-        doubleDownEfficiency: doubleTotal > 0 ? Math.round((doubleDownWins / doubleTotal) * 1000) / 10 : null,
-        splitWins,
-        splitLosses,
-        splitEfficiency: splitTotal > 0 ? Math.round((splitWins / splitTotal) * 1000) / 10 : null,
-        strategyComplianceRate: strategyTotalCount > 0
-            ? Math.round((strategyOptimalCount / strategyTotalCount) * 1000) / 10
-            : null,
-        totalAmountWagered,
-        handsPlayed: history.length,
-        wins,
-        losses,
+        hands: totals.hands,
+        winRate: totals.hands > 0 ? round1((totals.wins / totals.hands) * 100) : 0,
+        net: totals.net,
+        netROI: totals.wagered > 0 ? round1((totals.net / totals.wagered) * 100) : 0,
+        netStdDev: round1(totals.netStats.stdDev),
     };
 }
+
+/**
+ * Incremental advanced statistics. Feed it each completed hand with add(), or
+ * replay stored history with rebuild(); read the result with getStats().
+ */
+export class AdvancedStatsAggregator {
+    /**
+     * @param {Object} [options]
+     * @param {number} [options.windowSize] - Hands in the "last N" window.
+     */
+    constructor({ windowSize = 100 } = {}) {
+        this.window = new RollingWindow(windowSize);
+        this.netStats = new RunningStats();
+        this.percentiles = { p5: new P2Quantile(0.05), p50: new P2Quantile(0.5), p95: new P2Quantile(0.95) };
+        this.session = createTotals();
+        this.reset();
+    }
+
+    /** Clears all-time metrics and the window (the session is kept). */
+    reset() {
+        this.handsPlayed = 0;
+        this.longestWinStreak = 0;
+        this.longestLossStreak = 0;
+        this.winRun = 0;
+        this.lossRun = 0;
+        this.lastResult = null;
+        this.lastResultRun = 0;
+        this.doubleDownWins = 0;
+        this.doubleDownLosses = 0;
+        this.splitWins = 0;
+        this.splitLosses = 0;
+        this.strategyOptimalCount = 0;
+        this.strategyTotalCount = 0;
+        this.window.reset();
+        this.netStats.reset();
+        for (const estimator of Object.values(this.percentiles)) estimator.reset();
+    }
+
+    /** Starts a new session window (e.g. after a game reset). */
+    startSession() {
+        this.session = createTotals();
+    }
+
+    /**
+     * Adds one completed hand. O(1).
+     * @param {Object} entry - HandHistory entry.
+     * @param {Object} [options]
+     * @param {boolean} [options.session] - Count the hand in the current session.
+     */
+    add(entry, { session = true } = {}) {
+        if (!entry) return;
+        const code = resultCode(entry.result);
+        const flags = entryFlags(entry);
+        const net = Number(entry.netChange) || 0;
+        const bet = Number(entry.betAmount) || 0;
+
+        this.handsPlayed++;
+        if (code === RESULT_WIN) {
+            this.winRun++;
+            this.lossRun = 0;
+            if (this.winRun > this.longestWinStreak) this.longestWinStreak = this.winRun;
+        } else if (code === RESULT_LOSE) {
+            this.lossRun++;
+            this.winRun = 0;
+            if (this.lossRun > this.longestLossStreak) this.longestLossStreak = this.lossRun;
+        }
+        if (entry.result === this.lastResult) {
+            this.lastResultRun++;
+        } else {
+            this.lastResult = entry.result;
+            this.lastResultRun = 1;
+        }
+
+        if (flags & FLAG_DOUBLE) {
+            if (code === RESULT_WIN) this.doubleDownWins++;
+            else if (code === RESULT_LOSE) this.doubleDownLosses++;
+        }
+        if (flags & FLAG_SPLIT) {
+            if (code === RESULT_WIN) this.splitWins++;
+            else if (code === RESULT_LOSE) this.splitLosses++;
+        }
+        if (flags & FLAG_STRATEGY_KNOWN) {
+            this.strategyTotalCount++;
+            if (flags & FLAG_STRATEGY_OPTIMAL) this.strategyOptimalCount++;
+        }
+
+        this.window.push(code, net, bet);
+        this.netStats.push(net);
+        for (const estimator of Object.values(this.percentiles)) estimator.push(net);
+
+        if (session) {
+            const totals = this.session;
+            totals.hands++;
+            if (code === RESULT_WIN) totals.wins++;
+            else if (code === RESULT_LOSE) totals.losses++;
+            totals.net += net;
+            totals.wagered += bet;
+            totals.netStats.push(net);
+        }
+    }
+
+    /**
+     * Replaces the all-time metrics by replaying stored history. Replayed hands
+     * do not count toward the current session.
+     * @param {Iterable<Object>} entries
+     * @param {Object} [options]
+     * @param {boolean} [options.newestFirst] - `entries` is an array ordered newest
+     *   first (HandHistory order); it is walked backwards without copying.
+     * @returns {AdvancedStatsAggregator} this
+     */
+    rebuild(entries, { newestFirst = false } = {}) {
+        this.reset();
+        if (newestFirst) {
+            for (let i = entries.length - 1; i >= 0; i--) this.add(entries[i], { session: false });
+        } else {
+            for (const entry of entries) this.add(entry, { session: false });
+        }
+        return this;
+    }
+
+    /**
+     * rebuild() for an async stream of entries in chronological order
+     * (e.g. pages read from a storage backend).
+     * @param {AsyncIterable<Object>} stream
+     * @returns {Promise<AdvancedStatsAggregator>} this
+     */
+    async rebuildFrom(stream) {
+        this.reset();
+        for await (const entry of stream) this.add(entry, { session: false });
+        return this;
+    }
+
+    /**
+     * Current statistics, in the shape computeAdvancedStats() has always returned
+     * plus variance, percentile and rolling-window metrics.
+     * @param {Object} baseStats - Game counters (see computeAdvancedStats).
+     * @returns {Object}
+     */
+    getStats(baseStats) {
+        const {
+            wins = 0,
+            losses = 0,
+            totalWinnings = 0,
+            totalAmountWagered = 0,
+            sessionBestBalance = 0,
+            sessionWorstBalance = 0,
+        } = baseStats || {};
+
+        const handsForRate = wins + losses + (baseStats?.ties || 0);
+        const winRate = handsForRate > 0 ? (wins / handsForRate) * 100 : 0;
+        const netROI = totalAmountWagered > 0 ? (totalWinnings / totalAmountWagered) * 100 : 0;
+
+        let currentStreak = { type: 'none', count: 0 };
+        if (this.handsPlayed > 0) {
+            currentStreak = {
+                type: this.lastResult === 'win' ? 'win' : this.lastResult === 'lose' ? 'loss' : 'other',
+                count: this.lastResultRun,
+            };
+        }
+
+        const { p5, p50, p95 } = this.percentiles;
+        return {
+            winRate: round1(winRate),
+            netROI: round1(netROI),
+            longestWinStreak: this.longestWinStreak,
+            longestLossStreak: this.longestLossStreak,
+            currentStreak,
+            sessionBestBalance,
+            sessionWorstBalance,
+            doubleDownWins: this.doubleDownWins,
+            doubleDownLosses: this.doubleDownLosses,
+            doubleDownEfficiency: percent(this.doubleDownWins, this.doubleDownWins + this.doubleDownLosses),
+            splitWins: this.splitWins,
+            splitLosses: this.splitLosses,
+            splitEfficiency: percent(this.splitWins, this.splitWins + this.splitLosses),
+            strategyComplianceRate: percent(this.strategyOptimalCount, this.strategyTotalCount),
+            totalAmountWagered,
+            handsPlayed: this.handsPlayed,
+            wins,
+            losses,
+            netPerHand: {
+                mean: round1(this.netStats.mean),
+                stdDev: round1(this.netStats.stdDev),
+                p5: p5.value,
+                p50: p50.value,
+                p95: p95.value,
+            },
+            lastHands: this.window.summary(),
+            session: totalsSummary(this.session),
+        };
+    }
+}
+
+/**
+ * Computes advanced statistics from hand history and base game counters.
+ * One-shot wrapper around AdvancedStatsAggregator; keep an aggregator around
+ * instead when stats are read repeatedly.
+ * @param {Array<Object>} history - Array of HandHistory entries (newest first).
+ * @param {Object} baseStats
+ * @param {number} baseStats.wins
+ * @param {number} baseStats.losses
+ * @param {number} baseStats.blackjacks
+ * @param {number} baseStats.totalWinnings
+ * @param {number} baseStats.balance
+ * @param {number} baseStats.totalAmountWagered
+ * @param {number} baseStats.sessionBestBalance
+ * @param {number} baseStats.sessionWorstBalance
+ * @returns {Object} Advanced statistics object.
+ */
+export function computeAdvancedStats(history, baseStats) {
+    return new AdvancedStatsAggregator().rebuild(history, { newestFirst: true }).getStats(baseStats);
+}
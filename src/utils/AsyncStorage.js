@@ -0,0 +1,228 @@
+/**
+ * Pluggable async storage for data that outgrows localStorage (hand history).
+ *
+ * Backends store structured-clone values (no JSON/base64 round trip) as one
+ * record per hand, keyed by [owner, id] where owner is the per-user storage key
+ * and id the hand number. Each record carries a CRC-32 of its JSON so corrupted
+ * or hand-edited records can be spotted on read.
+ *
+ * Backend interface (all methods async):
+ *   putRecords(owner, records)          records: Array<{ id, value }>
+ *   getRecords(owner, { before, limit }) newest first -> Array<{ id, value }>
+ *   countRecords(owner)
+ *   deleteOwner(owner)
+ *   getMeta(key) / setMeta(key, value)
+ */
+
+import { crc32String } from './crc32.js';
+import { StorageManager } from './StorageManager.js';
+
+const DB_NAME = 'blackjack-premium';
+const DB_VERSION = 1;
+const HANDS_STORE = 'hands';
+const META_STORE = 'meta';
+
+/**
+ * Checksum stored alongside a record value.
+ * @param {*} value
+ * @returns {number}
+ */
+export function recordChecksum(value) {
+    return crc32String(JSON.stringify(value));
+}
+
+function verifyRecord(record) {
+    if (record.crc !== recordChecksum(record.value)) {
+        console.warn('Storage record checksum mismatch - data may have been tampered');
+    }
+    return { id: record.id, value: record.value };
+}
+
+function requestToPromise(request) {
+    return new Promise((resolve, reject) => {
+        request.onsuccess = () => resolve(request.result);
+        request.onerror = () => reject(request.error);
+    });
+}
+
+function transactionDone(tx) {
+    return new Promise((resolve, reject) => {
+        tx.oncomplete = () => resolve();
+        tx.onerror = () => reject(tx.error);
+        tx.onabort = () => reject(tx.error);
+    });
+}
+
+/**
+ * IndexedDB backend. Writes run in their own transactions and never block the
+ * main thread the way localStorage.setItem does.
+ */
+export class IndexedDBBackend {
+    /**
+     * @param {Object} [factory] - IDBFactory, defaults to the global indexedDB.
+     * @param {string} [dbName]
+     */
+    constructor(factory = globalThis.indexedDB, dbName = DB_NAME) {
+        this.factory = factory;
+        this.dbName = dbName;
+        this.dbPromise = null;
+    }
+
+    open() {
+        if (!this.dbPromise) {
+            const request = this.factory.open(this.dbName, DB_VERSION);
+            request.onupgradeneeded = () => {
+                const db = request.result;
+                if (!db.objectStoreNames.contains(HANDS_STORE)) {
+                    db.createObjectStore(HANDS_STORE, { keyPath: ['owner', 'id'] });
+                }
+                if (!db.objectStoreNames.contains(META_STORE)) {
+                    db.createObjectStore(META_STORE);
+                }
+            };
+            this.dbPromise = requestToPromise(request);
+        }
+        return this.dbPromise;
+    }
+
+    ownerRange(owner, before = null) {
+        const upper = before === null ? [owner, Infinity] : [owner, before];
+        return globalThis.IDBKeyRange.bound([owner, -Infinity], upper, false, before !== null);
+    }
+
+    async putRecords(owner, records) {
+        if (records.length === 0) return;
+        const db = await this.open();
+        const tx = db.transaction(HANDS_STORE, 'readwrite');
+        const store = tx.objectStore(HANDS_STORE);
+        for (const { id, value } of records) {
+            store.put({ owner, id, value, crc: recordChecksum(value) });
+        }
+        await transactionDone(tx);
+    }
+
+    async getRecords(owner, { before = null, limit = Infinity } = {}) {
+        const db = await this.open();
+        const tx = db.transaction(HANDS_STORE, 'readonly');
+        const request = tx.objectStore(HANDS_STORE).openCursor(this.ownerRange(owner, before), 'prev');
+        const records = [];
+        return new Promise((resolve, reject) => {
+            request.onsuccess = () => {
+                const cursor = request.result;
+                if (!cursor || records.length >= limit) {
+                    resolve(records);
+                    return;
+                }
+                records.push(verifyRecord(cursor.value));
+                cursor.continue();
+            };
+            request.onerror = () => reject(request.error);
+        });
+    }
+
+    async countRecords(owner) {
+        const db = await this.open();
+        const tx = db.transaction(HANDS_STORE, 'readonly');
+        return requestToPromise(tx.objectStore(HANDS_STORE).count(this.ownerRange(owner)));
+    }
+
+    async deleteOwner(owner) {
+        const db = await this.open();
+        const tx = db.transaction(HANDS_STORE, 'readwrite');
+        tx.objectStore(HANDS_STORE).delete(this.ownerRange(owner));
+        await transactionDone(tx);
+    }
+
+    async getMeta(key) {
+        const db = await this.open();
+        const tx = db.transaction(META_STORE, 'readonly');
+        return requestToPromise(tx.objectStore(META_STORE).get(key));
+    }
+
+    async setMeta(key, value) {
+        const db = await this.open();
+        const tx = db.transaction(META_STORE, 'readwrite');
+        tx.objectStore(META_STORE).put(value, key);
+        await transactionDone(tx);
+    }
+}
+
+/**
+ * In-memory backend with the same interface (tests, or as a stand-in).
+ */
+export class MemoryBackend {
+    constructor() {
+        /** @type {Map<string, Map<number, Object>>} */
+        this.owners = new Map();
+        this.meta = new Map();
+    }
+
+    async putRecords(owner, records) {
+        if (!this.owners.has(owner)) this.owners.set(owner, new Map());
+        const rows = this.owners.get(owner);
+        for (const { id, value } of records) {
+            rows.set(id, { owner, id, value: globalThis.structuredClone(value), crc: recordChecksum(value) });
+        }
+    }
+
+    async getRecords(owner, { before = null, limit = Infinity } = {}) {
+        const rows = this.owners.get(owner);
+        if (!rows) return [];
+        return [...rows.values()]
+            .filter((row) => before === null || row.id < before)
+            .sort((a, b) => b.id - a.id)
+            .slice(0, limit)
+            .map(verifyRecord);
+    }
+
+    async countRecords(owner) {
+        return this.owners.get(owner)?.size ?? 0;
+    }
+
+    async deleteOwner(owner) {
+        this.owners.delete(owner);
+    }
+
+    async getMeta(key) {
+        return this.meta.get(key);
+    }
+
+    async setMeta(key, value) {
+        this.meta.set(key, value);
+    }
+}
+
+/**
+ * Returns the IndexedDB backend when the browser has one, otherwise null
+ * (callers keep using localStorage).
+ * @returns {IndexedDBBackend|null}
+ */
+export function createStorageBackend() {
+    if (typeof globalThis.indexedDB === 'undefined' || typeof globalThis.IDBKeyRange === 'undefined') {
+        return null;
+    }
+    return new IndexedDBBackend();
+}
+
+/**
+ * One-time move of a legacy localStorage history blob (`blackjack-premium-history-*`)
+ * into the backend. The localStorage key is removed once the records are stored.
+ * @param {Object} backend
+ * @param {string} storageKey - Legacy localStorage key, also used as the record owner.
+ * @returns {Promise<number>} Number of hands migrated.
+ */
+export async function migrateLegacyHistory(backend, storageKey) {
+    const marker = `migrated:${storageKey}`;
+    if (await backend.getMeta(marker)) return 0;
+
+    const saved = StorageManager.get(storageKey);
+    const entries = saved && Array.isArray(saved.entries) ? saved.entries : [];
+    const records = entries
+        .filter((entry) => Number.isFinite(entry?.handNumber))
+        .map((entry) => ({ id: entry.handNumber, value: entry }));
+
+    await backend.putRecords(storageKey, records);
+    await backend.setMeta(marker, Date.now());
+    StorageManager.remove(storageKey);
+    return records.length;
+}
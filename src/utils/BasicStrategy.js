@@ -14,6 +14,11 @@
  */
 
 import { classifyHand } from './HandUtils.js';
+import { getStrategyEVTable, registerStrategyEVTables } from './StrategyEV.js';
+import { STRATEGY_EV_TABLES } from './strategyEVTables.js';
+
+// Precomputed EV tables (scripts/build-ev-tables.js), decoded on first lookup.
+registerStrategyEVTables(STRATEGY_EV_TABLES);
 
 // Dealer upcard column index: 2,3,4,5,6,7,8,9,10,A
 const DEALER_COLS = ['2', '3', '4', '5', '6', '7', '8', '9', '10', 'A'];
@@ -107,11 +112,13 @@ function getDealerColIndex(dealerUpCard) {
  * @param {string} code - Raw strategy code (H, S, D, DS, P, SP, SU, US)
  * @param {Object} ruleProfile - Active rule profile from Constants.js
  * @param {boolean} canSplit - Whether splitting is currently available
+ * @param {Object} [available]
+ * @param {boolean} [available.canDouble=true] - Whether this hand may double now.
+ * @param {boolean} [available.canSurrender=true] - Whether this hand may surrender now (rules permitting).
  * @returns {{ action: string, finalCode: string }}
  */
-function resolveCode(code, ruleProfile, canSplit) {
-    const canDouble = true; // basic doubling is always available; doubleAfterSplit only restricts post-split doubles
-    const canSurrender = ruleProfile.surrenderType && ruleProfile.surrenderType !== 'none';
+function resolveCode(code, ruleProfile, canSplit, { canDouble = true, canSurrender: surrenderNow = true } = {}) {
+    const canSurrender = surrenderNow && ruleProfile.surrenderType && ruleProfile.surrenderType !== 'none';
     const hasDAS = ruleProfile.doubleAfterSplit === true;
 
     switch (code) {
@@ -133,9 +140,10 @@ function resolveCode(code, ruleProfile, canSplit) {
  * @param {Object} dealerUpCard - Dealer's visible card.
  * @param {Object} ruleProfile - Active rule profile.
  * @param {boolean} [canSplit=true] - Whether the player is currently allowed to split.
+ * @param {Object} [available] - `{ canDouble, canSurrender }`, both default true.
  * @returns {{ action: string, code: string, explanation: string, handType: string, playerTotal: number }}
  */
-export function getRecommendedAction(playerCards, dealerUpCard, ruleProfile, canSplit = true) {
+export function getRecommendedAction(playerCards, dealerUpCard, ruleProfile, canSplit = true, available = {}) {
     if (!playerCards || playerCards.length === 0 || !dealerUpCard || !ruleProfile) {
         return { action: 'hit', code: 'H', explanation: 'Pedir carta.', handType: 'hard', playerTotal: 0 };
     }
@@ -167,7 +175,7 @@ export function getRecommendedAction(playerCards, dealerUpCard, ruleProfile, can
         handType = 'hard';
     }
 
-    const { action } = resolveCode(rawCode, ruleProfile, canSplit && type === 'pair');
+    const { action } = resolveCode(rawCode, ruleProfile, canSplit && type === 'pair', available);
 
     return {
         action,
@@ -178,6 +186,57 @@ export function getRecommendedAction(playerCards, dealerUpCard, ruleProfile, can
     };
 }
 
+const DEFENSIVE_ACTIONS = new Set(['stand', 'surrender']);
+const AGGRESSIVE_ACTIONS = new Set(['hit', 'double']);
+
+/**
+ * Suboptimal (rather than wrong): both actions are in the same family,
+ * e.g. stand vs surrender on 17 (both defensive).
+ */
+function isSameActionFamily(a, b) {
+    return (DEFENSIVE_ACTIONS.has(a) && DEFENSIVE_ACTIONS.has(b)) ||
+        (AGGRESSIVE_ACTIONS.has(a) && AGGRESSIVE_ACTIONS.has(b));
+}
+
+/**
+ * Looks up the EV of every available action and the EV given up by `playerAction`.
+ * O(1): reads the precomputed table for the rule profile. Actions the hand
+ * cannot take now (split, double, surrender) are masked out, as in the solver.
+ * @param {string} playerAction
+ * @param {Array<Object>} playerCards
+ * @param {Object} dealerUpCard
+ * @param {Object} ruleProfile
+ * @param {boolean} canSplit
+ * @param {Object} [available]
+ * @param {boolean} [available.canDouble=true] - False e.g. after a split without DAS or outside the allowed totals.
+ * @param {boolean} [available.canSurrender=true] - False e.g. after a split.
+ * @returns {{ evByAction: Object|null, evBestAction: string|null, evLoss: number|null }}
+ */
+export function getActionEVCost(playerAction, playerCards, dealerUpCard, ruleProfile, canSplit = true,
+    { canDouble = true, canSurrender = true } = {}) {
+    const table = getStrategyEVTable(ruleProfile);
+    const evs = table ? table.getActionEVs(playerCards, dealerUpCard) : null;
+    if (!evs) return { evByAction: null, evBestAction: null, evLoss: null };
+
+    const evByAction = { ...evs };
+    if (!canSplit) evByAction.split = null;
+    if (!canDouble) evByAction.double = null;
+    if (!canSurrender) evByAction.surrender = null;
+
+    let evBestAction = null;
+    Object.entries(evByAction).forEach(([action, ev]) => {
+        if (ev !== null && (evBestAction === null || ev > evByAction[evBestAction])) {
+            evBestAction = action;
+        }
+    });
+
+    const chosen = evByAction[playerAction];
+    const evLoss = chosen === null || chosen === undefined
+        ? null
+        : Math.round((evByAction[evBestAction] - chosen) * 10000) / 10000;
+    return { evByAction, evBestAction, evLoss };
+}
+
 /**
  * Evaluates a player action against the optimal basic strategy.
  * @param {string} playerAction - The action the player took.
@@ -185,11 +244,16 @@ export function getRecommendedAction(playerCards, dealerUpCard, ruleProfile, can
  * @param {Object} dealerUpCard - Dealer's visible card.
  * @param {Object} ruleProfile - Active rule profile.
  * @param {boolean} [canSplit=true] - Whether splitting was available.
- * @returns {{ isOptimal: boolean, isSuboptimal: boolean, isWrong: boolean, recommended: string, recommendedLabel: string, explanation: string }}
+ * @param {Object} [available] - `{ canDouble, canSurrender }`, both default true.
+ * @returns {{ isOptimal: boolean, isSuboptimal: boolean, isWrong: boolean, recommended: string, recommendedLabel: string, explanation: string, evLoss: number|null, evByAction: Object|null }}
+ *   evLoss is the expected cost of the action in units of the bet (null when no EV table applies).
  */
-export function evaluatePlayerAction(playerAction, playerCards, dealerUpCard, ruleProfile, canSplit = true) {
-    const recommendation = getRecommendedAction(playerCards, dealerUpCard, ruleProfile, canSplit);
+export function evaluatePlayerAction(playerAction, playerCards, dealerUpCard, ruleProfile, canSplit = true, available = {}) {
+    const recommendation = getRecommendedAction(playerCards, dealerUpCard, ruleProfile, canSplit, available);
     const recommended = recommendation.action;
+    const { evByAction, evLoss } = getActionEVCost(
+        playerAction, playerCards, dealerUpCard, ruleProfile, canSplit, available
+    );
 
     if (playerAction === recommended) {
         return {
@@ -199,15 +263,12 @@ export function evaluatePlayerAction(playerAction, playerCards, dealerUpCard, ru
             recommended,
             recommendedLabel: ACTION_LABELS[recommended] || recommended,
             explanation: recommendation.explanation,
+            evLoss,
+            evByAction,
         };
     }
 
-    // Suboptimal: action is in the same family (e.g. stand vs surrender on 17 — both defensive)
-    const defensiveActions = new Set(['stand', 'surrender']);
-    const aggressiveActions = new Set(['hit', 'double']);
-    const isSuboptimal =
-        (defensiveActions.has(playerAction) && defensiveActions.has(recommended)) ||
-        (aggressiveActions.has(playerAction) && aggressiveActions.has(recommended));
+    const isSuboptimal = isSameActionFamily(playerAction, recommended);
 
     return {
         isOptimal: false,
@@ -216,5 +277,35 @@ export function evaluatePlayerAction(playerAction, playerCards, dealerUpCard, ru
         recommended,
         recommendedLabel: ACTION_LABELS[recommended] || recommended,
         explanation: recommendation.explanation,
+        evLoss,
+        evByAction,
+    };
+}
+
+/**
+ * Evaluates a player action against exact EVs (e.g. from CompositionSolver),
+ * returning the same shape as evaluatePlayerAction.
+ * @param {string} playerAction
+ * @param {Object} evByAction - EV per action, null for unavailable actions.
+ * @param {string} bestAction - Action with the highest EV.
+ * @returns {Object}
+ */
+export function evaluateActionWithEVs(playerAction, evByAction, bestAction) {
+    const chosen = evByAction[playerAction];
+    const best = evByAction[bestAction];
+    const evLoss = chosen === null || chosen === undefined ? null : Math.round((best - chosen) * 10000) / 10000;
+    const isOptimal = playerAction === bestAction || evLoss === 0;
+    const isSuboptimal = !isOptimal && isSameActionFamily(playerAction, bestAction);
+    const bestPct = (best * 100).toFixed(1);
+
+    return {
+        isOptimal,
+        isSuboptimal,
+        isWrong: !isOptimal && !isSuboptimal,
+        recommended: bestAction,
+        recommendedLabel: ACTION_LABELS[bestAction] || bestAction,
+        explanation: `Pela composição atual do sabot, ${ACTION_LABELS[bestAction] || bestAction} rende ${best >= 0 ? '+' : ''}${bestPct}% da aposta.`,
+        evLoss,
+        evByAction,
     };
 }
@@ -0,0 +1,104 @@
+/**
+ * Compact integer card encoding.
+ *
+ * A card code is rank * 4 + suit (0-51), small enough for a Uint8Array shoe.
+ * Ranks and suits use the same order Deck.reset() builds a deck in.
+ * decodeCard() hands out one shared, frozen {suit, value} object per code, so
+ * adapters back to the object shape the UI and history use cost nothing.
+ */
+
+/** Rank names, indexed by rank (0 = Ace ... 12 = King). */
+export const RANKS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10', 'J', 'Q', 'K'];
+
+/** Suit symbols, indexed by suit. */
+export const SUITS = ['♠', '♥', '♦', '♣'];
+
+export const CARD_CODE_COUNT = RANKS.length * SUITS.length;
+
+/** Blackjack value by rank (Ace = 11, faces = 10). */
+export const RANK_VALUE = Uint8Array.from([11, 2, 3, 4, 5, 6, 7, 8, 9, 10, 10, 10, 10]);
+
+/** Hi-Lo count by rank: 2-6 = +1, 7-9 = 0, 10-A = -1. */
+export const RANK_HILO = Int8Array.from([-1, 1, 1, 1, 1, 1, 0, 0, 0, -1, -1, -1, -1]);
+
+/** Rank index by rank name, e.g. RANK_INDEX['Q'] === 11. */
+export const RANK_INDEX = Object.freeze(
+    RANKS.reduce((acc, rank, i) => ({ ...acc, [rank]: i }), {})
+);
+
+/** Blackjack value by rank name, for the object representation. */
+export const VALUE_BY_RANK = Object.freeze(
+    RANKS.reduce((acc, rank, i) => ({ ...acc, [rank]: RANK_VALUE[i] }), {})
+);
+
+const SUIT_INDEX = SUITS.reduce((acc, suit, i) => ({ ...acc, [suit]: i }), {});
+
+/** Blackjack value by card code. */
+export const CODE_VALUE = Uint8Array.from({ length: CARD_CODE_COUNT }, (_, code) => RANK_VALUE[code >> 2]);
+
+/** Hi-Lo count by card code. */
+export const CODE_HILO = Int8Array.from({ length: CARD_CODE_COUNT }, (_, code) => RANK_HILO[code >> 2]);
+
+const CARD_OBJECTS = Array.from({ length: CARD_CODE_COUNT }, (_, code) =>
+    Object.freeze({ suit: SUITS[code & 3], value: RANKS[code >> 2] })
+);
+
+/**
+ * Builds a card code from rank and suit indices.
+ * @param {number} rank - 0 (Ace) to 12 (King).
+ * @param {number} suit - 0 to 3, see SUITS.
+ * @returns {number}
+ */
+export function makeCardCode(rank, suit) {
+    return rank * 4 + suit;
+}
+
+/**
+ * Rank index of a card code.
+ * @param {number} code
+ * @returns {number}
+ */
+export function getCodeRank(code) {
+    return code >> 2;
+}
+
+/**
+ * Converts a {suit, value} card to its code. Unknown suits map to suit 0.
+ * @param {Object} card
+ * @returns {number} Code, or -1 for an unknown rank.
+ */
+export function encodeCard(card) {
+    const rank = card ? RANK_INDEX[card.value] : undefined;
+    if (rank === undefined) return -1;
+    return makeCardCode(rank, SUIT_INDEX[card.suit] ?? 0);
+}
+
+/**
+ * Converts a card code back to the {suit, value} shape. The returned object is
+ * shared and frozen; copy it before changing it.
+ * @param {number} code
+ * @returns {Object}
+ */
+export function decodeCard(code) {
+    return CARD_OBJECTS[code];
+}
+
+/**
+ * Converts an array of cards to a Uint8Array of codes.
+ * @param {Array<Object>} cards
+ * @returns {Uint8Array}
+ */
+export function encodeCards(cards) {
+    const codes = new Uint8Array(cards.length);
+    for (let i = 0; i < cards.length; i++) codes[i] = encodeCard(cards[i]);
+    return codes;
+}
+
+/**
+ * Converts codes back to card objects.
+ * @param {ArrayLike<number>} codes
+ * @returns {Array<Object>}
+ */
+export function decodeCards(codes) {
+    return Array.from(codes, decodeCard);
+}
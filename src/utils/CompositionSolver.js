@@ -0,0 +1,141 @@
+import {
+    compositionKey,
+    computeActionEVs,
+    createDealerCache,
+    getDealerProbabilities,
+    getEVRankIndex,
+    getRuleSignature
+} from './StrategyEV.js';
+import { LRUCache } from './LRUCache.js';
+
+/**
+ * Composition-dependent ("perfect play") advice for the live shoe.
+ *
+ * The solver tracks the unseen cards (counts per rank, see StrategyEV) and
+ * answers "what is each action worth right now". Dealer outcome distributions
+ * are kept in an LRU keyed by composition, upcard and rules. Below that, the
+ * recursive dealer memo is keyed by absolute sub-composition and survives card
+ * removals: after removeCard() most branches of the next solve are already
+ * known, so only the new ones are computed.
+ *
+ * The first solve on a fresh 6-deck shoe fills the dealer memo and can take
+ * tens of milliseconds (about 28 ms measured), more than a frame; later solves
+ * in the same shoe reuse the memo and are much cheaper.
+ */
+
+const DEFAULT_RESULT_CACHE = 256;
+const DEFAULT_MEMO_LIMIT = 250000;
+
+export class CompositionSolver {
+    /**
+     * @param {Object} [options]
+     * @param {number} [options.cacheSize] - Entries in the dealer-distribution LRU.
+     * @param {number} [options.memoLimit] - Max recursive memo entries before it is reset.
+     */
+    constructor(options = {}) {
+        this.comp = new Array(10).fill(0);
+        this.dealerCache = new LRUCache(options.cacheSize ?? DEFAULT_RESULT_CACHE);
+        this.memoLimit = options.memoLimit ?? DEFAULT_MEMO_LIMIT;
+        // One recursive memo per soft-17 rule: its keys do not include the rule.
+        this.memos = { H17: createDealerCache(), S17: createDealerCache() };
+        this.lastSolveMs = 0;
+    }
+
+    /**
+     * Replaces the tracked composition (e.g. after a reshuffle).
+     * Memo entries stay valid: they are keyed by absolute composition.
+     * @param {Array<number>} counts - Unseen cards per rank index (A, 2-9, ten).
+     */
+    setComposition(counts) {
+        for (let r = 0; r < 10; r++) this.comp[r] = counts[r] || 0;
+    }
+
+    /**
+     * Marks a card as seen. O(1).
+     * @param {Object|number} card - Card object or rank index.
+     */
+    removeCard(card) {
+        const r = typeof card === 'number' ? card : getEVRankIndex(card);
+        if (r >= 0 && this.comp[r] > 0) this.comp[r]--;
+    }
+
+    /**
+     * Returns a card to the unseen pool. O(1).
+     * @param {Object|number} card - Card object or rank index.
+     */
+    addCard(card) {
+        const r = typeof card === 'number' ? card : getEVRankIndex(card);
+        if (r >= 0) this.comp[r]++;
+    }
+
+    /**
+     * Dealer final-total distribution for the current composition.
+     * @param {number} upRank - Upcard rank index (the upcard is not part of the composition).
+     * @param {Object} ruleProfile
+     * @returns {Float64Array} See StrategyEV.getDealerProbabilities.
+     */
+    getDealerProbabilities(upRank, ruleProfile) {
+        const key = `${compositionKey(this.comp)}|${upRank}|${getRuleSignature(ruleProfile)}`;
+        let probs = this.dealerCache.get(key);
+        if (!probs) {
+            probs = getDealerProbabilities(this.comp, upRank, ruleProfile, this._memoFor(ruleProfile));
+            this.dealerCache.set(key, probs);
+        }
+        return probs;
+    }
+
+    /**
+     * EV of every available action for a hand, using the tracked composition.
+     * @param {Array<Object>} playerCards - Already removed from the composition.
+     * @param {Object} dealerUpCard - Already removed from the composition.
+     * @param {Object} ruleProfile
+     * @param {Object} [options]
+     * @param {boolean} [options.canSplit]
+     * @param {boolean} [options.canDouble]
+     * @param {boolean} [options.canSurrender]
+     * @returns {{ evByAction: Object, bestAction: string }|null}
+     */
+    solve(playerCards, dealerUpCard, ruleProfile, options = {}) {
+        const upRank = getEVRankIndex(dealerUpCard);
+        if (upRank < 0 || !playerCards || playerCards.length === 0) return null;
+        const start = performance.now();
+
+        let hardTotal = 0;
+        let hasAce = false;
+        for (const card of playerCards) {
+            const r = getEVRankIndex(card);
+            if (r < 0) return null;
+            hardTotal += r + 1;
+            if (r === 0) hasAce = true;
+        }
+        const twoCards = playerCards.length === 2;
+        const r0 = getEVRankIndex(playerCards[0]);
+        const pairRank = twoCards && options.canSplit !== false && r0 === getEVRankIndex(playerCards[1]) ? r0 : -1;
+
+        const dealer = this.getDealerProbabilities(upRank, ruleProfile);
+        const evByAction = computeActionEVs(
+            this.comp,
+            upRank,
+            ruleProfile,
+            { hardTotal, hasAce, pairRank, twoCards },
+            null,
+            dealer
+        );
+        if (options.canDouble === false) evByAction.double = null;
+        if (options.canSurrender === false) evByAction.surrender = null;
+
+        let bestAction = null;
+        Object.entries(evByAction).forEach(([action, ev]) => {
+            if (ev !== null && (bestAction === null || ev > evByAction[bestAction])) bestAction = action;
+        });
+
+        this.lastSolveMs = performance.now() - start;
+        return { evByAction, bestAction };
+    }
+
+    _memoFor(ruleProfile) {
+        const memo = ruleProfile.dealerHitsSoft17 ? this.memos.H17 : this.memos.S17;
+        if (memo.size > this.memoLimit) memo.clear();
+        return memo;
+    }
+}
@@ -1,9 +1,20 @@
 /**
  * HandHistory - manages a ring buffer of played hand records.
  * Works for both guest (localStorage) and authenticated (Supabase) users.
+ * Hands are kept in a columnar HandHistoryStore; `entries` is a lazy view in
+ * the usual object shape.
+ * In the cloud every hand is one append-only `hand_events` row; only hands
+ * played since the last save are sent, and older hands load page by page.
  */
 
 import { StorageManager } from './StorageManager.js';
+import { HandHistoryStore } from './HandHistoryStore.js';
+import { instrumentMethods } from './PerfTracer.js';
+
+// Rows per hand_events upsert request.
+const HAND_EVENTS_BATCH_SIZE = 500;
+// device_id of rows written before per-device sync (matches the column default).
+const DEFAULT_DEVICE_ID = 'legacy';
 
 export class HandHistory {
     /**
@@ -12,8 +23,27 @@ export class HandHistory {
     constructor(maxEntries = 50, onSyncNotice = null) {
         this.maxEntries = maxEntries;
         this.onSyncNotice = onSyncNotice;
-        /** @type {Array<Object>} Newest entry is at index 0. */
-        this.entries = [];
+        this.store = new HandHistoryStore(maxEntries);
+        /** Highest hand number this device has stored in the cloud. */
+        this.syncedThrough = 0;
+        /** Highest hand number already written to the local storage backend. */
+        this.persistedThrough = 0;
+        /** @type {{ handNumber: number, deviceId: string }|null} Keyset cursor for the next older cloud page. */
+        this.nextCursor = null;
+        /** Bumped whenever entries change other than through addHand(). */
+        this.revision = 0;
+        /** While true, addHand() grows the store instead of dropping the oldest hand (see AutoPlayer). */
+        this.retainAll = false;
+        /** @type {?Function} Called after the entries were replaced (cleared or loaded), not after older pages. */
+        this.onReplaced = null;
+    }
+
+    /**
+     * Bumps the revision after the entries were replaced and calls onReplaced.
+     */
+    markReplaced() {
+        this.revision++;
+        if (typeof this.onReplaced === 'function') this.onReplaced(this);
     }
 
     notifySyncIssue(message, level = 'error') {
@@ -32,14 +62,41 @@ export class HandHistory {
     }
 
     /**
-     * Adds a new hand entry and trims to maxEntries.
+     * Entries, newest at index 0. Read-only; assigning replaces the contents.
+     * @type {Array<Object>}
+     */
+    get entries() {
+        return this.store.toArray();
+    }
+
+    set entries(entries) {
+        this.store.replace(entries);
+    }
+
+    /**
+     * Adds a new hand entry and trims to maxEntries (or to the current size
+     * when older pages were loaded, so scrolling back is not undone). With
+     * retainAll set nothing is dropped until trimTo() is called.
      * @param {Object} entry
      */
     addHand(entry) {
-        this.entries.unshift(entry);
-        if (this.entries.length > this.maxEntries) {
-            this.entries = this.entries.slice(0, this.maxEntries);
+        const store = this.store;
+        if (this.retainAll) {
+            if (store.size === store.capacity) store.grow(store.capacity * 2);
+            store.push(entry);
+            return;
         }
+        const keep = Math.max(this.maxEntries, store.size);
+        store.push(entry);
+        store.trim(keep);
+    }
+
+    /**
+     * Drops the oldest hands beyond `size` (never below maxEntries).
+     * @param {number} [size]
+     */
+    trimTo(size = this.maxEntries) {
+        this.store.trim(Math.max(this.maxEntries, size));
     }
 
     /**
@@ -56,21 +113,35 @@ export class HandHistory {
      * @returns {Array<Object>}
      */
     getRecentHands(n = 10) {
-        return this.entries.slice(0, n);
+        return this.store.toArray(n);
+    }
+
+    /**
+     * Hands matching a filter, newest first, via the store's indexes
+     * (e.g. `{ action: 'split', dealerUpCard: 10 }`). See HandHistoryStore.find().
+     * @param {Object} filter
+     * @param {number} [limit]
+     * @returns {Array<Object>}
+     */
+    findHands(filter, limit) {
+        return this.store.find(filter, limit);
     }
 
     /** Clears all entries. */
     clear() {
-        this.entries = [];
+        this.store.clear();
+        this.markReplaced();
     }
 
     /**
-     * Persists history to localStorage via StorageManager.
+     * Persists the newest maxEntries hands to localStorage via StorageManager.
+     * Older pages loaded from the backend or the cloud are not written back;
+     * they are loaded again on demand.
      * @param {string} storageKey
      */
     saveToLocalStorage(storageKey) {
         if (!storageKey) return;
-        StorageManager.set(storageKey, { entries: this.entries });
+        StorageManager.set(storageKey, { entries: this.store.toArray(this.maxEntries) });
     }
 
     /**
@@ -83,63 +154,249 @@ export class HandHistory {
             const saved = StorageManager.get(storageKey);
             if (saved && Array.isArray(saved.entries)) {
                 this.entries = saved.entries.slice(0, this.maxEntries);
+                this.markReplaced();
             }
         } catch {
             // Corrupt data — start fresh
             this.entries = [];
+            this.markReplaced();
+        }
+    }
+
+    /**
+     * Writes hands played since the last call to an async storage backend, one
+     * record per hand (see AsyncStorage). Hands loaded from other devices' cloud
+     * rows are not stored locally.
+     * @param {Object} backend
+     * @param {string} owner - Per-user storage key.
+     * @returns {Promise<boolean>} false when the write failed and should be retried.
+     */
+    async saveToBackend(backend, owner) {
+        if (!backend || !owner) return true;
+        const pending = [];
+        for (let i = 0; i < this.store.size; i++) {
+            const id = this.store.handNumberAt(i);
+            if (id <= this.persistedThrough) continue;
+            const value = this.store.at(i);
+            // Records are keyed by hand number, so only this device's hands are stored.
+            if (!value?.deviceId) pending.push({ id, value });
+        }
+        if (pending.length === 0) return true;
+        try {
+            await backend.putRecords(owner, pending);
+            this.persistedThrough = Math.max(this.persistedThrough, ...pending.map((record) => record.id));
+            return true;
+        } catch (err) {
+            console.warn('Could not write hand history:', err);
+            return false;
         }
     }
 
     /**
-     * Saves history to Supabase (upsert single row per user).
+     * Loads the most recent hands from an async storage backend.
+     * @param {Object} backend
+     * @param {string} owner - Per-user storage key.
+     */
+    async loadFromBackend(backend, owner) {
+        if (!backend || !owner) return;
+        try {
+            const records = await backend.getRecords(owner, { limit: this.maxEntries });
+            if (records.length === 0) return;
+            const newestStored = records[0].id;
+            const unsaved = this.entries.filter((entry) => entry?.handNumber > newestStored);
+            this.entries = [...unsaved, ...records.map((record) => record.value)].slice(0, this.maxEntries);
+            this.persistedThrough = newestStored;
+            this.markReplaced();
+        } catch (err) {
+            console.warn('Could not read hand history:', err);
+        }
+    }
+
+    /**
+     * Appends the next page of hands older than the oldest loaded one from an
+     * async storage backend.
+     * @param {Object} backend
+     * @param {string} owner - Per-user storage key.
+     * @param {number} [limit]
+     * @returns {Promise<boolean>} Whether more pages may remain.
+     */
+    async loadOlderFromBackend(backend, owner, limit = this.maxEntries) {
+        if (!backend || !owner || this.store.size === 0) return false;
+        try {
+            const oldest = this.store.handNumberAt(this.store.size - 1);
+            const records = await backend.getRecords(owner, { before: oldest, limit });
+            if (records.length === 0) return false;
+            this.store.appendOlder(records.map((record) => record.value));
+            this.revision++;
+            return records.length === limit;
+        } catch (err) {
+            console.warn('Could not read hand history:', err);
+            return false;
+        }
+    }
+
+    /**
+     * Hands this device played since the last successful cloud save, oldest
+     * first. Hands loaded from other devices (tagged with `deviceId`) are
+     * never sent back.
+     * @returns {Array<Object>}
+     */
+    getUnsyncedHands() {
+        const pending = [];
+        for (let i = 0; i < this.store.size; i++) {
+            if (this.store.handNumberAt(i) <= this.syncedThrough) continue;
+            const entry = this.store.at(i);
+            if (!entry?.deviceId) pending.push(entry);
+        }
+        return pending.sort((a, b) => a.handNumber - b.handNumber);
+    }
+
+    /**
+     * Maps a history entry to a `hand_events` row.
+     * @param {Object} entry
+     * @param {string} userId
+     * @param {string} [deviceId]
+     * @returns {Object}
+     */
+    toHandEventRow(entry, userId, deviceId = DEFAULT_DEVICE_ID) {
+        return {
+            user_id: userId,
+            device_id: deviceId,
+            hand_number: entry.handNumber,
+            hand: entry,
+            played_at: new Date(entry.timestamp || Date.now()).toISOString(),
+        };
+    }
+
+    /**
+     * Appends the hands played since the last save to `hand_events`, in batches.
+     * Rows are keyed by (user_id, device_id, hand_number), so a retried batch is
+     * harmless and devices that played offline with the same hand numbers do not
+     * overwrite each other.
      * @param {Object} supabase - Supabase client instance.
      * @param {string} userId
+     * @param {string} [deviceId] - See StatsSync.
+     * @returns {Promise<boolean>} false when the save failed and should be retried.
      */
-    async saveToSupabase(supabase, userId) {
-        if (!supabase || !userId) return;
+    async saveToSupabase(supabase, userId, deviceId = DEFAULT_DEVICE_ID) {
+        if (!supabase || !userId) return true;
+        const pending = this.getUnsyncedHands();
+        if (pending.length === 0) return true;
+
         try {
-            const { error } = await supabase
-                .from('hand_history')
-                .upsert({
-                    user_id: userId,
-                    hands_json: this.entries,
-                    updated_at: new Date().toISOString(),
-                }, { onConflict: 'user_id' });
+            for (let start = 0; start < pending.length; start += HAND_EVENTS_BATCH_SIZE) {
+                const batch = pending.slice(start, start + HAND_EVENTS_BATCH_SIZE);
+                const { error } = await supabase
+                    .from('hand_events')
+                    .upsert(batch.map((entry) => this.toHandEventRow(entry, userId, deviceId)), {
+                        onConflict: 'user_id,device_id,hand_number',
+                    });
 
-            if (error) {
-                if (this.isSchemaError(error)) {
-                    this.notifySyncIssue('Histórico na nuvem indisponível. Atualize as migrations do Supabase.', 'warning');
-                    return;
-                }
+                if (error) {
+                    if (this.isSchemaError(error)) {
+                        this.notifySyncIssue('Histórico na nuvem indisponível. Atualize as migrations do Supabase.', 'warning');
+                        return true;
+                    }
 
-                console.error('Error saving hand history to Supabase:', error);
-                this.notifySyncIssue('Erro ao salvar histórico na nuvem.', 'error');
+                    console.error('Error saving hand history to Supabase:', error);
+                    this.notifySyncIssue('Erro ao salvar histórico na nuvem.', 'error');
+                    return false;
+                }
+                this.syncedThrough = Math.max(this.syncedThrough, batch[batch.length - 1].handNumber);
             }
+            return true;
         } catch (err) {
             console.error('Unexpected error saving hand history:', err);
             this.notifySyncIssue('Erro de conexão ao salvar histórico na nuvem.', 'error');
+            return false;
+        }
+    }
+
+    /**
+     * Fetches one page of cloud history, newest first, using (hand number,
+     * device id) as a keyset cursor (no OFFSET scans). Rows from other devices
+     * are tagged with their `deviceId`; this device's and legacy rows are not.
+     * @param {Object} supabase - Supabase client instance.
+     * @param {string} userId
+     * @param {Object} [options]
+     * @param {{ handNumber: number, deviceId: string }|null} [options.before] - Only rows after this one.
+     * @param {number} [options.limit]
+     * @param {string} [options.deviceId] - This device (see StatsSync).
+     * @returns {Promise<{ entries: Array<Object>, nextCursor: Object|null, error: Object|null }>}
+     */
+    async fetchSupabasePage(supabase, userId, { before = null, limit = this.maxEntries, deviceId = DEFAULT_DEVICE_ID } = {}) {
+        let query = supabase
+            .from('hand_events')
+            .select('hand_number, device_id, hand')
+            .eq('user_id', userId);
+        if (before !== null) {
+            const { handNumber, deviceId: beforeDevice } = before;
+            query = query.or(
+                `hand_number.lt.${handNumber},and(hand_number.eq.${handNumber},device_id.lt."${beforeDevice}")`
+            );
         }
+
+        const { data, error } = await query
+            .order('hand_number', { ascending: false })
+            .order('device_id', { ascending: false })
+            .limit(limit);
+        if (error) return { entries: [], nextCursor: null, error };
+
+        const rows = Array.isArray(data) ? data : [];
+        const entries = rows.map((row) => {
+            const entry = { ...row.hand, handNumber: row.hand_number };
+            if (row.device_id && row.device_id !== deviceId && row.device_id !== DEFAULT_DEVICE_ID) {
+                entry.deviceId = row.device_id;
+            } else {
+                delete entry.deviceId;
+            }
+            return entry;
+        });
+        const last = rows[rows.length - 1];
+        const nextCursor = rows.length === limit
+            ? { handNumber: last.hand_number, deviceId: last.device_id || DEFAULT_DEVICE_ID }
+            : null;
+        return { entries, nextCursor, error: null };
+    }
+
+    /**
+     * Highest hand number this device (or the pre-device-sync client) has
+     * stored in the cloud.
+     * @param {Object} supabase - Supabase client instance.
+     * @param {string} userId
+     * @param {string} deviceId
+     * @returns {Promise<{ handNumber: number, error: Object|null }>}
+     */
+    async fetchSyncedThrough(supabase, userId, deviceId) {
+        const { data, error } = await supabase
+            .from('hand_events')
+            .select('hand_number')
+            .eq('user_id', userId)
+            .in('device_id', [deviceId, DEFAULT_DEVICE_ID])
+            .order('hand_number', { ascending: false })
+            .limit(1);
+        if (error) return { handNumber: 0, error };
+        return { handNumber: Array.isArray(data) && data.length > 0 ? data[0].hand_number : 0, error: null };
     }
 
     /**
-     * Loads history from Supabase.
+     * Loads the most recent page of history from Supabase. Hands this device
+     * played that are not in the cloud yet are kept (all of them, even past
+     * maxEntries) and will be sent on the next save.
      * @param {Object} supabase - Supabase client instance.
      * @param {string} userId
+     * @param {string} [deviceId] - See StatsSync.
      */
-    async loadFromSupabase(supabase, userId) {
+    async loadFromSupabase(supabase, userId, deviceId = DEFAULT_DEVICE_ID) {
         if (!supabase || !userId) return;
         try {
-            const { data, error } = await supabase
-                .from('hand_history')
-                .select('hands_json')
-                .eq('user_id', userId)
-                .single();
-
-            if (data && Array.isArray(data.hands_json)) {
-                this.entries = data.hands_json.slice(0, this.maxEntries);
-            } else if (this.isNoRowsError(error)) {
-                // No history row yet (fresh user). Keep existing local history.
-            } else if (error) {
+            const [page, synced] = await Promise.all([
+                this.fetchSupabasePage(supabase, userId, { deviceId }),
+                this.fetchSyncedThrough(supabase, userId, deviceId),
+            ]);
+            const error = page.error || synced.error;
+
+            if (error) {
                 if (this.isSchemaError(error)) {
                     this.notifySyncIssue('Histórico na nuvem indisponível. Atualize as migrations do Supabase.', 'warning');
                     return;
@@ -147,10 +404,74 @@ export class HandHistory {
 
                 console.error('Error loading hand history from Supabase:', error);
                 this.notifySyncIssue('Erro ao carregar histórico da nuvem.', 'error');
+                return;
+            }
+
+            // No cloud rows yet (fresh user): keep existing local history.
+            if (page.entries.length === 0) return;
+
+            this.syncedThrough = Math.max(this.syncedThrough, synced.handNumber);
+            const unsynced = new Set(this.getUnsyncedHands());
+            const merged = [...unsynced, ...page.entries].sort((a, b) => b.handNumber - a.handNumber);
+            this.entries = merged.filter((entry, i) => i < this.maxEntries || unsynced.has(entry));
+            this.nextCursor = page.nextCursor;
+            this.markReplaced();
+        } catch (err) {
+            console.error('Unexpected error loading hand history:', err);
+            this.notifySyncIssue('Erro de conexão ao carregar histórico da nuvem.', 'error');
+        }
+    }
+
+    /**
+     * Appends the next (older) page of cloud history to the entries.
+     * @param {Object} supabase - Supabase client instance.
+     * @param {string} userId
+     * @param {string} [deviceId] - See StatsSync.
+     * @param {number} [limit]
+     * @returns {Promise<boolean>} Whether more pages remain.
+     */
+    async loadMoreFromSupabase(supabase, userId, deviceId = DEFAULT_DEVICE_ID, limit = this.maxEntries) {
+        if (!supabase || !userId || this.nextCursor === null) return false;
+        try {
+            const { entries, nextCursor, error } = await this.fetchSupabasePage(supabase, userId, {
+                before: this.nextCursor,
+                limit,
+                deviceId,
+            });
+            if (error) {
+                console.error('Error loading hand history from Supabase:', error);
+                this.notifySyncIssue('Erro ao carregar histórico da nuvem.', 'error');
+                return false;
             }
+            this.store.appendOlder(entries);
+            this.nextCursor = nextCursor;
+            this.revision++;
+            return nextCursor !== null;
         } catch (err) {
             console.error('Unexpected error loading hand history:', err);
             this.notifySyncIssue('Erro de conexão ao carregar histórico da nuvem.', 'error');
+            return false;
+        }
+    }
+
+    /**
+     * Deletes the user's cloud history (used when the game is reset).
+     * @param {Object} supabase - Supabase client instance.
+     * @param {string} userId
+     */
+    async clearSupabase(supabase, userId) {
+        if (!supabase || !userId) return;
+        try {
+            const { error } = await supabase.from('hand_events').delete().eq('user_id', userId);
+            if (error && !this.isSchemaError(error)) {
+                console.error('Error clearing hand history in Supabase:', error);
+                this.notifySyncIssue('Erro ao salvar histórico na nuvem.', 'error');
+            }
+        } catch (err) {
+            console.error('Unexpected error clearing hand history:', err);
+            this.notifySyncIssue('Erro de conexão ao salvar histórico na nuvem.', 'error');
         }
     }
 }
+
+instrumentMethods(HandHistory.prototype, 'HandHistory', ['saveToSupabase', 'fetchSupabasePage', 'clearSupabase']);
@@ -0,0 +1,477 @@
+/**
+ * HandHistoryStore - columnar ring buffer of played hands.
+ *
+ * Each hand occupies one slot across typed-array columns (hand number,
+ * timestamp, bet, net change, result code, flags, action bitmask, dealer
+ * upcard) plus fixed-width byte blocks for the packed card codes and the action
+ * sequence. Adding a hand overwrites the oldest slot in place: no unshift, no
+ * re-slicing and no per-hand card objects kept alive.
+ *
+ * Secondary indexes keep one bitset per result, dealer upcard value and action,
+ * so a filter such as "split hands vs dealer 10" is a word-wise AND instead of
+ * a scan over decoded entries. Entry objects in the usual history shape are
+ * built lazily, on first access, and cached per slot.
+ *
+ * Hands that do not fit the packed layout (unknown cards, more than MAX_HANDS
+ * hands, fields from other versions) are kept verbatim in an overflow map and
+ * indexed the same way.
+ */
+
+import { CODE_VALUE, SUITS, decodeCard, encodeCard } from './CardCodes.js';
+
+/** Result names, in result-code order (code 0 is any other result). */
+export const RESULTS = Object.freeze(['win', 'lose', 'tie', 'surrender']);
+
+/** Action names, in bit order of the action bitmask. */
+export const ACTIONS = Object.freeze(['hit', 'stand', 'double', 'split', 'surrender']);
+
+const MAX_HANDS = 4;
+// Bytes per slot: hand count, dealer card count, one length per hand, then codes.
+const CARD_HEADER = 2 + MAX_HANDS;
+const CARD_STRIDE = 64;
+// Bytes per slot: action count, then one action code per byte.
+const ACTION_STRIDE = 16;
+const NO_CARD = 255;
+
+const FLAG_BLACKJACK = 1;
+const FLAG_STRATEGY_KNOWN = 2;
+const FLAG_STRATEGY_OPTIMAL = 4;
+
+const ENTRY_KEYS = [
+    'handNumber',
+    'timestamp',
+    'playerCards',
+    'dealerCards',
+    'dealerUpCard',
+    'actions',
+    'result',
+    'betAmount',
+    'netChange',
+    'hadBlackjack',
+    'wasStrategyOptimal',
+];
+
+const RESULT_CODE = new Map(RESULTS.map((result, i) => [result, i + 1]));
+const ACTION_CODE = new Map(ACTIONS.map((action, i) => [action, i + 1]));
+
+// Bitset rows of the index: one per result code, upcard value (0 = none) and action.
+const KEY_RESULT = 0;
+const KEY_UPCARD = KEY_RESULT + RESULTS.length + 1;
+const KEY_ACTION = KEY_UPCARD + 12;
+const KEY_COUNT = KEY_ACTION + ACTIONS.length;
+
+/** Code of a plain {suit, value} card, or -1 when it would not decode back identically. */
+function plainCardCode(card) {
+    if (!card || typeof card !== 'object' || Object.keys(card).length !== 2) return -1;
+    if (!SUITS.includes(card.suit)) return -1;
+    return encodeCard(card);
+}
+
+function actionMask(actions) {
+    let mask = 0;
+    if (!Array.isArray(actions)) return mask;
+    for (const action of actions) {
+        const code = ACTION_CODE.get(action);
+        if (code) mask |= 1 << (code - 1);
+    }
+    return mask;
+}
+
+function hasEntryShape(entry) {
+    return (
+        Object.keys(entry).length === ENTRY_KEYS.length &&
+        ENTRY_KEYS.every((key) => key in entry) &&
+        Number.isInteger(entry.handNumber) &&
+        entry.handNumber >= 0 &&
+        entry.handNumber <= 0xffffffff &&
+        Number.isFinite(entry.timestamp) &&
+        Number.isFinite(entry.betAmount) &&
+        Number.isFinite(entry.netChange) &&
+        RESULT_CODE.has(entry.result) &&
+        typeof entry.hadBlackjack === 'boolean' &&
+        (entry.wasStrategyOptimal === null || typeof entry.wasStrategyOptimal === 'boolean') &&
+        (entry.dealerUpCard === null || plainCardCode(entry.dealerUpCard) >= 0)
+    );
+}
+
+function popcount(x) {
+    x -= (x >>> 1) & 0x55555555;
+    x = (x & 0x33333333) + ((x >>> 2) & 0x33333333);
+    return (((x + (x >>> 4)) & 0x0f0f0f0f) * 0x01010101) >>> 24;
+}
+
+export class HandHistoryStore {
+    /**
+     * @param {number} capacity - Slots allocated up front; push() overwrites the oldest hand once full.
+     */
+    constructor(capacity = 50) {
+        this.allocate(Math.max(1, Math.floor(capacity)));
+        /** Oldest occupied slot. */
+        this.start = 0;
+        this.size = 0;
+        /** Bumped on every change; lets callers cache derived data. */
+        this.version = 0;
+    }
+
+    allocate(capacity) {
+        this.capacity = capacity;
+        this.words = Math.ceil(capacity / 32);
+        this.handNumber = new Uint32Array(capacity);
+        this.timestamp = new Float64Array(capacity);
+        this.bet = new Float64Array(capacity);
+        this.net = new Float64Array(capacity);
+        this.result = new Uint8Array(capacity);
+        this.flags = new Uint8Array(capacity);
+        this.actionMask = new Uint8Array(capacity);
+        this.upCard = new Uint8Array(capacity);
+        this.cards = new Uint8Array(capacity * CARD_STRIDE);
+        this.actionSeq = new Uint8Array(capacity * ACTION_STRIDE);
+        this.index = new Uint32Array(KEY_COUNT * this.words);
+        /** @type {Map<number, Object>} Slot -> entry that could not be packed. */
+        this.overflow = new Map();
+        /** @type {Array<Object|undefined>} Decoded entry per slot. */
+        this.views = new Array(capacity);
+        this.arrayCache = null;
+    }
+
+    slotAt(i) {
+        return (this.start + this.size - 1 - i) % this.capacity;
+    }
+
+    /**
+     * Adds the newest hand, overwriting the oldest one when the store is full.
+     * @param {Object} entry
+     */
+    push(entry) {
+        if (this.size === this.capacity) this.dropOldest();
+        this.size++;
+        this.write(this.slotAt(0), entry);
+        this.changed();
+    }
+
+    /**
+     * Adds hands older than every stored hand (e.g. the next cloud page),
+     * growing the store when needed.
+     * @param {Array<Object>} entries - Newest first.
+     */
+    appendOlder(entries) {
+        if (entries.length === 0) return;
+        if (this.size + entries.length > this.capacity) {
+            this.grow(Math.max(this.capacity * 2, this.size + entries.length));
+        }
+        for (const entry of entries) {
+            this.start = (this.start - 1 + this.capacity) % this.capacity;
+            this.size++;
+            this.write(this.start, entry);
+        }
+        this.changed();
+    }
+
+    /**
+     * Replaces the contents.
+     * @param {Array<Object>} entries - Newest first.
+     */
+    replace(entries) {
+        this.clear();
+        this.appendOlder(entries);
+    }
+
+    /**
+     * Drops the oldest hands beyond maxSize.
+     * @param {number} maxSize
+     */
+    trim(maxSize) {
+        if (this.size <= maxSize) return;
+        while (this.size > maxSize) this.dropOldest();
+        this.changed();
+    }
+
+    clear() {
+        this.index.fill(0);
+        this.overflow.clear();
+        this.views.fill(undefined);
+        this.start = 0;
+        this.size = 0;
+        this.changed();
+    }
+
+    dropOldest() {
+        const slot = this.start;
+        this.setIndexed(slot, false);
+        this.overflow.delete(slot);
+        this.views[slot] = undefined;
+        this.start = (slot + 1) % this.capacity;
+        this.size--;
+    }
+
+    changed() {
+        this.version++;
+        this.arrayCache = null;
+    }
+
+    grow(capacity) {
+        const old = this;
+        const slots = Array.from({ length: this.size }, (_, i) => this.slotAt(this.size - 1 - i));
+        const columns = ['handNumber', 'timestamp', 'bet', 'net', 'result', 'flags', 'actionMask', 'upCard'];
+        const saved = Object.fromEntries(columns.map((name) => [name, old[name]]));
+        const { cards, actionSeq, overflow, views } = old;
+
+        this.allocate(capacity);
+        slots.forEach((from, to) => {
+            for (const name of columns) this[name][to] = saved[name][from];
+            this.cards.set(cards.subarray(from * CARD_STRIDE, (from + 1) * CARD_STRIDE), to * CARD_STRIDE);
+            this.actionSeq.set(
+                actionSeq.subarray(from * ACTION_STRIDE, (from + 1) * ACTION_STRIDE),
+                to * ACTION_STRIDE
+            );
+            if (overflow.has(from)) this.overflow.set(to, overflow.get(from));
+            this.views[to] = views[from];
+            this.setIndexed(to, true);
+        });
+        this.start = 0;
+    }
+
+    write(slot, entry) {
+        const upCode = plainCardCode(entry?.dealerUpCard);
+        this.handNumber[slot] =
+            Number.isInteger(entry?.handNumber) && entry.handNumber >= 0 ? entry.handNumber : 0;
+        this.timestamp[slot] = Number(entry?.timestamp) || 0;
+        this.bet[slot] = Number(entry?.betAmount) || 0;
+        this.net[slot] = Number(entry?.netChange) || 0;
+        this.result[slot] = RESULT_CODE.get(entry?.result) || 0;
+        this.flags[slot] =
+            (entry?.hadBlackjack === true ? FLAG_BLACKJACK : 0) |
+            (typeof entry?.wasStrategyOptimal === 'boolean' ? FLAG_STRATEGY_KNOWN : 0) |
+            (entry?.wasStrategyOptimal === true ? FLAG_STRATEGY_OPTIMAL : 0);
+        this.actionMask[slot] = actionMask(entry?.actions);
+        this.upCard[slot] = upCode >= 0 ? upCode : NO_CARD;
+
+        const packed =
+            entry !== null &&
+            typeof entry === 'object' &&
+            hasEntryShape(entry) &&
+            this.packCards(slot, entry) &&
+            this.packActions(slot, entry.actions);
+        if (packed) {
+            this.overflow.delete(slot);
+            this.views[slot] = undefined;
+        } else {
+            this.overflow.set(slot, entry);
+            this.views[slot] = entry;
+        }
+        this.setIndexed(slot, true);
+    }
+
+    packCards(slot, entry) {
+        const hands = entry.playerCards;
+        const dealer = entry.dealerCards;
+        if (!Array.isArray(hands) || !Array.isArray(dealer) || hands.length > MAX_HANDS) return false;
+
+        const base = slot * CARD_STRIDE;
+        const end = base + CARD_STRIDE;
+        let pos = base + CARD_HEADER;
+        this.cards[base] = hands.length;
+        this.cards[base + 1] = dealer.length;
+        for (let h = 0; h < hands.length; h++) {
+            const cards = hands[h];
+            if (!Array.isArray(cards) || pos + cards.length > end) return false;
+            this.cards[base + 2 + h] = cards.length;
+            for (const card of cards) {
+                const code = plainCardCode(card);
+                if (code < 0) return false;
+                this.cards[pos++] = code;
+            }
+        }
+        if (pos + dealer.length > end) return false;
+        for (const card of dealer) {
+            const code = plainCardCode(card);
+            if (code < 0) return false;
+            this.cards[pos++] = code;
+        }
+        return true;
+    }
+
+    packActions(slot, actions) {
+        if (!Array.isArray(actions) || actions.length >= ACTION_STRIDE) return false;
+        const base = slot * ACTION_STRIDE;
+        this.actionSeq[base] = actions.length;
+        for (let i = 0; i < actions.length; i++) {
+            const code = ACTION_CODE.get(actions[i]);
+            if (!code) return false;
+            this.actionSeq[base + 1 + i] = code;
+        }
+        return true;
+    }
+
+    decode(slot) {
+        const base = slot * CARD_STRIDE;
+        const handCount = this.cards[base];
+        let pos = base + CARD_HEADER;
+        const playerCards = [];
+        for (let h = 0; h < handCount; h++) {
+            const length = this.cards[base + 2 + h];
+            playerCards.push(Array.from(this.cards.subarray(pos, pos + length), decodeCard));
+            pos += length;
+        }
+        const dealerCards = Array.from(this.cards.subarray(pos, pos + this.cards[base + 1]), decodeCard);
+
+        const actionBase = slot * ACTION_STRIDE;
+        const actions = Array.from(
+            this.actionSeq.subarray(actionBase + 1, actionBase + 1 + this.actionSeq[actionBase]),
+            (code) => ACTIONS[code - 1]
+        );
+        const flags = this.flags[slot];
+
+        return {
+            handNumber: this.handNumber[slot],
+            timestamp: this.timestamp[slot],
+            playerCards,
+            dealerCards,
+            dealerUpCard: this.upCard[slot] === NO_CARD ? null : decodeCard(this.upCard[slot]),
+            actions,
+            result: RESULTS[this.result[slot] - 1],
+            betAmount: this.bet[slot],
+            netChange: this.net[slot],
+            hadBlackjack: (flags & FLAG_BLACKJACK) !== 0,
+            wasStrategyOptimal: flags & FLAG_STRATEGY_KNOWN ? (flags & FLAG_STRATEGY_OPTIMAL) !== 0 : null,
+        };
+    }
+
+    entryAtSlot(slot) {
+        let entry = this.views[slot];
+        if (entry === undefined) {
+            entry = this.decode(slot);
+            this.views[slot] = entry;
+        }
+        return entry;
+    }
+
+    /**
+     * Entry at position i, newest first.
+     * @param {number} i
+     * @returns {Object|undefined}
+     */
+    at(i) {
+        if (i < 0 || i >= this.size) return undefined;
+        return this.entryAtSlot(this.slotAt(i));
+    }
+
+    /**
+     * Hand number at position i without decoding the entry.
+     * @param {number} i
+     * @returns {number}
+     */
+    handNumberAt(i) {
+        return this.handNumber[this.slotAt(i)];
+    }
+
+    /**
+     * Entries newest first. The full list is cached until the next change and
+     * must be treated as read-only.
+     * @param {number} [limit]
+     * @returns {Array<Object>}
+     */
+    toArray(limit = Infinity) {
+        const count = Math.min(limit, this.size);
+        if (count === this.size && this.arrayCache) return this.arrayCache;
+        const entries = new Array(count);
+        for (let i = 0; i < count; i++) entries[i] = this.at(i);
+        if (count === this.size) this.arrayCache = entries;
+        return entries;
+    }
+
+    setIndexed(slot, on) {
+        const word = slot >>> 5;
+        const bit = 1 << (slot & 31);
+        const up = this.upCard[slot];
+        const keys = [KEY_RESULT + this.result[slot], KEY_UPCARD + (up === NO_CARD ? 0 : CODE_VALUE[up])];
+        const mask = this.actionMask[slot];
+        for (let a = 0; a < ACTIONS.length; a++) {
+            if (mask & (1 << a)) keys.push(KEY_ACTION + a);
+        }
+        for (const key of keys) {
+            const i = key * this.words + word;
+            this.index[i] = on ? this.index[i] | bit : this.index[i] & ~bit;
+        }
+    }
+
+    /**
+     * Bitset of slots matching a filter; null when the filter has no criteria.
+     * @returns {Uint32Array|null}
+     */
+    match({ result, dealerUpCard, action } = {}) {
+        const keys = [];
+        if (result !== undefined) keys.push(RESULT_CODE.has(result) ? KEY_RESULT + RESULT_CODE.get(result) : -1);
+        if (dealerUpCard !== undefined) {
+            const valid = Number.isInteger(dealerUpCard) && dealerUpCard >= 2 && dealerUpCard <= 11;
+            keys.push(valid ? KEY_UPCARD + dealerUpCard : -1);
+        }
+        if (action !== undefined) {
+            for (const name of [].concat(action)) {
+                keys.push(ACTION_CODE.has(name) ? KEY_ACTION + ACTION_CODE.get(name) - 1 : -1);
+            }
+        }
+        if (keys.length === 0) return null;
+
+        const mask = new Uint32Array(this.words);
+        if (keys.includes(-1)) return mask;
+        mask.set(this.index.subarray(keys[0] * this.words, (keys[0] + 1) * this.words));
+        for (let k = 1; k < keys.length; k++) {
+            const offset = keys[k] * this.words;
+            for (let w = 0; w < this.words; w++) mask[w] &= this.index[offset + w];
+        }
+        return mask;
+    }
+
+    /**
+     * Hands matching every given criterion, newest first.
+     * @param {Object} [filter]
+     * @param {string} [filter.result] - 'win', 'lose', 'tie' or 'surrender'.
+     * @param {number} [filter.dealerUpCard] - Upcard value, 2-11 (10 covers faces, 11 is the Ace).
+     * @param {string|Array<string>} [filter.action] - Action, or actions that were all taken.
+     * @param {number} [limit]
+     * @returns {Array<Object>}
+     */
+    find(filter = {}, limit = Infinity) {
+        const mask = this.match(filter);
+        if (!mask) return this.toArray(limit);
+
+        const slots = [];
+        const newest = this.start + this.size - 1;
+        if (newest < this.capacity) {
+            collectDescending(mask, newest, this.start, slots, limit);
+        } else {
+            collectDescending(mask, newest - this.capacity, 0, slots, limit);
+            collectDescending(mask, this.capacity - 1, this.start, slots, limit);
+        }
+        return slots.map((slot) => this.entryAtSlot(slot));
+    }
+
+    /**
+     * Number of hands matching a filter (see find()).
+     * @param {Object} [filter]
+     * @returns {number}
+     */
+    count(filter = {}) {
+        const mask = this.match(filter);
+        if (!mask) return this.size;
+        let total = 0;
+        for (let w = 0; w < mask.length; w++) total += popcount(mask[w]);
+        return total;
+    }
+}
+
+/** Pushes set bits of mask between slots `from` and `to` (inclusive), highest first. */
+function collectDescending(mask, from, to, out, limit) {
+    if (from < to) return;
+    for (let w = from >>> 5; w >= to >>> 5 && out.length < limit; w--) {
+        let bits = mask[w];
+        if (w === from >>> 5 && (from & 31) !== 31) bits &= (1 << ((from & 31) + 1)) - 1;
+        if (w === to >>> 5) bits &= ~((1 << (to & 31)) - 1);
+        while (bits !== 0 && out.length < limit) {
+            const b = 31 - Math.clz32(bits);
+            out.push(w * 32 + b);
+            bits ^= 1 << b;
+        }
+    }
+}
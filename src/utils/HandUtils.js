@@ -1,6 +1,9 @@
 /**
  * Utility functions for Blackjack hand calculations.
+ * The `...Codes` variants take integer card codes (see CardCodes.js) instead of
+ * {suit, value} objects and are meant for hot loops such as the simulator.
  */
+import { CODE_VALUE, CODE_HILO, VALUE_BY_RANK } from './CardCodes.js';
 
 /**
  * Returns the numeric blackjack value of a card.
@@ -10,13 +13,8 @@
  */
 export function getCardNumericValue(card) {
     if (!card) return 0;
-    if (card.value === 'A') {
-        return 11;
-    } else if (['J', 'Q', 'K'].includes(card.value)) {
-        return 10;
-    } else {
-        return parseInt(card.value);
-    }
+    const value = VALUE_BY_RANK[card.value];
+    return value !== undefined ? value : parseInt(card.value);
 }
 
 /**
@@ -49,6 +47,43 @@ export function getHandStats(hand) {
     return { value, isSoft: aces > 0, aces };
 }
 
+/**
+ * Creates a running score for a hand: { value, softAces, cardCount }.
+ * value is the best total, softAces the number of Aces still counted as 11.
+ * Keep it in sync with addCardToScore instead of rescanning the hand.
+ * @param {Array<Object>} [hand] - Cards already in the hand.
+ * @returns {{ value: number, softAces: number, cardCount: number }}
+ */
+export function createHandScore(hand = []) {
+    const score = { value: 0, softAces: 0, cardCount: 0 };
+    if (!hand || !Array.isArray(hand)) return score;
+    for (const card of hand) {
+        addCardToScore(score, card);
+    }
+    return score;
+}
+
+/**
+ * Adds one card to a running score in O(1).
+ * Same result as getHandStats on the full hand: Aces are only downgraded while
+ * the total is over 21, and totals never decrease as cards are added.
+ * @param {{ value: number, softAces: number, cardCount: number }} score - Updated in place.
+ * @param {Object} card - The card object.
+ * @returns {{ value: number, softAces: number, cardCount: number }} The same score.
+ */
+export function addCardToScore(score, card) {
+    score.cardCount++;
+    if (!card) return score;
+    const cardValue = getCardNumericValue(card);
+    score.value += cardValue;
+    if (cardValue === 11) score.softAces++;
+    while (score.value > 21 && score.softAces > 0) {
+        score.value -= 10;
+        score.softAces--;
+    }
+    return score;
+}
+
 /**
  * Calculates the final numeric value of a hand.
  * @param {Array<Object>} hand - Array of card objects.
@@ -114,3 +149,92 @@ export function getHiLoValue(card) {
     if (val >= 10) return -1; // 10, J, Q, K, A
     return 0; // 7, 8, 9
 }
+
+/**
+ * Integer version of getHandStats.
+ * @param {ArrayLike<number>} codes - Card codes.
+ * @returns {Object} { value: number, isSoft: boolean, aces: number }
+ */
+export function getHandStatsCodes(codes) {
+    let value = 0;
+    let aces = 0;
+    for (let i = 0; i < codes.length; i++) {
+        const cardValue = CODE_VALUE[codes[i]];
+        value += cardValue;
+        if (cardValue === 11) aces++;
+    }
+    while (value > 21 && aces > 0) {
+        value -= 10;
+        aces--;
+    }
+    return { value, isSoft: aces > 0, aces };
+}
+
+/**
+ * Integer version of calculateHandValue. Allocation-free.
+ * @param {ArrayLike<number>} codes - Card codes.
+ * @returns {number} Hand value (best possible <= 21).
+ */
+export function calculateHandValueCodes(codes) {
+    let value = 0;
+    let aces = 0;
+    for (let i = 0; i < codes.length; i++) {
+        const cardValue = CODE_VALUE[codes[i]];
+        value += cardValue;
+        if (cardValue === 11) aces++;
+    }
+    while (value > 21 && aces > 0) {
+        value -= 10;
+        aces--;
+    }
+    return value;
+}
+
+/**
+ * Integer version of isSoftHand.
+ * @param {ArrayLike<number>} codes - Card codes.
+ * @returns {boolean} True if soft.
+ */
+export function isSoftHandCodes(codes) {
+    return getHandStatsCodes(codes).isSoft;
+}
+
+/**
+ * Integer version of isNaturalBlackjack.
+ * @param {ArrayLike<number>} codes - Card codes.
+ * @param {number} handsCount - Total number of player hands.
+ * @returns {boolean} True if natural blackjack.
+ */
+export function isNaturalBlackjackCodes(codes, handsCount) {
+    if (!codes || codes.length !== 2 || handsCount > 1) return false;
+    return CODE_VALUE[codes[0]] + CODE_VALUE[codes[1]] === 21;
+}
+
+/**
+ * Integer version of classifyHand. pairValue is the rank index of the pair (0 = Ace).
+ * @param {ArrayLike<number>} codes - Card codes.
+ * @returns {{ type: 'pair'|'soft'|'hard', total: number, pairValue: number|null }}
+ */
+export function classifyHandCodes(codes) {
+    if (!codes || codes.length === 0) return { type: 'hard', total: 0, pairValue: null };
+
+    if (codes.length === 2) {
+        const v0 = CODE_VALUE[codes[0]];
+        const v1 = CODE_VALUE[codes[1]];
+        if (v0 === v1) {
+            return { type: 'pair', total: v0 + v1, pairValue: codes[0] >> 2 };
+        }
+    }
+
+    const { value, isSoft } = getHandStatsCodes(codes);
+    return { type: isSoft ? 'soft' : 'hard', total: value, pairValue: null };
+}
+
+/**
+ * Integer version of getHiLoValue.
+ * @param {number} code - Card code.
+ * @returns {number} The Hi-Lo value.
+ */
+export function getHiLoValueCode(code) {
+    return CODE_HILO[code];
+}
@@ -0,0 +1,56 @@
+/**
+ * Small least-recently-used cache on top of Map insertion order.
+ */
+export class LRUCache {
+    /**
+     * @param {number} capacity - Maximum number of entries.
+     */
+    constructor(capacity = 256) {
+        this.capacity = Math.max(1, capacity);
+        this.map = new Map();
+        this.hits = 0;
+        this.misses = 0;
+    }
+
+    get size() {
+        return this.map.size;
+    }
+
+    /**
+     * Returns the cached value and marks it as most recently used.
+     * @param {*} key
+     * @returns {*} The value, or undefined.
+     */
+    get(key) {
+        if (!this.map.has(key)) {
+            this.misses++;
+            return undefined;
+        }
+        const value = this.map.get(key);
+        this.map.delete(key);
+        this.map.set(key, value);
+        this.hits++;
+        return value;
+    }
+
+    /**
+     * Stores a value, evicting the least recently used entry when full.
+     * @param {*} key
+     * @param {*} value
+     */
+    set(key, value) {
+        if (this.map.has(key)) this.map.delete(key);
+        this.map.set(key, value);
+        if (this.map.size > this.capacity) {
+            this.map.delete(this.map.keys().next().value);
+        }
+    }
+
+    has(key) {
+        return this.map.has(key);
+    }
+
+    clear() {
+        this.map.clear();
+    }
+}
@@ -0,0 +1,222 @@
+/**
+ * Hot-path timing behind a runtime flag.
+ *
+ * Instrumented calls go through trace(), which does nothing but call the
+ * function while tracing is disabled. When enabled, each call becomes a
+ * `performance.measure` (visible in the DevTools Performance panel), a sample
+ * for the per-span p50/p95 and an entry in a bounded event buffer that
+ * exportTrace() turns into Chrome trace-event JSON for field reports.
+ *
+ * Span names are `Owner.method`; the owner is the trace category.
+ */
+
+const SAMPLES_PER_SPAN = 256;
+const MAX_EVENTS = 10000;
+// performance.measure entries are cleared this often so the timeline buffer stays small.
+const MEASURE_CLEAR_EVERY = 1000;
+
+export class PerfTracer {
+    /**
+     * @param {Object} [options]
+     * @param {Object} [options.clock] - Object with now() and timeOrigin, defaults to `performance`.
+     * @param {number} [options.maxEvents] - Events kept for export, oldest dropped first.
+     */
+    constructor({ clock = globalThis.performance, maxEvents = MAX_EVENTS } = {}) {
+        this.clock = clock;
+        this.maxEvents = maxEvents;
+        this.enabled = false;
+        this.longTaskObserver = null;
+        this.reset();
+    }
+
+    /** Drops every recorded sample and event. */
+    reset() {
+        /** @type {Map<string, { count: number, total: number, samples: Float64Array, next: number }>} */
+        this.spans = new Map();
+        /** @type {Array<{ name: string, cat: string, start: number, dur: number }>} Ring buffer. */
+        this.events = [];
+        this.eventIndex = 0;
+        this.longTasks = { count: 0, total: 0 };
+        this.measureCount = 0;
+    }
+
+    /**
+     * Turns tracing on or off. Long tasks are observed while it is on.
+     * @param {boolean} enabled
+     */
+    setEnabled(enabled) {
+        this.enabled = !!enabled;
+        if (this.enabled) this.observeLongTasks();
+        else this.disconnect();
+    }
+
+    /**
+     * Runs `fn` and, when enabled, records how long it took. Promises (and
+     * other thenables) are timed until they settle; the settled value is passed through.
+     * @param {string} name - Span name, `Owner.method`.
+     * @param {Function} fn
+     * @returns {*} What `fn` returns.
+     */
+    trace(name, fn) {
+        if (!this.enabled) return fn();
+        const start = this.clock.now();
+        let result;
+        try {
+            result = fn();
+        } catch (err) {
+            this.record(name, start, this.clock.now() - start);
+            throw err;
+        }
+        if (result && typeof result.then === 'function') {
+            return Promise.resolve(result).finally(() => this.record(name, start, this.clock.now() - start));
+        }
+        this.record(name, start, this.clock.now() - start);
+        return result;
+    }
+
+    /**
+     * Records a finished span.
+     * @param {string} name
+     * @param {number} start - Clock time the span started.
+     * @param {number} dur - Duration in ms.
+     * @param {string} [cat] - Category, defaults to the part of `name` before the dot.
+     */
+    record(name, start, dur, cat = name.split('.')[0]) {
+        let span = this.spans.get(name);
+        if (!span) {
+            span = { count: 0, total: 0, samples: new Float64Array(SAMPLES_PER_SPAN), next: 0 };
+            this.spans.set(name, span);
+        }
+        span.samples[span.next] = dur;
+        span.next = (span.next + 1) % SAMPLES_PER_SPAN;
+        span.count++;
+        span.total += dur;
+
+        const event = { name, cat, start, dur };
+        if (this.events.length < this.maxEvents) {
+            this.events.push(event);
+        } else {
+            this.events[this.eventIndex] = event;
+            this.eventIndex = (this.eventIndex + 1) % this.maxEvents;
+        }
+
+        const perf = globalThis.performance;
+        if (perf && typeof perf.measure === 'function' && cat !== 'longtask') {
+            try {
+                perf.measure(name, { start, duration: dur });
+                if (++this.measureCount % MEASURE_CLEAR_EVERY === 0) perf.clearMeasures();
+            } catch {
+                // User Timing L3 options unsupported; the tracer's own records still work.
+            }
+        }
+    }
+
+    /**
+     * Per-span summary over the last SAMPLES_PER_SPAN calls.
+     * @returns {Array<{ name: string, count: number, total: number, mean: number, p50: number, p95: number }>}
+     *   Times in ms, sorted by total time, slowest first.
+     */
+    getSummary() {
+        const rows = [];
+        for (const [name, span] of this.spans) {
+            const n = Math.min(span.count, SAMPLES_PER_SPAN);
+            const sorted = span.samples.slice(0, n).sort();
+            rows.push({
+                name,
+                count: span.count,
+                total: span.total,
+                mean: span.total / span.count,
+                p50: percentile(sorted, 0.5),
+                p95: percentile(sorted, 0.95),
+            });
+        }
+        return rows.sort((a, b) => b.total - a.total);
+    }
+
+    /** Starts counting main-thread long tasks where the browser reports them. */
+    observeLongTasks() {
+        const Observer = globalThis.PerformanceObserver;
+        if (this.longTaskObserver || typeof Observer !== 'function') return;
+        if (!(Observer.supportedEntryTypes || []).includes('longtask')) return;
+        this.longTaskObserver = new Observer((list) => {
+            for (const entry of list.getEntries()) {
+                this.longTasks.count++;
+                this.longTasks.total += entry.duration;
+                this.record('longtask', entry.startTime, entry.duration, 'longtask');
+            }
+        });
+        this.longTaskObserver.observe({ type: 'longtask' });
+    }
+
+    disconnect() {
+        if (this.longTaskObserver) this.longTaskObserver.disconnect();
+        this.longTaskObserver = null;
+    }
+
+    /**
+     * Recorded events in Chrome trace-event format (complete `X` events, µs),
+     * loadable in the DevTools Performance panel or chrome://tracing.
+     * @param {Object} [metadata] - Extra fields for the `metadata` block (e.g. render stats).
+     * @returns {{ traceEvents: Array<Object>, displayTimeUnit: string, metadata: Object }}
+     */
+    exportTrace(metadata = {}) {
+        const origin = this.clock.timeOrigin || 0;
+        const ordered = this.events.length < this.maxEvents
+            ? this.events
+            : [...this.events.slice(this.eventIndex), ...this.events.slice(0, this.eventIndex)];
+        const traceEvents = [
+            { name: 'process_name', ph: 'M', pid: 1, tid: 1, args: { name: 'Blackjack' } },
+            { name: 'thread_name', ph: 'M', pid: 1, tid: 1, args: { name: 'Main thread' } },
+        ];
+        for (const event of ordered) {
+            traceEvents.push({
+                name: event.name,
+                cat: event.cat,
+                ph: 'X',
+                ts: Math.round((origin + event.start) * 1000),
+                dur: Math.round(event.dur * 1000),
+                pid: 1,
+                tid: 1,
+            });
+        }
+        return {
+            traceEvents,
+            displayTimeUnit: 'ms',
+            metadata: {
+                userAgent: globalThis.navigator?.userAgent || '',
+                exportedAt: new Date().toISOString(),
+                longTasks: { ...this.longTasks },
+                spans: this.getSummary(),
+                ...metadata,
+            },
+        };
+    }
+}
+
+function percentile(sorted, q) {
+    if (sorted.length === 0) return 0;
+    return sorted[Math.min(sorted.length - 1, Math.floor(q * sorted.length))];
+}
+
+/** Tracer shared by the instrumented modules. */
+export const perfTracer = new PerfTracer();
+
+/**
+ * Wraps methods of `target` (a prototype, class or instance) in perfTracer spans
+ * named `${owner}.${method}`. With tracing disabled a wrapped call costs one flag check.
+ * @param {Object} target
+ * @param {string} owner
+ * @param {Array<string>} methods
+ * @param {PerfTracer} [tracer]
+ */
+export function instrumentMethods(target, owner, methods, tracer = perfTracer) {
+    for (const method of methods) {
+        const original = target[method];
+        if (typeof original !== 'function') continue;
+        const name = `${owner}.${method}`;
+        target[method] = function (...args) {
+            if (!tracer.enabled) return original.apply(this, args);
+            return tracer.trace(name, () => original.apply(this, args));
+        };
+    }
+}
@@ -1,10 +1,45 @@
+/**
+ * Random number helpers.
+ *
+ * A "random source" is any object exposing `nextUint32()`, returning an
+ * integer in [0, 2^32). Passing a seeded one to getRandomInt makes the result
+ * reproducible (simulations, tests); a pooled one batches crypto calls.
+ * Without a source, crypto is called once per value.
+ */
+
+const UINT32_RANGE = 4294967296;
+const DEFAULT_POOL_SIZE = 4096;
+// crypto.getRandomValues rejects requests larger than 65536 bytes.
+const MAX_CRYPTO_WORDS = 16384;
+
+// Single-value buffer reused by the unpooled crypto path.
+const singleBuffer = new Uint32Array(1);
+
+/**
+ * Draws an unbiased integer in [0, max-1] from a source via rejection sampling.
+ * limit is the largest multiple of max <= 2^32; values at or above it are redrawn.
+ */
+function sampleBelow(max, source) {
+    const limit = UINT32_RANGE - (UINT32_RANGE % max);
+    let value;
+    do {
+        value = source.nextUint32();
+    } while (value >= limit);
+    return value % max;
+}
+
 /**
  * Generates a random integer between 0 and max-1 using crypto if available.
  * Uses rejection sampling to avoid modulo bias.
  * @param {number} max - The exclusive upper bound.
+ * @param {{ nextUint32: Function }|null} [source] - Optional random source (seeded or pooled).
  * @returns {number} Random integer in [0, max-1].
  */
-export function getRandomInt(max) {
+export function getRandomInt(max, source = null) {
+    if (source) {
+        return sampleBelow(max, source);
+    }
+
     if (typeof crypto !== 'undefined' && crypto.getRandomValues) {
         // Rejection sampling to avoid modulo bias
         // We want a number in [0, max-1]
@@ -15,16 +50,151 @@ export function getRandomInt(max) {
         const maxUint32 = 4294967296;
         const limit = maxUint32 - (maxUint32 % max);
 
-        // We can't reuse a buffer across calls easily without state,
-        // but creating a new Uint32Array(1) is very cheap.
-        const buffer = new Uint32Array(1);
-
         do {
-            crypto.getRandomValues(buffer);
-        } while (buffer[0] >= limit);
+            crypto.getRandomValues(singleBuffer);
+        } while (singleBuffer[0] >= limit);
 
-        return buffer[0] % max;
+        return singleBuffer[0] % max;
     } else {
         return Math.floor(Math.random() * max);
     }
 }
+
+/**
+ * Fills a Uint32Array with random words, from crypto when available.
+ * @param {Uint32Array} buffer
+ */
+function fillRandomWords(buffer) {
+    if (typeof crypto !== 'undefined' && crypto.getRandomValues) {
+        for (let offset = 0; offset < buffer.length; offset += MAX_CRYPTO_WORDS) {
+            const end = Math.min(buffer.length, offset + MAX_CRYPTO_WORDS);
+            crypto.getRandomValues(buffer.subarray(offset, end));
+        }
+        return;
+    }
+    for (let i = 0; i < buffer.length; i++) {
+        buffer[i] = Math.floor(Math.random() * UINT32_RANGE);
+    }
+}
+
+/**
+ * Creates a pooled random source: one crypto call fills `size` words, which are
+ * handed out one by one until the pool is empty. Same values as the unpooled
+ * path, far fewer crypto calls.
+ * @param {number} [size] - Pool size in 32-bit words.
+ * @returns {{ nextUint32: Function, refills: number }}
+ */
+export function createPooledRandom(size = DEFAULT_POOL_SIZE) {
+    const pool = new Uint32Array(Math.max(1, Math.floor(size)));
+    let index = pool.length;
+
+    return {
+        refills: 0,
+        nextUint32() {
+            if (index >= pool.length) {
+                fillRandomWords(pool);
+                index = 0;
+                this.refills++;
+            }
+            return pool[index++];
+        }
+    };
+}
+
+/** Shared pooled crypto source used by the shufflers when no source is injected. */
+export const pooledRandom = createPooledRandom();
+
+/**
+ * Bulk version of getRandomInt: out[i] = random integer in [0, maxes[i] - 1].
+ * Uses the same rejection sampling, so every value is unbiased.
+ * @param {ArrayLike<number>} maxes - Exclusive upper bound for each slot.
+ * @param {Uint32Array|Array<number>} [out] - Destination with room for maxes.length values
+ *   (defaults to a new Uint32Array).
+ * @param {{ nextUint32: Function }} [source] - Defaults to the shared pooled source.
+ * @returns {Uint32Array|Array<number>} out
+ */
+export function fillRandomInts(maxes, out = new Uint32Array(maxes.length), source = pooledRandom) {
+    for (let i = 0; i < maxes.length; i++) {
+        out[i] = sampleBelow(maxes[i], source);
+    }
+    return out;
+}
+
+/**
+ * SplitMix32 finalizer. Spreads nearby seeds across the 32-bit space.
+ * @param {number} x
+ * @returns {number} Unsigned 32-bit integer.
+ */
+function mix32(x) {
+    x = (x + 0x9e3779b9) | 0;
+    x = Math.imul(x ^ (x >>> 16), 0x85ebca6b);
+    x = Math.imul(x ^ (x >>> 13), 0xc2b2ae35);
+    return (x ^ (x >>> 16)) >>> 0;
+}
+
+/**
+ * Normalizes a seed (number or string) to an unsigned 32-bit integer.
+ * @param {number|string} seed
+ * @returns {number}
+ */
+export function normalizeSeed(seed) {
+    if (typeof seed === 'number' && Number.isFinite(seed)) {
+        return (Math.floor(seed) >>> 0);
+    }
+    if (typeof seed === 'string' && /^\d+$/.test(seed)) {
+        return (Number(seed) >>> 0);
+    }
+    const str = String(seed);
+    let hash = 0x811c9dc5;
+    for (let i = 0; i < str.length; i++) {
+        hash ^= str.charCodeAt(i);
+        hash = Math.imul(hash, 0x01000193);
+    }
+    return hash >>> 0;
+}
+
+/**
+ * Derives an independent child seed, e.g. one per simulation shard.
+ * The same (masterSeed, index) pair always yields the same seed.
+ * @param {number|string} masterSeed
+ * @param {number} index
+ * @returns {number} Unsigned 32-bit seed.
+ */
+export function deriveSeed(masterSeed, index) {
+    return mix32(normalizeSeed(masterSeed) ^ mix32(index));
+}
+
+/**
+ * Creates a deterministic random source (xoshiro128**).
+ * Not cryptographically secure: intended for simulations and tests only.
+ * @param {number|string} seed
+ * @returns {{ seed: number, nextUint32: Function }}
+ */
+export function createSeededRandom(seed) {
+    const normalized = normalizeSeed(seed);
+    // Expand the 32-bit seed into 128 bits of state with SplitMix32.
+    let s0 = mix32(normalized);
+    let s1 = mix32(s0);
+    let s2 = mix32(s1);
+    let s3 = mix32(s2);
+    if ((s0 | s1 | s2 | s3) === 0) s0 = 1;
+
+    return {
+        seed: normalized,
+        nextUint32() {
+            const result = Math.imul(rotl(Math.imul(s1, 5), 7), 9) >>> 0;
+            const t = s1 << 9;
+            s2 ^= s0;
+            s3 ^= s1;
+            s1 ^= s2;
+            s0 ^= s3;
+            s2 ^= t;
+            s3 = rotl(s3, 11);
+            return result;
+        }
+    };
+}
+
+function rotl(x, k) {
+    return (x << k) | (x >>> (32 - k));
+}
@@ -1,3 +1,5 @@
+import { instrumentMethods } from './PerfTracer.js';
+
 export class StorageManager {
     static set(key, value) {
         try {
@@ -124,3 +126,5 @@ export class StorageManager {
         }
     }
 }
+
+instrumentMethods(StorageManager, 'StorageManager', ['encode', 'decode']);
@@ -0,0 +1,494 @@
+/**
+ * Combinatorial expected-value engine for basic strategy decisions.
+ *
+ * For every (player hand, dealer upcard) pair it computes the EV, in units of
+ * the initial bet, of stand, hit, double, split and surrender under a rule
+ * profile and shoe size. Results are packed into a compact table
+ * (StrategyEVTable) that can be serialized, shipped and looked up in O(1).
+ *
+ * Model:
+ * - Two-card hands remove their cards and the upcard from the shoe. Drawing
+ *   probabilities then follow the remaining composition card by card.
+ * - Dealer outcome probabilities are memoized by remaining-shoe composition.
+ *   For a decision they are taken from the composition at the start of the
+ *   decision (after the player's first two cards and the upcard), the usual
+ *   approximation of composition-dependent calculators.
+ * - Peek games condition on the dealer not having blackjack. In no-peek games
+ *   a dealer blackjack takes every bet on the table, doubles and splits included.
+ * - Splits are played once (no resplits). Split aces get one card each, and
+ *   doubling after a split follows doubleAfterSplit.
+ * - Multi-card hands use rows keyed by hard/soft total, computed from the
+ *   shoe minus the upcard. They only offer stand and hit.
+ */
+
+/** Rank names by index: Ace, 2-9 and every ten-valued card. */
+export const EV_RANKS = ['A', '2', '3', '4', '5', '6', '7', '8', '9', '10'];
+
+/** Action order inside a table cell. */
+export const EV_ACTIONS = ['stand', 'hit', 'double', 'split', 'surrender'];
+
+// Hard value of each rank (Ace counts 1, soft totals add 10 when it fits).
+const RANK_POINTS = [1, 2, 3, 4, 5, 6, 7, 8, 9, 10];
+const TEN = 9;
+const ACE = 0;
+
+// Dealer outcome slots: totals 17-21, bust, blackjack.
+const BUST = 5;
+const DEALER_BJ = 6;
+
+// Serialized EVs are Int16 in units of 1/EV_SCALE bets; MISSING marks illegal actions.
+const EV_SCALE = 10000;
+const MISSING = -32768;
+
+const TABLE_VERSION = 1;
+
+const HARD_ROWS = [5, 6, 7, 8, 9, 10, 11, 12, 13, 14, 15, 16, 17, 18, 19, 20, 21];
+const SOFT_ROWS = [12, 13, 14, 15, 16, 17, 18, 19, 20, 21];
+
+/**
+ * Row keys in table order: two-card hands as "r1,r2" (rank indices, r1 <= r2,
+ * the natural A,10 excluded), then "H<total>" and "S<total>".
+ */
+export const EV_ROW_KEYS = (() => {
+    const keys = [];
+    for (let r1 = 0; r1 < 10; r1++) {
+        for (let r2 = r1; r2 < 10; r2++) {
+            if (r1 === ACE && r2 === TEN) continue;
+            keys.push(`${r1},${r2}`);
+        }
+    }
+    HARD_ROWS.forEach((t) => keys.push(`H${t}`));
+    SOFT_ROWS.forEach((t) => keys.push(`S${t}`));
+    return keys;
+})();
+
+const ROW_INDEX = new Map(EV_ROW_KEYS.map((key, i) => [key, i]));
+
+/**
+ * Identifies the rule fields that change EVs (payout does not affect decisions).
+ * @param {Object} ruleProfile
+ * @returns {string}
+ */
+export function getRuleSignature(ruleProfile) {
+    return [
+        ruleProfile.dealerHitsSoft17 ? 'H17' : 'S17',
+        ruleProfile.doubleAfterSplit ? 'DAS' : 'NDAS',
+        ruleProfile.holeCardPolicy === 'no_peek' ? 'ENHC' : 'PEEK',
+        ruleProfile.surrenderType && ruleProfile.surrenderType !== 'none' ? 'LS' : 'NS'
+    ].join('-');
+}
+
+/**
+ * Rank index (0-9) of a {suit, value} card, or -1.
+ * @param {Object} card
+ * @returns {number}
+ */
+export function getEVRankIndex(card) {
+    if (!card) return -1;
+    if (card.value === 'A') return ACE;
+    if (card.value === 'J' || card.value === 'Q' || card.value === 'K' || card.value === '10') return TEN;
+    const n = parseInt(card.value, 10);
+    return n >= 2 && n <= 9 ? n - 1 : -1;
+}
+
+/**
+ * Counts per rank index for a full shoe.
+ * @param {number} decks
+ * @returns {Array<number>}
+ */
+export function createShoeComposition(decks) {
+    return RANK_POINTS.map((_, r) => (r === TEN ? 16 : 4) * decks);
+}
+
+/**
+ * Compact string key for a composition (one char per rank count).
+ * @param {Array<number>} comp
+ * @returns {string}
+ */
+export function compositionKey(comp) {
+    let key = '';
+    for (let r = 0; r < 10; r++) key += String.fromCharCode(comp[r] + 48);
+    return key;
+}
+
+function sumComposition(comp) {
+    let n = 0;
+    for (let r = 0; r < 10; r++) n += comp[r];
+    return n;
+}
+
+function bestTotal(hardTotal, hasAce) {
+    return hasAce && hardTotal + 10 <= 21 ? hardTotal + 10 : hardTotal;
+}
+
+/**
+ * Memo for dealer outcomes, keyed by composition, hand total and softness.
+ * Reuse one cache across calls with the same soft-17 rule.
+ */
+export function createDealerCache() {
+    return new Map();
+}
+
+function dealerFinal(comp, hardTotal, hasAce, hitsSoft17, cache) {
+    const best = bestTotal(hardTotal, hasAce);
+    const out = new Float64Array(6);
+    if (best > 21) {
+        out[BUST] = 1;
+        return out;
+    }
+    const isSoft17 = best === 17 && hasAce && hardTotal + 10 === 17;
+    if (best >= 17 && !(isSoft17 && hitsSoft17)) {
+        out[best - 17] = 1;
+        return out;
+    }
+
+    const key = `${compositionKey(comp)}|${hardTotal}|${hasAce ? 1 : 0}`;
+    const cached = cache.get(key);
+    if (cached) return cached;
+
+    const n = sumComposition(comp);
+    for (let r = 0; r < 10; r++) {
+        const count = comp[r];
+        if (count === 0) continue;
+        const p = count / n;
+        comp[r]--;
+        const sub = dealerFinal(comp, hardTotal + RANK_POINTS[r], hasAce || r === ACE, hitsSoft17, cache);
+        comp[r]++;
+        for (let i = 0; i < 6; i++) out[i] += p * sub[i];
+    }
+    cache.set(key, out);
+    return out;
+}
+
+/**
+ * Final-outcome probabilities for the dealer.
+ * @param {Array<number>} comp - Remaining shoe (upcard already removed). Restored on return.
+ * @param {number} upRank - Upcard rank index.
+ * @param {Object} ruleProfile
+ * @param {Map} [cache] - See createDealerCache.
+ * @returns {Float64Array} [P17, P18, P19, P20, P21, Pbust, Pblackjack]; conditioned on
+ *   no blackjack in peek games.
+ */
+export function getDealerProbabilities(comp, upRank, ruleProfile, cache = createDealerCache()) {
+    const out = new Float64Array(7);
+    const n = sumComposition(comp);
+    const hitsSoft17 = !!ruleProfile.dealerHitsSoft17;
+
+    for (let h = 0; h < 10; h++) {
+        const count = comp[h];
+        if (count === 0) continue;
+        const p = count / n;
+        if ((upRank === ACE && h === TEN) || (upRank === TEN && h === ACE)) {
+            out[DEALER_BJ] += p;
+            continue;
+        }
+        comp[h]--;
+        const sub = dealerFinal(comp, RANK_POINTS[upRank] + RANK_POINTS[h], upRank === ACE || h === ACE, hitsSoft17, cache);
+        comp[h]++;
+        for (let i = 0; i < 6; i++) out[i] += p * sub[i];
+    }
+
+    if (ruleProfile.holeCardPolicy !== 'no_peek' && out[DEALER_BJ] > 0) {
+        const keep = 1 - out[DEALER_BJ];
+        for (let i = 0; i < 6; i++) out[i] /= keep;
+        out[DEALER_BJ] = 0;
+    }
+    return out;
+}
+
+/**
+ * EV of standing on each total 0-21 against a dealer distribution.
+ * @param {Float64Array} dealer - From getDealerProbabilities.
+ * @returns {Float64Array}
+ */
+function standEVs(dealer) {
+    const ev = new Float64Array(22);
+    for (let total = 0; total <= 21; total++) {
+        let v = dealer[BUST] - dealer[DEALER_BJ];
+        for (let t = 17; t <= 21; t++) {
+            const p = dealer[t - 17];
+            if (total > t) v += p;
+            else if (total < t) v -= p;
+        }
+        ev[total] = v;
+    }
+    return ev;
+}
+
+function hitEV(comp, hardTotal, hasAce, ctx) {
+    const key = `${compositionKey(comp)}|${hardTotal}|${hasAce ? 1 : 0}`;
+    const cached = ctx.hitMemo.get(key);
+    if (cached !== undefined) return cached;
+
+    const n = sumComposition(comp);
+    let ev = 0;
+    for (let r = 0; r < 10; r++) {
+        const count = comp[r];
+        if (count === 0) continue;
+        const p = count / n;
+        const nextHard = hardTotal + RANK_POINTS[r];
+        const nextAce = hasAce || r === ACE;
+        const best = bestTotal(nextHard, nextAce);
+        if (best > 21) {
+            ev -= p;
+        } else if (best === 21) {
+            ev += p * ctx.stand[21];
+        } else {
+            comp[r]--;
+            ev += p * Math.max(ctx.stand[best], hitEV(comp, nextHard, nextAce, ctx));
+            comp[r]++;
+        }
+    }
+    ctx.hitMemo.set(key, ev);
+    return ev;
+}
+
+function doubleEV(comp, hardTotal, hasAce, ctx) {
+    const n = sumComposition(comp);
+    let ev = 0;
+    for (let r = 0; r < 10; r++) {
+        const count = comp[r];
+        if (count === 0) continue;
+        const best = bestTotal(hardTotal + RANK_POINTS[r], hasAce || r === ACE);
+        ev += (count / n) * (best > 21 ? -1 : ctx.stand[best]);
+    }
+    return 2 * ev;
+}
+
+function splitEV(comp, rank, ruleProfile, ctx) {
+    const n = sumComposition(comp);
+    let single = 0;
+    for (let s = 0; s < 10; s++) {
+        const count = comp[s];
+        if (count === 0) continue;
+        const hard = RANK_POINTS[rank] + RANK_POINTS[s];
+        const hasAce = rank === ACE || s === ACE;
+        const best = bestTotal(hard, hasAce);
+        comp[s]--;
+        let v = ctx.stand[best];
+        if (rank !== ACE) {
+            if (best < 21) v = Math.max(v, hitEV(comp, hard, hasAce, ctx));
+            if (ruleProfile.doubleAfterSplit) v = Math.max(v, doubleEV(comp, hard, hasAce, ctx));
+        }
+        comp[s]++;
+        single += (count / n) * v;
+    }
+    return 2 * single;
+}
+
+/**
+ * Computes all action EVs for one situation.
+ * @param {Array<number>} comp - Shoe after removing the player's cards and the upcard.
+ * @param {number} upRank
+ * @param {Object} ruleProfile
+ * @param {Object} hand - { hardTotal, hasAce, pairRank (or -1), twoCards }
+ * @param {Map} [dealerCache] - Only used to compute the dealer distribution when dealerProbs is not given.
+ * @param {Float64Array} [dealerProbs] - Precomputed getDealerProbabilities result for comp/upRank.
+ * @returns {Object} EV per action (null when the action is not available).
+ */
+export function computeActionEVs(comp, upRank, ruleProfile, hand, dealerCache = null, dealerProbs = null) {
+    const dealer = dealerProbs || getDealerProbabilities(comp, upRank, ruleProfile, dealerCache ?? createDealerCache());
+    const ctx = { stand: standEVs(dealer), hitMemo: new Map() };
+    const best = bestTotal(hand.hardTotal, hand.hasAce);
+    const surrenderAllowed = ruleProfile.surrenderType && ruleProfile.surrenderType !== 'none';
+
+    return {
+        stand: ctx.stand[best],
+        // The engine stands automatically on 21.
+        hit: best >= 21 ? null : hitEV(comp, hand.hardTotal, hand.hasAce, ctx),
+        double: hand.twoCards ? doubleEV(comp, hand.hardTotal, hand.hasAce, ctx) : null,
+        split: hand.pairRank >= 0 ? splitEV(comp, hand.pairRank, ruleProfile, ctx) : null,
+        surrender: hand.twoCards && surrenderAllowed ? -0.5 : null
+    };
+}
+
+/**
+ * Immutable lookup table of action EVs.
+ */
+export class StrategyEVTable {
+    /**
+     * @param {Object} data
+     * @param {number} data.decks
+     * @param {string} data.rules - Rule signature (see getRuleSignature).
+     * @param {Int16Array} data.values - rows x 10 upcards x 5 actions.
+     */
+    constructor({ decks, rules, values }) {
+        this.decks = decks;
+        this.rules = rules;
+        this.values = values;
+    }
+
+    /**
+     * Raw EVs for a row key and upcard rank index.
+     * @param {string} rowKey - See EV_ROW_KEYS.
+     * @param {number} upRank
+     * @returns {Object|null} { stand, hit, double, split, surrender } with null for unavailable actions.
+     */
+    getRow(rowKey, upRank) {
+        const row = ROW_INDEX.get(rowKey);
+        if (row === undefined || upRank < 0) return null;
+        const offset = (row * 10 + upRank) * EV_ACTIONS.length;
+        const result = {};
+        EV_ACTIONS.forEach((action, i) => {
+            const raw = this.values[offset + i];
+            result[action] = raw === MISSING ? null : raw / EV_SCALE;
+        });
+        return result;
+    }
+
+    /**
+     * EVs for a player hand against a dealer upcard.
+     * @param {Array<Object>} playerCards
+     * @param {Object} dealerUpCard
+     * @returns {Object|null}
+     */
+    getActionEVs(playerCards, dealerUpCard) {
+        if (!playerCards || playerCards.length === 0) return null;
+        const upRank = getEVRankIndex(dealerUpCard);
+        if (playerCards.length === 2) {
+            const r1 = getEVRankIndex(playerCards[0]);
+            const r2 = getEVRankIndex(playerCards[1]);
+            if (r1 < 0 || r2 < 0) return null;
+            return this.getRow(r1 <= r2 ? `${r1},${r2}` : `${r2},${r1}`, upRank);
+        }
+
+        let hard = 0;
+        let hasAce = false;
+        for (const card of playerCards) {
+            const r = getEVRankIndex(card);
+            if (r < 0) return null;
+            hard += RANK_POINTS[r];
+            if (r === ACE) hasAce = true;
+        }
+        const best = bestTotal(hard, hasAce);
+        if (best > 21) return null;
+        const soft = best !== hard;
+        const total = soft ? best : Math.max(5, best);
+        return this.getRow(`${soft ? 'S' : 'H'}${total}`, upRank);
+    }
+
+    /**
+     * Compact serialized form (base64-packed Int16 values).
+     * @returns {{ v: number, decks: number, rules: string, data: string }}
+     */
+    serialize() {
+        const bytes = new Uint8Array(this.values.buffer, this.values.byteOffset, this.values.byteLength);
+        let binary = '';
+        for (let i = 0; i < bytes.length; i++) binary += String.fromCharCode(bytes[i]);
+        return { v: TABLE_VERSION, decks: this.decks, rules: this.rules, data: btoa(binary) };
+    }
+
+    /**
+     * Restores a table produced by serialize().
+     * @param {{ v: number, decks: number, rules: string, data: string }} serialized
+     * @returns {StrategyEVTable}
+     */
+    static deserialize(serialized) {
+        if (!serialized || serialized.v !== TABLE_VERSION) {
+            throw new Error('Unsupported EV table version');
+        }
+        const binary = atob(serialized.data);
+        const bytes = new Uint8Array(binary.length);
+        for (let i = 0; i < binary.length; i++) bytes[i] = binary.charCodeAt(i);
+        const values = new Int16Array(bytes.buffer);
+        if (values.length !== EV_ROW_KEYS.length * 10 * EV_ACTIONS.length) {
+            throw new Error('Corrupted EV table');
+        }
+        return new StrategyEVTable({ decks: serialized.decks, rules: serialized.rules, values });
+    }
+}
+
+/**
+ * Computes the full EV table for a rule profile and shoe size.
+ * Takes a few seconds for a 6-deck shoe: build it offline (scripts/build-ev-tables.js).
+ * @param {Object} ruleProfile
+ * @param {number} decks
+ * @returns {StrategyEVTable}
+ */
+export function buildStrategyEVTable(ruleProfile, decks) {
+    const values = new Int16Array(EV_ROW_KEYS.length * 10 * EV_ACTIONS.length);
+    const dealerCache = createDealerCache();
+    const shoe = createShoeComposition(decks);
+
+    const store = (rowKey, upRank, evs) => {
+        const offset = (ROW_INDEX.get(rowKey) * 10 + upRank) * EV_ACTIONS.length;
+        EV_ACTIONS.forEach((action, i) => {
+            const ev = evs[action];
+            values[offset + i] = ev === null || ev === undefined ? MISSING : Math.round(ev * EV_SCALE);
+        });
+    };
+
+    for (let up = 0; up < 10; up++) {
+        const comp = shoe.slice();
+        comp[up]--;
+
+        for (const rowKey of EV_ROW_KEYS) {
+            if (rowKey[0] === 'H' || rowKey[0] === 'S') {
+                const total = Number(rowKey.slice(1));
+                const soft = rowKey[0] === 'S';
+                const hand = {
+                    hardTotal: soft ? total - 10 : total,
+                    hasAce: soft,
+                    pairRank: -1,
+                    twoCards: false
+                };
+                store(rowKey, up, computeActionEVs(comp, up, ruleProfile, hand, dealerCache));
+                continue;
+            }
+
+            const [r1, r2] = rowKey.split(',').map(Number);
+            if (comp[r1] === 0 || comp[r2] - (r1 === r2 ? 1 : 0) <= 0) continue;
+            comp[r1]--;
+            comp[r2]--;
+            const hand = {
+                hardTotal: RANK_POINTS[r1] + RANK_POINTS[r2],
+                hasAce: r1 === ACE || r2 === ACE,
+                pairRank: r1 === r2 ? r1 : -1,
+                twoCards: true
+            };
+            store(rowKey, up, computeActionEVs(comp, up, ruleProfile, hand, dealerCache));
+            comp[r1]++;
+            comp[r2]++;
+        }
+    }
+
+    return new StrategyEVTable({ decks, rules: getRuleSignature(ruleProfile), values });
+}
+
+const registry = new Map();
+const pending = [];
+
+/**
+ * Registers serialized tables (decoded on first lookup).
+ * @param {Array<Object>} serializedTables
+ */
+export function registerStrategyEVTables(serializedTables) {
+    (serializedTables || []).forEach((t) => pending.push(t));
+}
+
+/**
+ * Adds an already-built table to the registry.
+ * @param {StrategyEVTable} table
+ */
+export function addStrategyEVTable(table) {
+    registry.set(`${table.rules}/${table.decks}`, table);
+}
+
+/**
+ * Finds a table for a rule profile, preferring the given shoe size.
+ * @param {Object} ruleProfile
+ * @param {number} [decks]
+ * @returns {StrategyEVTable|null}
+ */
+export function getStrategyEVTable(ruleProfile, decks) {
+    if (!ruleProfile) return null;
+    while (pending.length > 0) {
+        addStrategyEVTable(StrategyEVTable.deserialize(pending.shift()));
+    }
+    const rules = getRuleSignature(ruleProfile);
+    if (decks !== undefined) return registry.get(`${rules}/${decks}`) || null;
+    for (const table of registry.values()) {
+        if (table.rules === rules) return table;
+    }
+    return null;
+}
@@ -0,0 +1,39 @@
+/**
+ * CRC-32 (IEEE 802.3) over byte arrays, table driven.
+ */
+
+const CRC_TABLE = (() => {
+    const table = new Int32Array(256);
+    for (let n = 0; n < 256; n++) {
+        let c = n;
+        for (let k = 0; k < 8; k++) {
+            c = c & 1 ? 0xedb88320 ^ (c >>> 1) : c >>> 1;
+        }
+        table[n] = c;
+    }
+    return table;
+})();
+
+const textEncoder = new globalThis.TextEncoder();
+
+/**
+ * CRC-32 of a byte array.
+ * @param {Uint8Array} bytes
+ * @returns {number} Unsigned 32-bit checksum.
+ */
+export function crc32(bytes) {
+    let crc = -1;
+    for (let i = 0; i < bytes.length; i++) {
+        crc = CRC_TABLE[(crc ^ bytes[i]) & 0xff] ^ (crc >>> 8);
+    }
+    return (crc ^ -1) >>> 0;
+}
+
+/**
+ * CRC-32 of a string's UTF-8 bytes.
+ * @param {string} str
+ * @returns {number}
+ */
+export function crc32String(str) {
+    return crc32(textEncoder.encode(str));
+}
@@ -27,6 +27,8 @@ const BOOLEAN_SETTING_FIELDS = [
     'autoSave',
     'showStats',
     'trainingMode',
+    'turboMode',
+    'perfectPlay',
 ];
 
 export class ImportValidationError extends Error {
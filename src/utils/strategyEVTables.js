@@ -0,0 +1,10 @@
+// Generated by scripts/build-ev-tables.js. Do not edit by hand.
+// Action EVs per (hand, upcard), see StrategyEV.js.
+export const STRATEGY_EV_TABLES = [
+    // vegas_strip
+    { v: 1, decks: 6, rules: 'H17-DAS-PEEK-LS', data: 'qOiK/TvplgR47Oj0MwOs/d8SeOx79g0EMQC4FHjsKPgPBdoCqBZ47Mz5SgaDBaoYeOyA+2kHCAh2Gnjsk+1mBg35jBJ47CDsrgPO8w0OeOz76vv/Ze5SCXjs9Opv/ULsNAd47KzoIfw/6QCAeOzd9NIBlf0AgHjscfbnAhwAAIB47B74FgS+AgCAeOzd+WMFfgUAgHjsfvuEBvYHAIB47ITtrATy+ACAeOwU7AICsfMAgHjs8eqp/q7uAIB47ObqBPwq7ACAeOyv6MP6QekAgHjs3vTlAI/9AIB47HL2AgINAACAeOw4+EQDxAIAgHjs4fmNBHMFAIB47IL7uAXsBwCAeOyH7fcC2PgAgHjsF+yhAA70AIB47OPqJ/2K7gCAeOzn6qf6I+wAgHjss+hS+R3pAIB47N/0/f9n/QCAeOyM9iwB+v8AgHjsPPhsAqICAIB47OX5vgNTBQCAeOyG+/MEzwcAgHjsi+1lAQ75AIB47Ans4P608wCAeOzj6pr7X+4AgHjs6Oo++QfsAIB47LHo3/fj6ACAeOz49C//Tf0AgHjskPZaAND/AIB47ED4pAF6AgCAeOzp+f4CLwUAgHjsh/tcBPQHAIB47Hztqv/I+ACAeOwK7Eb9mvMAgHjs5OoU+jHuAIB47OnqzvfJ6wCAeOzp62j3n+oAgHjsCfr//9H/AIB47Hf7KAFCAgCAeOwE/W4C3AQAgHjsf/7jA8cHAIB47M7/9wTvCQCAeOzy+yICtv8AgHjsDvEq/Sb2AIB47JLvPPqo8ACAeOyc7174O+4AgHjsMvfF+bHvAIB47GsEWgKGBACAeOyIBXED1AYAgHjsrgbIBI8JAIB47MYH6gXTCwCAeOyyCP4G+w0AgHjssw+9BtUIAIB47DkEmQHu/gCAeOze+B78z/QAgHjs/Phn+o/yAIB47GcHef0F9wCAeOzgDrYEPgkAgHjsng/gBbQLAIB47DwQ2ga1DQCAeOwvEQsIFhAAgHjsqhEFCQsSAIB47A0YpAiRDACAeOxHFwAGqgcAgHjsPAtJADz9AIB47HkCiPzH9gCAeOynFyQBQv4AgHjs6BgWBwAOAIB47DUZ6QfEDwCAeOyeGe4I3BEAgHjsMBoJChIUAIB47Hga+QrxFQCAeOw1HvIJFg8AgHjs4x6UB+EKAIB47KsddQR+BQCAeOyqFeAAYv8AgHjsr+iX9F7R5ex47NL0nPul6a/8eOxn9uH8zuw6/3jsFfhG/ivwMQJ47O352//b8+AFeOx8+y8B+PYhCXjsdu2D/Ozay/947Ajs3vkP2DL5eOzn6rb2zdXI8Xjs2OrL9LDVo+147LPom/Nl0QCAeOzT9BX7pukAgHjsaPZe/NHsAIB47C/42v1e8ACAeOzy+Wb/4/MAgHjsgPvCAAD3AIB47HntUPvy2gCAeOwL7K74FtgAgHjs2Oqc9bHVAIB47NnqzPOy1QCAeOy26JPy59EAgHjs1PSR+nLqAIB47IL28PvE7QCAeOwz+GX9JfEAgHjs9vn4/qD0AIB47IT7ZwC59wCAeOx97fn5ON0AgHjs/eto98HYAIB47Nnqf/Rt1gCAeOza6sTycNYAgHjstehL8pXVAIB47O30yPtZ7wCAeOyG9hr9afIAgHjsN/iK/qP1AIB47Pn5HQDt+ACAeOyE+3cB5/sAgHjsbu1Q/S/pAIB47P3rtffb3gCAeOza6tf0ydoAgHjs2+qF89LaAIB47Lvoo/WA3wCAeOzp9Bf/LPgAgHjsgfZQAPb6AIB47DL4swHd/QCAeOzy+RcD2QAAgHjsXfssBDUDAIB47GbtTQME+QCAeOz366/9de4AgHjs1OrF9wzkAIB47NLqPfbI4gCAeOzE6Ar7LO4AgHjs4/TdApsCAIB47Hz2CQQOBQCAeOwr+DQFiwcAgHjsy/ldBvkJAIB47FX7ZQciDACAeOxf7dAGegQAgHjs8evtAzz/AIB47Mvq9v1q9ACAeOz26vr53u0AgHjsuehGAaz+AIB47N/0OAdFDgCAeOx19i4IUBAAgHjsBPgVCSoSAIB47MP5NgpsFACAeOxO+yILRRYAgHjsWu0ZCn4PAIB47OjrywdGCwCAeOzt6poE5AUAgHjs8OoDAbz/AIB47K/oIQRgBACAeOzY9GMJmRIAgHjsTvYpCkMUAIB47Pz3HAs4FgCAeOy7+ScMThgAgHjsR/sFDQoaAIB47FHtYgsDEgCAeOwJ7OQIjg0AgHjs5+oaBtcIAIB47OrqnwTjBgCAeOyY6BPxfd8AgHjssvQf9j3sAIB47Ef25vbM7QCAeOz197j3ce8AgHjstfmT+CfxAIB47EH7SvmT8gCAeOxz7a33O+wAgHjsBOxe9d7nAIB47OLqs/Im4wCAeOzl6lrxR+EAgHjstuiT8ufRGet47NT0kPpx6t76eOxp9t/7lu3S/XjsSfhy/UrxZwF47Pb5+P6j9A0FeOyE+2cAuvdQCHjsfO34+TjdZv147A7sbffk2An3eOzK6nf0Ttbl73js2urI8nDW0Ot47LnoO/Kf1QCAeOzV9Kr7N+8AgHjsg/b+/FfyAIB47E34gP6+9QCAeOz6+REA+/gAgHjsh/tqAe/7AIB47IDtS/1S6QCAeOwA7KX34N4AgHjsy+q59KvaAIB47NvqcfPR2gCAeOy46KP1i98AgHjs7vQU/yr4AIB47If2TQD0+gCAeOxR+LwB+v0AgHjs/vknA/wAAIB47Ij7WwSXAwCAeOxx7UwDG/kAgHjsAeys/YjuAIB47Mzqtvf84wCAeOzc6jz22OIAgHjsvugg+zruAIB47On06wKWAgCAeOyC9hcECQUAgHjsTPhQBacHAIB47Pf5mAZQCgCAeOxh+4UHRQwAgHjsau3iBpIEAIB47Prr+wNM/wCAeOzF6vf9V/QAgHjs0+oO+sztAIB47MjoRgHE/gCAeOzk9D0HTQ4AgHjsffY3CGAQAIB47EX4RwmPEgCAeOzP+UgKkBQAgHjsWfs0C2gWAIB47GLtKwqxDwCAeOz069oHeAsAgHjsveqYBMcFAIB47PfqAgHJ/wCAeOy96CYEfwQAgHjs4PRrCagSAIB47Hf2UAqSFACAeOwe+DELYhYAgHjsx/k4DHAYAIB47FH7Fg0rGgCAeOxd7WYLHhIAgHjs6+vtCJINAIB47N7qFQbaCACAeOzx6qcEAQcAgHjssujr8DPfAIB47Nn0+/X16wCAeOxP9q72XO0AgHjsFfiG9wzvAIB47L/5X/i98ACAeOxL+xT5KPIAgHjsVO1197jrAIB47A3sHPVj5wCAeOzZ6mfykuIAgHjs6+oX8cXgAIB47JzoW+8T3QCAeOyy9Pfz7+cAgHjsSPaf9D/pAIB47A74UPWh6gCAeOy5+QX2CewAgHjsRfud9jntAIB47HbtdvUI6QCAeOwH7FHz4+QAgHjs0+oN8crgAIB47Obqmu9+3gCAeOy96Lf1ld8v6Xjs1vQd/xb4wvl47J32WgD2+gX9eOxS+MwB/P2BAHjs/vk7AwcBOAR47Iv7bwSgA38HeOyD7WcDPvnE+njs8uuw/WruvPR47Mvqxvf9483teOzb6kz22OLd6XjsvOgk+0fuAIB47O/07wKdAgCAeOyh9hwEFwUAgHjsVfhUBbAHAIB47AL6qQZyCgCAeOyM+7YHpgwAgHjsde3lBqgEAIB47PLr7gM8/wCAeOzM6vX9ZvQAgHjs3eoS+tztAIB47MLoTQHY/gCAeOzr9EMHWQ4AgHjsnPY+CHAQAIB47FD4UQmjEgCAeOz7+XYK7BQAgHjsZftJC5EWAIB47G3tNwrfDwCAeOzs688HbgsAgHjsxuqZBNsFAIB47NTqCQHE/wCAeOzM6CoEogQAgHjs5vR0CboSAIB47Jf2XwqzFACAeOxJ+F4LvBYAgHjs0/lLDJUYAIB47Fz7KA1QGgCAeOxm7W0LPRIAgHjs5uvwCKMNAIB47L7qJQboCACAeOz46qcEEAcAgHjswejs8EzfAIB47OH0BvYL7ACAeOyQ9tb2q+0AgHjsIviX9y/vAIB47Mv5b/je8ACAeOxV+yX5SfIAgHjsYO1499DrAIB47N3rGPVM5wCAeOzf6mLynOIAgHjs8uoc8d7gAIB47LbobO893QCAeOza9Ar0E+gAgHjsafak9EnpAIB47Br4VfWq6gCAeOzD+Qn2EuwAgHjsTvuh9kLtAIB47FjtcPXu6ACAeOz/60Hzx+QAgHjs2uoE8cDgAIB47Ozqku9z3gCAeOyf6LbtktoAgHjstPTE8YjjAIB47GH2S/KW5ACAeOwT+NfyreUAgHjsvflq89XmAIB47En75fPJ5wCAeOx57Uzzm+UAgHjs+euN8TTiAIB47NTqRu/t3QCAeOzm6u3tntsAgHjsu+hMAdr+8uZ47An1TAdvDtj4eOyl9kUIfhD4+3jsWfhUCakSjf947AX6ggoEFUIDeOyN+3QL6BaRBnjsZu0rCtIPMvh47PPrzgd9Cy7yeOzN6pgE6QVo63js3uoNAdP/rOd47MHoMgS0BACAeOwE9YYJ4BIAgHjsoPZtCs8UAIB47FT4bAvXFgCAeOz++XoM8xgAgHjsZfs8DXgaAIB47F7tcwtSEgCAeOzs6/4Izw0AgHjsx+oqBgUJAIB47NXqrgQRBwCAeOzK6OnwXt8AgHjs//QR9iHsAIB47Jv24fbC7QCAeOxN+Ln3cu8AgHjs1vl9+PrwAIB47F37L/le8gCAeOxX7Wf3t+sAgHjs5usW9VvnAIB47L/qbPKo4gCAeOz56h7x9eAAgHjsv+ge76vcAIB47Pr0y/OX5wCAeOyU9nr09OgAgHjsJfgZ9TLqAIB47M75zfWa6wCAeOxW+2P2xewAgHjsUu0d9UjoAIB47N7r9/Ik5ACAeOzh6rfwMeAAgHjs8+pG7+PdAIB47LXouO2c2gCAeOzz9NHxo+MAgHjsbfZL8pbkAIB47B341/Ku5QCAeOzH+Wvz1eYAgHjsT/vj88XnAIB47EntRPN95QCAeOz/63nxEuIAgHjs2+oy783dAIB47O3q4u2M2wCAeOye6B7s7dcAgHjszfSJ7xHfAIB47GX27u/c3wCAeOwW+FnwsuAAgHjswPnN8JrhAIB47Er7J/FP4gCAeOxr7ZHxxuIAgHjs+uu07xbfAIB47NXqju3s2gCAeOzn6lTsp9gAgHjsx+js8GPff+V47P/0EfYh7C34eOyb9uH2we2L+3jsT/i893fvOf947Pf5lPgo8fkCeOw++xv5NvLSBXjsV+1e96PrOPZ47ObrFfVa53PweOzB6nLyuOLi6XjszOob8d7gKOZ47NDoEe+e3ACAeOz69MrzlOcAgHjslvZ79PfoAIB47Ej4L/Ve6gCAeOzP+c/1nusAgHjsNftQ9qDsAIB47FDtGvVC6ACAeOzg6+vyDuQAgHjsueqw8BDgAIB47PDqQO/j3QCAeOzG6Kjte9oAgHjs9fTL8ZbjAIB47I/2V/Kt5ACAeOwh+NTyp+UAgHjsx/ll88vmAIB47C77zPOX5wCAeOxK7UPzc+UAgHjs1+t68f3hAIB47NrqIu+k3QCAeOzq6s7tYtsAgHjsu+gn7PjXAIB47O70ke8j3wCAeOxo9urv1N8AgHjsGfhW8KzgAIB47MD5yPCQ4QCAeOwo+xPxJuIAgHjsQu2T8bniAIB47Pnrr+8C3wCAeOzU6ojt1toAgHjs5OpG7IPYAIB47KTo7urc1QCAeOzI9I3tGdsAgHjsYPbT7abbAIB47BH4Hu483ACAeOy5+XDu4NwAgHjsI/vk7sjdAIB47GPtA/AH4ACAeOzz60nuktwAgHjsz+pK7JPYAIB47N7qIOs/1gCAeOzZ6F7t5dnr5Hjs9fSG8QvjX/p47JH2FPIo5Kr9eOxB+KHyQuVOAXjsqPkS8yPmfgR47C37h/MO57YHeOxJ7QTz6+SY/Hjs2us88XfhvvB47LHq5e4T3VXqeOwU63/txtqA53jsz+hf7GvYAIB47PD00O+g3wCAeOyK9jnwceAAgHjsGviV8CrhAIB47KD5+PDw4QCAeOwm+1DxoOIAgHjsRO3R8TXjAIB47NLr8O9+3wCAeOzS6sHtStsAgHjsDut97PrYAIB47MTo++r31QCAeOzp9JvtNtsAgHjsY/bX7a/bAIB47BH4IO5A3ACAeOyY+WXuytwAgHjsIPvj7sfdAIB47DvtBfAL4ACAeOzz60TuiNwAgHjszOpF7IvYAIB47AjrGesx1gCAeOzu62rp09IAgHjs3Pn36u/VAIB47Ez7IutF1gCAeOzY/E3rmtYAgHjsNP6863jXAIB47J7/4evC1wCAeOy/+07tnNoAgHjs/vBq7NPYAIB47ILviOoQ1QCAeOyn71jpsdIAgHjsxOj86vnVzOt47Ov0ne062+kAeOyD9uTtyNudA3js8vcV7ivcMgZ47Jf5Ze7K3DoJeOwf++Tux93fC3jsPu0F8AvgkAh47MnrRu6N3Kz8eOzz6j7sfNgg8HjsB+sZ6zLWHe147APsfOn40gCAeOz++QTrB9YAgHjsTPsl60nWAIB47Lj8ReuK1gCAeOwz/rzreNcAgHjsnP/h68LXAIB47Lf7Ue2i2gCAeOzd8Gfsz9gAgHjsi++A6gHVAIB47MrvVumt0gCAeOxG9wfnDs4AgHjsSQSU5yjPAIB47GIFqOdQzwCAeOxsBvjn8c8AgHjsowca6DXQAIB47JsILOhZ0ACAeOyJDxDpH9IAgHjsEQQQ6R/SAIB47MT4DOgX0ACAeOwv+dnmss0AgHjsbfcV5yrOpvZ47GgEnOc4zxsHeOxEBaLnRM8YCXjsbAb55/HPlQt47KMHGug10EEOeOyaCCzoWdBqEHjsnA8R6SLSbA547OEDDukc0lEIeOzE+AnoE9BG/HjsUfnX5q7NmPR47IAHYePDxgCAeOzDDl/jvsYAgHjsZA+k40fHAIB47CMQruNdxwCAeOwXEb3je8cAgHjsmRHF44rHAIB47AYYKeRSyACAeOwXFzrkdMgAgHjsFwsm5EzIAIB47LYCneM5xwCAeOxzF3ne87wJAnjsuRik3ki9vQ147CQZp95NvaEPeOyPGaneUr2bEXjsIRqt3lm91BN47G4ar95evaoVeOwoHsjej73eE3js4B7L3pa9Nw947Ikd0t6kvdoIeOzXFeTex70CAnjsquig8wCAAIAAgM30FPsAgACAAIBj9l78AIAAgACAEfjH/QCAAIAAgLn5Pf8AgACAAIBB+5EAAIAAgACAZ+1d+wCAAIAAgPrrr/gAgACAAIDZ6qP1AIAAgACA7ere8wCAAIAAgKrosPIAgACAAIDN9Jj6AIAAgACAY/bn+wCAAIAAgBH4VP0AgACAAIC5+dH+AIAAgACAQfs3AACAAIAAgGftHPoAgACAAID66473AIAAgACA2eqi9ACAAIAAgO3q7fIAgACAAICq6FTyAIAAgACAzfS0+wCAAIAAgGP2/PwAgACAAIAR+GX+AIAAgACAufnn/wCAAIAAgEH7NwEAgACAAIBn7VL9AIAAgACA+uvB9wCAAIAAgNnq5fQAgACAAIDt6pvzAIAAgACAquiq9QCAAIAAgM30BP8AgACAAIBj9jQAAIAAgACAEfiPAQCAAIAAgLn56wIAgACAAIBB+xcEAIAAgACAZ+1BAwCAAIAAgPrrrv0AgACAAIDZ6tD3AIAAgACA7epV9gCAAIAAgKroD/sAgACAAIDN9MoCAIAAgACAY/btAwCAAIAAgBH4EwUAgACAAIC5+VUGAIAAgACAQftaBwCAAIAAgGftwgYAgACAAID6694DAIAAgACA2ery/QCAAIAAgO3qFPoAgACAAICq6C4BAIAAgACAzfQbBwCAAIAAgGP2DAgAgACAAIAR+A8JAIAAgACAufkqCgCAAIAAgEH7EwsAgACAAIBn7Q8KAIAAgACA+uu3BwCAAIAAgNnqhgQAgACAAIDt6v4AAIAAgACAqugRBACAAIAAgM30VQkAgACAAIBj9jQKAIAAgACAEfgmCwCAAIAAgLn5KgwAgACAAIBB+wMNAIAAgACAZ+1cCwCAAIAAgPrr5ggAgACAAIDZ6hcGAIAAgACA7eqdBACAAIAAgKroAPEAgACAAIDN9BX2AIAAgACAY/bc9gCAAIAAgBH4r/cAgACAAIC5+YP4AIAAgACAQfs1+QCAAIAAgGftj/cAgACAAID66z31AIAAgACA2eqQ8gCAAIAAgO3qPfEAgACAAICq6EnvAIAAgACAzfTu8wCAAIAAgGP2l/QAgACAAIAR+ET1AIAAgACAufn09QCAAIAAgEH7iPYAgACAAIBn7Vr1AIAAgACA+usz8wCAAIAAgNnq9fAAgACAAIDt6oDvAIAAgACAquix7QCAAIAAgM30yPEAgACAAIBj9k3yAIAAgACAEfjV8gCAAIAAgLn5ZPMAgACAAIBB+9rzAIAAgACAZ+1O8wCAAIAAgPrrjPEAgACAAIDZ6j7vAIAAgACA7erj7QCAAIAAgKroNuwAgACAAIDN9J3vAIAAgACAY/b/7wCAAIAAgBH4ZvAAgACAAIC5+dXwAIAAgACAQfsu8QCAAIAAgGftpfEAgACAAID668rvAIAAgACA2eql7QCAAIAAgO3qY+wAgACAAICq6NTqAIAAgACAzfRu7QCAAIAAgGP2se0AgACAAIAR+PftAIAAgACAuflH7gCAAIAAgEH7xe4AgACAAIBn7eDvAIAAgACA+usn7gCAAIAAgNnqKuwAgACAAIDt6v/qAIAAgACA5utU6QCAAIAAgOL52+oAgACAAIBO+wLrAIAAgACA2vwq6wCAAIAAgFb+oesAgACAAIDA/8brAIAAgACA0/sv7QCAAIAAgAPxS+wAgACAAICM72vqAIAAgACAqe8+6QCAAIAAgDT38eYAgACAAIBGBHrnAIAAgACAYAWM5wCAAIAAgIkG4ucAgACAAIDBBwToAIAAgACAuAgW6ACAAIAAgKIP9+gAgACAAIAcBPfoAIAAgACA1fj15wCAAIAAgCD5wuYAgACAAIBaB0/jAIAAgACAug5M4wCAAIAAgHoPk+MAgACAAIA5EJ7jAIAAgACALRGt4wCAAIAAgLARteMAgACAAIAWGBfkAIAAgACAMxcp5ACAAIAAgCkLFeQAgACAAICXAovjAIAAgACAhhdx3gCAAIAAgMcYm94AgACAAIAzGZ7eAIAAgACAnRmg3gCAAIAAgDAapN4AgACAAIB9GqbeAIAAgACAOR6+3gCAAIAAgO4ewt4AgACAAICbHcjeAIAAgACAuRXa3gCAAIAAgFcjAIAAgACAAIBgIgCAAIAAgACAhCIAgACAAIAAgKQiAIAAgACAAIDSIgCAAIAAgACA7SIAgACAAIAAgC4kAIAAgACAAIBZJACAAIAAgACAryQAgACAAIAAgJclAIAAgACAAICq6Iv9AIAAgACAzfQfAwCAAIAAgGP2/AMAgACAAIAR+PwEAIAAgACAufk6BgCAAIAAgEH7RwcAgACAAIBn7WEGAIAAgACA+uuYAwCAAIAAgNnq3/8AgACAAIDt6m39AIAAgACAqugk/ACAAIAAgM30xwEAgACAAIBj9t4CAIAAgACAEfgNBACAAIAAgLn5UAUAgACAAIBB+2IGAIAAgACAZ+2nBACAAIAAgPrr8wEAgACAAIDZ6pf+AIAAgACA7eoL/ACAAIAAgKroyPoAgACAAIDN9NwAAIAAgACAY/b6AQCAAIAAgBH4LwMAgACAAIC5+XUEAIAAgACAQfuQBQCAAIAAgGft9wIAgACAAID665MAAIAAgACA2eok/QCAAIAAgO3qs/oAgACAAICq6Gj5AIAAgACAzfQAAACAAIAAgGP2JAEAgACAAIAR+F0CAIAAgACAufmqAwCAAIAAgEH7zQQAgACAAIBn7X4BAIAAgACA+uv+/gCAAIAAgNnqrfsAgACAAIDt6lf5AIAAgACAqugU+ACAAIAAgM30MP8AgACAAIBj9lgAAIAAgACAEfiaAQCAAIAAgLn57gIAgACAAIBB+z0EAIAAgACAZ+3e/wCAAIAAgPrrc/0AgACAAIDZ6kT6AIAAgACA7eoI+ACAAIAAgObrafcAgACAAIDi+d//AIAAgACATvsEAQCAAIAAgNr8QwIAgACAAIBW/rcDAIAAgACAwP/iBACAAIAAgNP7HwIAgACAAIAD8Sb9AIAAgACAjO81+gCAAIAAgKnvZ/gAgACAAIA098v5AIAAgACARgQ/AgCAAIAAgGAFUQMAgACAAICJBqQEAIAAgACAwQflBQCAAIAAgLgI9gYAgACAAICiD7gGAIAAgACAHASVAQCAAIAAgNX4GvwAgACAAIAg+Xj6AIAAgACAWgd4/QCAAIAAgLoOowQAgACAAIB6D8wFAIAAgACAORDiBgCAAIAAgC0RFAgAgACAAICwEQoJAIAAgACAFhirCACAAIAAgDMX+wUAgACAAIApC04AAIAAgACAlwKe/ACAAIAAgIYXLgEAgACAAIDHGBsHAIAAgACAMxkMCACAAIAAgJ0ZDwkAgACAAIAwGioKAIAAgACAfRoTCwCAAIAAgDkeDwoAgACAAIDuHrcHAIAAgACAmx2GBACAAIAAgLkV/gAAgACAAIBXIwCAAIAAgACAYCIAgACAAIAAgIQiAIAAgACAAICkIgCAAIAAgACA0iIAgACAAIAAgO0iAIAAgACAAIAuJACAAIAAgACAWSQAgACAAIAAgK8kAIAAgACAAICXJQCAAIAAgACA' },
+    // atlantic_city
+    { v: 1, decks: 6, rules: 'S17-DAS-PEEK-LS', data: '9+U2/+Tn0wR47K30RQOO/eMSeOxI9h0EFgC8FHjs9vcMBcACqxZ47Lj5SgZ4BawYeOxP+lsHbAeQGnjsk+1mBg35jBJ47CDsrgPO8w0OeOz76vv/Ze5SCXjs9Opv/ULsNAd47Prlvv3l5wCAeOyg9NEBdv0AgHjsPPbmAgAAAIB47Oz3EASkAgCAeOzG+WAFcgUAgHjsP/peBlIHAIB47ITtrATy+ACAeOwU7AICsfMAgHjs8eqp/q7uAIB47ObqBPwq7ACAeOz85VH83ecAgHjsoPTgAG79AIB47D72/QHx/wCAeOwE+DkDqAIAgHjsyvmJBGcFAIB47EL6fgVGBwCAeOyH7fcC2PgAgHjsF+yhAA70AIB47OPqJ/2K7gCAeOzn6qf6I+wAgHjs/+XN+rPnAIB47KP09P9G/QCAeOxW9iMB3P8AgHjsCPheAoYCAIB47M75uANHBQCAeOxG+qQEJgcAgHjsi+1lAQ75AIB47Ans4P608wCAeOzj6pr7X+4AgHjs6Oo++QfsAIB47ALmU/l65wCAeOy79CH/K/0AgHjsWvZPALP/AIB47Az4lAFeAgCAeOzS+fcCIwUAgHjsSfoBBFIHAIB47Hztqv/I+ACAeOwK7Eb9mvMAgHjs5OoU+jHuAIB47OnqzvfJ6wCAeOxM7en4GesAgHjsKPoJANv/AIB47JL7MAFLAgCAeOwf/XIC5QQAgHjsi/7mA8sHAIB47HgAGAUxCgCAeOzy+yICtv8AgHjsDvEq/Sb2AIB47JLvPPqo8ACAeOyc7174O+4AgHjsFfxO/NHxAIB47NgEdgK1BACAeOznBYoD/QYAgHjsCgfcBLcJAIB47O8H8wXlCwCAeOz1Cn8H/Q4AgHjssw+9BtUIAIB47DkEmQHu/gCAeOze+B78z/QAgHjs/Phn+o/yAIB47O0Ks/+C+ACAeOwuD8sEXgkAgHjs4g/zBdELAIB47H4Q6AbRDQCAeOxNEREIIxAAgHjsSxNgCcASAIB47A0YpAiRDACAeOxHFwAGqgcAgHjsPAtJADz9AIB47HkCiPzH9gCAeOzEGQsDGv8AgHjsGBkjBxMOAIB47F4Z9gfUDwCAeOzGGfYI7BEAgHjsQhoNChkUAIB47HIbLQtZFgCAeOw1HvIJFg8AgHjs4x6UB+EKAIB47KsddQR+BQCAeOyqFeAAYv8AgHjs/OUY9vjLDvB47JP0h/sl6bH8eOwv9s78Xuw8/3js4/cv/sbvDAJ47NT5z/+p88wFeOwu+pQAXPQhCHjsdu2D/Ozay/947Ajs3vkP2DL5eOzn6rb2zdXI8Xjs2OrL9LDVo+147P7lDfX9ywCAeOyT9Pz6JukAgHjsMvZJ/GTsAIB47Pv3v/317wCAeOzZ+Vn/sfMAgHjsMvoYAGT0AIB47HntUPvy2gCAeOwL7K74FtgAgHjs2Oqc9bHVAIB47NnqzPOy1QCAeOwB5vXzGs0AgHjslvR1+gTqAIB47En21vth7QCAeOz/90f9yPAAgHjs3fnq/nT0AIB47DX6rv9s9QCAeOx97fn5ON0AgHjs/eto98HYAIB47Nnqf/Rt1gCAeOza6sTycNYAgHjsBObJ8+DTAIB47K70yvsw7wCAeOxO9hz9RfIAgHjsA/iH/oL1AIB47OD5HADe+ACAeOw5+moBG/sAgHjsbu1Q/S/pAIB47P3rtffb3gCAeOza6tf0ydoAgHjs2+qF89LaAIB47B3mI/hY4ACAeOyp9DH/QPgAgHjsSfZnAAf7AIB47P73wwHu/QCAeOzZ+SAD4QAAgHjsEvqdBKcDAIB47GbtTQME+QCAeOz366/9de4AgHjs1OrF9wzkAIB47NLqPfbI4gCAeOwT5lP9K+8AgHjspPTyArICAIB47ET2HAQiBQCAeOz490EFngcAgHjssvlkBgIKAIB47Ar6vwejDACAeOxf7dAGegQAgHjs8evtAzz/AIB47Mvq9v1q9ACAeOz26vr53u0AgHjsCuYqA4T/AIB47J/0RgdYDgCAeOw+9jsIYBAAgHjs0PcdCToSAIB47Kr5Ogp0FACAeOwE+lgLsRYAgHjsWu0ZCn4PAIB47OjrywdGCwCAeOzt6poE5AUAgHjs8OoDAbz/AIB47ADmtAWbBACAeOyZ9GoJnRIAgHjsF/YvCkcUAIB47Mj3Hgs7FgCAeOyj+SgMUBgAgHjs/fkSDSQaAIB47FHtYgsDEgCAeOwJ7OQIjg0AgHjs5+oaBtcIAIB47OrqnwTjBgCAeOzn5WLy0N8AgHjscvQi9kTsAIB47A/26fbS7QCAeOzB97v3du8AgHjsnPmV+CrxAIB47PX5W/m28gCAeOxz7a33O+wAgHjsBOxe9d7nAIB47OLqs/Im4wCAeOzl6lrxR+EAgHjsAeb18xnNIO547JT0c/oA6rn6eOw19sf7Oe20/XjsEvhT/enwOgF47N356v539PcEeOw2+q7/bfUwB3jsfO34+TjdZv147A7sbffk2An3eOzK6nf0Ttbl73js2urI8nDW0Ot47APmtPPf0wCAeOyX9Kz7D+8AgHjsTfYA/TTyAIB47Bb4ff6b9QCAeOzh+RAA6/gAgHjsOfpZAR/7AIB47IDtS/1S6QCAeOwA7KX34N4AgHjsy+q59KvaAIB47NvqcfPR2gCAeOwG5jL4ZOAAgHjsrvQu/z34AIB47FH2YwAE+wCAeOwa+M0BCv4AgHjs5fkvAwUBAIB47Dz6zAQHBACAeOxx7UwDG/kAgHjsAeys/YjuAIB47Mzqtvf84wCAeOzc6jz22OIAgHjsH+ZV/SvvAIB47Kn0AAOsAgCAeOxM9ikEGwUAgHjsFvheBboHAIB47N75nwZaCgCAeOwV+t8HwgwAgHjsau3iBpIEAIB47Prr+wNM/wCAeOzF6vf9V/QAgHjs0+oO+sztAIB47BbmKgOb/wCAeOyl9EsHYA4AgHjsR/ZDCHAQAIB47A/4UAmfEgCAeOy2+UwKmBQAgHjsDvpqC9QWAIB47GLtKwqxDwCAeOz069oHeAsAgHjsveqYBMcFAIB47PfqAgHJ/wCAeOwM5rUFtAQAgHjsoPRyCawSAIB47EH2VgqWFACAeOzo9zILZRYAgHjsrvk5DHIYAIB47Af6IQ1DGgCAeOxd7WYLHhIAgHjs6+vtCJINAIB47N7qFQbaCACAeOzx6qcEAQcAgHjsA+Y58oXfAIB47Jn0/vX86wCAeOwa9rH2Ye0AgHjs4PeJ9xLvAIB47Kf5YPjA8ACAeOwB+ib5S/IAgHjsVO1197jrAIB47A3sHPVj5wCAeOzZ6mfykuIAgHjs6+oX8cXgAIB47OrlkfDP3QCAeOxy9AD0/+cAgHjsEvam9E3pAIB47Nj3V/Wu6gCAeOyg+Qj2EOwAgHjs+fnI9pDtAIB47HbtdvUI6QCAeOwH7FHz4+QAgHjs0+oN8crgAIB47Obqmu9+3gCAeOwG5kD4Y+AK7HjsmvQ1/yf4mPl47GT2cAAG+938eOwb+N0BDP5LAHjs5flDAw8BIAR47Dz63QQLBEAGeOyD7WcDPvnE+njs8uuw/WruvPR47Mvqxvf9483teOzb6kz22OLd6XjsCeZl/TvvAIB47LH0BAOyAgCAeOxo9i8EKQUAgHjsH/hiBcIHAIB47On5rwZ7CgCAeOxA+g8IIg0AgHjsde3lBqgEAIB47PLr7gM8/wCAeOzM6vX9ZvQAgHjs3eoS+tztAIB47CLmIAOp/wCAeOyt9FEHbA4AgHjsZPZLCIEQAIB47Br4WQmzEgCAeOzi+XoK9BQAgHjsGfp/C/0WAIB47G3tNwrfDwCAeOzs688HbgsAgHjsxuqZBNsFAIB47NTqCQHE/wCAeOwZ5rYFzwQAgHjsqPR6Cb0SAIB47F/2ZQq2FACAeOwT+F8LvhYAgHjsuvlLDJcYAIB47BH6Mg1kGgCAeOxm7W0LPRIAgHjs5uvwCKMNAIB47L7qJQboCACAeOz46qcEEAcAgHjsD+Y38pjfAIB47KP0CfYR7ACAeOxY9tj2sO0AgHjs7Pea9zTvAIB47LL5cPjh8ACAeOwK+jT5afIAgHjsYO1499DrAIB47N3rGPVM5wCAeOzf6mLynOIAgHjs8uoc8d7gAIB47AbmovDx3QCAeOyc9BH0I+gAgHjsMfar9FfpAIB47OT3XPW36gCAeOyr+Qz2GOwAgHjsBPrK9pXtAIB47FjtcPXu6ACAeOz/60Hzx+QAgHjs2uoE8cDgAIB47Ozqku9z3gCAeOzt5dLuqtsAgHjsdfTQ8aDjAIB47Cn2VvKs5ACAeOzc9+HywuUAgHjspPlv897mAIB47Pz5J/RO6ACAeOx57Uzzm+UAgHjs+euN8TTiAIB47NTqRu/t3QCAeOzm6u3tntsAgHjsDOYvA7r/xOl47Mn0WweDDqb4eOxt9lIIkBDM+3jsI/hdCboSVv947Oz5hgoMFSkDeOxD+qwLWRdJBXjsZu0rCtIPMvh47PPrzgd9Cy7yeOzN6pgE6QVo63js3uoNAdP/rOd47CXmuAXtBACAeOzE9I0J5BIAgHjsaPZ0CtMUAIB47B74bQvbFgCAeOzl+XsM9RgAgHjsHPpKDZMaAIB47F7tcwtSEgCAeOzs6/4Izw0AgHjsx+oqBgUJAIB47NXqrgQRBwCAeOwc5jbyp98AgHjsv/QU9ifsAIB47GP25PbH7QCAeOwX+Lz3d+8AgHjsvvl++P3wAIB47BT6Pvl98gCAeOxX7Wf3t+sAgHjs5usW9VvnAIB47L/qbPKo4gCAeOz56h7x9eAAgHjsEuZT8F/dAIB47Lr00/Om5wCAeOxc9oH0AukAgHjs8Pcf9T/qAIB47LX50PWg6wCAeOwO+oz2GO0AgHjsUu0d9UjoAIB47N7r9/Ik5ACAeOzh6rfwMeAAgHjs8+pG7+PdAIB47Anm2e6+2wCAeOy09N7xveMAgHjsNfZW8qzkAIB47Oj34fLD5QCAeOyu+XDz3+YAgHjsB/on9E7oAIB47EntRPN95QCAeOz/63nxEuIAgHjs2+oy783dAIB47O3q4u2M2wCAeOzv5Svte9kAgHjsjfSa7zXfAIB47C32/e/63wCAeOzg92jwz+AAgHjsqPnU8KjhAIB47P/5hvEN4wCAeOxr7ZHxxuIAgHjs+uu07xbfAIB47NXqju3s2gCAeOzn6lTsp9gAgHjsPuYj8qDfGOh47L/0E/Ym7PX3eOxj9uP2xu1a+3jsGfi+93zvAf947N75lfgq8eACeOz1+Sj5UfKIBHjsV+1e96PrOPZ47ObrFfVa53PweOzB6nLyuOLi6XjszOob8d7gKOZ47DTmPvBO3QCAeOy69NLzpOcAgHjsXvaC9AXpAIB47BL4NvVr6gCAeOy3+dL1pOsAgHjs7fl59vLsAIB47FDtGvVC6ACAeOzg6+vyDuQAgHjsueqw8BDgAIB47PDqQO/j3QCAeOwq5sPumNsAgHjstvTY8bDjAIB47Ff2YvLE5ACAeOzr997yvOUAgHjsrvlq89XmAIB47Of5EfQh6ACAeOxK7UPzc+UAgHjs1+t68f3hAIB47NrqIu+k3QCAeOzq6s7tYtsAgHjsIeYv7YDZAIB47K/0o+9H3wCAeOww9vrv898AgHjs4/dl8MngAIB47Kf5z/Ce4QCAeOzh+XLx5eIAgHjsQu2T8bniAIB47Pnrr+8C3wCAeOzU6ojt1toAgHjs5OpG7IPYAIB47Ajm4uvF1wCAeOyI9KPtR9sAgHjsKPbn7c7bAIB47Nz3Me5i3ACAeOyh+Xnu8twAgHjs2fle77zeAIB47GPtA/AH4ACAeOzz60nuktwAgHjsz+pK7JPYAIB47N7qIOs/1gCAeOwr5oLuDNvk53jstfST8SXjXvp47Fn2H/I/5Kj9eOwL+KzyV+VEAXjsj/kX8y7megR47Ob5zPOY54MHeOxJ7QTz6+SY/Hjs2us88XfhvvB47LHq5e4T3VXqeOwU63/txtqA53jsIeZv7QDaAIB47LD04u/E3wCAeOxT9kjwkOAAgHjs5Pek8EjhAIB47If5//D+4QCAeOzf+bDxX+MAgHjsRO3R8TXjAIB47NLr8O9+3wCAeOzS6sHtStsAgHjsDut97PrYAIB47Bfm+Ovw1wCAeOyq9LLtY9sAgHjsK/br7dbbAIB47Nz3M+5n3ACAeOyA+W7u3dwAgHjs2fld77reAIB47DvtBfAL4ACAeOzz60TuiNwAgHjszOpF7IvYAIB47AjrGesx1gCAeOxl7Ubqi9QAgHjs/vkM6xfWAIB47Gn7NOto1gCAeOz0/F7rvNYAgHjsQv7E64jXAIB47FMATeya2ACAeOy/+07tnNoAgHjs/vBq7NPYAIB47ILviOoQ1QCAeOyn71jpsdIAgHjsF+b56/LX+fB47Kz0tO1n2yABeOxM9vjt8NvNA3jsvfcp7lHcWAZ47H/5bu7c3EwJeOzZ+V3vu97JDHjsPu0F8AvgkAh47MnrRu6N3Kz8eOzz6j7sfNgg8HjsB+sZ6zLWHe147H3tWOqx1ACAeOwg+hjrL9YAgHjsavs262zWAIB47NX8Vuus1gCAeOxA/sTriNcAgHjsUwBN7JrYAIB47Lf7Ue2i2gCAeOzd8Gfsz9gAgHjsi++A6gHVAIB47MrvVumt0gCAeOwz/ILnBM8AgHjsvASf5z/PAIB47McFsudkzwCAeOzNBgLoBNAAgHjs0Qcf6D7QAIB47PoKaejT0ACAeOyJDxDpH9IAgHjsEQQQ6R/SAIB47MT4DOgX0ACAeOwv+dnmss0AgHjsXfyR5yLPNvt47NoEp+dOz0YHeOyoBaznWM89CXjszQYC6ATQsQt47NAHH+g+0E4OeOz4Cmno0tAeEXjsnA8R6SLSbA547OEDDukc0lEIeOzE+AnoE9BG/HjsUfnX5q7NmPR47AkLmOMwxwCAeOwWD2TjyMYAgHjsrA+o41DHAIB47GgQs+NlxwCAeOw4Eb/jf8cAgHjsTRPg48HHAIB47AYYKeRSyACAeOwXFzrkdMgAgHjsFwsm5EzIAIB47LYCneM5xwCAeOySGYfeDr3cBXjs6xil3kq92g147FAZqN5QvbsPeOy5GareVL2yEXjsNRqt3lq93BN47HQbtt5rvRcWeOwoHsjej73eE3js4B7L3pa9Nw947Ikd0t6kvdoIeOzXFeTex70CAnjs/eUY9QCAAIAAgI70/PoAgACAAIAs9kj8AIAAgACA3Pes/QCAAIAAgKD5Mf8AgACAAID5+ez/AIAAgACAZ+1d+wCAAIAAgPrrr/gAgACAAIDZ6qP1AIAAgACA7ere8wCAAIAAgP3lGvQAgACAAICO9Hz6AIAAgACALPbO+wCAAIAAgNz3N/0AgACAAICg+cT+AIAAgACA+fmF/wCAAIAAgGftHPoAgACAAID66473AIAAgACA2eqi9ACAAIAAgO3q7fIAgACAAID95dbzAIAAgACAjvS2+wCAAIAAgCz2//wAgACAAIDc92L+AIAAgACAoPnm/wCAAIAAgPn5KgEAgACAAIBn7VL9AIAAgACA+uvB9wCAAIAAgNnq5fQAgACAAIDt6pvzAIAAgACA/eU9+ACAAIAAgI70Hv8AgACAAIAs9ksAAIAAgACA3PegAQCAAIAAgKD59AIAgACAAID5+YcEAIAAgACAZ+1BAwCAAIAAgPrrrv0AgACAAIDZ6tD3AIAAgACA7epV9gCAAIAAgP3lVf0AgACAAICO9N8CAIAAgACALPb/AwCAAIAAgNz3IQUAgACAAICg+VwGAIAAgACA+fmyBwCAAIAAgGftwgYAgACAAID6694DAIAAgACA2ery/QCAAIAAgO3qFPoAgACAAID95RIDAIAAgACAjvQpBwCAAIAAgCz2GQgAgACAAIDc9xcJAIAAgACAoPkuCgCAAIAAgPn5SQsAgACAAIBn7Q8KAIAAgACA+uu3BwCAAIAAgNnqhgQAgACAAIDt6v4AAIAAgACA/eWiBQCAAIAAgI70XAkAgACAAIAs9jsKAIAAgACA3PcnCwCAAIAAgKD5KwwAgACAAID5+RANAIAAgACAZ+1cCwCAAIAAgPrr5ggAgACAAIDZ6hcGAIAAgACA7eqdBACAAIAAgP3lTfIAgACAAICO9Bj2AIAAgACALPbf9gCAAIAAgNz3sfcAgACAAICg+YX4AIAAgACA+flG+QCAAIAAgGftj/cAgACAAID66z31AIAAgACA2eqQ8gCAAIAAgO3qPfEAgACAAID95X/wAIAAgACAjvT28wCAAIAAgCz2nvQAgACAAIDc90r1AIAAgACAoPn39QCAAIAAgPn5svYAgACAAIBn7Vr1AIAAgACA+usz8wCAAIAAgNnq9fAAgACAAIDt6oDvAIAAgACA/eXR7gCAAIAAgI701fEAgACAAIAs9ljyAIAAgACA3Pff8gCAAIAAgKD5afMAgACAAID5+R/0AIAAgACAZ+1O8wCAAIAAgPrrjPEAgACAAIDZ6j7vAIAAgACA7erj7QCAAIAAgP3lQe0AgACAAICO9K7vAIAAgACALPYO8ACAAIAAgNz3dPAAgACAAICg+dzwAIAAgACA+fmM8QCAAIAAgGftpfEAgACAAID668rvAIAAgACA2eql7QCAAIAAgO3qY+wAgACAAID95czrAIAAgACAjvSE7QCAAIAAgCz2xO0AgACAAIDc9wruAIAAgACAoPlP7gCAAIAAgPn5PO8AgACAAIBn7eDvAIAAgACA+usn7gCAAIAAgNnqKuwAgACAAIDt6v/qAIAAgACAVe0t6gCAAIAAgAP67uoAgACAAIBr+xPrAIAAgACA9vw76wCAAIAAgGP+qOsAgACAAIByADDsAIAAgACA0/sv7QCAAIAAgAPxS+wAgACAAICM72vqAIAAgACAqe8+6QCAAIAAgBL8aucAgACAAIC3BIXnAIAAgACAwwWW5wCAAIAAgOgG6+cAgACAAIDtBwjoAIAAgACAEQtS6ACAAIAAgKIP9+gAgACAAIAcBPfoAIAAgACA1fj15wCAAIAAgCD5wuYAgACAAIDYCoTjAIAAgACACw9Q4wCAAIAAgMEPmOMAgACAAIB9EKLjAIAAgACATRGv4wCAAIAAgF8Tz+MAgACAAIAWGBfkAIAAgACAMxcp5ACAAIAAgCkLFeQAgACAAICXAovjAIAAgACAnxl+3gCAAIAAgPgYnN4AgACAAIBdGZ/eAIAAgACAxhmh3gCAAIAAgEMapN4AgACAAIB/G6zeAIAAgACAOR6+3gCAAIAAgO4ewt4AgACAAICbHcjeAIAAgACAuRXa3gCAAIAAgAokAIAAgACAAIBwIgCAAIAAgACAkyIAgACAAIAAgLEiAIAAgACAAIDZIgCAAIAAgACAQyMAgACAAIAAgC4kAIAAgACAAIBZJACAAIAAgACAryQAgACAAIAAgJclAIAAgACAAID95Tf/AIAAgACAjvQyAwCAAIAAgCz2DQQAgACAAIDc9/oEAIAAgACAoPk5BgCAAIAAgPn5OAcAgACAAIBn7WEGAIAAgACA+uuYAwCAAIAAgNnq3/8AgACAAIDt6m39AIAAgACA/eXC/QCAAIAAgI70xwEAgACAAIAs9t0CAIAAgACA3PcHBACAAIAAgKD5TQUAgACAAID5+T0GAIAAgACAZ+2nBACAAIAAgPrr8wEAgACAAIDZ6pf+AIAAgACA7eoL/ACAAIAAgP3lWPwAgACAAICO9NcAAIAAgACALPb2AQCAAIAAgNz3JQMAgACAAICg+XEEAIAAgACA+flXBQCAAIAAgGft9wIAgACAAID665MAAIAAgACA2eok/QCAAIAAgO3qs/oAgACAAID95er6AIAAgACAjvT2/wCAAIAAgCz2GwEAgACAAIDc91ACAIAAgACAoPmkAwCAAIAAgPn5gQQAgACAAIBn7X4BAIAAgACA+uv+/gCAAIAAgNnqrfsAgACAAIDt6lf5AIAAgACA/eWJ+QCAAIAAgI70I/8AgACAAIAs9kwAAIAAgACA3PeKAQCAAIAAgKD55wIAgACAAID5+eADAIAAgACAZ+3e/wCAAIAAgPrrc/0AgACAAIDZ6kT6AIAAgACA7eoI+ACAAIAAgFXt9vgAgACAAIAD+ur/AIAAgACAa/sNAQCAAIAAgPb8SAIAgACAAIBj/roDAIAAgACAcgAGBQCAAIAAgNP7HwIAgACAAIAD8Sb9AIAAgACAjO81+gCAAIAAgKnvZ/gAgACAAIAS/FD8AIAAgACAtwRcAgCAAIAAgMMFawMAgACAAIDoBrkEAIAAgACA7QfvBQCAAIAAgBELewcAgACAAICiD7gGAIAAgACAHASVAQCAAIAAgNX4GvwAgACAAIAg+Xj6AIAAgACA2Aqt/wCAAIAAgAsPuQQAgACAAIDBD98FAIAAgACAfRDxBgCAAIAAgE0RGwgAgACAAIBfE2gJAIAAgACAFhirCACAAIAAgDMX+wUAgACAAIApC04AAIAAgACAlwKe/ACAAIAAgJ8ZEgMAgACAAID4GCkHAIAAgACAXRkZCACAAIAAgMYZFwkAgACAAIBDGi4KAIAAgACAfxtJCwCAAIAAgDkeDwoAgACAAIDuHrcHAIAAgACAmx2GBACAAIAAgLkV/gAAgACAAIAKJACAAIAAgACAcCIAgACAAIAAgJMiAIAAgACAAICxIgCAAIAAgACA2SIAgACAAIAAgEMjAIAAgACAAIAuJACAAIAAgACAWSQAgACAAIAAgK8kAIAAgACAAICXJQCAAIAAgACA' },
+    // european_no_hole_card
+    { v: 1, decks: 6, rules: 'S17-DAS-ENHC-NS', data: '6+FS8xzXDusAgK30RQOO/eMSAIBI9h0EFgC8FACA9vcMBcACqxYAgLj5SgZ4BawYAIBP+lsHbAeQGgCAk+1mBg35jBIAgCDsrgPO8w0OAID76vv/Ze5SCQCArOnV+hroIAEAgO3hT/Id1wCAAICg9NEBdv0AgACAPPbmAgAAAIAAgOz3EASkAgCAAIDG+WAFcgUAgACAP/peBlIHAIAAgITtrATy+ACAAIAU7AICsfMAgACA8eqp/q7uAIAAgJDpaPnT5wCAAIDu4VPxF9cAgACAoPTgAG79AIAAgD72/QHx/wCAAIAE+DkDqAIAgACAyvmJBGcFAIAAgEL6fgVGBwCAAICH7fcC2PgAgACAF+yhAA70AIAAgOPqJ/2K7gCAAICR6SX4zecAgACA8OFI8PrWAIAAgKP09P9G/QCAAIBW9iMB3P8AgACACPheAoYCAIAAgM75uANHBQCAAIBG+qQEJgcAgACAi+1lAQ75AIAAgAns4P608wCAAIDj6pr7X+4AgACAkenX9rPnAIAAgPLhQ+/T1gCAAIC79CH/K/0AgACAWvZPALP/AIAAgAz4lAFeAgCAAIDS+fcCIwUAgACASfoBBFIHAIAAgHztqv/I+ACAAIAK7Eb9mvMAgACA5OoU+jHuAIAAgJPpgvV65wCAAID55vruUtkAgACAKPoJANv/AIAAgJL7MAFLAgCAAIAf/XIC5QQAgACAi/7mA8sHAIAAgHgAGAUxCgCAAIDy+yICtv8AgACADvEq/Sb2AIAAgJLvPPqo8ACAAIDs7Qf2vekAgACAKvFR8fTdAIAAgNgEdgK1BACAAIDnBYoD/QYAgACACgfcBLcJAIAAgO8H8wXlCwCAAID1Cn8H/Q4AgACAsw+9BtUIAIAAgDkEmQHu/gCAAIDe+B78z/QAgACAmvbp977tAIAAgGX7qPOQ4gCAAIAuD8sEXgkAgACA4g/zBdELAIAAgH4Q6AbRDQCAAIBNEREIIxAAgACASxNgCcASAIAAgA0YpAiRDACAAIBHFwAGqgcAgACAPAtJADz9AIAAgGL/4vmm8QCAAICgBfb1HOcAgACAGBkjBxMOAIAAgF4Z9gfUDwCAAIDGGfYI7BEAgACAQhoNChkUAIAAgHIbLQtZFgCAAIA1HvIJFg8AgACA4x6UB+EKAIAAgKsddQR+BQCAAIAkEef9nfkAgACA7uEJ7d3DvdwAgJP0h/sl6bH8AIAv9s78Xuw8/wCA4/cv/sbvDAIAgNT5z/+p88wFAIAu+pQAXPQhCACAdu2D/Ozay/8AgAjs3vkP2DL5AIDn6rb2zdXI8QCAdOmh8ujSqugAgPDhUezgwwCAAICT9Pz6JukAgACAMvZJ/GTsAIAAgPv3v/317wCAAIDZ+Vn/sfMAgACAMvoYAGT0AIAAgHntUPvy2gCAAIAL7K74FtgAgACA2Oqc9bHVAIAAgHXptfHq0gCAAIDy4ZDrpMQAgACAlvR1+gTqAIAAgEn21vth7QCAAID/90f9yPAAgACA3fnq/nT0AIAAgDX6rv9s9QCAAIB97fn5ON0AgACA/eto98HYAIAAgNnqf/Rt1gCAAIB26cLwmdMAgACA9OFx61DJAIAAgK70yvsw7wCAAIBO9hz9RfIAgACAA/iH/oL1AIAAgOD5HADe+ACAAIA5+moBG/sAgACAbu1Q/S/pAIAAgP3rtffb3gCAAIDa6tf0ydoAgACAdul08aTXAIAAgAXicu7o0QCAAICp9DH/QPgAgACASfZnAAf7AIAAgP73wwHu/QCAAIDZ+SAD4QAAgACAEvqdBKcDAIAAgGbtTQME+QCAAID366/9de4AgACA1OrF9wzkAIAAgG7p9vP83gCAAID+4QXyINwAgACApPTyArICAIAAgET2HAQiBQCAAID490EFngcAgACAsvlkBgIKAIAAgAr6vwejDACAAIBf7dAGegQAgACA8evtAzz/AIAAgMvq9v1q9ACAAICQ6Wn3NekAgACA+OEL9mXnAIAAgJ/0RgdYDgCAAIA+9jsIYBAAgACA0PcdCToSAIAAgKr5Ogp0FACAAIAE+lgLsRYAgACAWu0ZCn4PAIAAgOjrywdGCwCAAIDt6poE5AUAgACAiunm/bD5AIAAgPHhy/fn6gCAAICZ9GoJnRIAgACAF/YvCkcUAIAAgMj3Hgs7FgCAAICj+SgMUBgAgACA/fkSDSQaAIAAgFHtYgsDEgCAAIAJ7OQIjg0AgACA5+oaBtcIAIAAgITpOgFJAACAAIDr4Y/qsNEAgACAcvQi9kTsAIAAgA/26fbS7QCAAIDB97v3du8AgACAnPmV+CrxAIAAgPX5W/m28gCAAIBz7a33O+wAgACABOxe9d7nAIAAgOLqs/Im4wCAAICA6XTvmN0AgACA8eGQ66TEaNsAgJT0c/oA6rn6AIA19sf7Oe20/QCAEvhT/enwOgEAgN356v539PcEAIA2+q7/bfUwBwCAfO34+TjdZv0AgA7sbffk2An3AIDK6nf0Ttbl7wCAdunG8JnT+eYAgPPhY+tPyQCAAICX9Kz7D+8AgACATfYA/TTyAIAAgBb4ff6b9QCAAIDh+RAA6/gAgACAOfpZAR/7AIAAgIDtS/1S6QCAAIAA7KX34N4AgACAy+q59KvaAIAAgHbpYvGj1wCAAID14Xzu8NEAgACArvQu/z34AIAAgFH2YwAE+wCAAIAa+M0BCv4AgACA5fkvAwUBAIAAgDz6zAQHBACAAIBx7UwDG/kAgACAAeys/YjuAIAAgMzqtvf84wCAAIB36fXzC98AgACAB+IG8iDcAIAAgKn0AAOsAgCAAIBM9ikEGwUAgACAFvheBboHAIAAgN75nwZaCgCAAIAV+t8HwgwAgACAau3iBpIEAIAAgPrr+wNM/wCAAIDF6vf9V/QAgACAb+l79yXpAIAAgADiC/Z15wCAAICl9EsHYA4AgACAR/ZDCHAQAIAAgA/4UAmfEgCAAIC2+UwKmBQAgACADvpqC9QWAIAAgGLtKwqxDwCAAID069oHeAsAgACAveqYBMcFAIAAgJHp5f28+QCAAID64cz3+eoAgACAoPRyCawSAIAAgEH2VgqWFACAAIDo9zILZRYAgACArvk5DHIYAIAAgAf6IQ1DGgCAAIBd7WYLHhIAgACA6+vtCJINAIAAgN7qFQbaCACAAICL6UEBZQAAgACA8+Fe6lbRAIAAgJn0/vX86wCAAIAa9rH2Ye0AgACA4PeJ9xLvAIAAgKf5YPjA8ACAAIAB+ib5S/IAgACAVO1197jrAIAAgA3sHPVj5wCAAIDZ6mfykuIAgACAhek37yHdAIAAgO3hTelN0ACAAIBy9AD0/+cAgACAEvam9E3pAIAAgNj3V/Wu6gCAAICg+Qj2EOwAgACA+fnI9pDtAIAAgHbtdvUI6QCAAIAH7FHz4+QAgACA0+oN8crgAIAAgIDp1+0H2wCAAID24Ybu8NH42QCAmvQ1/yf4mPkAgGT2cAAG+938AIAb+N0BDP5LAACA5flDAw8BIAQAgDz63QQLBEAGAICD7WcDPvnE+gCA8uuw/WruvPQAgMvqxvf9483tAIB36QT0Ct8q5QCA+OES8ivcAIAAgLH0BAOyAgCAAIBo9i8EKQUAgACAH/hiBcIHAIAAgOn5rwZ7CgCAAIBA+g8IIg0AgACAde3lBqgEAIAAgPLr7gM8/wCAAIDM6vX9ZvQAgACAeOl/9zPpAIAAgAniBfZ/5wCAAICt9FEHbA4AgACAZPZLCIEQAIAAgBr4WQmzEgCAAIDi+XoK9BQAgACAGfp/C/0WAIAAgG3tNwrfDwCAAIDs688HbgsAgACAxuqZBNsFAIAAgHDp7P23+QCAAIAC4s33C+sAgACAqPR6Cb0SAIAAgF/2ZQq2FACAAIAT+F8LvhYAgACAuvlLDJcYAIAAgBH6Mg1kGgCAAIBm7W0LPRIAgACA5uvwCKMNAIAAgL7qJQboCACAAICR6UIBcgAAgACA/OFd6mTRAIAAgKP0CfYR7ACAAIBY9tj2sO0AgACA7Pea9zTvAIAAgLL5cPjh8ACAAIAK+jT5afIAgACAYO1499DrAIAAgN3rGPVM5wCAAIDf6mLynOIAgACAjOk77zfdAIAAgPXhRelB0ACAAICc9BH0I+gAgACAMfar9FfpAIAAgOT3XPW36gCAAICr+Qz2GOwAgACABPrK9pXtAIAAgFjtcPXu6ACAAID/60Hzx+QAgACA2uoE8cDgAIAAgIbp0O392gCAAIDu4Rfo0c4AgACAdfTQ8aDjAIAAgCn2VvKs5ACAAIDc9+HywuUAgACApPlv897mAIAAgPz5J/RO6ACAAIB57Uzzm+UAgACA+euN8TTiAIAAgNTqRu/t3QCAAICB6UvsYNgAgACA+uEP9ornZ9gAgMn0WweDDqb4AIBt9lIIkBDM+wCAI/hdCboSVv8AgOz5hgoMFSkDAIBD+qwLWRdJBQCAZu0rCtIPMvgAgPPrzgd9Cy7yAIDN6pgE6QVo6wCAeenw/cX5IuMAgAvizvcf6wCAAIDE9I0J5BIAgACAaPZ0CtMUAIAAgB74bQvbFgCAAIDl+XsM9RgAgACAHPpKDZMaAIAAgF7tcwtSEgCAAIDs6/4Izw0AgACAx+oqBgUJAIAAgHHpSAFzAACAAIAE4lzqbtEAgACAv/QU9ifsAIAAgGP25PbH7QCAAIAX+Lz3d+8AgACAvvl++P3wAIAAgBT6Pvl98gCAAIBX7Wf3t+sAgACA5usW9VvnAIAAgL/qbPKo4gCAAICT6T3vTd0AgACA/uEP6dzPAIAAgLr00/Om5wCAAIBc9oH0AukAgACA8Pcf9T/qAIAAgLX50PWg6wCAAIAO+oz2GO0AgACAUu0d9UjoAIAAgN7r9/Ik5ACAAIDh6rfwMeAAgACAjemK7XjaAIAAgPfhCui8zgCAAIC09N7xveMAgACANfZW8qzkAIAAgOj34fLD5QCAAICu+XDz3+YAgACAB/on9E7oAIAAgEntRPN95QCAAID/63nxEuIAgACA2+oy783dAIAAgIfpQexP2ACAAIDw4fLmTs0AgACAjfSa7zXfAIAAgC32/e/63wCAAIDg92jwz+AAgACAqPnU8KjhAIAAgP/5hvEN4wCAAIBr7ZHxxuIAgACA+uu07xbfAIAAgNXqju3s2gCAAICC6dLqpNUAgACAHOJP6mrRQNcAgL/0E/Ym7PX3AIBj9uP2xu1a+wCAGfi+93zvAf8AgN75lfgq8eACAID1+Sj5UfKIBACAV+1e96PrOPYAgObrFfVa53PwAIDB6nLyuOLi6QCAaek67zjdvuEAgBXiAenQzwCAAIC69NLzpOcAgACAXvaC9AXpAIAAgBL4NvVr6gCAAIC3+dL1pOsAgACA7fl59vLsAIAAgFDtGvVC6ACAAIDg6+vyDuQAgACAueqw8BDgAIAAgIrphO132gCAAIAO4vvnos4AgACAtvTY8bDjAIAAgFf2YvLE5ACAAIDr997yvOUAgACArvlq89XmAIAAgOf5EfQh6ACAAIBK7UPzc+UAgACA1+t68f3hAIAAgNrqIu+k3QCAAICE6S/sKNgAgACACOLl5jDNAIAAgK/0o+9H3wCAAIAw9vrv898AgACA4/dl8MngAIAAgKf5z/Ce4QCAAIDh+XLx5eIAgACAQu2T8bniAIAAgPnrr+8C3wCAAIDU6ojt1toAgACAf+nF6oPVAIAAgAHiD+YezACAAICI9KPtR9sAgACAKPbn7c7bAIAAgNz3Me5i3ACAAICh+Xnu8twAgACA2fle77zeAIAAgGPtA/AH4ACAAIDz60nuktwAgACAz+pK7JPYAIAAgHrptuls0wCAAIAO4s7nQs4c1wCAtfST8SXjXvoAgFn2H/I/5Kj9AIAL+KzyV+VEAQCAj/kX8y7megQAgOb5zPOY54MHAIBJ7QTz6+SY/ACA2us88XfhvvAAgLHq5e4T3VXqAICr6ebrmdf54gCACOIR54nNAIAAgLD04u/E3wCAAIBT9kjwkOAAgACA5Pek8EjhAIAAgIf5//D+4QCAAIDf+bDxX+MAgACARO3R8TXjAIAAgNLr8O9+3wCAAIDS6sHtStsAgACApun46vHVAIAAgAHiDuYdzACAAICq9LLtY9sAgACAK/br7dbbAIAAgNz3M+5n3ACAAICA+W7u3dwAgACA2fld77reAIAAgDvtBfAL4ACAAIDz60TuiNwAgACAzOpF7IvYAIAAgKDpsOlf0wCAAIAb5/Hk48kAgACA/vkM6xfWAIAAgGn7NOto1gCAAID0/F7rvNYAgACAQv7E64jXAIAAgFMATeya2ACAAIC/+07tnNoAgACA/vBq7NPYAIAAgILviOoQ1QCAAIDk7RLoJNAAgACAAeIP5h7MX90AgKz0tO1n2yABAIBM9vjt8NvNAwCAvfcp7lHcWAYAgH/5bu7c3EwJAIDZ+V3vu97JDACAPu0F8AvgkAgAgMnrRu6N3Kz8AIDz6j7sfNgg8ACAoOmw6WDTKugAgBvn8OTgyQCAAIAg+hjrL9YAgACAavs262zWAIAAgNX8Vuus1gCAAIBA/sTriNcAgACAUwBN7JrYAIAAgLf7Ue2i2gCAAIDd8Gfsz9gAgACAi++A6gHVAIAAgAPuEOgh0ACAAIBc8QfjD8YAgACAvASf5z/PAIAAgMcFsudkzwCAAIDNBgLoBNAAgACA0Qcf6D7QAIAAgPoKaejT0ACAAICJDxDpH9IAgACAEQQQ6R/SAIAAgMT4DOgX0ACAAICt9sXlicsAgACAXPEF4wvGbuQAgNoEp+dOz0YHAICoBaznWM89CQCAzQYC6ATQsQsAgNAHH+g+0E4OAID4Cmno0tAeEQCAnA8R6SLSbA4AgOEDDukc0lEIAIDE+AnoE9BG/ACAzfbC5YXLFu8AgKL7UeCiwACAAIAWD2TjyMYAgACArA+o41DHAIAAgGgQs+NlxwCAAIA4Eb/jf8cAgACATRPg48HHAIAAgAYYKeRSyACAAIAXFzrkdMgAgACAFwsm5EzIAIAAgHj/yOKRxQCAAIDoBdTcp7lQ7ACA6xil3kq92g0AgFAZqN5QvbsPAIC5GareVL2yEQCANRqt3lq93BMAgHQbtt5rvRcWAIAoHsjej73eEwCA4B7L3pa9Nw8AgIkd0t6kvdoIAIAcEW3e27zJ+wCA9eFn7ACAAIAAgI70/PoAgACAAIAs9kj8AIAAgACA3Pes/QCAAIAAgKD5Mf8AgACAAID5+ez/AIAAgACAZ+1d+wCAAIAAgPrrr/gAgACAAIDZ6qP1AIAAgACAienK8QCAAIAAgPXhuOsAgACAAICO9Hz6AIAAgACALPbO+wCAAIAAgNz3N/0AgACAAICg+cT+AIAAgACA+fmF/wCAAIAAgGftHPoAgACAAID66473AIAAgACA2eqi9ACAAIAAgInp7PAAgACAAID14YjrAIAAgACAjvS2+wCAAIAAgCz2//wAgACAAIDc92L+AIAAgACAoPnm/wCAAIAAgPn5KgEAgACAAIBn7VL9AIAAgACA+uvB9wCAAIAAgNnq5fQAgACAAICJ6Y3xAIAAgACA9eGT7gCAAIAAgI70Hv8AgACAAIAs9ksAAIAAgACA3PegAQCAAIAAgKD59AIAgACAAID5+YcEAIAAgACAZ+1BAwCAAIAAgPrrrv0AgACAAIDZ6tD3AIAAgACAiekR9ACAAIAAgPXhGfIAgACAAICO9N8CAIAAgACALPb/AwCAAIAAgNz3IQUAgACAAICg+VwGAIAAgACA+fmyBwCAAIAAgGftwgYAgACAAID6694DAIAAgACA2ery/QCAAIAAgInphfcAgACAAID14RD2AIAAgACAjvQpBwCAAIAAgCz2GQgAgACAAIDc9xcJAIAAgACAoPkuCgCAAIAAgPn5SQsAgACAAIBn7Q8KAIAAgACA+uu3BwCAAIAAgNnqhgQAgACAAICJ6ef9AIAAgACA9eHW9wCAAIAAgI70XAkAgACAAIAs9jsKAIAAgACA3PcnCwCAAIAAgKD5KwwAgACAAID5+RANAIAAgACAZ+1cCwCAAIAAgPrr5ggAgACAAIDZ6hcGAIAAgACAiek+AQCAAIAAgPXheeoAgACAAICO9Bj2AIAAgACALPbf9gCAAIAAgNz3sfcAgACAAICg+YX4AIAAgACA+flG+QCAAIAAgGftj/cAgACAAID66z31AIAAgACA2eqQ8gCAAIAAgInpXe8AgACAAID14TnpAIAAgACAjvT28wCAAIAAgCz2nvQAgACAAIDc90r1AIAAgACAoPn39QCAAIAAgPn5svYAgACAAIBn7Vr1AIAAgACA+usz8wCAAIAAgNnq9fAAgACAAICJ6cLtAIAAgACA9eEQ6ACAAIAAgI701fEAgACAAIAs9ljyAIAAgACA3Pff8gCAAIAAgKD5afMAgACAAID5+R/0AIAAgACAZ+1O8wCAAIAAgPrrjPEAgACAAIDZ6j7vAIAAgACAielF7ACAAIAAgPXh/OYAgACAAICO9K7vAIAAgACALPYO8ACAAIAAgNz3dPAAgACAAICg+dzwAIAAgACA+fmM8QCAAIAAgGftpfEAgACAAID668rvAIAAgACA2eql7QCAAIAAgInp4+oAgACAAID14fnlAIAAgACAjvSE7QCAAIAAgCz2xO0AgACAAIDc9wruAIAAgACAoPlP7gCAAIAAgPn5PO8AgACAAIBn7eDvAIAAgACA+usn7gCAAIAAgNnqKuwAgACAAICJ6ZrpAIAAgACACufb5ACAAIAAgAP67uoAgACAAIBr+xPrAIAAgACA9vw76wCAAIAAgGP+qOsAgACAAIByADDsAIAAgACA0/sv7QCAAIAAgAPxS+wAgACAAICM72vqAIAAgACA6e385wCAAIAAgDrx8uIAgACAAIC3BIXnAIAAgACAwwWW5wCAAIAAgOgG6+cAgACAAIDtBwjoAIAAgACAEQtS6ACAAIAAgKIP9+gAgACAAIAcBPfoAIAAgACA1fj15wCAAIAAgKT2seUAgACAAIBw+0DgAIAAgACACw9Q4wCAAIAAgMEPmOMAgACAAIB9EKLjAIAAgACATRGv4wCAAIAAgF8Tz+MAgACAAIAWGBfkAIAAgACAMxcp5ACAAIAAgCkLFeQAgACAAIBh/7riAIAAgACApwXH3ACAAIAAgPgYnN4AgACAAIBdGZ/eAIAAgACAxhmh3gCAAIAAgEMapN4AgACAAIB/G6zeAIAAgACAOR6+3gCAAIAAgO4ewt4AgACAAICbHcjeAIAAgACACBFl3gCAAIAAgNsMAIAAgACAAIBwIgCAAIAAgACAkyIAgACAAIAAgLEiAIAAgACAAIDZIgCAAIAAgACAQyMAgACAAIAAgC4kAIAAgACAAIBZJACAAIAAgACAryQAgACAAIAAgKwfAIAAgACAAID14WbzAIAAgACAjvQyAwCAAIAAgCz2DQQAgACAAIDc9/oEAIAAgACAoPk5BgCAAIAAgPn5OAcAgACAAIBn7WEGAIAAgACA+uuYAwCAAIAAgNnq3/8AgACAAICJ6Zz6AIAAgACA9eFk8gCAAIAAgI70xwEAgACAAIAs9t0CAIAAgACA3PcHBACAAIAAgKD5TQUAgACAAID5+T0GAIAAgACAZ+2nBACAAIAAgPrr8wEAgACAAIDZ6pf+AIAAgACAielV+QCAAIAAgPXhavEAgACAAICO9NcAAIAAgACALPb2AQCAAIAAgNz3JQMAgACAAICg+XEEAIAAgACA+flXBQCAAIAAgGft9wIAgACAAID665MAAIAAgACA2eok/QCAAIAAgInpGPgAgACAAID14W3wAIAAgACAjvT2/wCAAIAAgCz2GwEAgACAAIDc91ACAIAAgACAoPmkAwCAAIAAgPn5gQQAgACAAIBn7X4BAIAAgACA+uv+/gCAAIAAgNnqrfsAgACAAICJ6df2AIAAgACA9eF57wCAAIAAgI70I/8AgACAAIAs9kwAAIAAgACA3PeKAQCAAIAAgKD55wIAgACAAID5+eADAIAAgACAZ+3e/wCAAIAAgPrrc/0AgACAAIDZ6kT6AIAAgACAiemi9QCAAIAAgArnE+8AgACAAIAD+ur/AIAAgACAa/sNAQCAAIAAgPb8SAIAgACAAIBj/roDAIAAgACAcgAGBQCAAIAAgNP7HwIAgACAAIAD8Sb9AIAAgACAjO81+gCAAIAAgOnt+fUAgACAAIA68WXxAIAAgACAtwRcAgCAAIAAgMMFawMAgACAAIDoBrkEAIAAgACA7QfvBQCAAIAAgBELewcAgACAAICiD7gGAIAAgACAHASVAQCAAIAAgNX4GvwAgACAAICk9uH3AIAAgACAcPu48wCAAIAAgAsPuQQAgACAAIDBD98FAIAAgACAfRDxBgCAAIAAgE0RGwgAgACAAIBfE2gJAIAAgACAFhirCACAAIAAgDMX+wUAgACAAIApC04AAIAAgACAYf/d+QCAAIAAgKcFEPYAgACAAID4GCkHAIAAgACAXRkZCACAAIAAgMYZFwkAgACAAIBDGi4KAIAAgACAfxtJCwCAAIAAgDkeDwoAgACAAIDuHrcHAIAAgACAmx2GBACAAIAAgAgR5/0AgACAAIDbDACAAIAAgACAcCIAgACAAIAAgJMiAIAAgACAAICxIgCAAIAAgACA2SIAgACAAIAAgEMjAIAAgACAAIAuJACAAIAAgACAWSQAgACAAIAAgK8kAIAAgACAAICsHwCAAIAAgACA' }
+];
@@ -0,0 +1,46 @@
+-- Append-only hand history: one row per played hand
+create table if not exists public.hand_events (
+    id bigint generated by default as identity primary key,
+    user_id uuid references auth.users not null,
+    hand_number integer not null,
+    hand jsonb not null,
+    played_at timestamptz default now(),
+    created_at timestamptz default now(),
+    unique (user_id, hand_number)
+);
+
+-- The unique constraint creates the (user_id, hand_number) index used by
+-- upsert(on conflict user_id, hand_number) and by keyset pagination
+-- (where user_id = ? and hand_number < ? order by hand_number desc limit ?).
+
+-- Enable RLS
+alter table public.hand_events enable row level security;
+
+-- Create policies
+create policy "Users can view their own hand events"
+    on public.hand_events for select
+    using (auth.uid() = user_id);
+
+create policy "Users can insert their own hand events"
+    on public.hand_events for insert
+    with check (auth.uid() = user_id);
+
+create policy "Users can update their own hand events"
+    on public.hand_events for update
+    using (auth.uid() = user_id);
+
+create policy "Users can delete their own hand events"
+    on public.hand_events for delete
+    using (auth.uid() = user_id);
+
+-- Backfill from the legacy single-row JSON history
+insert into public.hand_events (user_id, hand_number, hand, played_at)
+select
+    h.user_id,
+    (e ->> 'handNumber')::integer,
+    e,
+    coalesce(to_timestamp((e ->> 'timestamp')::double precision / 1000), h.updated_at)
+from public.hand_history h
+cross join lateral jsonb_array_elements(h.hands_json) as e
+where jsonb_typeof(e -> 'handNumber') = 'number'
+on conflict (user_id, hand_number) do nothing;
@@ -0,0 +1,117 @@
+-- Delta sync for statistics: counters are sent as per-device, sequenced increments
+
+alter table public.statistics
+    add column if not exists total_amount_wagered numeric default 0,
+    add column if not exists hand_counter bigint default 0,
+    add column if not exists session_best_balance numeric default 1000,
+    add column if not exists session_worst_balance numeric default 1000;
+
+-- Last delta sequence number applied per device
+create table if not exists public.statistics_devices (
+    user_id uuid references auth.users not null,
+    device_id text not null,
+    last_seq bigint not null default 0,
+    updated_at timestamptz default now(),
+    primary key (user_id, device_id)
+);
+
+-- Enable RLS
+alter table public.statistics_devices enable row level security;
+
+-- Create policies
+create policy "Users can view their own devices"
+    on public.statistics_devices for select
+    using (auth.uid() = user_id);
+
+create policy "Users can insert their own devices"
+    on public.statistics_devices for insert
+    with check (auth.uid() = user_id);
+
+create policy "Users can update their own devices"
+    on public.statistics_devices for update
+    using (auth.uid() = user_id);
+
+-- Applies a batch of deltas: [{ seq, reset?, d: { balance, wins, ... }, best?, worst? }].
+-- Deltas at or below the device's last_seq were already applied and are skipped,
+-- so a replayed batch changes nothing. Returns { stats, last_seq }.
+create or replace function public.apply_stat_deltas(p_device_id text, p_deltas jsonb)
+returns jsonb
+language plpgsql
+security invoker
+as $$
+declare
+    v_user uuid := auth.uid();
+    v_last bigint;
+    v_delta jsonb;
+    v_seq bigint;
+    v_stats public.statistics;
+begin
+    if v_user is null then
+        raise exception 'not authenticated';
+    end if;
+
+    insert into public.statistics (user_id) values (v_user)
+        on conflict (user_id) do nothing;
+    insert into public.statistics_devices (user_id, device_id) values (v_user, p_device_id)
+        on conflict (user_id, device_id) do nothing;
+
+    select last_seq into v_last
+        from public.statistics_devices
+        where user_id = v_user and device_id = p_device_id
+        for update;
+
+    for v_delta in
+        select value from jsonb_array_elements(p_deltas) order by (value ->> 'seq')::bigint
+    loop
+        v_seq := (v_delta ->> 'seq')::bigint;
+        continue when v_seq <= v_last;
+
+        if coalesce((v_delta ->> 'reset')::boolean, false) then
+            update public.statistics set
+                balance = 1000, wins = 0, losses = 0, blackjacks = 0,
+                total_winnings = 0, total_amount_wagered = 0, hand_counter = 0,
+                session_best_balance = 1000, session_worst_balance = 1000
+            where user_id = v_user;
+        end if;
+
+        update public.statistics set
+            balance = balance + coalesce((v_delta -> 'd' ->> 'balance')::numeric, 0),
+            wins = wins + coalesce((v_delta -> 'd' ->> 'wins')::integer, 0),
+            losses = losses + coalesce((v_delta -> 'd' ->> 'losses')::integer, 0),
+            blackjacks = blackjacks + coalesce((v_delta -> 'd' ->> 'blackjacks')::integer, 0),
+            total_winnings = total_winnings + coalesce((v_delta -> 'd' ->> 'totalWinnings')::numeric, 0),
+            total_amount_wagered = coalesce(total_amount_wagered, 0)
+                + coalesce((v_delta -> 'd' ->> 'totalAmountWagered')::numeric, 0),
+            hand_counter = coalesce(hand_counter, 0)
+                + coalesce((v_delta -> 'd' ->> 'handCounter')::bigint, 0),
+            -- greatest/least ignore nulls
+            session_best_balance = greatest(session_best_balance, (v_delta ->> 'best')::numeric),
+            session_worst_balance = least(session_worst_balance, (v_delta ->> 'worst')::numeric),
+            updated_at = now()
+        where user_id = v_user;
+
+        v_last := v_seq;
+    end loop;
+
+    update public.statistics_devices
+        set last_seq = v_last, updated_at = now()
+        where user_id = v_user and device_id = p_device_id;
+
+    select * into v_stats from public.statistics where user_id = v_user;
+    return jsonb_build_object('stats', to_jsonb(v_stats), 'last_seq', v_last);
+end;
+$$;
+
+-- Hands from devices that played offline can share hand numbers
+alter table public.hand_events
+    add column if not exists device_id text not null default 'legacy';
+
+alter table public.hand_events
+    drop constraint if exists hand_events_user_id_hand_number_key;
+
+alter table public.hand_events
+    add constraint hand_events_user_device_hand_key unique (user_id, device_id, hand_number);
+
+-- Keyset pagination (where user_id = ? and hand_number < ? order by hand_number desc)
+create index if not exists hand_events_user_hand_idx
+    on public.hand_events (user_id, hand_number);
@@ -0,0 +1,6 @@
+-- Keyset pagination over (hand_number, device_id): devices can share hand numbers
+-- (where user_id = ? and (hand_number, device_id) < (?, ?) order by hand_number desc, device_id desc)
+drop index if exists public.hand_events_user_hand_idx;
+
+create index if not exists hand_events_user_hand_device_idx
+    on public.hand_events (user_id, hand_number desc, device_id desc);
@@ -48,17 +48,28 @@ def _find_chromium_executable():
     return None
 
 
-@pytest.fixture
-def page():
-    """Create a fresh browser and page for each test."""
+# Number of logged-in pages kept warm per browser (i.e. per xdist worker).
+CONTEXT_POOL_SIZE = int(os.getenv("E2E_CONTEXT_POOL", "2"))
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call):
+    """Record each phase's report on the item so fixtures can see if the test failed."""
+    outcome = yield
+    report = outcome.get_result()
+    setattr(item, f"rep_{report.when}", report)
+
+
+@pytest.fixture(scope="session")
+def browser():
+    """One Chromium per session (per worker under pytest-xdist)."""
     with sync_playwright() as p:
         launch_kwargs = {
             "headless": True,
             "args": [
                 "--no-sandbox",
                 "--disable-gpu",
-                "--single-process",
-                "--no-zygote",
+                "--disable-dev-shm-usage",
                 "--disable-setuid-sandbox",
             ],
         }
@@ -72,26 +83,35 @@ def page():
             if "Executable doesn't exist" in message:
                 pytest.skip(f"Chromium unavailable for E2E tests: {message}")
             raise
-
-        # Use reduced motion to disable animations and improve stability
-        context = browser.new_context(reduced_motion="reduce")
-        pg = context.new_page()
-        yield pg
-        context.close()
+        yield browser
         browser.close()
 
 
+def _new_context(browser):
+    # Use reduced motion to disable animations and improve stability
+    return browser.new_context(reduced_motion="reduce")
+
+
 @pytest.fixture
+def page(browser):
+    """Create a fresh context and page for each test (no app state shared)."""
+    context = _new_context(browser)
+    pg = context.new_page()
+    yield pg
+    context.close()
+
+
+@pytest.fixture(scope="session")
 def game_url():
     """Return the full URL to the game's index.html."""
     return "http://localhost:3000"
 
-@pytest.fixture
-def logged_in_page(page, game_url):
+
+def _log_in(page, game_url):
     """
-    Fixture that returns a page where a user has 'logged in' via direct manipulation
-    of the GameManager instance, bypassing Supabase network calls.
-    It also navigates past the Welcome Screen to the main game area.
+    Logs a user in via direct manipulation of the GameManager instance,
+    bypassing Supabase network calls, and navigates past the Welcome Screen
+    to the main game area.
     """
     page.goto(game_url)
 
@@ -139,3 +159,105 @@ def logged_in_page(page, game_url):
     """)
 
     return page
+
+
+class ContextPool:
+    """
+    Pre-warmed, already logged-in pages on a shared browser.
+
+    A page is handed to one test at a time. Afterwards it is reset in place
+    with window.__game.__resetForTest() (src/core/e2eReset.js) and reused;
+    pages from failed tests, or whose reset fails, are closed and replaced.
+    """
+
+    def __init__(self, browser, game_url, size):
+        self.browser = browser
+        self.game_url = game_url
+        self.size = max(1, size)
+        self.idle = []
+
+    def _warm(self):
+        context = _new_context(self.browser)
+        try:
+            return _log_in(context.new_page(), self.game_url)
+        except Exception:
+            context.close()
+            raise
+
+    def prewarm(self):
+        while len(self.idle) < self.size:
+            self.idle.append(self._warm())
+
+    def acquire(self):
+        return self.idle.pop() if self.idle else self._warm()
+
+    def release(self, page, reuse=True):
+        if reuse and len(self.idle) < self.size:
+            try:
+                if page.evaluate("window.__game.__resetForTest ? window.__game.__resetForTest() : false"):
+                    self.idle.append(page)
+                    return
+            except Exception as e:
+                print(f"Context reset failed, discarding page: {e}")
+        page.context.close()
+
+    def close(self):
+        for page in self.idle:
+            page.context.close()
+        self.idle = []
+
+
+@pytest.fixture(scope="session")
+def context_pool(browser, game_url):
+    pool = ContextPool(browser, game_url, CONTEXT_POOL_SIZE)
+    pool.prewarm()
+    yield pool
+    pool.close()
+
+
+@pytest.fixture
+def logged_in_page(context_pool, request):
+    """
+    A page where a user has 'logged in' and the game area is showing, taken
+    from the session's context pool and reset when the test is done.
+    """
+    page = context_pool.acquire()
+    yield page
+    report = getattr(request.node, "rep_call", None)
+    context_pool.release(page, reuse=report is not None and report.passed)
+
+
+@pytest.fixture
+def fresh_logged_in_page(page, game_url):
+    """
+    A logged-in page in its own new context, never pooled or reused (for
+    tests that measure the page, such as tests/perf).
+    """
+    return _log_in(page, game_url)
+
+
+class GameClock:
+    """Drives round timers on a page switched to the virtual clock."""
+
+    def __init__(self, page):
+        self.page = page
+
+    def advance(self, ms):
+        """Fires every round timer due within `ms` and renders the result."""
+        self.page.evaluate(
+            "(ms) => { window.__game.scheduler.advance(ms); window.__game.ui.flushRender(); }", ms
+        )
+
+    def run_all(self):
+        """Fires timers until the round has nothing left scheduled."""
+        self.page.evaluate("() => { window.__game.scheduler.runAll(); window.__game.ui.flushRender(); }")
+
+
+@pytest.fixture
+def game_clock(logged_in_page):
+    """
+    Switches the logged-in page's round timers (CONFIG.DELAYS) to a virtual
+    clock, so tests advance them instantly instead of sleeping.
+    """
+    logged_in_page.evaluate("window.__game.__useVirtualClock()")
+    return GameClock(logged_in_page)
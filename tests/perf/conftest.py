@@ -0,0 +1,226 @@
+"""
+Browser performance regression suite.
+
+Scenarios are played in the page through window.__game on the virtual clock,
+with a frame between actions so renders happen as they would for a player.
+Each scenario is measured with the Chrome DevTools Protocol (layout and style
+recalc counts, script time, JS heap after GC) plus an in-page probe (frame
+times, long tasks, DOM nodes), then compared with tests/perf/baselines.json.
+
+Run serially (no -n) against the production build served on port 3000
+(`npm run build && npm run preview -- --port 3000`): `npm run test:perf`.
+Set PERF_UPDATE_BASELINE=1 to write the measured values as the new baselines;
+a scenario without a baseline fails. Committed baselines are recorded on the
+CI runner (run the CI workflow manually with update-perf-baselines).
+Every run writes tests/perf/results/perf-results.json.
+"""
+import json
+import os
+
+import pytest
+
+PERF_DIR = os.path.dirname(__file__)
+BASELINES_PATH = os.path.join(PERF_DIR, "baselines.json")
+RESULTS_PATH = os.path.join(PERF_DIR, "results", "perf-results.json")
+UPDATE_BASELINE = os.getenv("PERF_UPDATE_BASELINE") == "1"
+
+# In-page helpers: frame and long-task recording, settling the virtual clock,
+# and scripting the next cards dealt.
+HARNESS_JS = """
+() => {
+    const game = window.__game;
+    const nextFrame = () => new Promise((resolve) => requestAnimationFrame(() => resolve()));
+    const harness = {
+        frames: [],
+        longTasks: 0,
+        recording: false,
+        nextFrame,
+        async settle() {
+            game.scheduler.runAll();
+            await nextFrame();
+        },
+        start() {
+            this.frames = [];
+            this.longTasks = 0;
+            this.recording = true;
+            let last = performance.now();
+            const loop = (now) => {
+                if (!this.recording) return;
+                this.frames.push(now - last);
+                last = now;
+                requestAnimationFrame(loop);
+            };
+            requestAnimationFrame(loop);
+            if (!this.observer && (PerformanceObserver.supportedEntryTypes || []).includes('longtask')) {
+                this.observer = new PerformanceObserver((list) => {
+                    if (this.recording) this.longTasks += list.getEntries().length;
+                });
+                this.observer.observe({ type: 'longtask' });
+            }
+        },
+        async stop() {
+            // One more frame so work queued by the last action is included.
+            await nextFrame();
+            this.recording = false;
+            return {
+                frames: this.frames,
+                longTasks: this.longTasks,
+                domNodes: document.getElementsByTagName('*').length,
+            };
+        },
+        rig(cards) {
+            const deck = game.engine.deck;
+            const queue = [...cards];
+            const draw = deck.draw;
+            deck.draw = function (faceDown) {
+                if (queue.length > 0) return queue.shift();
+                deck.draw = draw;
+                return draw.call(deck, faceDown);
+            };
+        },
+        async answerInsurance() {
+            if (!game.gameOver && game.dealerHand[0] && game.dealerHand[0].value === 'A') {
+                game.respondToInsurance(false);
+                await this.settle();
+            }
+        },
+    };
+    window.__perfHarness = harness;
+    return true;
+}
+"""
+
+
+def _percentile(values, q):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class PerfProbe:
+    """CDP session plus the in-page harness for one measured page."""
+
+    def __init__(self, page):
+        self.page = page
+        self.cdp = page.context.new_cdp_session(page)
+        self.cdp.send("Performance.enable")
+        self.before = None
+
+    def _metrics(self):
+        return {m["name"]: m["value"] for m in self.cdp.send("Performance.getMetrics")["metrics"]}
+
+    def start(self):
+        self.cdp.send("HeapProfiler.collectGarbage")
+        self.before = self._metrics()
+        self.page.evaluate("window.__perfHarness.start()")
+
+    def stop(self):
+        probe = self.page.evaluate("window.__perfHarness.stop()")
+        self.cdp.send("HeapProfiler.collectGarbage")
+        after = self._metrics()
+        before = self.before
+        frames = probe["frames"][1:]  # The first delta spans the gap before start().
+        return {
+            "frame_p95_ms": round(_percentile(frames, 0.95), 2),
+            "frame_max_ms": round(max(frames, default=0.0), 2),
+            "long_tasks": probe["longTasks"],
+            "js_heap_mb": round(after["JSHeapUsedSize"] / 1e6, 2),
+            "dom_nodes": probe["domNodes"],
+            "layout_count": int(after["LayoutCount"] - before["LayoutCount"]),
+            "recalc_style_count": int(after["RecalcStyleCount"] - before["RecalcStyleCount"]),
+            "script_ms": round((after["ScriptDuration"] - before["ScriptDuration"]) * 1000, 1),
+        }
+
+    def close(self):
+        self.cdp.detach()
+
+
+def load_baselines():
+    with open(BASELINES_PATH, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def find_regressions(metrics, baseline, config):
+    """
+    Metrics above `baseline * (1 + tolerance) + slack`. Slack absorbs noise
+    on small values (a few layouts, a couple of ms per frame).
+    """
+    tolerance = float(os.getenv("PERF_TOLERANCE", config["tolerance"]))
+    regressions = []
+    for name, value in metrics.items():
+        if name not in baseline:
+            continue
+        limit = baseline[name] * (1 + tolerance) + config["slack"].get(name, 0)
+        if value > limit:
+            regressions.append(f"{name}: {value} > {round(limit, 2)} (baseline {baseline[name]})")
+    return regressions
+
+
+@pytest.fixture(scope="session")
+def perf_results():
+    """Collects each scenario's metrics; written to RESULTS_PATH (and baselines when updating)."""
+    results = {}
+    yield results
+    if not results:
+        return
+    os.makedirs(os.path.dirname(RESULTS_PATH), exist_ok=True)
+    with open(RESULTS_PATH, "w", encoding="utf-8") as f:
+        json.dump(results, f, indent=2, sort_keys=True)
+    if UPDATE_BASELINE:
+        baselines = load_baselines()
+        baselines.pop("note", None)
+        baselines["scenarios"].update(results)
+        with open(BASELINES_PATH, "w", encoding="utf-8") as f:
+            json.dump(baselines, f, indent=2, sort_keys=True)
+            f.write("\n")
+
+
+@pytest.fixture
+def perf_page(fresh_logged_in_page):
+    """A fresh logged-in page on the virtual clock with the harness installed."""
+    page = fresh_logged_in_page
+    page.evaluate("""
+        () => {
+            const game = window.__game;
+            game.__useVirtualClock();
+            game.balance = 1000000;
+            game.currentBet = 10;
+            game.updateUI();
+        }
+    """)
+    page.evaluate(HARNESS_JS)
+    return page
+
+
+@pytest.fixture
+def measure(perf_page, perf_results):
+    """
+    `measure(scenario, script, arg=None)` runs the async in-page `script`
+    under the probe, records the metrics and fails on regressions against
+    the stored baseline.
+    """
+    probe = PerfProbe(perf_page)
+
+    def run(scenario, script, arg=None):
+        probe.start()
+        perf_page.evaluate(script, arg)
+        metrics = probe.stop()
+        perf_results[scenario] = metrics
+        print(f"{scenario}: {json.dumps(metrics, sort_keys=True)}")
+
+        if UPDATE_BASELINE:
+            return metrics
+        baselines = load_baselines()
+        baseline = baselines["scenarios"].get(scenario)
+        if baseline is None:
+            pytest.fail(
+                f"No baseline for {scenario}; record baselines on the CI runner "
+                "(CI workflow, update-perf-baselines) or locally with PERF_UPDATE_BASELINE=1"
+            )
+        regressions = find_regressions(metrics, baseline, baselines)
+        assert not regressions, f"{scenario} regressed:\n" + "\n".join(regressions)
+        return metrics
+
+    yield run
+    probe.close()
@@ -0,0 +1,100 @@
+"""Perf scenarios: 3-way splits, rapid rebets and the stats modal with a full history."""
+
+SPLIT_ROUNDS = 20
+REBETS = 100
+STATS_MODAL_OPENS = 10
+HISTORY_HANDS = 1000
+
+# Player 8-8 against a dealer 6, split twice into three hands; the dealer
+# draws to 16 and busts. Deal order: player, dealer, player, dealer (hole),
+# then two cards per split.
+THREE_WAY_SPLIT_CARDS = [
+    {"suit": "♠", "value": "8"}, {"suit": "♦", "value": "6"},
+    {"suit": "♥", "value": "8"}, {"suit": "♣", "value": "10"},
+    {"suit": "♦", "value": "8"}, {"suit": "♣", "value": "3"},
+    {"suit": "♥", "value": "5"}, {"suit": "♠", "value": "9"},
+    {"suit": "♥", "value": "10"},
+]
+
+
+def test_three_way_splits(measure):
+    measure("three_way_splits", """
+        async ({ rounds, cards }) => {
+            const game = window.__game;
+            const h = window.__perfHarness;
+            game.engine.shuffleDeck();
+            for (let i = 0; i < rounds; i++) {
+                h.rig(cards);
+                game.rebetAndDeal();
+                await h.settle();
+                game.split();
+                await h.nextFrame();
+                game.split();
+                await h.nextFrame();
+                if (game.playerHands.length !== 3) throw new Error('expected three hands');
+                while (!game.gameOver) {
+                    game.stand();
+                    await h.settle();
+                }
+            }
+        }
+    """, {"rounds": SPLIT_ROUNDS, "cards": THREE_WAY_SPLIT_CARDS})
+
+
+def test_rapid_rebets(measure):
+    measure("rapid_rebets", """
+        async (rebets) => {
+            const game = window.__game;
+            const h = window.__perfHarness;
+            for (let i = 0; i < rebets; i++) {
+                game.rebetAndDeal();
+                await h.settle();
+                await h.answerInsurance();
+                while (!game.gameOver) {
+                    game.stand();
+                    await h.settle();
+                }
+            }
+        }
+    """, REBETS)
+
+
+# Plays HISTORY_HANDS hands, then loads all of them into the history the way
+# older cloud/IndexedDB pages are loaded, so the modal works on far more than
+# the ring's maxEntries hands.
+SEED_HISTORY_JS = """
+    async (hands) => {
+        const game = window.__game;
+        const played = [];
+        const collect = (entry) => played.push(entry);
+        game.events.on('hand:completed', collect);
+        await game.autoPlay({ hands, bet: 10 });
+        game.events.off('hand:completed', collect);
+        const history = game.handHistory;
+        history.entries = played.reverse();
+        history.markReplaced();
+        game.events.emit('history:changed');
+        return { size: history.store.size, maxEntries: history.maxEntries };
+    }
+"""
+
+
+def test_stats_modal_with_full_history(perf_page, measure):
+    seeded = perf_page.evaluate(SEED_HISTORY_JS, HISTORY_HANDS)
+    assert seeded["size"] == HISTORY_HANDS, "every played hand should be in the history"
+    assert seeded["size"] > seeded["maxEntries"], "history should be longer than the ring"
+
+    measure("stats_modal_full_history", """
+        async (opens) => {
+            const h = window.__perfHarness;
+            const open = document.getElementById('stats-modal-btn');
+            const close = document.querySelector('.stats-modal-close');
+            for (let i = 0; i < opens; i++) {
+                open.click();
+                await h.nextFrame();
+                await h.nextFrame();
+                close.click();
+                await h.nextFrame();
+            }
+        }
+    """, STATS_MODAL_OPENS)
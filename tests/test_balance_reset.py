@@ -1,8 +1,7 @@
 """Test: Balance reset when player goes bankrupt."""
-import time
 
 
-def test_no_bankruptcy_notification(logged_in_page):
+def test_no_bankruptcy_notification(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -22,10 +21,10 @@ def test_no_bankruptcy_notification(logged_in_page):
         window.__game.endGame();
     }""")
 
-    time.sleep(2.5)
+    game_clock.advance(2500)
 
     content = page.content()
     notification_visible = "Voce ficou sem dinheiro! Reiniciando..." in content
 
-    time.sleep(2.5)
+    game_clock.run_all()
     assert not notification_visible, "Bankruptcy notification should not be present"
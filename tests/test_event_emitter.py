@@ -1,5 +1,4 @@
 """Test: EventEmitter integration — verify events are emitted during game actions."""
-import time
 
 
 def test_event_emitter_exists(logged_in_page):
@@ -10,7 +9,7 @@ def test_event_emitter_exists(logged_in_page):
     assert has_events, "GameManager should have an events (EventEmitter) property"
 
 
-def test_game_started_event(logged_in_page):
+def test_game_started_event(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -30,13 +29,13 @@ def test_game_started_event(logged_in_page):
         if(document.getElementById('bet-input')) document.getElementById('bet-input').value = 50;
         window.__game.startGame();
     """)
-    time.sleep(1.5) # Increased wait time for startup
+    game_clock.advance(1500)
 
     log = page.evaluate("window.__eventLog")
     assert "game:started" in log, f"Expected 'game:started' event, got {log}"
 
 
-def test_player_hit_event(logged_in_page):
+def test_player_hit_event(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -67,7 +66,7 @@ def test_player_hit_event(logged_in_page):
 
         window.__game.hit();
     """)
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     log = page.evaluate("window.__eventLog")
     assert len(log) > 0, "Expected player:hit event to be logged"
@@ -75,7 +74,7 @@ def test_player_hit_event(logged_in_page):
     assert log[0]["handIndex"] == 0, f"Expected handIndex 0, got {log[0]['handIndex']}"
 
 
-def test_player_stand_event(logged_in_page):
+def test_player_stand_event(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -105,7 +104,7 @@ def test_player_stand_event(logged_in_page):
 
         window.__game.stand();
     """)
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     log = page.evaluate("window.__eventLog")
     assert "player:stand" in log, f"Expected 'player:stand' event, got {log}"
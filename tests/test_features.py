@@ -1,8 +1,7 @@
 """Test: Game features — insurance modal."""
-import time
 
 
-def test_insurance_modal(logged_in_page):
+def test_insurance_modal(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -19,7 +18,8 @@ def test_insurance_modal(logged_in_page):
     """
     page.evaluate(js_mock_deck)
     page.click("#bet-btn")
+    game_clock.advance(1000)  # CONFIG.DELAYS.INSURANCE_MODAL
     page.click("#insurance-no-btn")
-    time.sleep(2)
+    game_clock.run_all()
     page.evaluate("window.__game.resetGame()")
     page.wait_for_selector("#bet-btn")
@@ -1,8 +1,7 @@
 """Test: Insurance functionality — accept/decline, insufficient balance handling."""
-import time
 
 
-def test_insurance_insufficient_balance(logged_in_page):
+def test_insurance_insufficient_balance(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -16,7 +15,7 @@ def test_insurance_insufficient_balance(logged_in_page):
         document.getElementById('bet-input').value = 100;
         window.__game.startGame();
     """)
-    time.sleep(1)
+    game_clock.advance(1000)
 
     # Player balance should be 0 after betting 100
     balance_after_bet = page.evaluate("window.__game.balance")
@@ -24,7 +23,7 @@ def test_insurance_insufficient_balance(logged_in_page):
 
     # Try to accept insurance — should fail due to insufficient balance
     page.evaluate("window.__game.respondToInsurance(true)")
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     insurance_taken = page.evaluate("window.__game.insuranceTaken")
     assert insurance_taken == False, (
@@ -32,7 +31,7 @@ def test_insurance_insufficient_balance(logged_in_page):
     )
 
 
-def test_insurance_accepted_with_sufficient_balance(logged_in_page):
+def test_insurance_accepted_with_sufficient_balance(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -43,13 +42,13 @@ def test_insurance_accepted_with_sufficient_balance(logged_in_page):
         document.getElementById('bet-input').value = 100;
         window.__game.startGame();
     """)
-    time.sleep(1)
+    game_clock.advance(1000)
 
     balance_before = page.evaluate("window.__game.balance")
 
     # Accept insurance (costs half the bet = 50)
     page.evaluate("window.__game.respondToInsurance(true)")
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     balance_after = page.evaluate("window.__game.balance")
     insurance_taken = page.evaluate("window.__game.insuranceTaken")
@@ -60,7 +59,7 @@ def test_insurance_accepted_with_sufficient_balance(logged_in_page):
     )
 
 
-def test_insurance_declined(logged_in_page):
+def test_insurance_declined(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -70,13 +69,13 @@ def test_insurance_declined(logged_in_page):
         document.getElementById('bet-input').value = 100;
         window.__game.startGame();
     """)
-    time.sleep(1)
+    game_clock.advance(1000)
 
     balance_before = page.evaluate("window.__game.balance")
 
     # Decline insurance
     page.evaluate("window.__game.respondToInsurance(false)")
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     balance_after = page.evaluate("window.__game.balance")
     assert balance_after == balance_before, "Balance should not change when insurance is declined"
@@ -1,8 +1,7 @@
 """Test: Keyboard shortcuts — H, S, D, P, R keys trigger game actions."""
-import time
 
 
-def test_keyboard_hit(logged_in_page):
+def test_keyboard_hit(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -24,13 +23,13 @@ def test_keyboard_hit(logged_in_page):
         window.__game.ui.toggleGameControls(true);
         window.__game.updateUI();
     """)
-    time.sleep(0.5)
+    game_clock.run_all()
 
     cards_before = page.evaluate("window.__game.playerHands[0].cards.length")
 
     # Press 'h' for hit
     page.keyboard.press("h")
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     cards_after = page.evaluate("window.__game.playerHands[0].cards.length")
     assert cards_after == cards_before + 1, (
@@ -38,7 +37,7 @@ def test_keyboard_hit(logged_in_page):
     )
 
 
-def test_keyboard_stand(logged_in_page):
+def test_keyboard_stand(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -60,17 +59,17 @@ def test_keyboard_stand(logged_in_page):
         window.__game.ui.toggleGameControls(true);
         window.__game.updateUI();
     """)
-    time.sleep(0.5)
+    game_clock.run_all()
 
     # Press 's' for stand
     page.keyboard.press("s")
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     status = page.evaluate("window.__game.playerHands[0].status")
     assert status == "stand", f"Expected 'stand' status after pressing S, got '{status}'"
 
 
-def test_keyboard_visual_feedback(logged_in_page):
+def test_keyboard_visual_feedback(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -86,7 +85,7 @@ def test_keyboard_visual_feedback(logged_in_page):
         window.__game.ui.toggleGameControls(true);
         window.__game.updateUI();
     """)
-    time.sleep(0.5)
+    game_clock.run_all()
 
     # Press 'h' and check for kbd-active class on the hit button
     page.keyboard.press("h")
@@ -1,5 +1,4 @@
 """Test: Shoe indicator — verifies the shoe progress bar updates correctly."""
-import time
 
 
 def test_shoe_indicator_exists(logged_in_page):
@@ -16,7 +15,7 @@ def test_shoe_indicator_exists(logged_in_page):
     assert shoe_label is not None, "Shoe label element should exist"
 
 
-def test_shoe_indicator_updates_after_deal(logged_in_page):
+def test_shoe_indicator_updates_after_deal(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -31,7 +30,7 @@ def test_shoe_indicator_updates_after_deal(logged_in_page):
         document.getElementById('bet-input').value = 50;
         window.__game.startGame();
     """)
-    time.sleep(1)
+    game_clock.advance(1000)
 
     # After dealing 4 cards from 312, percentage should be ~99%
     label_after = page.evaluate("document.getElementById('shoe-label').textContent")
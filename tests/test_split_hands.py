@@ -1,8 +1,7 @@
 """Test: Split hand functionality."""
-import time
 
 
-def test_split_creates_two_hands(logged_in_page):
+def test_split_creates_two_hands(logged_in_page, game_clock):
     page = logged_in_page
     page.wait_for_function("window.__game !== undefined")
 
@@ -10,7 +9,7 @@ def test_split_creates_two_hands(logged_in_page):
     page.click("#bet-btn")
 
     # Wait for game to fully initialize and player turn to start
-    time.sleep(2)
+    game_clock.advance(2000)
 
     # Inject state: two 8s for split
     page.evaluate("""() => {
@@ -26,7 +25,7 @@ def test_split_creates_two_hands(logged_in_page):
         window.__game.updateUI();
     }""")
 
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     # Verify the injected state allows split
     can_split = page.evaluate("""() => {
@@ -39,7 +38,7 @@ def test_split_creates_two_hands(logged_in_page):
 
     # Execute split via JS to avoid Playwright click issues
     page.evaluate("window.__game.split()")
-    time.sleep(0.5)
+    game_clock.advance(500)
 
     hands_count = page.evaluate("window.__game.playerHands.length")
     assert hands_count == 2, f"Expected 2 hands, found {hands_count}"
@@ -1,6 +1,5 @@
 """Test: Win animation triggers without errors."""
 import os
-import time
 
 
 def test_win_animation(page, game_url):
@@ -15,7 +14,8 @@ def test_win_animation(page, game_url):
 
     # Trigger win animation
     page.evaluate("window.__game.ui.showWinAnimation(500)")
-    time.sleep(1)
+    # Confetti runs on animation frames, not round timers: let two frames draw.
+    page.evaluate("() => new Promise((r) => requestAnimationFrame(() => requestAnimationFrame(r)))")
 
     screenshot_path = os.path.abspath("tests/win_animation_test.png")
     page.screenshot(path=screenshot_path)
@@ -1,5 +1,10 @@
 import { describe, it, expect } from 'vitest';
-import { computeAdvancedStats } from '../../src/utils/AdvancedStats.js';
+import {
+    computeAdvancedStats,
+    AdvancedStatsAggregator,
+    RunningStats,
+    P2Quantile,
+} from '../../src/utils/AdvancedStats.js';
 
 function makeEntry({ result, actions = [], wasStrategyOptimal = null, netChange = 0 }) {
     return {
@@ -161,3 +166,57 @@ describe('computeAdvancedStats', () => {
         });
     });
 });
+
+describe('AdvancedStatsAggregator', () => {
+    const results = ['win', 'lose', 'win', 'win', 'push', 'lose', 'lose', 'win'];
+    const chronological = results.map((result, i) => makeEntry({
+        result,
+        actions: i % 3 === 0 ? ['double'] : ['hit'],
+        wasStrategyOptimal: i % 2 === 0,
+        netChange: result === 'win' ? 50 : result === 'lose' ? -50 : 0,
+    }));
+
+    it('matches a full recomputation when fed one hand at a time', () => {
+        const aggregator = new AdvancedStatsAggregator();
+        chronological.forEach(entry => aggregator.add(entry));
+        const newestFirst = [...chronological].reverse();
+
+        const streamed = aggregator.getStats({ wins: 4, losses: 3 });
+        const batch = computeAdvancedStats(newestFirst, { wins: 4, losses: 3 });
+        // Rebuilt history is not part of the current session; everything else matches.
+        expect({ ...streamed, session: null }).toEqual({ ...batch, session: null });
+        expect(streamed.session.hands).toBe(8);
+        expect(streamed.currentStreak).toEqual({ type: 'win', count: 1 });
+        expect(streamed.longestLossStreak).toBe(2);
+    });
+
+    it('keeps last-N and session summaries without storing entries', () => {
+        const aggregator = new AdvancedStatsAggregator({ windowSize: 3 });
+        aggregator.rebuild(chronological.slice(0, 5));
+        chronological.slice(5).forEach(entry => aggregator.add(entry));
+
+        const stats = aggregator.getStats({});
+        expect(stats.lastHands).toEqual({ hands: 3, winRate: 33.3, net: -50, netROI: -33.3 });
+        expect(stats.session.hands).toBe(3);
+        expect(stats.handsPlayed).toBe(8);
+    });
+
+    it('estimates variance and percentiles in constant memory', () => {
+        const running = new RunningStats();
+        const median = new P2Quantile(0.5);
+        const p95 = new P2Quantile(0.95);
+        const values = Array.from({ length: 2001 }, (_, i) => (i * 7919) % 2001);
+        values.forEach(v => {
+            running.push(v);
+            median.push(v);
+            p95.push(v);
+        });
+
+        const mean = values.reduce((a, b) => a + b, 0) / values.length;
+        const variance = values.reduce((a, v) => a + (v - mean) ** 2, 0) / (values.length - 1);
+        expect(running.mean).toBeCloseTo(mean, 6);
+        expect(running.variance).toBeCloseTo(variance, 3);
+        expect(Math.abs(median.value - 1000)).toBeLessThan(40);
+        expect(Math.abs(p95.value - 1900)).toBeLessThan(40);
+    });
+});
@@ -0,0 +1,119 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { AnimationTicker } from '../../src/ui/modules/AnimationTicker.js';
+import { ConfettiSystem } from '../../src/ui/modules/Confetti.js';
+
+function createFrames() {
+    const queue = new Map();
+    let id = 0;
+    let time = 0;
+    return {
+        requestFrame: vi.fn((cb) => {
+            queue.set(++id, cb);
+            return id;
+        }),
+        cancelFrame: (frameId) => queue.delete(frameId),
+        now: () => time,
+        get pending() {
+            return queue.size;
+        },
+        advance(ms) {
+            for (let end = time + ms; time < end; ) {
+                time = Math.min(time + 16, end);
+                const callbacks = [...queue.values()];
+                queue.clear();
+                callbacks.forEach((cb) => cb(time));
+            }
+        },
+    };
+}
+
+describe('AnimationTicker', () => {
+    let frames;
+    let ticker;
+
+    beforeEach(() => {
+        frames = createFrames();
+        ticker = new AnimationTicker(frames);
+    });
+
+    it('drives every tween from one frame loop and stops when idle', () => {
+        const balance = { textContent: '' };
+        const wins = { textContent: '' };
+        ticker.set(balance, 100, '$');
+        ticker.set(wins, 0);
+
+        ticker.tween(balance, 200, { prefix: '$' });
+        ticker.tween(wins, 10);
+        expect(frames.pending).toBe(1);
+
+        frames.advance(250);
+        expect(balance.textContent).toBe('$188');
+        expect(wins.textContent).toBe('9');
+
+        frames.advance(250);
+        expect(balance.textContent).toBe('$200');
+        expect(wins.textContent).toBe('10');
+        expect(ticker.active).toBe(false);
+        expect(frames.pending).toBe(0);
+    });
+
+    it('writes the first value immediately and retargets from the shown value', () => {
+        const el = { textContent: 'ignored 999' };
+        ticker.tween(el, 50);
+        expect(el.textContent).toBe('50');
+        expect(frames.pending).toBe(0);
+
+        ticker.tween(el, 150);
+        frames.advance(100);
+        const shown = Number(el.textContent);
+        ticker.tween(el, 0);
+        frames.advance(500);
+        expect(shown).toBeGreaterThan(50);
+        expect(el.textContent).toBe('0');
+    });
+
+    it('pauses while the document is hidden', () => {
+        const listeners = {};
+        const doc = { visibilityState: 'visible', addEventListener: (type, fn) => (listeners[type] = fn) };
+        ticker.attachLifecycle(doc);
+        const el = { textContent: '' };
+        ticker.set(el, 0);
+        ticker.tween(el, 100);
+
+        doc.visibilityState = 'hidden';
+        listeners.visibilitychange();
+        expect(frames.pending).toBe(0);
+
+        doc.visibilityState = 'visible';
+        listeners.visibilitychange();
+        frames.advance(500);
+        expect(el.textContent).toBe('100');
+    });
+});
+
+describe('ConfettiSystem', () => {
+    it('draws particles from sprites without save/restore and finishes off screen', () => {
+        const ctx = {
+            setTransform: vi.fn(),
+            clearRect: vi.fn(),
+            drawImage: vi.fn(),
+            fillRect: vi.fn(),
+            save: vi.fn(),
+        };
+        const canvas = { width: 200, height: 100, getContext: () => ctx };
+        const system = new ConfettiSystem(canvas, {
+            count: 20,
+            createCanvas: () => ({ getContext: () => ctx }),
+        });
+        system.burst();
+
+        let frames = 0;
+        while (system.step(1000 / 60) && frames < 1000) frames++;
+
+        expect(frames).toBeGreaterThan(0);
+        expect(frames).toBeLessThan(1000);
+        expect(ctx.drawImage).toHaveBeenCalled();
+        expect(ctx.save).not.toHaveBeenCalled();
+        expect(ctx.fillRect).toHaveBeenCalledTimes(6); // one per sprite colour
+    });
+});
@@ -0,0 +1,81 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { MemoryBackend, migrateLegacyHistory, recordChecksum } from '../../src/utils/AsyncStorage.js';
+import { crc32, crc32String } from '../../src/utils/crc32.js';
+import { HandHistory } from '../../src/utils/HandHistory.js';
+import { StorageManager } from '../../src/utils/StorageManager.js';
+
+const OWNER = 'blackjack-premium-history-user-1';
+
+function makeEntry(n) {
+    return { handNumber: n, timestamp: n * 1000, result: 'win', betAmount: 10, netChange: 10 };
+}
+
+describe('crc32', () => {
+    it('matches the standard check value', () => {
+        expect(crc32String('123456789')).toBe(0xcbf43926);
+        expect(crc32(new Uint8Array(0))).toBe(0);
+    });
+});
+
+describe('MemoryBackend', () => {
+    it('returns records newest first with a keyset cursor', async () => {
+        const backend = new MemoryBackend();
+        await backend.putRecords(OWNER, [1, 2, 3, 4].map((n) => ({ id: n, value: makeEntry(n) })));
+        await backend.putRecords('other', [{ id: 9, value: makeEntry(9) }]);
+
+        const page = await backend.getRecords(OWNER, { limit: 2 });
+        expect(page.map((r) => r.id)).toEqual([4, 3]);
+        const next = await backend.getRecords(OWNER, { before: 3, limit: 2 });
+        expect(next.map((r) => r.id)).toEqual([2, 1]);
+        expect(await backend.countRecords(OWNER)).toBe(4);
+        expect(backend.owners.get(OWNER).get(1).crc).toBe(recordChecksum(makeEntry(1)));
+    });
+});
+
+describe('HandHistory with a storage backend', () => {
+    let backend;
+
+    beforeEach(() => {
+        backend = new MemoryBackend();
+        vi.restoreAllMocks();
+    });
+
+    it('writes one record per new hand and keeps more than maxEntries', async () => {
+        const history = new HandHistory(3);
+        for (let i = 1; i <= 5; i++) {
+            history.addHand(makeEntry(i));
+            await history.saveToBackend(backend, OWNER);
+        }
+        expect(await backend.countRecords(OWNER)).toBe(5);
+
+        const reloaded = new HandHistory(3);
+        await reloaded.loadFromBackend(backend, OWNER);
+        expect(reloaded.entries.map((e) => e.handNumber)).toEqual([5, 4, 3]);
+        expect(reloaded.persistedThrough).toBe(5);
+    });
+
+    it('pages older hands in and keeps them when new hands are added', async () => {
+        await backend.putRecords(OWNER, [1, 2, 3, 4, 5, 6, 7].map((n) => ({ id: n, value: makeEntry(n) })));
+        const history = new HandHistory(3);
+        await history.loadFromBackend(backend, OWNER);
+
+        expect(await history.loadOlderFromBackend(backend, OWNER)).toBe(true);
+        expect(history.entries.map((e) => e.handNumber)).toEqual([7, 6, 5, 4, 3, 2]);
+        expect(await history.loadOlderFromBackend(backend, OWNER)).toBe(false);
+
+        history.addHand(makeEntry(8));
+        expect(history.entries.map((e) => e.handNumber)).toEqual([8, 7, 6, 5, 4, 3, 2]);
+    });
+
+    it('migrates the legacy localStorage history once', async () => {
+        vi.spyOn(StorageManager, 'get').mockReturnValue({ entries: [makeEntry(2), makeEntry(1)] });
+        const remove = vi.spyOn(StorageManager, 'remove').mockReturnValue(true);
+
+        expect(await migrateLegacyHistory(backend, OWNER)).toBe(2);
+        expect(remove).toHaveBeenCalledWith(OWNER);
+        expect(await migrateLegacyHistory(backend, OWNER)).toBe(0);
+
+        const records = await backend.getRecords(OWNER);
+        expect(records.map((r) => r.value.handNumber)).toEqual([2, 1]);
+    });
+});
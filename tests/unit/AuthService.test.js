@@ -0,0 +1,26 @@
+import { describe, it, expect, vi } from 'vitest';
+import { AuthService } from '../../src/core/services/AuthService.js';
+
+describe('AuthService', () => {
+    it('sends queued saves before revoking the session on logout', async () => {
+        const order = [];
+        const supabase = {
+            auth: {
+                signOut: vi.fn(async () => {
+                    order.push('signOut');
+                    return { error: null };
+                }),
+            },
+        };
+        const game = {
+            ui: null,
+            persistenceService: {
+                flushSavesAndWait: vi.fn(async () => { order.push('saved'); }),
+            },
+        };
+
+        await new AuthService(game, supabase).logout();
+
+        expect(order).toEqual(['saved', 'signOut']);
+    });
+});
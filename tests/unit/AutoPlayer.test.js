@@ -0,0 +1,135 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { GameManager } from '../../src/core/GameManager.js';
+import { RealTimeScheduler } from '../../src/core/services/TimerScheduler.js';
+
+describe('AutoPlayer', () => {
+    let game;
+
+    beforeEach(() => {
+        GameManager.instance = null;
+        game = new GameManager(null, null);
+        game.balance = 1000000;
+    });
+
+    afterEach(() => {
+        game.clearTimeouts();
+        GameManager.instance = null;
+    });
+
+    it('plays a batch through the round flow and reports progress', async () => {
+        const progress = vi.fn();
+        const completed = vi.fn();
+        game.events.on('autoplay:progress', progress);
+        game.events.on('hand:completed', completed);
+        const scheduler = game.scheduler;
+
+        const summary = await game.autoPlay({ hands: 500, bet: 10, chunkSize: 100 });
+
+        expect(summary).toMatchObject({ requested: 500, played: 500, stopReason: 'completed' });
+        expect(summary.net).toBe(game.balance - 1000000);
+        expect(game.handCounter).toBe(500);
+        expect(completed).toHaveBeenCalledTimes(500);
+        expect(game.handHistory.store.size).toBeGreaterThan(0);
+        expect(game.wins + game.losses).toBeGreaterThan(0);
+        expect(game.getAdvancedStats().handsPlayed).toBe(500);
+        expect(progress).toHaveBeenCalledTimes(5);
+        expect(progress.mock.calls[4][0]).toMatchObject({ played: 500, total: 500 });
+        expect(game.scheduler).toBe(scheduler);
+        expect(game.autoPlayer.running).toBe(false);
+    });
+
+    it('detaches the UI and sound during the batch and restores them after', async () => {
+        const ui = {
+            toggleGameControls: vi.fn(),
+            requestRender: vi.fn(),
+            invalidateRender: vi.fn(),
+            showMessage: vi.fn(),
+            showNewGameButton: vi.fn(),
+        };
+        const soundManager = { play: vi.fn() };
+        game.ui = ui;
+        game.soundManager = soundManager;
+
+        await game.autoPlay({ hands: 50, bet: 10, flushEvery: 25 });
+
+        expect(soundManager.play).not.toHaveBeenCalled();
+        // One render per interval flush plus the final one, not one per action.
+        expect(ui.requestRender).toHaveBeenCalledTimes(2);
+        expect(ui.showMessage).toHaveBeenCalledTimes(1);
+        expect(game.ui).toBe(ui);
+        expect(game.soundManager).toBe(soundManager);
+    });
+
+    it('writes every hand of a batch longer than the history ring once, at the end', async () => {
+        const records = new Map();
+        game.userId = 'user-id';
+        game.persistenceService.supabase = null;
+        const putRecords = vi.fn(async (owner, batch) => batch.forEach(({ id }) => records.set(id, owner)));
+        game.persistenceService.storageBackend = { putRecords };
+
+        await game.autoPlay({ hands: 120, bet: 10 });
+
+        expect(putRecords).toHaveBeenCalledTimes(1);
+        expect(records.size).toBe(120);
+        expect(game.handHistory.store.size).toBe(game.handHistory.maxEntries);
+        expect(game.handHistory.retainAll).toBe(false);
+    });
+
+    it('writes the kept hands every flushEvery hands', async () => {
+        game.userId = 'user-id';
+        game.persistenceService.supabase = null;
+        const putRecords = vi.fn(async () => {});
+        game.persistenceService.storageBackend = { putRecords };
+
+        await game.autoPlay({ hands: 300, bet: 10, flushEvery: 200 });
+
+        expect(putRecords.mock.calls.map(([, batch]) => batch.length)).toEqual([200, 100]);
+    });
+
+    it('still finishes and voids the broken round when a hand throws', async () => {
+        const finished = vi.fn();
+        game.events.on('autoplay:finished', finished);
+        let balanceBeforeRound = null;
+        const decide = game.autoPlayer.decide;
+        game.autoPlayer.decide = function (hand) {
+            if (game.handCounter >= 3) {
+                // First decision of the round: only the initial bet is on the table.
+                balanceBeforeRound = game.balance + 10;
+                throw new Error('boom');
+            }
+            return decide.call(this, hand);
+        };
+
+        await expect(game.autoPlay({ hands: 10, bet: 10 })).rejects.toThrow('boom');
+
+        expect(finished).toHaveBeenCalledTimes(1);
+        expect(finished.mock.calls[0][0]).toMatchObject({ stopReason: 'error', endBalance: balanceBeforeRound });
+        expect(game.engine.gameStarted).toBe(false);
+        expect(game.balance).toBe(balanceBeforeRound);
+        expect(game.autoPlayer.running).toBe(false);
+        expect(game.scheduler).toBeInstanceOf(RealTimeScheduler);
+    });
+
+    it('stops after the current chunk when cancelled', async () => {
+        game.events.on('autoplay:progress', () => game.cancelAutoPlay());
+
+        const summary = await game.autoPlay({ hands: 1000, bet: 10, chunkSize: 50 });
+
+        expect(summary).toMatchObject({ played: 50, stopReason: 'cancelled' });
+        expect(game.handCounter).toBe(50);
+        expect(game.scheduler).toBeInstanceOf(RealTimeScheduler);
+    });
+
+    it('stops when the balance cannot cover the bet and blocks manual rounds meanwhile', async () => {
+        game.balance = 100;
+        const run = game.autoPlay({ hands: 100000, bet: 50, chunkSize: 1 });
+        expect(game.autoPlayer.running).toBe(true);
+        game.startGame();
+        expect(await game.autoPlay({ hands: 1 })).toBeNull();
+
+        const summary = await run;
+        expect(summary.stopReason).toBe('balance');
+        expect(game.balance).toBeLessThan(50);
+        expect(summary.played).toBe(game.handCounter);
+    });
+});
@@ -2,6 +2,8 @@ import { describe, it, expect, beforeEach, vi } from 'vitest';
 import { BlackjackEngine } from '../../src/core/BlackjackEngine.js';
 import { Deck } from '../../src/core/Deck.js';
 import { RULES, getActiveRuleProfile } from '../../src/core/Constants.js';
+import * as HandUtils from '../../src/utils/HandUtils.js';
+import { CardCounter } from '../../src/core/CardCounter.js';
 
 vi.mock('../../src/core/Deck.js', () => {
     return {
@@ -25,6 +27,8 @@ describe('BlackjackEngine', () => {
             shuffleWithMode: vi.fn(),
             burnCards: vi.fn(),
             draw: vi.fn().mockReturnValue({ suit: '♠', value: '10' }), // Default card
+            revealCard: vi.fn(),
+            counter: new CardCounter(6),
             cards: [],
             needsReshuffle: false,
             remainingCards: 52,
@@ -239,4 +243,44 @@ describe('BlackjackEngine', () => {
         expect(result.results[0].result).toBe('tie');
         expect(result.results[0].winMultiplier).toBe(1);
     });
+
+    it('keeps a running score in sync as cards are dealt', () => {
+        engine.startGame(100);
+        const hand = engine.playerHands[0];
+        hand.cards = [{ suit: '♠', value: 'A' }, { suit: '♥', value: '3' }];
+
+        mockDeckInstance.draw.mockReturnValue({ suit: '♣', value: '9' });
+        engine.hit(0);
+
+        const score = engine.getHandScore(hand.cards);
+        expect(score).toEqual({ value: 13, softAces: 0, cardCount: 3 });
+        expect(score.value).toBe(HandUtils.calculateHandValue(hand.cards));
+    });
+
+    it('exposes player and dealer scores through getState', () => {
+        engine.startGame(100);
+        engine.dealerHand = [{ suit: '♥', value: 'A' }, { suit: '♦', value: '6' }];
+
+        const state = engine.getState();
+        expect(state.playerScores).toHaveLength(1);
+        expect(state.playerScores[0].value).toBe(20);
+        expect(state.dealerScore).toEqual({ value: 17, softAces: 1, cardCount: 2 });
+    });
+
+    it('counts the hole card only once it is revealed', () => {
+        mockDeckInstance.draw
+            .mockReturnValueOnce({ suit: '♠', value: '9' })
+            .mockReturnValueOnce({ suit: '♥', value: '10' })
+            .mockReturnValueOnce({ suit: '♣', value: '7' })
+            .mockReturnValueOnce({ suit: '♦', value: '5' });
+        engine.startGame(100);
+
+        expect(mockDeckInstance.draw).toHaveBeenLastCalledWith(true);
+        expect(mockDeckInstance.revealCard).not.toHaveBeenCalled();
+
+        engine.dealerRevealed = true;
+        engine.dealerRevealed = true;
+        expect(mockDeckInstance.revealCard).toHaveBeenCalledTimes(1);
+        expect(mockDeckInstance.revealCard).toHaveBeenCalledWith({ suit: '♦', value: '5' });
+    });
 });
@@ -0,0 +1,141 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { CanvasWorkerClient } from '../../src/ui/modules/CanvasWorkerClient.js';
+import { UIManager } from '../../src/ui/UIManager.js';
+
+function createCanvas() {
+    return {
+        width: 280,
+        height: 100,
+        transferControlToOffscreen: vi.fn(() => ({ offscreen: true })),
+        getContext: vi.fn(() => new Proxy({}, { get: (target, key) => target[key] || vi.fn() })),
+    };
+}
+
+describe('CanvasWorkerClient', () => {
+    let worker;
+    let client;
+
+    beforeEach(() => {
+        worker = { postMessage: vi.fn(), terminate: vi.fn() };
+        client = new CanvasWorkerClient(() => worker);
+        worker.onmessage({ data: { type: 'ready' } });
+    });
+
+    it('transfers each canvas once', () => {
+        const canvas = createCanvas();
+        client.attach('winrate', canvas);
+        client.attach('winrate', canvas);
+
+        expect(canvas.transferControlToOffscreen).toHaveBeenCalledTimes(1);
+        expect(worker.postMessage).toHaveBeenCalledTimes(1);
+        const [msg, transfer] = worker.postMessage.mock.calls[0];
+        expect(msg).toMatchObject({ type: 'attach', name: 'winrate' });
+        expect(transfer).toEqual([msg.canvas]);
+        expect(client.has('winrate')).toBe(true);
+    });
+
+    it('posts theme colours only when they change', () => {
+        client.setTheme({ win: '#0f0', lose: '#f00' });
+        client.setTheme({ win: '#0f0', lose: '#f00' });
+        client.setTheme({ win: '#0a0', lose: '#f00' });
+
+        const themes = worker.postMessage.mock.calls.filter(([msg]) => msg.type === 'theme');
+        expect(themes).toHaveLength(2);
+    });
+
+    it('hands transferred canvases back when the worker fails', () => {
+        const onError = vi.fn();
+        const failing = { postMessage: vi.fn(), terminate: vi.fn() };
+        const failingClient = new CanvasWorkerClient(() => failing, { onError });
+        expect(failingClient.ready).toBe(false);
+        failing.onmessage({ data: { type: 'ready' } });
+        const canvas = createCanvas();
+        failingClient.attach('streak', canvas);
+
+        const event = { preventDefault: vi.fn() };
+        failing.onerror(event);
+
+        expect(event.preventDefault).toHaveBeenCalled();
+        expect(failing.terminate).toHaveBeenCalled();
+        expect(onError).toHaveBeenCalledWith(event, [canvas]);
+        expect(failingClient.ready).toBe(false);
+        expect(failingClient.has('streak')).toBe(false);
+    });
+});
+
+describe('UIManager stats charts', () => {
+    let ui;
+    const stats = { winRate: 60, longestWinStreak: 4, longestLossStreak: 2, history: [1, 2, 3] };
+
+    beforeEach(() => {
+        ui = new UIManager();
+        ui.elements = { statsChartWinrate: createCanvas(), statsChartStreak: createCanvas() };
+        global.window = {
+            getComputedStyle: vi.fn(() => ({ getPropertyValue: () => '' })),
+        };
+        global.document = { body: {} };
+    });
+
+    it('draws on the main thread without a worker and reads theme colours once', () => {
+        ui.canvasWorker = null;
+        ui._renderStatsCharts(stats);
+        ui._renderStatsCharts(stats);
+
+        expect(window.getComputedStyle).toHaveBeenCalledTimes(1);
+        expect(ui.elements.statsChartWinrate.getContext).toHaveBeenCalledTimes(2);
+    });
+
+    it('draws on the main thread until the worker has loaded, then keeps those canvases there', () => {
+        const worker = { postMessage: vi.fn(), terminate: vi.fn() };
+        ui.canvasWorker = new CanvasWorkerClient(() => worker);
+        ui._renderStatsCharts(stats);
+        worker.onmessage({ data: { type: 'ready' } });
+        ui._renderStatsCharts(stats);
+
+        expect(worker.postMessage).not.toHaveBeenCalled();
+        expect(ui.elements.statsChartWinrate.transferControlToOffscreen).not.toHaveBeenCalled();
+        expect(ui.elements.statsChartWinrate.getContext).toHaveBeenCalledTimes(2);
+    });
+
+    it('swaps in fresh canvases when the worker fails after taking them', () => {
+        const worker = { postMessage: vi.fn(), terminate: vi.fn() };
+        ui.canvasWorker = new CanvasWorkerClient(() => worker, {
+            onError: (err, canvases) => ui._onCanvasWorkerError(err, canvases),
+        });
+        worker.onmessage({ data: { type: 'ready' } });
+        const transferred = ui.elements.statsChartWinrate;
+        const fresh = createCanvas();
+        transferred.cloneNode = vi.fn(() => fresh);
+        transferred.replaceWith = vi.fn();
+        ui.elements.statsChartStreak.cloneNode = vi.fn(() => createCanvas());
+        ui.elements.statsChartStreak.replaceWith = vi.fn();
+        ui._renderStatsCharts(stats);
+
+        const warn = vi.spyOn(console, 'warn').mockImplementation(() => {});
+        worker.onerror({});
+        warn.mockRestore();
+        ui._renderStatsCharts(stats);
+
+        expect(transferred.replaceWith).toHaveBeenCalledWith(fresh);
+        expect(ui.elements.statsChartWinrate).toBe(fresh);
+        expect(ui.canvasWorker).toBeNull();
+        expect(fresh.getContext).toHaveBeenCalledTimes(1);
+    });
+
+    it('hands the chart canvases to the worker when one is available', () => {
+        const worker = { postMessage: vi.fn(), terminate: vi.fn() };
+        ui.canvasWorker = new CanvasWorkerClient(() => worker);
+        worker.onmessage({ data: { type: 'ready' } });
+        ui._renderStatsCharts(stats);
+        ui._renderStatsCharts(stats);
+
+        const types = worker.postMessage.mock.calls.map(([msg]) => msg.type);
+        expect(types).toEqual(['attach', 'attach', 'theme', 'stats', 'stats']);
+        expect(worker.postMessage.mock.calls[3][0].stats).toEqual({
+            winRate: 60,
+            longestWinStreak: 4,
+            longestLossStreak: 2,
+        });
+        expect(ui.elements.statsChartWinrate.getContext).not.toHaveBeenCalled();
+    });
+});
@@ -0,0 +1,84 @@
+import { describe, it, expect } from 'vitest';
+import * as CardCodes from '../../src/utils/CardCodes.js';
+import * as HandUtils from '../../src/utils/HandUtils.js';
+import { Deck } from '../../src/core/Deck.js';
+
+const c = (value, suit = '♠') => ({ value, suit });
+const codes = (...cards) => CardCodes.encodeCards(cards);
+
+describe('CardCodes', () => {
+    it('round-trips every card through its code', () => {
+        for (const suit of CardCodes.SUITS) {
+            for (const value of CardCodes.RANKS) {
+                const code = CardCodes.encodeCard(c(value, suit));
+                expect(code).toBeGreaterThanOrEqual(0);
+                expect(code).toBeLessThan(52);
+                expect(CardCodes.decodeCard(code)).toEqual({ suit, value });
+            }
+        }
+        expect(CardCodes.encodeCard(c('X'))).toBe(-1);
+    });
+
+    it('lookup tables agree with the object-based helpers', () => {
+        for (let code = 0; code < CardCodes.CARD_CODE_COUNT; code++) {
+            const card = CardCodes.decodeCard(code);
+            expect(CardCodes.CODE_VALUE[code]).toBe(HandUtils.getCardNumericValue(card));
+            expect(HandUtils.getHiLoValueCode(code)).toBe(HandUtils.getHiLoValue(card));
+        }
+    });
+
+    it('integer hand helpers match the object versions', () => {
+        const hands = [
+            [c('A'), c('K')],
+            [c('A'), c('5'), c('8')],
+            [c('A'), c('A')],
+            [c('8'), c('8')],
+            [c('10'), c('6'), c('9')],
+            [c('A'), c('6')]
+        ];
+        for (const hand of hands) {
+            const encoded = CardCodes.encodeCards(hand);
+            expect(HandUtils.calculateHandValueCodes(encoded)).toBe(HandUtils.calculateHandValue(hand));
+            expect(HandUtils.isSoftHandCodes(encoded)).toBe(HandUtils.isSoftHand(hand));
+            expect(HandUtils.isNaturalBlackjackCodes(encoded, 1)).toBe(HandUtils.isNaturalBlackjack(hand, 1));
+            expect(HandUtils.classifyHandCodes(encoded).type).toBe(HandUtils.classifyHand(hand).type);
+        }
+        expect(HandUtils.classifyHandCodes(codes(c('8'), c('8', '♥'))).pairValue).toBe(7);
+        expect(HandUtils.isNaturalBlackjackCodes(codes(c('A'), c('J')), 2)).toBe(false);
+    });
+});
+
+describe('Deck (compact)', () => {
+    it('keeps a Uint8Array shoe and deals the usual card objects', () => {
+        const deck = new Deck(6, { compact: true });
+        expect(deck.codes).toBeInstanceOf(Uint8Array);
+        expect(deck.remainingCards).toBe(312);
+
+        const card = deck.draw();
+        expect(CardCodes.RANKS).toContain(card.value);
+        expect(CardCodes.SUITS).toContain(card.suit);
+        expect(deck.remainingCards).toBe(311);
+
+        const code = deck.drawCode();
+        expect(code).toBeLessThan(52);
+        expect(deck.remainingCards).toBe(310);
+    });
+
+    it('holds every card exactly numberOfDecks times after a casino shuffle', () => {
+        const deck = new Deck(2, { compact: true, shuffleMode: 'casino' });
+        const counts = new Array(52).fill(0);
+        deck.codes.forEach((code) => counts[code]++);
+        expect(counts.every((n) => n === 2)).toBe(true);
+    });
+
+    it('burns cards and reshuffles when empty', () => {
+        const deck = new Deck(1, { compact: true });
+        expect(deck.burnCards(2)).toBe(2);
+        expect(deck.remainingCards).toBe(50);
+        for (let i = 0; i < 50; i++) deck.draw();
+        expect(deck.remainingCards).toBe(0);
+        deck.draw();
+        expect(deck.remainingCards).toBeLessThan(52);
+        expect(deck.remainingCards).toBeGreaterThan(40);
+    });
+});
@@ -0,0 +1,86 @@
+import { describe, it, expect } from 'vitest';
+import { CardCounter, COUNT_SYSTEMS } from '../../src/core/CardCounter.js';
+import { Deck } from '../../src/core/Deck.js';
+import { BlackjackEngine } from '../../src/core/BlackjackEngine.js';
+import { getHiLoValue } from '../../src/utils/HandUtils.js';
+import { RANKS } from '../../src/utils/CardCodes.js';
+
+describe('CardCounter', () => {
+    it('ships balanced tag tables that sum to zero over a deck', () => {
+        for (const system of Object.values(COUNT_SYSTEMS)) {
+            const sum = Array.from(system.tags).reduce((a, b) => a + b, 0) * 4;
+            expect(sum === 0).toBe(system.balanced);
+        }
+    });
+
+    it('matches HandUtils.getHiLoValue for every rank', () => {
+        const counter = new CardCounter(1);
+        RANKS.forEach((value, rank) => {
+            expect(counter.tags[rank]).toBe(getHiLoValue({ value, suit: '♠' }));
+        });
+    });
+
+    it('tracks running count, true count and ranks remaining', () => {
+        const counter = new CardCounter(2);
+        ['2', '5', 'K', '6', '3'].forEach((value) => counter.countCard({ value, suit: '♥' }));
+        expect(counter.runningCount).toBe(3);
+        expect(counter.cardsSeen).toBe(5);
+        expect(counter.trueCount).toBeCloseTo(3 / (99 / 52));
+        expect(counter.remainingByRank[12]).toBe(7);
+    });
+
+    it('starts KO at its pivot offset', () => {
+        expect(new CardCounter(6, 'ko').runningCount).toBe(-20);
+        expect(new CardCounter(6, 'unknown').systemKey).toBe('hilo');
+    });
+
+    it('never wraps ranks remaining below zero', () => {
+        const counter = new CardCounter(1);
+        for (let i = 0; i < 5; i++) counter.countCard({ value: 'A', suit: '♠' });
+        expect(counter.remainingByRank[0]).toBe(0);
+    });
+});
+
+describe('Deck counting', () => {
+    function fullShoeCount(deck) {
+        while (deck.remainingCards > 0) deck.draw();
+        return deck.counter;
+    }
+
+    it('counts every face-up draw in both shoe representations', () => {
+        for (const compact of [false, true]) {
+            const counter = fullShoeCount(new Deck(1, { compact, countSystem: 'omega2' }));
+            expect(counter.runningCount).toBe(0);
+            expect(counter.cardsSeen).toBe(52);
+            expect(Array.from(counter.remainingByRank).every((n) => n === 0)).toBe(true);
+        }
+    });
+
+    it('leaves face-down cards out until revealed and restarts on reset', () => {
+        const deck = new Deck(1);
+        const card = deck.draw(true);
+        expect(deck.counter.cardsSeen).toBe(0);
+        deck.revealCard(card);
+        expect(deck.counter.cardsSeen).toBe(1);
+        deck.reset();
+        expect(deck.counter.cardsSeen).toBe(0);
+    });
+
+    it('counts the dealer hole card when the engine reveals it', () => {
+        const engine = new BlackjackEngine({ numberOfDecks: 1 });
+        engine.startGame(10);
+        expect(engine.getState().count.cardsSeen).toBe(3);
+        engine.dealerRevealed = true;
+        expect(engine.getState().count.cardsSeen).toBe(4);
+    });
+
+    it('skips a hole card dealt before the shoe ran out mid-round', () => {
+        const engine = new BlackjackEngine({ numberOfDecks: 1 });
+        engine.startGame(10);
+        engine.deck.cards = [];
+        engine.hit(0);
+        expect(engine.getState().count.cardsSeen).toBe(1);
+        engine.dealerRevealed = true;
+        expect(engine.getState().count.cardsSeen).toBe(1);
+    });
+});
@@ -0,0 +1,169 @@
+import { describe, it, expect, beforeEach } from 'vitest';
+import { CardPool } from '../../src/ui/modules/CardPool.js';
+import { UIManager } from '../../src/ui/UIManager.js';
+
+class FakeNode {
+    constructor(className = '') {
+        this.className = className;
+        this.children = [];
+        this.parentNode = null;
+        this.style = {};
+        this.attributes = {};
+        this.textContent = '';
+        const classes = new Set();
+        this.classList = {
+            toggle: (cls, on) => (on ? classes.add(cls) : classes.delete(cls)),
+            add: (cls) => classes.add(cls),
+            remove: (cls) => classes.delete(cls),
+            contains: (cls) => classes.has(cls),
+        };
+    }
+
+    get lastChild() {
+        return this.children[this.children.length - 1] || null;
+    }
+
+    set innerHTML(_value) {
+        this.children.forEach((child) => (child.parentNode = null));
+        this.children = [];
+    }
+
+    setAttribute(name, value) {
+        this.attributes[name] = value;
+    }
+
+    appendChild(child) {
+        child.parentNode = this;
+        this.children.push(child);
+        return child;
+    }
+
+    replaceChild(next, prev) {
+        const i = this.children.indexOf(prev);
+        prev.parentNode = null;
+        next.parentNode = this;
+        this.children[i] = next;
+        return prev;
+    }
+
+    removeChild(child) {
+        this.children.splice(this.children.indexOf(child), 1);
+        child.parentNode = null;
+        return child;
+    }
+
+    querySelectorAll(selector) {
+        const cls = selector.slice(1);
+        const found = [];
+        const walk = (node) =>
+            node.children.forEach((child) => {
+                if (child.className.split(' ').includes(cls)) found.push(child);
+                walk(child);
+            });
+        walk(this);
+        return found;
+    }
+
+    querySelector(selector) {
+        return this.querySelectorAll(selector)[0] || null;
+    }
+
+    cloneNode() {
+        const card = new FakeNode('card');
+        const inner = card.appendChild(new FakeNode('card-inner'));
+        const front = inner.appendChild(new FakeNode('card-face card-front'));
+        ['suit', 'suit-bottom', 'value'].forEach((cls) => front.appendChild(new FakeNode(cls)));
+        inner.appendChild(new FakeNode('card-face card-back'));
+        return card;
+    }
+}
+
+const fakeDocument = {
+    createElement: (tag) => (tag === 'template' ? { content: { firstElementChild: new FakeNode() } } : new FakeNode()),
+};
+
+const c = (value, suit) => ({ value, suit });
+
+describe('CardPool', () => {
+    let pool;
+
+    beforeEach(() => {
+        pool = new CardPool(fakeDocument);
+    });
+
+    it('fills a cloned card and keeps its identity on the element', () => {
+        const el = pool.acquire(c('A', '♥'));
+
+        expect(el._cardKey).toBe('A♥');
+        expect(el.querySelector('.value').textContent).toBe('A');
+        expect(el.querySelector('.card-front').className).toBe('card-face card-front red');
+        expect(el.attributes['aria-label']).toBe('A de Copas');
+
+        pool.setHidden(el, true);
+        expect(el.classList.contains('flipped')).toBe(true);
+        expect(el.attributes['aria-label']).toBe('Carta virada');
+    });
+
+    it('reuses the node for the same card first, then any pooled node', () => {
+        const ace = pool.acquire(c('A', '♠'));
+        const king = pool.acquire(c('K', '♣'));
+        pool.release(ace);
+        pool.release(king);
+
+        expect(pool.acquire(c('K', '♣'))).toBe(king);
+        const reused = pool.acquire(c('7', '♦'));
+        expect(reused).toBe(ace);
+        expect(reused._cardKey).toBe('7♦');
+        expect(reused.querySelector('.suit').textContent).toBe('♦');
+        expect(pool.created).toBe(2);
+    });
+});
+
+describe('UIManager card rendering', () => {
+    let ui;
+    let dealer;
+    let player;
+
+    beforeEach(() => {
+        global.document = fakeDocument;
+        ui = new UIManager();
+        ui.cardPool = new CardPool(fakeDocument);
+        dealer = new FakeNode('cards');
+        player = new FakeNode('cards');
+        ui.elements = { dealerCards: dealer, playerCards: player };
+    });
+
+    const playRound = (dealerCards, hands) => {
+        ui.renderHand(dealer, dealerCards, true, false);
+        ui.renderPlayerHands(hands, 0);
+        ui.renderHand(dealer, dealerCards, true, true);
+        ui.renderHand(dealer, [], true, true);
+        ui.renderPlayerHands([], 0);
+    };
+
+    it('keeps elements of cards already on the table', () => {
+        ui.renderHand(dealer, [c('9', '♠'), c('5', '♥')], true, false);
+        const [first, hole] = dealer.children;
+        expect(hole.classList.contains('flipped')).toBe(true);
+
+        ui.renderHand(dealer, [c('9', '♠'), c('5', '♥'), c('2', '♣')], true, true);
+        expect(dealer.children[0]).toBe(first);
+        expect(dealer.children[1]).toBe(hole);
+        expect(hole.classList.contains('flipped')).toBe(false);
+    });
+
+    it('creates no new card nodes in steady state across split rounds', () => {
+        const split = [
+            { cards: [c('8', '♠'), c('3', '♦'), c('Q', '♥')], bet: 10 },
+            { cards: [c('8', '♥'), c('A', '♣')], bet: 10 },
+        ];
+        playRound([c('6', '♠'), c('J', '♦')], split);
+        const created = ui.cardPool.created;
+
+        playRound([c('2', '♥'), c('4', '♣')], [{ cards: [c('K', '♠'), c('K', '♦')], bet: 10 }]);
+        playRound([c('10', '♣'), c('7', '♥')], split);
+
+        expect(ui.cardPool.created).toBe(created);
+        expect(player.children).toHaveLength(0);
+    });
+});
@@ -0,0 +1,92 @@
+import { describe, it, expect } from 'vitest';
+import { CompositionSolver } from '../../src/utils/CompositionSolver.js';
+import { LRUCache } from '../../src/utils/LRUCache.js';
+import { createShoeComposition } from '../../src/utils/StrategyEV.js';
+import { evaluateActionWithEVs } from '../../src/utils/BasicStrategy.js';
+import { Deck } from '../../src/core/Deck.js';
+import { RULES } from '../../src/core/Constants.js';
+
+const vegasStrip = RULES.PROFILES.vegas_strip;
+const c = (value, suit = '♠') => ({ value, suit });
+
+function solverFor(decks, seen) {
+    const solver = new CompositionSolver();
+    solver.setComposition(createShoeComposition(decks));
+    seen.forEach((card) => solver.removeCard(card));
+    return solver;
+}
+
+describe('LRUCache', () => {
+    it('evicts the least recently used entry', () => {
+        const cache = new LRUCache(2);
+        cache.set('a', 1);
+        cache.set('b', 2);
+        cache.get('a');
+        cache.set('c', 3);
+        expect(cache.has('a')).toBe(true);
+        expect(cache.has('b')).toBe(false);
+        expect(cache.size).toBe(2);
+    });
+});
+
+describe('CompositionSolver', () => {
+    it('recommends standing on 16 vs 10 when the shoe is rich in tens', () => {
+        const player = [c('10'), c('6')];
+        const up = c('10');
+        // Strip most small cards out of a single deck.
+        const solver = solverFor(1, [...player, up]);
+        for (let r = 1; r <= 5; r++) {
+            for (let i = 0; i < 3; i++) solver.removeCard(r);
+        }
+        const result = solver.solve(player, up, vegasStrip, { canSurrender: false });
+        expect(result.bestAction).toBe('stand');
+    });
+
+    it('caches dealer distributions by composition and upcard', () => {
+        const player = [c('9'), c('7')];
+        const up = c('6');
+        const solver = solverFor(6, [...player, up]);
+        solver.solve(player, up, vegasStrip);
+        solver.solve(player, up, vegasStrip);
+        expect(solver.dealerCache.hits).toBeGreaterThan(0);
+
+        solver.removeCard(c('5'));
+        const missesBefore = solver.dealerCache.misses;
+        solver.solve(player, up, vegasStrip);
+        expect(solver.dealerCache.misses).toBe(missesBefore + 1);
+    });
+
+    it('answers within one animation frame on a six-deck shoe', () => {
+        const player = [c('2'), c('3')];
+        const up = c('2');
+        const solver = solverFor(6, [...player, up]);
+        solver.solve(player, up, vegasStrip); // warm up
+        solver.removeCard(c('K'));
+        solver.solve(player, up, vegasStrip);
+        expect(solver.lastSolveMs).toBeLessThan(16);
+    });
+
+    it('builds evaluations with the usual shape', () => {
+        const player = [c('6'), c('5')];
+        const up = c('6');
+        const solver = solverFor(6, [...player, up]);
+        const { evByAction, bestAction } = solver.solve(player, up, vegasStrip);
+        expect(bestAction).toBe('double');
+        const evaluation = evaluateActionWithEVs('stand', evByAction, bestAction);
+        expect(evaluation.isOptimal).toBe(false);
+        expect(evaluation.evLoss).toBeGreaterThan(0.5);
+        expect(evaluation.recommended).toBe('double');
+    });
+});
+
+describe('Deck.getComposition', () => {
+    it('counts remaining cards per rank with tens grouped', () => {
+        const deck = new Deck(2);
+        expect(deck.getComposition()).toEqual(createShoeComposition(2));
+        deck.draw();
+        expect(deck.getComposition().reduce((a, b) => a + b, 0)).toBe(103);
+
+        const compact = new Deck(2, { compact: true });
+        expect(compact.getComposition()).toEqual(createShoeComposition(2));
+    });
+});
@@ -0,0 +1,38 @@
+import { describe, it, expect, afterEach } from 'vitest';
+import { GameManager } from '../../src/core/GameManager.js';
+import { CONFIG } from '../../src/core/Constants.js';
+
+describe('GameManager advanced stats', () => {
+    afterEach(() => {
+        GameManager.instance = null;
+    });
+
+    it('counts every hand played, whenever the stats are first read', async () => {
+        GameManager.instance = null;
+        const game = new GameManager(null, null);
+        game.balance = 1000000;
+        game.persistenceService.supabase = null;
+        const hands = CONFIG.HAND_HISTORY_MAX_ENTRIES * 3;
+
+        await game.autoPlay({ hands, bet: 10 });
+
+        expect(game.handHistory.store.size).toBeLessThan(hands);
+        expect(game.getAdvancedStats().handsPlayed).toBe(hands);
+    });
+
+    it('replays the history when it is replaced, not when it is read', () => {
+        GameManager.instance = null;
+        const game = new GameManager(null, null);
+        const entry = (handNumber, result) => ({ handNumber, result, betAmount: 10, netChange: result === 'win' ? 10 : -10 });
+        game.events.emit('hand:completed', entry(1, 'win'));
+        expect(game.advancedStats.handsPlayed).toBe(1);
+
+        game.handHistory.entries = [entry(3, 'lose'), entry(2, 'lose')];
+        game.handHistory.markReplaced();
+        expect(game.advancedStats.handsPlayed).toBe(2);
+        expect(game.getAdvancedStats().handsPlayed).toBe(2);
+
+        game.handHistory.clear();
+        expect(game.advancedStats.handsPlayed).toBe(0);
+    });
+});
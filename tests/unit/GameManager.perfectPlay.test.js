@@ -0,0 +1,45 @@
+import { describe, it, expect, vi, afterEach } from 'vitest';
+import { GameManager } from '../../src/core/GameManager.js';
+import { Deck } from '../../src/core/Deck.js';
+import { getActiveRuleProfile } from '../../src/core/Constants.js';
+import { getEVRankIndex } from '../../src/utils/StrategyEV.js';
+
+describe('GameManager perfect play', () => {
+    afterEach(() => {
+        GameManager.instance = null;
+    });
+
+    it('reads the shoe composition once per shoe and follows the cards dealt after that', () => {
+        GameManager.instance = null;
+        const game = new GameManager(null, null);
+        const engine = game.engine;
+        const deck = engine.deck;
+        const getComposition = vi.spyOn(deck, 'getComposition');
+        const profile = getActiveRuleProfile();
+        const available = { canDouble: false, canSurrender: false };
+        // The shoe plus the unrevealed hole card, recomputed from scratch.
+        const unseen = () => {
+            const counts = Deck.prototype.getComposition.call(deck);
+            if (!engine.dealerRevealed) counts[getEVRankIndex(engine.dealerHand[1])]++;
+            return counts;
+        };
+        const evaluate = () => {
+            game._evaluatePerfectPlay('stand', engine.playerHands[0], engine.dealerHand[0], profile, false, available);
+            expect(Array.from(game.compositionSolver.comp)).toEqual(unseen());
+        };
+
+        for (let round = 0; round < 8; round++) {
+            engine.startGame(10);
+            evaluate();
+            engine.hit(0);
+            evaluate();
+            engine.dealerTurn();
+        }
+        expect(getComposition).toHaveBeenCalledTimes(1);
+
+        engine.shuffleDeck();
+        engine.startGame(10);
+        evaluate();
+        expect(getComposition).toHaveBeenCalledTimes(2);
+    });
+});
@@ -105,6 +105,17 @@ describe('HandHistory', () => {
             );
         });
 
+        it('writes only the newest maxEntries hands after older pages were loaded', () => {
+            for (let i = 11; i <= 15; i++) history.addHand(makeEntry(i));
+            history.store.appendOlder([10, 9, 8, 7, 6, 5, 4, 3].map(makeEntry));
+            history.addHand(makeEntry(16));
+            expect(history.entries.length).toBe(13);
+
+            history.saveToLocalStorage('test-key');
+            const saved = StorageManager.set.mock.calls[0][1].entries;
+            expect(saved.map((e) => e.handNumber)).toEqual([16, 15, 14, 13, 12]);
+        });
+
         it('does nothing when storageKey is null or empty', () => {
             history.saveToLocalStorage(null);
             expect(StorageManager.set).not.toHaveBeenCalled();
@@ -132,22 +143,134 @@ describe('HandHistory', () => {
 
 
     describe('Supabase sync', () => {
-        it('ignores PGRST116 on load without showing sync notice', async () => {
-            const onSyncNotice = vi.fn();
-            const supabase = {
-                from: vi.fn(() => ({
-                    select: vi.fn(() => ({
-                        eq: vi.fn(() => ({
-                            single: vi.fn(async () => ({ data: null, error: { code: 'PGRST116' } })),
-                        })),
+        // Rows must be sorted newest first by (hand_number, device_id).
+        function pagedSupabase(rows, calls = []) {
+            const from = vi.fn(() => {
+                const filters = [];
+                const query = {
+                    select: vi.fn(() => query),
+                    eq: vi.fn(() => query),
+                    in: vi.fn((column, values) => {
+                        filters.push((row) => values.includes(row[column]));
+                        return query;
+                    }),
+                    or: vi.fn((expr) => {
+                        calls.push(['or', expr]);
+                        const [, hand, device] = expr.match(/^hand_number\.lt\.(\d+),and\(hand_number\.eq\.\d+,device_id\.lt\."(.*)"\)$/);
+                        filters.push((row) => row.hand_number < Number(hand) ||
+                            (row.hand_number === Number(hand) && row.device_id < device));
+                        return query;
+                    }),
+                    order: vi.fn(() => query),
+                    limit: vi.fn(async (n) => ({
+                        data: rows.filter((row) => filters.every((filter) => filter(row))).slice(0, n),
+                        error: null,
                     })),
-                })),
-            };
+                };
+                return query;
+            });
+            return { from };
+        }
+
+        it('keeps local history without a sync notice when the cloud has no hands', async () => {
+            const onSyncNotice = vi.fn();
+            const { from } = pagedSupabase([]);
 
             const cloudHistory = new HandHistory(5, onSyncNotice);
-            await cloudHistory.loadFromSupabase(supabase, 'user-id');
+            cloudHistory.addHand(makeEntry(1));
+            await cloudHistory.loadFromSupabase({ from }, 'user-id');
 
             expect(onSyncNotice).not.toHaveBeenCalled();
+            expect(cloudHistory.entries.map(e => e.handNumber)).toEqual([1]);
+        });
+
+        it('loads cloud history page by page with a hand-number cursor', async () => {
+            const rows = [9, 8, 7, 6, 5, 4, 3].map(n => ({ hand_number: n, device_id: 'legacy', hand: makeEntry(n) }));
+            const calls = [];
+            const { from } = pagedSupabase(rows, calls);
+
+            const cloudHistory = new HandHistory(3);
+            await cloudHistory.loadFromSupabase({ from }, 'user-id');
+            expect(cloudHistory.entries.map(e => e.handNumber)).toEqual([9, 8, 7]);
+            expect(cloudHistory.syncedThrough).toBe(9);
+
+            const hasMore = await cloudHistory.loadMoreFromSupabase({ from }, 'user-id');
+            expect(calls).toEqual([['or', 'hand_number.lt.7,and(hand_number.eq.7,device_id.lt."legacy")']]);
+            expect(hasMore).toBe(true);
+            expect(cloudHistory.entries.map(e => e.handNumber)).toEqual([9, 8, 7, 6, 5, 4]);
+        });
+
+        it('does not skip hands that share a hand number across a page boundary', async () => {
+            const rows = [[5, 'b'], [5, 'a'], [4, 'b'], [4, 'a'], [3, 'b']].map(([n, device]) => ({
+                hand_number: n, device_id: device, hand: makeEntry(n),
+            }));
+            const { from } = pagedSupabase(rows);
+
+            const cloudHistory = new HandHistory(3);
+            await cloudHistory.loadFromSupabase({ from }, 'user-id', 'a');
+            const hasMore = await cloudHistory.loadMoreFromSupabase({ from }, 'user-id', 'a');
+
+            expect(hasMore).toBe(false);
+            expect(cloudHistory.entries.map(e => [e.handNumber, e.deviceId])).toEqual([
+                [5, 'b'], [5, undefined], [4, 'b'], [4, undefined], [3, 'b'],
+            ]);
+        });
+
+        it('keeps every offline hand of this device and sends only those', async () => {
+            const rows = [
+                ...[10, 9, 8].map(n => ({ hand_number: n, device_id: 'b', hand: makeEntry(n) })),
+                ...[4, 3].map(n => ({ hand_number: n, device_id: 'a', hand: makeEntry(n) })),
+            ];
+            const { from } = pagedSupabase(rows);
+
+            const cloudHistory = new HandHistory(3);
+            [3, 4, 5, 6, 7].forEach(n => cloudHistory.addHand(makeEntry(n)));
+            await cloudHistory.loadFromSupabase({ from }, 'user-id', 'a');
+
+            expect(cloudHistory.syncedThrough).toBe(4);
+            expect(cloudHistory.entries.map(e => e.handNumber)).toEqual([10, 9, 8, 7, 6, 5]);
+
+            const upsert = vi.fn(async () => ({ error: null }));
+            await cloudHistory.saveToSupabase({ from: vi.fn(() => ({ upsert })) }, 'user-id', 'a');
+            expect(upsert.mock.calls[0][0].map(row => [row.hand_number, row.device_id])).toEqual([
+                [5, 'a'], [6, 'a'], [7, 'a'],
+            ]);
+            expect(cloudHistory.syncedThrough).toBe(7);
+        });
+
+        it('sends only hands played since the last successful save', async () => {
+            const upsert = vi.fn(async () => ({ error: null }));
+            const supabase = { from: vi.fn(() => ({ upsert })) };
+
+            const cloudHistory = new HandHistory(5);
+            cloudHistory.addHand(makeEntry(1));
+            cloudHistory.addHand(makeEntry(2));
+            await cloudHistory.saveToSupabase(supabase, 'user-id');
+            cloudHistory.addHand(makeEntry(3));
+            await cloudHistory.saveToSupabase(supabase, 'user-id');
+            await cloudHistory.saveToSupabase(supabase, 'user-id');
+
+            expect(supabase.from).toHaveBeenCalledWith('hand_events');
+            expect(upsert).toHaveBeenCalledTimes(2);
+            expect(upsert.mock.calls[0][0].map(row => row.hand_number)).toEqual([1, 2]);
+            expect(upsert.mock.calls[1][0].map(row => row.hand_number)).toEqual([3]);
+            expect(upsert.mock.calls[1][1]).toEqual({ onConflict: 'user_id,device_id,hand_number' });
+        });
+
+        it('resends unsaved hands after a failed save', async () => {
+            const upsert = vi.fn()
+                .mockResolvedValueOnce({ error: { code: 'XX000' } })
+                .mockResolvedValueOnce({ error: null });
+            const supabase = { from: vi.fn(() => ({ upsert })) };
+            vi.spyOn(console, 'error').mockImplementation(() => {});
+
+            const cloudHistory = new HandHistory(5, vi.fn());
+            cloudHistory.addHand(makeEntry(1));
+            await cloudHistory.saveToSupabase(supabase, 'user-id');
+            await cloudHistory.saveToSupabase(supabase, 'user-id');
+
+            expect(upsert.mock.calls[1][0].map(row => row.hand_number)).toEqual([1]);
+            expect(cloudHistory.syncedThrough).toBe(1);
         });
 
         it('shows friendly warning for schema errors when saving', async () => {
@@ -177,6 +300,7 @@ describe('HandHistory', () => {
             };
 
             const cloudHistory = new HandHistory(5, onSyncNotice);
+            cloudHistory.addHand(makeEntry(1));
             await cloudHistory.saveToSupabase(supabase, 'user-id');
 
             expect(onSyncNotice).toHaveBeenCalledWith('Erro ao salvar histórico na nuvem.', 'error');
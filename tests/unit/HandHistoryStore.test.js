@@ -0,0 +1,78 @@
+import { describe, it, expect } from 'vitest';
+import { HandHistoryStore } from '../../src/utils/HandHistoryStore.js';
+
+const card = (value, suit = '♠') => ({ suit, value });
+
+function makeEntry(n, overrides = {}) {
+    return {
+        handNumber: n,
+        timestamp: 1700000000000 + n,
+        playerCards: [[card('9'), card('7', '♥')]],
+        dealerCards: [card('10', '♦'), card('8', '♣')],
+        dealerUpCard: card('10', '♦'),
+        actions: ['hit', 'stand'],
+        result: 'lose',
+        betAmount: 25,
+        netChange: -25,
+        hadBlackjack: false,
+        wasStrategyOptimal: null,
+        ...overrides,
+    };
+}
+
+describe('HandHistoryStore', () => {
+    it('decodes packed hands back to the original entries, newest first', () => {
+        const store = new HandHistoryStore(4);
+        const split = makeEntry(2, {
+            playerCards: [[card('8'), card('3', '♥'), card('K')], [card('8', '♦'), card('A', '♣')]],
+            dealerUpCard: card('Q', '♥'),
+            dealerCards: [card('Q', '♥'), card('6'), card('9', '♦')],
+            actions: ['split', 'hit', 'stand', 'stand'],
+            result: 'win',
+            netChange: 37.5,
+            wasStrategyOptimal: true,
+        });
+        store.push(makeEntry(1));
+        store.push(split);
+
+        expect(store.toArray()).toEqual([split, makeEntry(1)]);
+        expect(store.overflow.size).toBe(0);
+    });
+
+    it('overwrites the oldest slot once full and keeps indexes in sync', () => {
+        const store = new HandHistoryStore(3);
+        for (let n = 1; n <= 5; n++) store.push(makeEntry(n, { result: n % 2 ? 'win' : 'lose' }));
+
+        expect(store.toArray().map((e) => e.handNumber)).toEqual([5, 4, 3]);
+        expect(store.find({ result: 'win' }).map((e) => e.handNumber)).toEqual([5, 3]);
+        expect(store.count({ result: 'lose' })).toBe(1);
+    });
+
+    it('answers combined filters from the indexes', () => {
+        const store = new HandHistoryStore(100);
+        for (let n = 1; n <= 70; n++) {
+            store.push(makeEntry(n, {
+                actions: n % 5 === 0 ? ['split', 'stand', 'stand'] : ['stand'],
+                dealerUpCard: n % 2 ? card('K', '♥') : card('6', '♥'),
+            }));
+        }
+
+        const splitsVsTen = store.find({ action: 'split', dealerUpCard: 10 });
+        expect(splitsVsTen.map((e) => e.handNumber)).toEqual([65, 55, 45, 35, 25, 15, 5]);
+        expect(store.find({ action: 'split', dealerUpCard: 10 }, 2).map((e) => e.handNumber)).toEqual([65, 55]);
+        expect(store.count({ action: ['split', 'double'] })).toBe(0);
+        expect(store.count({ dealerUpCard: 6 })).toBe(35);
+    });
+
+    it('grows for older pages and keeps hands it cannot pack verbatim', () => {
+        const store = new HandHistoryStore(2);
+        store.push(makeEntry(9));
+        const legacy = { handNumber: 7, result: 'win', note: 'imported' };
+        store.appendOlder([makeEntry(8), legacy, makeEntry(6)]);
+
+        expect(store.capacity).toBeGreaterThanOrEqual(4);
+        expect(store.toArray().map((e) => e.handNumber)).toEqual([9, 8, 7, 6]);
+        expect(store.at(2)).toBe(legacy);
+        expect(store.find({ result: 'win' })).toEqual([legacy]);
+    });
+});
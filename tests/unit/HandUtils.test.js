@@ -203,3 +203,22 @@ describe('HandUtils', () => {
         });
     });
 });
+
+describe('running hand scores', () => {
+    it('matches getHandStats after every added card', () => {
+        const cards = [c('A'), c('A'), c('5'), c('K'), c('A'), c('3')];
+        const score = HandUtils.createHandScore();
+        cards.forEach((card, i) => {
+            HandUtils.addCardToScore(score, card);
+            const stats = HandUtils.getHandStats(cards.slice(0, i + 1));
+            expect(score.value).toBe(stats.value);
+            expect(score.softAces > 0).toBe(stats.isSoft);
+            expect(score.cardCount).toBe(i + 1);
+        });
+    });
+
+    it('builds a score from an existing hand', () => {
+        expect(HandUtils.createHandScore([c('A'), c('6')])).toEqual({ value: 17, softAces: 1, cardCount: 2 });
+        expect(HandUtils.createHandScore(null)).toEqual({ value: 0, softAces: 0, cardCount: 0 });
+    });
+});
@@ -0,0 +1,119 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { HistoryList } from '../../src/ui/modules/HistoryList.js';
+
+class FakeElement {
+    constructor() {
+        this.style = {};
+        this.children = [];
+        this.scrollTop = 0;
+        this.clientHeight = 320;
+        this.listeners = {};
+    }
+
+    set innerHTML(_value) {
+        this.children = [];
+    }
+
+    appendChild(child) {
+        this.children.push(child);
+        return child;
+    }
+
+    addEventListener(type, fn) {
+        this.listeners[type] = fn;
+    }
+
+    removeEventListener(type) {
+        delete this.listeners[type];
+    }
+}
+
+function makeList(entries, overrides = {}) {
+    const container = new FakeElement();
+    const options = {
+        getCount: () => entries.length,
+        getEntry: (i) => entries[i],
+        find: ({ result }) => entries.filter((e) => e.result === result),
+        loadOlder: vi.fn(async () => false),
+        createRow: vi.fn(() => new FakeElement()),
+        fillRow: vi.fn((row, entry) => {
+            row.handNumber = entry.handNumber;
+        }),
+        rowHeight: 32,
+        overscan: 2,
+        ...overrides,
+    };
+    const list = new HistoryList(container, options);
+    return { list, container, options };
+}
+
+const visibleHands = (list) =>
+    [...list.rows.entries()]
+        .sort((a, b) => parseFloat(a[1].style.transform.slice(11)) - parseFloat(b[1].style.transform.slice(11)))
+        .map(([entry]) => entry.handNumber);
+
+describe('HistoryList', () => {
+    let entries;
+
+    beforeEach(() => {
+        global.document = { createElement: () => new FakeElement() };
+        entries = Array.from({ length: 1000 }, (_, i) => ({
+            handNumber: 1000 - i,
+            result: i % 3 === 0 ? 'win' : 'lose',
+        }));
+    });
+
+    it('renders only the rows in and around the viewport', () => {
+        const { list, options } = makeList(entries);
+        list.render();
+
+        expect(list.spacer.style.height).toBe('32000px');
+        expect(options.createRow).toHaveBeenCalledTimes(13); // 10 visible + 1 partial + 2 overscan
+        expect(visibleHands(list).slice(0, 3)).toEqual([1000, 999, 998]);
+    });
+
+    it('recycles rows while scrolling instead of creating new ones', () => {
+        const { list, container, options } = makeList(entries);
+        list.render();
+        container.scrollTop = 32 * 500;
+        list.render();
+
+        expect(options.createRow).toHaveBeenCalledTimes(13 + 2);
+        expect(visibleHands(list)).toContain(500);
+        expect(visibleHands(list)).not.toContain(1000);
+    });
+
+    it('prepends a new hand without refilling rows already on screen', () => {
+        const { list, options } = makeList(entries);
+        list.render();
+        options.fillRow.mockClear();
+
+        entries.unshift({ handNumber: 1001, result: 'win' });
+        list.prepend(1);
+
+        expect(options.fillRow).toHaveBeenCalledTimes(1);
+        expect(options.fillRow.mock.calls[0][1].handNumber).toBe(1001);
+        expect(visibleHands(list).slice(0, 2)).toEqual([1001, 1000]);
+    });
+
+    it('keeps the scrolled view in place when a hand is prepended', () => {
+        const { list, container } = makeList(entries);
+        container.scrollTop = 320;
+        list.render();
+        entries.unshift({ handNumber: 1001, result: 'lose' });
+        list.prepend(1);
+
+        expect(container.scrollTop).toBe(352);
+    });
+
+    it('filters through the source and asks for older pages near the end', async () => {
+        const few = entries.slice(0, 9);
+        const { list, options } = makeList(few);
+        list.setFilter({ result: 'win' });
+
+        expect(visibleHands(list)).toEqual([1000, 997, 994]);
+        expect(options.loadOlder).toHaveBeenCalledTimes(1);
+        await Promise.resolve();
+        expect(list.hasMore).toBe(false);
+    });
+});
@@ -0,0 +1,35 @@
+import { describe, it, expect } from 'vitest';
+import { planShards, runParallelSimulation } from '../../src/core/ParallelSimulator.js';
+import { Deck } from '../../src/core/Deck.js';
+import { createSeededRandom } from '../../src/utils/RandomUtils.js';
+
+describe('ParallelSimulator', () => {
+    it('plans shards that cover every round exactly once', () => {
+        const shards = planShards({ hands: 25, seed: 7, shardSize: 10 });
+        expect(shards.map(s => s.rounds)).toEqual([10, 10, 5]);
+        expect(new Set(shards.map(s => s.seed)).size).toBe(3);
+    });
+
+    it('seeded decks deal the same shoe', () => {
+        const a = new Deck(2, { random: createSeededRandom(99) });
+        const b = new Deck(2, { random: createSeededRandom(99) });
+        expect(a.cards).toEqual(b.cards);
+        expect(a.cutCardPosition).toBe(b.cutCardPosition);
+    });
+
+    it('is reproducible for a master seed regardless of worker count', async () => {
+        const options = { hands: 6000, shardSize: 1000, seed: 2024, ruleProfile: 'european_no_hole_card' };
+        const single = await runParallelSimulation({ ...options, workers: 1 });
+        const multi = await runParallelSimulation({ ...options, workers: 3 });
+
+        expect(multi.workers).toBe(3);
+        expect(multi.rounds).toBe(6000);
+        expect(multi.net).toBe(single.net);
+        expect(multi.outcomes).toEqual(single.outcomes);
+        expect(multi.variance).toBe(single.variance);
+    });
+
+    it('rejects function policies, which cannot cross thread boundaries', async () => {
+        await expect(runParallelSimulation({ hands: 10, policy: () => 'stand' })).rejects.toThrow();
+    });
+});
@@ -0,0 +1,76 @@
+import { describe, it, expect, vi } from 'vitest';
+import { PerfTracer, instrumentMethods } from '../../src/utils/PerfTracer.js';
+import { PerfOverlay } from '../../src/ui/modules/PerfOverlay.js';
+
+function createClock() {
+    return { time: 0, timeOrigin: 1000, now() { return this.time; } };
+}
+
+describe('PerfTracer', () => {
+    it('only calls through while disabled and records spans once enabled', () => {
+        const clock = createClock();
+        const tracer = new PerfTracer({ clock });
+        const fn = vi.fn(() => 42);
+
+        expect(tracer.trace('Engine.hit', fn)).toBe(42);
+        expect(tracer.getSummary()).toEqual([]);
+
+        tracer.enabled = true;
+        for (let i = 1; i <= 100; i++) {
+            tracer.trace('Engine.hit', () => { clock.time += i; });
+        }
+        const [row] = tracer.getSummary();
+        expect(row).toMatchObject({ name: 'Engine.hit', count: 100, p50: 51, p95: 96 });
+        expect(fn).toHaveBeenCalledTimes(1);
+    });
+
+    it('times promises until they settle and passes the value through', async () => {
+        const clock = createClock();
+        const tracer = new PerfTracer({ clock });
+        tracer.enabled = true;
+
+        let resolve;
+        const pending = tracer.trace('HandHistory.saveToSupabase', () => new Promise((r) => { resolve = r; }));
+        clock.time = 25;
+        resolve('ok');
+
+        expect(await pending).toBe('ok');
+        expect(tracer.getSummary()[0]).toMatchObject({ count: 1, p50: 25 });
+    });
+
+    it('wraps methods keeping `this`, arguments and return values', () => {
+        const tracer = new PerfTracer({ clock: createClock() });
+        class Counter {
+            constructor() { this.total = 0; }
+            add(n) { this.total += n; return this.total; }
+        }
+        instrumentMethods(Counter.prototype, 'Counter', ['add', 'missing'], tracer);
+        const counter = new Counter();
+
+        expect(counter.add(2)).toBe(2);
+        tracer.enabled = true;
+        expect(counter.add(3)).toBe(5);
+        expect(tracer.getSummary().map((row) => row.name)).toEqual(['Counter.add']);
+    });
+
+    it('exports Chrome trace events in microseconds, oldest first', () => {
+        const clock = createClock();
+        const tracer = new PerfTracer({ clock, maxEvents: 2 });
+        tracer.enabled = true;
+        ['A.one', 'A.two', 'UIManager.render'].forEach((name, i) => {
+            clock.time = i * 10;
+            tracer.trace(name, () => { clock.time += 1.5; });
+        });
+
+        const trace = tracer.exportTrace({ renderStats: { performed: 1 } });
+        const spans = trace.traceEvents.filter((e) => e.ph === 'X');
+        expect(spans).toEqual([
+            { name: 'A.two', cat: 'A', ph: 'X', ts: 1010000, dur: 1500, pid: 1, tid: 1 },
+            { name: 'UIManager.render', cat: 'UIManager', ph: 'X', ts: 1020000, dur: 1500, pid: 1, tid: 1 },
+        ]);
+        expect(trace.metadata.renderStats).toEqual({ performed: 1 });
+
+        const overlay = new PerfOverlay(tracer, { getRenderStats: () => ({ performed: 3, requested: 9 }) });
+        expect(overlay.format()).toContain('renders: 3 / 9');
+    });
+});
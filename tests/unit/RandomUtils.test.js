@@ -53,3 +53,71 @@ describe('RandomUtils', () => {
         spy.mockRestore();
     });
 });
+
+describe('Seeded random sources', () => {
+    it('produces the same sequence for the same seed', () => {
+        const a = RandomUtils.createSeededRandom(1234);
+        const b = RandomUtils.createSeededRandom(1234);
+        for (let i = 0; i < 50; i++) {
+            expect(a.nextUint32()).toBe(b.nextUint32());
+        }
+    });
+
+    it('produces different sequences for different seeds', () => {
+        const a = RandomUtils.createSeededRandom(1);
+        const b = RandomUtils.createSeededRandom(2);
+        const seqA = Array.from({ length: 8 }, () => a.nextUint32());
+        const seqB = Array.from({ length: 8 }, () => b.nextUint32());
+        expect(seqA).not.toEqual(seqB);
+    });
+
+    it('getRandomInt draws from an injected source instead of crypto', () => {
+        const spy = vi.spyOn(crypto, 'getRandomValues');
+        const source = RandomUtils.createSeededRandom('shoe');
+        for (let i = 0; i < 100; i++) {
+            const val = RandomUtils.getRandomInt(13, source);
+            expect(val).toBeGreaterThanOrEqual(0);
+            expect(val).toBeLessThan(13);
+        }
+        expect(spy).not.toHaveBeenCalled();
+        spy.mockRestore();
+    });
+
+    it('derives stable, distinct child seeds', () => {
+        expect(RandomUtils.deriveSeed(42, 0)).toBe(RandomUtils.deriveSeed(42, 0));
+        expect(RandomUtils.deriveSeed(42, 0)).not.toBe(RandomUtils.deriveSeed(42, 1));
+        expect(RandomUtils.normalizeSeed('42')).toBe(42);
+    });
+});
+
+describe('Pooled random source', () => {
+    it('fills the pool with one crypto call and serves values from it', () => {
+        const spy = vi.spyOn(crypto, 'getRandomValues');
+        const pool = RandomUtils.createPooledRandom(64);
+        for (let i = 0; i < 64; i++) {
+            const val = RandomUtils.getRandomInt(52, pool);
+            expect(val).toBeGreaterThanOrEqual(0);
+            expect(val).toBeLessThan(52);
+        }
+        // Rejection sampling may need a few extra words, hence at most a second refill.
+        expect(spy.mock.calls.length).toBeGreaterThanOrEqual(1);
+        expect(spy.mock.calls.length).toBeLessThanOrEqual(2);
+        spy.mockRestore();
+    });
+
+    it('fillRandomInts respects a per-slot upper bound', () => {
+        const maxes = Uint32Array.from({ length: 200 }, (_, i) => i + 1);
+        const out = RandomUtils.fillRandomInts(maxes);
+        expect(out.length).toBe(200);
+        out.forEach((val, i) => {
+            expect(val).toBeLessThan(maxes[i]);
+        });
+    });
+
+    it('fillRandomInts is deterministic with a seeded source', () => {
+        const maxes = new Array(20).fill(6);
+        const a = RandomUtils.fillRandomInts(maxes, [], RandomUtils.createSeededRandom(7));
+        const b = RandomUtils.fillRandomInts(maxes, [], RandomUtils.createSeededRandom(7));
+        expect(a).toEqual(b);
+    });
+});
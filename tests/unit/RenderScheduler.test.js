@@ -0,0 +1,56 @@
+import { describe, it, expect, vi } from 'vitest';
+import { RenderScheduler } from '../../src/ui/modules/RenderScheduler.js';
+
+function manualFrames() {
+    const callbacks = new Map();
+    let next = 1;
+    return {
+        requestFrame: (cb) => {
+            callbacks.set(next, cb);
+            return next++;
+        },
+        cancelFrame: (id) => callbacks.delete(id),
+        tick() {
+            const pending = [...callbacks.values()];
+            callbacks.clear();
+            pending.forEach((cb) => cb());
+        },
+        get size() {
+            return callbacks.size;
+        },
+    };
+}
+
+describe('RenderScheduler', () => {
+    it('runs one render per frame however many requests arrive', () => {
+        const frames = manualFrames();
+        const render = vi.fn();
+        const scheduler = new RenderScheduler(render, frames);
+
+        for (let i = 0; i < 5; i++) scheduler.request();
+        expect(frames.size).toBe(1);
+        expect(render).not.toHaveBeenCalled();
+
+        frames.tick();
+        expect(render).toHaveBeenCalledTimes(1);
+        expect(scheduler.getStats()).toEqual({ requested: 5, performed: 1, coalesced: 4 });
+
+        scheduler.request();
+        frames.tick();
+        expect(render).toHaveBeenCalledTimes(2);
+    });
+
+    it('flushes a pending frame synchronously and cancels it', () => {
+        const frames = manualFrames();
+        const render = vi.fn();
+        const scheduler = new RenderScheduler(render, frames);
+
+        expect(scheduler.flush()).toBe(false);
+        scheduler.request();
+        expect(scheduler.flush()).toBe(true);
+        expect(frames.size).toBe(0);
+        frames.tick();
+        expect(render).toHaveBeenCalledTimes(1);
+        expect(scheduler.pending).toBe(false);
+    });
+});
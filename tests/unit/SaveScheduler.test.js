@@ -0,0 +1,121 @@
+import { describe, it, expect, vi } from 'vitest';
+import { SaveScheduler } from '../../src/core/services/SaveScheduler.js';
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+function createScheduler(options = {}) {
+    return new SaveScheduler({
+        windowMs: 5,
+        retryBaseMs: 5,
+        retryMaxMs: 20,
+        maxAttempts: 3,
+        requestIdle: (callback) => setTimeout(callback, 0),
+        ...options
+    });
+}
+
+describe('SaveScheduler', () => {
+    it('coalesces saves requested within the window into one run per channel', async () => {
+        const scheduler = createScheduler();
+        const local = vi.fn();
+        const remote = vi.fn(async () => true);
+        scheduler.register('local', local, { idle: true });
+        scheduler.register('statistics', remote);
+
+        for (let i = 0; i < 10; i++) scheduler.markDirty();
+        expect(local).not.toHaveBeenCalled();
+
+        await sleep(30);
+        expect(local).toHaveBeenCalledTimes(1);
+        expect(remote).toHaveBeenCalledTimes(1);
+        expect(scheduler.hasPending).toBe(false);
+    });
+
+    it('keeps one request in flight and sends later changes afterwards', async () => {
+        const scheduler = createScheduler();
+        let release;
+        const remote = vi.fn(() => new Promise((resolve) => { release = resolve; }));
+        scheduler.register('hand_events', remote);
+
+        scheduler.markDirty();
+        scheduler.flush();
+        scheduler.markDirty();
+        scheduler.flush();
+        expect(remote).toHaveBeenCalledTimes(1);
+
+        release(true);
+        await sleep(30);
+        expect(remote).toHaveBeenCalledTimes(2);
+    });
+
+    it('retries failed saves with backoff up to maxAttempts', async () => {
+        const scheduler = createScheduler();
+        const remote = vi.fn(async () => false);
+        vi.spyOn(console, 'error').mockImplementation(() => {});
+        scheduler.register('statistics', remote);
+
+        scheduler.markDirty();
+        scheduler.flush();
+        await sleep(80);
+        expect(remote).toHaveBeenCalledTimes(3);
+        expect(scheduler.hasPending).toBe(false);
+    });
+
+    it('holds marked changes while paused and saves them on resume', async () => {
+        const scheduler = createScheduler();
+        const local = vi.fn();
+        scheduler.register('local', local);
+
+        scheduler.pause();
+        for (let i = 0; i < 5; i++) scheduler.markDirty();
+        await sleep(30);
+        expect(local).not.toHaveBeenCalled();
+        expect(scheduler.hasPending).toBe(true);
+
+        scheduler.resume();
+        await sleep(30);
+        expect(local).toHaveBeenCalledTimes(1);
+        expect(scheduler.hasPending).toBe(false);
+    });
+
+    it('waits for requests in flight and the changes queued behind them', async () => {
+        const scheduler = createScheduler({ windowMs: 1000 });
+        const saved = [];
+        let version = 0;
+        scheduler.register('statistics', () => {
+            const sending = version;
+            return sleep(5).then(() => saved.push(sending));
+        });
+
+        scheduler.markDirty();
+        scheduler.flush();
+        version = 1;
+        scheduler.markDirty();
+        await scheduler.flushAndWait();
+
+        expect(saved).toEqual([0, 1]);
+        expect(scheduler.hasPending).toBe(false);
+        scheduler.dispose();
+    });
+
+    it('flushes synchronously when the page is hidden', () => {
+        const scheduler = createScheduler({ windowMs: 10000 });
+        const local = vi.fn();
+        scheduler.register('local', local, { idle: true });
+        const listeners = {};
+        const target = {
+            visibilityState: 'visible',
+            addEventListener: (type, fn) => { listeners[type] = fn; },
+            removeEventListener: vi.fn()
+        };
+        scheduler.attachLifecycle(target, target);
+
+        scheduler.markDirty('local');
+        target.visibilityState = 'hidden';
+        listeners.visibilitychange();
+        expect(local).toHaveBeenCalledTimes(1);
+
+        scheduler.dispose();
+        expect(target.removeEventListener).toHaveBeenCalledTimes(2);
+    });
+});
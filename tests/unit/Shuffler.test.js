@@ -0,0 +1,59 @@
+import { describe, it, expect } from 'vitest';
+import { Shuffler, ShuffleWorkspace } from '../../src/core/Shuffler.js';
+import { Deck } from '../../src/core/Deck.js';
+import { createSeededRandom } from '../../src/utils/RandomUtils.js';
+
+const makeCards = (n) => Array.from({ length: n }, (_, i) => ({ id: i }));
+const ids = (cards) => cards.map((c) => c.id);
+const sortedIds = (cards) => ids(cards).sort((a, b) => a - b);
+
+describe('Shuffler', () => {
+    it('riffle, strip and cut keep every card exactly once', () => {
+        const cards = makeCards(312);
+        const expected = sortedIds(cards);
+        expect(sortedIds(Shuffler.riffle(cards))).toEqual(expected);
+        expect(sortedIds(Shuffler.strip(cards))).toEqual(expected);
+        expect(sortedIds(Shuffler.cut(cards))).toEqual(expected);
+    });
+
+    it('strip reverses packet order while keeping cards inside a packet in order', () => {
+        const cards = makeCards(52);
+        const result = ids(Shuffler.strip(cards));
+        // The first packet comes from the top (end) of the original deck.
+        expect(result[0]).toBeGreaterThanOrEqual(47);
+        expect(result[result.length - 1]).toBeLessThanOrEqual(4);
+    });
+
+    it('casinoShuffleInPlace matches casinoShuffle for the same seed', () => {
+        const cards = makeCards(312);
+        const expected = ids(Shuffler.casinoShuffle(cards, 4, createSeededRandom(99)));
+        const inPlace = [...cards];
+        const returned = Shuffler.casinoShuffleInPlace(inPlace, 4, createSeededRandom(99));
+        expect(returned).toBe(inPlace);
+        expect(ids(inPlace)).toEqual(expected);
+    });
+
+    it('reuses a workspace across shuffles and resizes it when needed', () => {
+        const workspace = new ShuffleWorkspace(52);
+        const order = workspace.order;
+        const cards = makeCards(52);
+        Shuffler.casinoShuffleInPlace(cards, 4, null, workspace);
+        Shuffler.casinoShuffleInPlace(cards, 4, null, workspace);
+        expect([workspace.order, workspace.scratch]).toContain(order);
+        expect(sortedIds(cards)).toEqual(ids(makeCards(52)));
+
+        const bigger = makeCards(104);
+        Shuffler.casinoShuffleInPlace(bigger, 4, null, workspace);
+        expect(workspace.size).toBe(104);
+        expect(sortedIds(bigger)).toEqual(ids(makeCards(104)));
+    });
+
+    it('Deck uses the in-place pipeline when asked to', () => {
+        const deck = new Deck(6, { shuffleMode: 'casino', inPlaceShuffle: true });
+        const cardsRef = deck.cards;
+        expect(deck.shuffleWorkspace).toBeInstanceOf(ShuffleWorkspace);
+        deck.shuffleWithMode('casino');
+        expect(deck.cards).toBe(cardsRef);
+        expect(deck.remainingCards).toBe(312);
+    });
+});
@@ -0,0 +1,65 @@
+import { describe, it, expect } from 'vitest';
+import {
+    Simulator,
+    runSimulation,
+    createSimulationTotals,
+    mergeSimulationTotals,
+    summarizeSimulation,
+    SIMULATION_OUTCOMES
+} from '../../src/core/Simulator.js';
+import { RULES } from '../../src/core/Constants.js';
+
+describe('Simulator', () => {
+    it('plays the requested number of rounds and counts every hand outcome', () => {
+        const sim = new Simulator({ ruleProfile: 'vegas_strip', decks: 6, bet: 100 });
+        const totals = sim.run(2000);
+
+        expect(totals.rounds).toBe(2000);
+        expect(totals.hands).toBeGreaterThanOrEqual(2000);
+        const outcomeSum = SIMULATION_OUTCOMES.reduce((sum, key) => sum + totals.outcomes[key], 0);
+        expect(outcomeSum).toBe(totals.hands);
+    });
+
+    it('resolves profile keys and rejects unknown ones', () => {
+        const sim = new Simulator({ ruleProfile: 'atlantic_city' });
+        expect(sim.ruleProfile).toBe(RULES.PROFILES.atlantic_city);
+        expect(() => new Simulator({ ruleProfile: 'nope' })).toThrow();
+    });
+
+    it('never surrenders when the profile does not allow it', () => {
+        const report = runSimulation({ hands: 2000, ruleProfile: 'european_no_hole_card' });
+        expect(report.outcomes.surrender).toBe(0);
+    });
+
+    it('falls back to a legal action when the policy asks for an illegal one', () => {
+        const alwaysSplit = () => ({ action: 'split', code: 'P' });
+        const sim = new Simulator({ policy: alwaysSplit });
+        sim.run(200);
+        expect(sim.totals.rounds).toBe(200);
+    });
+
+    it('reports house edge and variance in units of the initial bet', () => {
+        const totals = createSimulationTotals();
+        totals.rounds = 4;
+        totals.hands = 4;
+        totals.net = 100 - 100 + 100 - 100;
+        totals.netSquared = 4 * 100 * 100;
+        totals.totalWagered = 400;
+
+        const report = summarizeSimulation(totals, 100);
+        expect(report.houseEdge).toBeCloseTo(0);
+        expect(report.variance).toBeCloseTo(1);
+        expect(report.standardError).toBeCloseTo(0.5);
+    });
+
+    it('merges totals exactly', () => {
+        const a = new Simulator().run(300);
+        const b = new Simulator().run(200);
+        const merged = mergeSimulationTotals(createSimulationTotals(), a);
+        mergeSimulationTotals(merged, b);
+
+        expect(merged.rounds).toBe(500);
+        expect(merged.net).toBe(a.net + b.net);
+        expect(merged.outcomes.win).toBe(a.outcomes.win + b.outcomes.win);
+    });
+});
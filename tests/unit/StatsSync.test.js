@@ -0,0 +1,123 @@
+import { describe, it, expect } from 'vitest';
+import { StatsSync } from '../../src/core/services/StatsSync.js';
+
+// In-memory stand-in for the apply_stat_deltas RPC.
+function createServer() {
+    const server = {
+        row: null,
+        lastSeq: new Map(),
+        calls: 0,
+        rpc: async (name, { p_device_id: device, p_deltas: deltas }) => {
+            server.calls++;
+            if (!server.row) server.row = { balance: 1000, wins: 0, losses: 0, blackjacks: 0, total_winnings: 0,
+                total_amount_wagered: 0, hand_counter: 0, session_best_balance: 1000, session_worst_balance: 1000 };
+            let last = server.lastSeq.get(device) || 0;
+            for (const delta of [...deltas].sort((a, b) => a.seq - b.seq)) {
+                if (delta.seq <= last) continue;
+                const d = delta.d || {};
+                server.row.balance += d.balance || 0;
+                server.row.wins += d.wins || 0;
+                server.row.losses += d.losses || 0;
+                server.row.hand_counter += d.handCounter || 0;
+                if (delta.best) server.row.session_best_balance = Math.max(server.row.session_best_balance, delta.best);
+                last = delta.seq;
+            }
+            server.lastSeq.set(device, last);
+            return { data: { stats: { ...server.row }, last_seq: last }, error: null };
+        }
+    };
+    return server;
+}
+
+function createGame(id) {
+    return {
+        userId: 'user-1',
+        balance: 1000,
+        wins: 0,
+        losses: 0,
+        blackjacks: 0,
+        totalWinnings: 0,
+        totalAmountWagered: 0,
+        handCounter: 0,
+        sessionBestBalance: 1000,
+        sessionWorstBalance: 1000,
+        getStorageKey: (key) => `${key}-${id}`
+    };
+}
+
+function playHand(game, net) {
+    game.handCounter++;
+    game.balance += net;
+    if (net > 0) game.wins++;
+    else game.losses++;
+    game.sessionBestBalance = Math.max(game.sessionBestBalance, game.balance);
+}
+
+describe('StatsSync', () => {
+    it('merges offline play from two devices without losing hands', async () => {
+        const server = createServer();
+        const a = createGame('a');
+        const b = createGame('b');
+        const syncA = new StatsSync(a, server);
+        const syncB = new StatsSync(b, server);
+        syncA.bootstrap(null, 0);
+        syncB.bootstrap(null, 0);
+
+        for (let i = 0; i < 100; i++) playHand(a, 10);
+        for (let i = 0; i < 50; i++) playHand(b, -10);
+
+        expect(await syncA.flush()).toBe(true);
+        expect(await syncB.flush()).toBe(true);
+        expect(server.calls).toBe(2);
+        expect(server.row.hand_counter).toBe(150);
+        expect(server.row.balance).toBe(1000 + 1000 - 500);
+        expect(b.balance).toBe(1500);
+        expect(b.wins).toBe(100);
+    });
+
+    it('ignores replayed deltas', async () => {
+        const server = createServer();
+        const game = createGame('a');
+        const sync = new StatsSync(game, server);
+        sync.bootstrap(null, 0);
+
+        playHand(game, 25);
+        sync.seal();
+        const sent = [...sync.getState().outbox];
+        await sync.flush();
+        await server.rpc('apply_stat_deltas', { p_device_id: sync.deviceId, p_deltas: sent });
+
+        expect(server.row.balance).toBe(1025);
+        expect(server.row.wins).toBe(1);
+        expect(sync.getState().outbox).toEqual([]);
+    });
+
+    it('keeps changes made while a flush is in flight', async () => {
+        const server = createServer();
+        const game = createGame('a');
+        const sync = new StatsSync(game, {
+            rpc: async (...args) => {
+                playHand(game, 5); // Hand finished before the response arrived.
+                return server.rpc(...args);
+            }
+        });
+        sync.bootstrap(null, 0);
+
+        playHand(game, 10);
+        await sync.flush();
+        expect(server.row.balance).toBe(1010);
+        expect(game.balance).toBe(1015);
+        expect(sync.openDelta().d).toEqual({ balance: 5, wins: 1, handCounter: 1 });
+    });
+
+    it('sends the local lead as an increment on first sync when local is newer', () => {
+        const game = createGame('a');
+        game.balance = 1500;
+        game.wins = 7;
+        const sync = new StatsSync(game, createServer());
+        sync.bootstrap({ balance: 1200, wins: 3, updated_at: '2024-01-01T00:00:00Z' }, Date.now());
+
+        expect(game.balance).toBe(1500);
+        expect(sync.openDelta().d).toEqual({ balance: 300, wins: 4 });
+    });
+});
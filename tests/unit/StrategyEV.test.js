@@ -0,0 +1,89 @@
+import { describe, it, expect } from 'vitest';
+import {
+    buildStrategyEVTable,
+    createShoeComposition,
+    getDealerProbabilities,
+    getStrategyEVTable,
+    StrategyEVTable
+} from '../../src/utils/StrategyEV.js';
+import { evaluatePlayerAction } from '../../src/utils/BasicStrategy.js';
+import { RULES } from '../../src/core/Constants.js';
+
+const vegasStrip = RULES.PROFILES.vegas_strip;
+const c = (value, suit = '♠') => ({ value, suit });
+
+describe('StrategyEV - dealer probabilities', () => {
+    it('sums to one and conditions on no blackjack in peek games', () => {
+        const comp = createShoeComposition(6);
+        comp[9]--; // upcard 10
+        const probs = getDealerProbabilities(comp, 9, vegasStrip);
+        const total = probs.reduce((a, b) => a + b, 0);
+        expect(total).toBeCloseTo(1, 10);
+        expect(probs[6]).toBe(0);
+        expect(comp).toEqual(createShoeComposition(6).map((n, r) => (r === 9 ? n - 1 : n)));
+    });
+
+    it('keeps the blackjack probability in no-peek games', () => {
+        const comp = createShoeComposition(6);
+        comp[0]--; // upcard A
+        const probs = getDealerProbabilities(comp, 0, RULES.PROFILES.european_no_hole_card);
+        expect(probs[6]).toBeGreaterThan(0.3);
+    });
+});
+
+describe('StrategyEV - tables', () => {
+    const table = buildStrategyEVTable(vegasStrip, 1);
+
+    it('matches well-known basic strategy decisions', () => {
+        const d11v6 = table.getActionEVs([c('6'), c('5')], c('6'));
+        expect(d11v6.double).toBeGreaterThan(d11v6.hit);
+        const h16v10 = table.getActionEVs([c('10'), c('6')], c('K'));
+        expect(h16v10.surrender).toBeGreaterThan(h16v10.stand);
+        const s17v6 = table.getActionEVs([c('10'), c('7')], c('6'));
+        expect(s17v6.stand).toBeGreaterThan(s17v6.hit);
+        expect(table.getActionEVs([c('9'), c('7')], c('6')).split).toBeNull();
+    });
+
+    it('looks up multi-card hands by total', () => {
+        const evs = table.getActionEVs([c('2'), c('3'), c('A')], c('9'));
+        expect(evs.double).toBeNull();
+        expect(evs.hit).toBeGreaterThan(evs.stand);
+    });
+
+    it('round-trips through serialize/deserialize', () => {
+        const restored = StrategyEVTable.deserialize(JSON.parse(JSON.stringify(table.serialize())));
+        expect(restored.rules).toBe(table.rules);
+        expect(Array.from(restored.values)).toEqual(Array.from(table.values));
+    });
+
+    it('ships a precomputed table for every rule profile', () => {
+        Object.values(RULES.PROFILES).forEach((profile) => {
+            expect(getStrategyEVTable(profile)).not.toBeNull();
+        });
+    });
+});
+
+describe('StrategyEV - training cost', () => {
+    it('reports the EV cost of a mistake and zero for the best play', () => {
+        const wrong = evaluatePlayerAction('stand', [c('3'), c('5')], c('7'), vegasStrip, false);
+        expect(wrong.evLoss).toBeGreaterThan(0.3);
+        const right = evaluatePlayerAction('double', [c('6'), c('5')], c('6'), vegasStrip, false);
+        expect(right.evLoss).toBe(0);
+    });
+
+    it('masks double and surrender when the hand cannot take them', () => {
+        // 11 vs 6 on a split hand without DAS: hitting is the best play left.
+        const noDouble = evaluatePlayerAction('hit', [c('6'), c('5')], c('6'), vegasStrip, false, { canDouble: false });
+        expect(noDouble.recommended).toBe('hit');
+        expect(noDouble.evLoss).toBe(0);
+        expect(noDouble.evByAction.double).toBeNull();
+
+        // 16 vs 10 after a split: surrender is gone.
+        const noSurrender = evaluatePlayerAction('hit', [c('10'), c('6')], c('10'), vegasStrip, false, {
+            canSurrender: false,
+        });
+        expect(noSurrender.recommended).toBe('hit');
+        expect(noSurrender.evLoss).toBe(0);
+        expect(noSurrender.evByAction.surrender).toBeNull();
+    });
+});
@@ -0,0 +1,94 @@
+import { describe, it, expect, beforeEach, afterEach, vi } from 'vitest';
+import { RealTimeScheduler, VirtualScheduler } from '../../src/core/services/TimerScheduler.js';
+import { GameManager } from '../../src/core/GameManager.js';
+
+describe('VirtualScheduler', () => {
+    it('fires timers in due order only when advanced, including ones scheduled meanwhile', () => {
+        const clock = new VirtualScheduler();
+        const log = [];
+        clock.setTimeout(() => log.push('b'), 500);
+        clock.setTimeout(() => {
+            log.push('a');
+            clock.setTimeout(() => log.push('c'), 300);
+        }, 250);
+        const dropped = clock.setTimeout(() => log.push('x'), 100);
+        clock.clearTimeout(dropped);
+
+        expect(log).toEqual([]);
+        expect(clock.advance(499)).toBe(1);
+        expect(log).toEqual(['a']);
+        clock.advance(100);
+        expect(log).toEqual(['a', 'b', 'c']);
+        expect(clock.pending).toBe(0);
+        expect(clock.now()).toBe(599);
+    });
+});
+
+describe('RealTimeScheduler', () => {
+    beforeEach(() => {
+        vi.useFakeTimers();
+    });
+
+    afterEach(() => {
+        vi.useRealTimers();
+    });
+
+    it('prunes fired timers and divides delays by the turbo speed', () => {
+        const scheduler = new RealTimeScheduler();
+        const fn = vi.fn();
+        scheduler.setSpeed(4);
+        scheduler.setTimeout(fn, 500);
+        scheduler.setTimeout(fn, 2000);
+        expect(scheduler.pending).toBe(2);
+
+        vi.advanceTimersByTime(125);
+        expect(fn).toHaveBeenCalledTimes(1);
+        expect(scheduler.pending).toBe(1);
+
+        scheduler.clearAll();
+        vi.advanceTimersByTime(1000);
+        expect(fn).toHaveBeenCalledTimes(1);
+    });
+});
+
+describe('GameManager on a virtual clock', () => {
+    beforeEach(() => {
+        GameManager.instance = null;
+    });
+
+    afterEach(() => {
+        GameManager.instance = null;
+    });
+
+    it('plays whole rounds without waiting for CONFIG.DELAYS', () => {
+        const game = new GameManager(null, null);
+        const clock = new VirtualScheduler();
+        game.setScheduler(clock);
+
+        for (let round = 0; round < 20; round++) {
+            game.newGame();
+            game.startGame();
+            clock.runAll();
+            if (game.dealerHand[0].value === 'A' && !game.gameOver) {
+                game.respondToInsurance(false);
+                clock.runAll();
+            }
+            while (!game.gameOver) {
+                game.stand();
+                clock.runAll();
+            }
+        }
+
+        expect(game.handCounter).toBe(20);
+        expect(clock.pending).toBe(0);
+    });
+
+    it('applies turbo mode to the scheduler', () => {
+        const game = new GameManager(null, null);
+        game.saveSettings = vi.fn();
+        game.updateSetting('turboMode', true);
+        expect(game.scheduler.speed).toBeGreaterThan(1);
+        game.updateSetting('turboMode', false);
+        expect(game.scheduler.speed).toBe(1);
+    });
+});
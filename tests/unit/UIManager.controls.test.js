@@ -125,4 +125,36 @@ describe('UIManager action controls and keyboard', () => {
 
         vi.useRealTimers();
     });
+
+    it('coalesces render requests and skips regions whose state did not change', () => {
+        global.document = { querySelectorAll: vi.fn(() => []) };
+        const frames = [];
+        ui.renderScheduler.requestFrame = (cb) => frames.push(cb);
+        const renderHand = vi.spyOn(ui, 'renderHand').mockImplementation(() => {});
+        const renderPlayerHands = vi.spyOn(ui, 'renderPlayerHands').mockImplementation(() => {});
+        const state = {
+            balance: 200,
+            currentBet: 50,
+            currentHandIndex: 0,
+            dealerHand: [{ value: '10', suit: '♦' }],
+            playerHands: [{ cards: [{ value: '9', suit: '♠' }], bet: 50, status: 'playing' }],
+        };
+        const getState = vi.fn(() => state);
+
+        ui.requestRender(getState);
+        ui.requestRender(getState);
+        ui.requestRender(getState);
+        expect(frames).toHaveLength(1);
+        frames.shift()();
+        expect(getState).toHaveBeenCalledTimes(1);
+
+        state.playerHands[0].cards.push({ value: '2', suit: '♣' });
+        ui.requestRender(getState);
+        expect(ui.flushRender()).toBe(true);
+
+        expect(renderHand).toHaveBeenCalledTimes(1);
+        expect(renderPlayerHands).toHaveBeenCalledTimes(2);
+        expect(ui.getRenderStats()).toMatchObject({ requested: 4, performed: 2, coalesced: 2 });
+        delete global.document;
+    });
 });
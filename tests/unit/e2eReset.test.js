@@ -0,0 +1,69 @@
+import { describe, it, expect, beforeEach, vi } from 'vitest';
+import { installE2EResetHook } from '../../src/core/e2eReset.js';
+import { EventEmitter } from '../../src/utils/EventEmitter.js';
+
+describe('installE2EResetHook', () => {
+    let game;
+    let appListener;
+
+    beforeEach(() => {
+        global.localStorage = { clear: vi.fn() };
+        global.document = { querySelectorAll: () => [], getElementById: () => null };
+        appListener = vi.fn();
+        game = {
+            events: new EventEmitter(),
+            settings: {},
+            engine: { deck: { reset: vi.fn() } },
+            advancedStats: { startSession: vi.fn() },
+            persistenceService: {
+                flushSaves: vi.fn(),
+                onGameReset: vi.fn(async () => {}),
+                statsSync: { forgetState: vi.fn() },
+            },
+            clearTimeouts: vi.fn(),
+            initializeGameState: vi.fn(() => {
+                game.balance = 1000;
+            }),
+            initializeSettings: vi.fn(),
+            newGame: vi.fn(),
+            setScheduler: vi.fn(),
+        };
+        game.events.on('hand:completed', appListener);
+        installE2EResetHook(game);
+    });
+
+    it('restores initial state and drops listeners added after install', async () => {
+        const testListener = vi.fn();
+        game.events.on('hand:completed', testListener);
+        game.events.on('player:hit', testListener);
+        game.balance = 0;
+
+        expect(await game.__resetForTest()).toBe(true);
+        game.events.emit('hand:completed');
+        game.events.emit('player:hit');
+
+        expect(game.balance).toBe(1000);
+        expect(appListener).toHaveBeenCalledTimes(1);
+        expect(testListener).not.toHaveBeenCalled();
+        expect(game.persistenceService.flushSaves).toHaveBeenCalled();
+        expect(game.engine.deck.reset).toHaveBeenCalled();
+        expect(localStorage.clear).toHaveBeenCalled();
+        expect(game.persistenceService.statsSync.forgetState).toHaveBeenCalled();
+        expect(game.newGame).toHaveBeenCalled();
+    });
+
+    it('resolves only after the stored history has been cleared', async () => {
+        let clearStore;
+        game.persistenceService.onGameReset = vi.fn(() => new Promise((resolve) => { clearStore = resolve; }));
+
+        let done = false;
+        const reset = game.__resetForTest().then(() => { done = true; });
+        await Promise.resolve();
+        expect(done).toBe(false);
+        expect(game.newGame).not.toHaveBeenCalled();
+
+        clearStore();
+        await reset;
+        expect(game.newGame).toHaveBeenCalled();
+    });
+});
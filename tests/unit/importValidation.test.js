@@ -42,6 +42,14 @@ describe('validateImportedGameData', () => {
         expect(result.settings.theme).toBe('light');
     });
 
+    it('mantém a configuração perfectPlay', () => {
+        const payload = buildValidPayload({ settings: { perfectPlay: true } });
+
+        expect(validateImportedGameData(payload).settings.perfectPlay).toBe(true);
+        expect(() => validateImportedGameData(buildValidPayload({ settings: { perfectPlay: 'sim' } })))
+            .toThrow(ImportValidationError);
+    });
+
     it('falha quando faltam campos obrigatórios', () => {
         const payload = {
             version: CONFIG.STORAGE_VERSION,